@@ -59,6 +59,17 @@ class Settings(BaseSettings):
     
     # Batch settings
     EMBEDDING_BATCH_SIZE: int = 32
+    EMBEDDING_BATCH_MAX_TOKENS: int = 8000  # Estimated token budget per embedding request
+    EMBEDDING_MAX_CONCURRENCY: int = 4  # Concurrent embedding requests (1 = serial)
+    EMBEDDING_MAX_RETRIES: int = 3  # Attempts per batch before failing
+    EMBEDDING_RETRY_DELAY: float = 1.0  # Initial backoff delay in seconds (doubles per retry)
+    MULTI_LEVEL_EMBED_BATCH_SIZE: int = 1024  # Table/row/cell items embedded and written per batch
+    EMBED_COMMIT_BATCH_SIZE: int = 512  # Chunks embedded, stored and checkpointed per commit (whole documents)
+    
+    # Per-text embedding cache (content hash of text + model + dimension)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_DTYPE: Literal["float32", "float16"] = "float32"  # float16 halves disk usage
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 200000  # LRU eviction beyond this (0 = unlimited)
     
     # Dynamic properties based on provider
     @property
@@ -103,6 +114,7 @@ class Settings(BaseSettings):
     # LLM Generation Settings
     LLM_TEMPERATURE: float = 0.1
     LLM_MAX_TOKENS: int = 2000
+    LLM_MAX_CONCURRENCY: int = 4  # Concurrent LLM calls in QueryEngine.batch_query
     
     @property
     def LLM_MODEL(self) -> str:
@@ -131,10 +143,20 @@ class Settings(BaseSettings):
     HYBRID_SEARCH_ALPHA: float = 0.5  # Weight for vector search (0.0 to 1.0)
     BM25_K1: float = 1.5
     BM25_B: float = 0.75
+    BM25_INDEX_DIR: Optional[str] = None  # Keyword index directory (default: data/cache/bm25_index)
+    SEARCH_MAX_CONCURRENCY: int = 8  # Threads shared by concurrent search branches
+    SEARCH_STRATEGY_TIMEOUT: float = 10.0  # Seconds per branch before fusing partial results (0 = no limit)
     
     # FAISS Settings (FREE & HIGH PERFORMANCE)
     FAISS_PERSIST_DIR: str = os.path.join(PROJECT_ROOT, "faiss_db")
-    FAISS_INDEX_TYPE: str = "flat"  # flat, ivf, hnsw
+    FAISS_INDEX_TYPE: str = "flat"  # flat, hnsw, ivf, ivf_pq, ivf_sq8
+    FAISS_NLIST: int = 0  # IVF lists (0 = auto, ~4*sqrt(N))
+    FAISS_NPROBE: int = 10  # IVF lists probed per query
+    FAISS_PQ_M: int = 0  # PQ sub-quantizers for ivf_pq (0 = auto)
+    FAISS_HNSW_M: int = 32  # HNSW graph degree
+    FAISS_EF_SEARCH: int = 64  # HNSW candidate list size per query
+    FAISS_TRAIN_SAMPLE_SIZE: int = 100000  # Vectors sampled to train IVF
+    FAISS_DELTA_LOG: bool = True  # Append bulk_load() writes to a crash-recovery log
     
     # Redis Vector Settings (OPTIONAL - for distributed systems)
     REDIS_VECTOR_HOST: str = "localhost"
@@ -157,6 +179,16 @@ class Settings(BaseSettings):
     EXTRACTION_YEAR_MIN: int = 2000
     EXTRACTION_YEAR_MAX: int = 2035
     
+    # Parallel extraction (process pool; each worker loads the Docling models once)
+    EXTRACTION_WORKERS: int = 1  # Worker processes (1 = serial, 0 = one per CPU core)
+    EXTRACTION_FILE_TIMEOUT: int = 900  # Per-file timeout in seconds for parallel mode (0 = none)
+    
+    # Parallel consolidation (reading files, regular/transposed/index outputs, sheets per output)
+    CONSOLIDATION_WORKERS: int = 1  # Worker processes (1 = serial, 0 = one per CPU core)
+    
+    # Table store: parsed sheets cached beside processed_advanced workbooks (<stem>.tables/) for consolidation
+    TABLE_STORE_ENABLED: bool = True
+    
     # Docling chunking (set very high to extract complete tables)
     DOCLING_CHUNK_SIZE: int = 100000
     
@@ -201,6 +233,21 @@ class Settings(BaseSettings):
     TOP_K: int = 5
     SIMILARITY_THRESHOLD: float = 0.7
     
+    # Semantic query cache (paraphrased questions reuse cached results)
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95  # Min cosine similarity between queries for a hit
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 1000  # LRU eviction beyond this
+    SEMANTIC_CACHE_TTL_SECONDS: int = 3600  # 0 = no expiry
+
+    # Cross-encoder reranking (model loads lazily, once per process)
+    RERANK_MODEL: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    RERANK_BATCH_SIZE: int = 32  # Pairs per model forward pass
+    RERANK_MAX_TOKENS: int = 256  # Token budget per (query, chunk) pair; long tables are truncated
+    RERANK_CACHE_SIZE: int = 10000  # LRU (query, chunk) scores kept in memory (0 = off)
+    RERANK_BACKEND: Literal["torch", "onnx"] = "torch"  # onnx needs sentence-transformers[onnx]
+    RERANK_QUANTIZE: bool = False  # int8 weights on CPU (dynamic quantization / quantized ONNX)
+    RERANK_BATCH_WAIT_MS: float = 5.0  # Window to merge concurrent rerank calls (0 = no micro-batching)
+    
     # ============================================================================
     # PDF PROCESSING SETTINGS
     # ============================================================================
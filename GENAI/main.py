@@ -161,6 +161,7 @@ def download(
 def extract(
     source: str = typer.Option(None, "--source", "-s", help="PDF directory"),
     force: bool = typer.Option(False, "--force", "-f", help="Force re-extraction"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Extraction worker processes (default: EXTRACTION_WORKERS)"),
     skip_process: bool = typer.Option(False, "--skip-process", help="Skip process step"),
     skip_advanced: bool = typer.Option(False, "--skip-advanced", help="Skip process-advanced step"),
     skip_consolidate: bool = typer.Option(False, "--skip-consolidate", help="Skip consolidate step"),
@@ -174,13 +175,14 @@ def extract(
     Example:
         python main.py extract --source ../raw_data
         python main.py extract --force  # Full re-extraction
+        python main.py extract --workers 8  # Parallel extraction
         python main.py extract --skip-advanced --skip-consolidate  # Extraction only
     """
     console.print("\n[bold green]Step 2: Extract Tables[/bold green]\n")
     
     # Step 1: Extract
     console.print("[bold]Step 1: Extract Tables from PDFs[/bold]")
-    result = run_extract(source_dir=source, force=force)
+    result = run_extract(source_dir=source, force=force, workers=workers)
     
     if not result.success:
         console.print(f"[red]Extraction failed: {result.error}[/red]")
@@ -261,19 +263,10 @@ def embed(
     
     set_local_embedding_mode(local)
     
-    # Step 2: Extract
-    console.print("[cyan]Extracting tables...[/cyan]")
-    extract_result = run_extract(source_dir=source, force=force)
-    
-    if not extract_result.success:
-        console.print(f"[red]Extraction failed: {extract_result.error}[/red]")
-        raise typer.Exit(code=1)
-    
-    console.print(f"[green]{extract_result.message}[/green]")
-    
-    # Step 4: Embed
-    console.print("[cyan]Generating embeddings...[/cyan]")
-    embed_result = run_embed(extracted_data=extract_result.data)
+    # Steps 2-4: Extract, embed and store one document batch at a time;
+    # committed documents are checkpointed, so a re-run resumes
+    console.print("[cyan]Extracting tables and generating embeddings...[/cyan]")
+    embed_result = run_embed(source_dir=source, force=force)
     
     handle_pipeline_result(embed_result)
 
@@ -403,7 +396,8 @@ def query(
     question: str = typer.Argument(..., help="Question to ask"),
     top_k: int = typer.Option(5, "--top-k", "-k", help="Context chunks"),
     no_cache: bool = typer.Option(False, "--no-cache", help="Disable cache"),
-    local: bool = typer.Option(False, "--local", "-l", help="Use local embeddings (offline mode)")
+    local: bool = typer.Option(False, "--local", "-l", help="Use local embeddings (offline mode)"),
+    stream: bool = typer.Option(True, "--stream/--no-stream", help="Print the answer as it is generated")
 ) -> None:
     """
     Step 7: Query with LLM response.
@@ -411,18 +405,41 @@ def query(
     Examples:
         python main.py query "What was revenue in Q1 2025?"
         python main.py query "What was revenue?" --local  # Offline embeddings
+        python main.py query "What was revenue?" --no-stream  # Print when complete
     """
     console.print(f"\n[bold green]Step 7: LLM Query[/bold green]\n")
     console.print(f"[cyan]Question:[/cyan] {question}\n")
     
     set_local_embedding_mode(local)
     
-    result = run_query(question=question, top_k=top_k, use_cache=not no_cache)
-    
-    if result.success:
-        console.print(f"[bold green]Answer:[/bold green]")
-        console.print(result.data['answer'])
+    if not stream:
+        result = run_query(question=question, top_k=top_k, use_cache=not no_cache)
+        if result.success:
+            console.print(f"[bold green]Answer:[/bold green]")
+            console.print(result.data['answer'])
     else:
+        def show_sources(sources) -> None:
+            for source in sources:
+                console.print(f"[dim]Source: {source.source_doc} p.{source.page_no} - {source.table_title}[/dim]")
+            console.print(f"\n[bold green]Answer:[/bold green]")
+        
+        result = run_query(
+            question=question,
+            top_k=top_k,
+            use_cache=not no_cache,
+            on_token=lambda text: console.print(text, end="", markup=False, highlight=False, soft_wrap=True),
+            on_sources=show_sources,
+        )
+        if result.success:
+            console.print()
+            ttft = result.metadata.get('time_to_first_token_ms')
+            if ttft is not None:
+                console.print(
+                    f"[dim]First token: {ttft:.0f} ms, "
+                    f"{result.metadata.get('tokens_per_sec', 0):.1f} tokens/s[/dim]"
+                )
+    
+    if not result.success:
         console.print(f"[red]Error: {result.error}[/red]")
         raise typer.Exit(code=1)
     
@@ -844,6 +861,38 @@ def stats() -> None:
     console.print()
 
 
+@app.command("build-index")
+def build_index(
+    index_type: str = typer.Option(settings.FAISS_INDEX_TYPE, "--type", "-t", help="flat, hnsw, ivf, ivf_pq, ivf_sq8"),
+    nlist: int = typer.Option(0, "--nlist", help="IVF lists (0 = auto from corpus size)"),
+    sample: int = typer.Option(0, "--sample", help="Training sample size (0 = settings default)"),
+) -> None:
+    """
+    Rebuild the FAISS index from stored vectors (no re-embedding).
+    
+    Examples:
+        python main.py build-index --type ivf
+        python main.py build-index --type ivf_pq --nlist 256
+    """
+    from src.infrastructure.vectordb.manager import get_vectordb_manager
+    
+    console.print(f"\n[bold green]Building {index_type} index[/bold green]\n")
+    
+    try:
+        params = get_vectordb_manager().build_index(
+            index_type=index_type,
+            nlist=nlist or None,
+            sample_size=sample or None,
+        )
+    except (ValueError, NotImplementedError) as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1)
+    
+    for key, value in params.items():
+        console.print(f"  {key}: {value}")
+    console.print()
+
+
 @app.command("clear-cache")
 def clear_cache(
     all: bool = typer.Option(False, "--all", "-a", help="Clear everything including vectordb (DESTRUCTIVE)"),
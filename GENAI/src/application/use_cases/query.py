@@ -2,20 +2,22 @@
 Query Use Case - RAG queries with caching.
 
 Orchestrates:
-1. Query cache lookup (Tier 3)
+1. Query cache lookup (Tier 3, exact then semantic)
 2. Vector retrieval
 3. LLM generation
 4. Response caching
 5. Optional evaluation
+
+Answers can also be streamed (stream_query): sources first, then tokens.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from functools import lru_cache
 import logging
 from src.utils import get_logger
 
-from src.domain.queries import RAGQuery, RAGResponse
-from src.infrastructure.cache import QueryCache
+from src.domain.queries import RAGQuery, RAGResponse, RAGStreamEvent
+from src.infrastructure.cache import QueryCache, SemanticQueryCache
 
 logger = get_logger(__name__)
 
@@ -26,6 +28,7 @@ class QueryUseCase:
     
     Wraps the existing query pipeline with:
     - Query cache (Tier 3) for instant repeated responses
+    - Semantic cache so paraphrased questions skip retrieval and the LLM
     - Force refresh option for users
     - Cache statistics tracking
     
@@ -42,6 +45,7 @@ class QueryUseCase:
         self,
         query_cache: Optional[QueryCache] = None,
         cache_enabled: bool = True,
+        semantic_cache: Optional[SemanticQueryCache] = None,
     ):
         """
         Initialize query use case.
@@ -49,9 +53,12 @@ class QueryUseCase:
         Args:
             query_cache: Tier 3 cache instance
             cache_enabled: Enable query caching
+            semantic_cache: Similarity-matched cache (default: built from
+                SEMANTIC_CACHE_* settings on first use)
         """
         self.query_cache = query_cache or QueryCache(enabled=cache_enabled)
         self.cache_enabled = cache_enabled
+        self._semantic_cache = semantic_cache
         
         # Lazy load the actual query engine
         self._query_engine = None
@@ -66,6 +73,28 @@ class QueryUseCase:
             self._query_engine = QueryEngine()
         return self._query_engine
     
+    @property
+    def semantic_cache(self) -> Optional[SemanticQueryCache]:
+        """Lazy load semantic cache (None when disabled)."""
+        if self._semantic_cache is None and self.cache_enabled:
+            from config.settings import settings
+            if not settings.SEMANTIC_CACHE_ENABLED:
+                return None
+            
+            from src.infrastructure.embeddings import get_embedding_manager
+            from src.infrastructure.vectordb import get_vectordb_manager
+            
+            # Re-ingested sources are evicted by invalidate_sources; the
+            # generation check still flushes after writes that bypass it
+            self._semantic_cache = SemanticQueryCache(
+                embed_fn=lambda text: get_embedding_manager().embed_query(text),
+                threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS or None,
+                generation_fn=lambda: get_vectordb_manager().index_generation,
+            )
+        return self._semantic_cache
+    
     def query(
         self,
         query: str,
@@ -93,6 +122,10 @@ class QueryUseCase:
             if cached_response:
                 logger.info(f"Query cache hit: '{query[:40]}...'")
                 return cached_response
+            
+            cached_response = self._semantic_lookup(query, filters, top_k)
+            if cached_response:
+                return cached_response
         
         # Execute query through pipeline
         logger.info(f"Executing query: '{query[:40]}...'")
@@ -108,6 +141,7 @@ class QueryUseCase:
             # Cache the response
             if self.cache_enabled:
                 self.query_cache.set_response(query, response, filters, top_k)
+                self._semantic_store(query, response, filters, top_k)
             
             return response
             
@@ -121,6 +155,89 @@ class QueryUseCase:
                 from_cache=False,
             )
     
+    def stream_query(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 5,
+        force_refresh: bool = False,
+    ) -> Iterator[RAGStreamEvent]:
+        """
+        Execute RAG query with caching, streaming the answer.
+        
+        Cache hits are replayed as a single token event. Fresh answers
+        are written to the query caches when the ``done`` event arrives.
+        
+        Args:
+            query: User question
+            filters: Metadata filters (year, quarter, table_type, etc.)
+            top_k: Number of results to retrieve
+            force_refresh: Force fresh search (skip cache)
+            
+        Yields:
+            RAGStreamEvent objects (see QueryEngine.stream_query)
+        """
+        if self.cache_enabled and not force_refresh:
+            cached_response = self.query_cache.get_response(query, filters, top_k)
+            if cached_response:
+                logger.info(f"Query cache hit: '{query[:40]}...'")
+            else:
+                cached_response = self._semantic_lookup(query, filters, top_k)
+            
+            if cached_response:
+                yield RAGStreamEvent(type="sources", sources=cached_response.sources)
+                yield RAGStreamEvent(type="token", text=cached_response.answer)
+                yield RAGStreamEvent(
+                    type="done", sources=cached_response.sources, response=cached_response
+                )
+                return
+        
+        logger.info(f"Streaming query: '{query[:40]}...'")
+        
+        for event in self.query_engine.stream_query(
+            query=query,
+            filters=filters,
+            top_k=top_k,
+            use_cache=False,  # We handle caching at this layer
+        ):
+            if event.type == "done" and self.cache_enabled and event.error is None:
+                self.query_cache.set_response(query, event.response, filters, top_k)
+                self._semantic_store(query, event.response, filters, top_k)
+            yield event
+    
+    def _semantic_lookup(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]],
+        top_k: int,
+    ) -> Optional[RAGResponse]:
+        """Look up a response cached for a similar question (errors count as misses)."""
+        try:
+            cache = self.semantic_cache
+            response = cache.lookup(query, filters, top_k) if cache is not None else None
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+        
+        if response is not None and hasattr(response, 'from_cache'):
+            response.from_cache = True
+        return response
+    
+    def _semantic_store(
+        self,
+        query: str,
+        response: RAGResponse,
+        filters: Optional[Dict[str, Any]],
+        top_k: int,
+    ) -> None:
+        """Add a fresh response to the semantic cache."""
+        try:
+            cache = self.semantic_cache
+            if cache is not None:
+                cache.store(query, response, filters, top_k)
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
+    
     def query_from_request(self, request: RAGQuery) -> RAGResponse:
         """
         Execute query from RAGQuery request object.
@@ -148,15 +265,42 @@ class QueryUseCase:
         Returns:
             Number of entries invalidated
         """
+        semantic_cache = self._semantic_cache
         if query:
             success = self.query_cache.invalidate_query(query)
-            return 1 if success else 0
+            semantic = semantic_cache.invalidate_query(query) if semantic_cache is not None else 0
+            return max(1 if success else 0, semantic)
         else:
+            if semantic_cache is not None:
+                semantic_cache.clear()
             return self.query_cache.clear()
     
+    def invalidate_sources(self, source_docs: List[str]) -> int:
+        """
+        Invalidate cached responses that used re-ingested documents.
+        
+        Only responses built from these documents (or with no recorded
+        sources) are evicted; the rest of the cache stays warm.
+        
+        Args:
+            source_docs: Source document filenames
+            
+        Returns:
+            Number of query cache entries invalidated
+        """
+        count = 0
+        for source_doc in dict.fromkeys(source_docs):
+            count += self.query_cache.invalidate_by_source(source_doc)
+            if self._semantic_cache is not None:
+                self._semantic_cache.invalidate_by_source(source_doc)
+        return count
+    
     def get_cache_stats(self) -> dict:
         """Get query cache statistics."""
-        return self.query_cache.get_stats().to_dict()
+        stats = self.query_cache.get_stats().to_dict()
+        if self._semantic_cache is not None:
+            stats['semantic'] = self._semantic_cache.get_stats().to_dict()
+        return stats
 
 
 # Singleton instance
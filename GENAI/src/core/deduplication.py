@@ -13,7 +13,6 @@ Example:
     ...     dedup.register(Path("10q0625.pdf"))
 """
 
-import hashlib
 import json
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -71,16 +70,14 @@ class PDFDeduplicator:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
+        from src.infrastructure.cache.extraction_cache import compute_content_hash
+        
         pdf_path = Path(pdf_path)
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
         
-        sha256 = hashlib.sha256()
-        with open(pdf_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        
-        return sha256.hexdigest()
+        # Shared, memoized hash: the extraction cache keys on the same value
+        return compute_content_hash(pdf_path)
     
     def is_duplicate(self, pdf_path: Path) -> Tuple[bool, Optional[str]]:
         """
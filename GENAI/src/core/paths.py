@@ -163,6 +163,20 @@ class PathManager:
         path.mkdir(parents=True, exist_ok=True)
         return path
     
+    @property
+    def checkpoint_dir(self) -> Path:
+        """Get data/cache/checkpoints/ directory (ingestion resume points)."""
+        path = self.cache_dir / 'checkpoints'
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    
+    @property
+    def bm25_index_dir(self) -> Path:
+        """Get data/cache/bm25_index/ directory (saved keyword index)."""
+        path = self.cache_dir / 'bm25_index'
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    
     @property
     def pdf_history_file(self) -> Path:
         """Get path to PDF deduplication history file."""
@@ -4,7 +4,7 @@ Domain layer - Business entities and value objects.
 This module contains domain models organized by bounded context:
 - tables: Financial table entities (TableMetadata, TableChunk, Enhanced*)
 - documents: Document processing entities (DocumentMetadata, PageLayout)
-- queries: RAG query/response entities (RAGQuery, RAGResponse, SearchResult)
+- queries: RAG query/response entities (RAGQuery, RAGResponse, RAGStreamEvent, SearchResult)
 
 All entities are re-exported for easy import.
 """
@@ -34,6 +34,7 @@ from src.domain.documents import (
 from src.domain.queries import (
     RAGQuery,
     RAGResponse,
+    RAGStreamEvent,
     SearchResult,
 )
 
@@ -58,6 +59,7 @@ __all__ = [
     # Queries
     'RAGQuery',
     'RAGResponse',
+    'RAGStreamEvent',
     'SearchResult',
 ]
 
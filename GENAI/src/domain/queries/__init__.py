@@ -7,11 +7,13 @@ Contains entities for RAG queries, responses, and search results.
 from src.domain.queries.entities import (
     RAGQuery,
     RAGResponse,
+    RAGStreamEvent,
     SearchResult,
 )
 
 __all__ = [
     'RAGQuery',
     'RAGResponse',
+    'RAGStreamEvent',
     'SearchResult',
 ]
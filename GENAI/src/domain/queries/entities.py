@@ -6,7 +6,7 @@ These are the primary I/O models for the RAG pipeline.
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 
 # Import TableMetadata for type reference
 from src.domain.tables.entities import TableMetadata
@@ -81,6 +81,31 @@ class RAGResponse(BaseModel):
         }
 
 
+class RAGStreamEvent(BaseModel):
+    """
+    One event of a streamed RAG answer.
+    
+    Events arrive in order: one ``sources`` event before generation
+    starts, ``token`` events as text is generated, then one ``done`` event
+    with the complete response and timing metrics.
+    """
+    
+    type: Literal["sources", "token", "done"] = Field(..., description="Event type")
+    text: str = Field("", description="Generated text (token events)")
+    sources: List[TableMetadata] = Field(
+        default_factory=list,
+        description="Source tables used (sources and done events)"
+    )
+    response: Optional[RAGResponse] = Field(
+        None,
+        description="Complete response (done event)"
+    )
+    metrics: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Timings: retrieval_ms, time_to_first_token_ms, total_ms, tokens, tokens_per_sec"
+    )
+    error: Optional[str] = Field(None, description="Failure message (done event)")
+
 class SearchResult(BaseModel):
     """
     Result from vector similarity search.
@@ -4,14 +4,17 @@ Infrastructure caching layer - Three-tier caching for RAG system.
 Tiers:
 - Tier 1: ExtractionCache (PDF extraction results)
 - Tier 2: EmbeddingCache (embeddings by extraction hash + model)
+- Tier 2: TextEmbeddingCache (per-text vectors by content hash + model)
 - Tier 3: QueryCache (RAG responses with refresh option)
+- Tier 3: SemanticQueryCache (in-memory, matches paraphrased queries)
 - Redis: RedisCache (low-level Redis operations)
 """
 
 from src.infrastructure.cache.base import BaseCache, CacheStats
 from src.infrastructure.cache.extraction_cache import ExtractionCache
-from src.infrastructure.cache.embedding_cache import EmbeddingCache
+from src.infrastructure.cache.embedding_cache import EmbeddingCache, TextEmbeddingCache
 from src.infrastructure.cache.query_cache import QueryCache
+from src.infrastructure.cache.semantic_cache import SemanticQueryCache
 from src.infrastructure.cache.redis_cache import RedisCache, get_redis_cache
 
 __all__ = [
@@ -19,7 +22,9 @@ __all__ = [
     'CacheStats',
     'ExtractionCache',
     'EmbeddingCache',
+    'TextEmbeddingCache',
     'QueryCache',
+    'SemanticQueryCache',
     'RedisCache',
     'get_redis_cache',
 ]
@@ -2,22 +2,30 @@
 Base cache implementation with common functionality.
 
 Provides:
-- File-based caching with pickle serialization
+- SQLite (WAL) storage with pickle serialization, one file per cache
 - TTL (time-to-live) expiration
-- Size limits with LRU eviction
+- Entry and byte limits with LRU eviction
 - Hit/miss metrics tracking
+
+Lookups hit the primary-key index, eviction walks the ``accessed`` and
+``expires`` indexes, and entry/byte totals are kept by triggers, so no
+operation scans the whole cache. Access times are buffered in memory and
+written in batches instead of on every hit. SQLite's file locking makes the
+cache safe to share between processes; each process (and forked child)
+opens its own connection.
 """
 
-import hashlib
-import pickle
 import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, Generic, Optional, TypeVar, List
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
-import logging
+from dataclasses import dataclass
 from src.utils import get_logger
-import os
 
 logger = get_logger(__name__)
 
@@ -27,20 +35,20 @@ T = TypeVar('T')
 @dataclass
 class CacheStats:
     """Cache performance statistics."""
-    
+
     hits: int = 0
     misses: int = 0
     total_entries: int = 0
     size_bytes: int = 0
     evictions: int = 0
     last_cleanup: Optional[datetime] = None
-    
+
     @property
     def hit_rate(self) -> float:
         """Calculate cache hit rate."""
         total = self.hits + self.misses
         return self.hits / total if total > 0 else 0.0
-    
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -54,254 +62,439 @@ class CacheStats:
         }
 
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key      TEXT PRIMARY KEY,
+    value    BLOB NOT NULL,
+    created  REAL NOT NULL,
+    accessed REAL NOT NULL,
+    expires  REAL,
+    size     INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed);
+CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries(expires);
+CREATE TABLE IF NOT EXISTS totals (
+    id      INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes   INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, entries, bytes) VALUES (0, 0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_resize AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET bytes = bytes + NEW.size - OLD.size WHERE id = 0;
+END;
+"""
+
+
 class BaseCache(Generic[T]):
     """
-    Base file-based cache with TTL and size limits.
-    
+    Base SQLite-backed cache with TTL and size limits.
+
     Features:
     - Pickle serialization for complex objects
     - Configurable TTL expiration
-    - Optional max size with LRU eviction
+    - Optional max entries / max bytes with LRU eviction
     - Hit/miss tracking
+    - Safe concurrent use from threads and processes
     """
-    
+
+    DB_NAME = "cache.sqlite"
+
+    # Extra tables/triggers created alongside the base schema by subclasses
+    EXTRA_SCHEMA = ""
+
+    # Buffered access-time updates are flushed after this many hits or seconds
+    ACCESS_FLUSH_BATCH = 64
+    ACCESS_FLUSH_SECONDS = 5.0
+
     def __init__(
         self,
         cache_dir: Path,
         name: str = "cache",
-        ttl_hours: int = 24,
+        ttl_hours: Optional[float] = 24,
         max_entries: Optional[int] = None,
         enabled: bool = True,
+        max_bytes: Optional[int] = None,
     ):
         """
         Initialize base cache.
-        
+
         Args:
-            cache_dir: Directory for cache files
+            cache_dir: Directory for the cache database
             name: Cache name for logging
-            ttl_hours: Time-to-live in hours
+            ttl_hours: Time-to-live in hours (None = never expires)
             max_entries: Max entries before eviction (None = unlimited)
             enabled: Enable/disable caching
+            max_bytes: Max total serialized size before eviction (None = unlimited)
         """
         self.cache_dir = Path(cache_dir)
         self.name = name
-        self.ttl = timedelta(hours=ttl_hours)
+        self.ttl_hours = ttl_hours
+        self.ttl = timedelta(hours=ttl_hours) if ttl_hours is not None else None
         self.max_entries = max_entries
+        self.max_bytes = max_bytes
         self.enabled = enabled
         self.stats = CacheStats()
-        
-        # Metadata file for tracking
-        self._metadata_file = self.cache_dir / "_metadata.json"
-        self._metadata: Dict[str, Any] = {}
-        
+        self.db_path = self.cache_dir / self.DB_NAME
+
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._pending_access: Dict[str, float] = {}
+        self._last_flush = time.monotonic()
+
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self._load_metadata()
+            self._connection()
+            self._migrate_legacy_files()
             logger.info(f"{self.name} cache initialized at {self.cache_dir}")
-    
+
     # =========================================================================
     # Core Operations
     # =========================================================================
-    
+
     def get(self, key: str) -> Optional[T]:
         """Get cached value by key."""
         if not self.enabled:
             return None
-        
-        cache_file = self._get_cache_file(key)
-        
-        if not cache_file.exists():
-            self.stats.misses += 1
-            logger.debug(f"[{self.name}] Cache miss: {key[:16]}...")
-            return None
-        
-        # Check expiration
-        if self._is_expired(cache_file):
-            self.stats.misses += 1
-            cache_file.unlink()
-            self._remove_from_metadata(key)
-            logger.debug(f"[{self.name}] Cache expired: {key[:16]}...")
-            return None
-        
-        # Load from cache
-        try:
-            with open(cache_file, 'rb') as f:
-                value = pickle.load(f)
-            
+
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT value, expires FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.stats.misses += 1
+                logger.debug(f"[{self.name}] Cache miss: {key[:16]}...")
+                return None
+
+            value, expires = row
+            now = time.time()
+
+            # Check expiration
+            if expires is not None and expires <= now:
+                self.stats.misses += 1
+                self._delete_keys([key])
+                logger.debug(f"[{self.name}] Cache expired: {key[:16]}...")
+                return None
+
+            # Load from cache
+            try:
+                result = pickle.loads(value)
+            except Exception as e:
+                self.stats.misses += 1
+                logger.error(f"[{self.name}] Error loading cache: {e}")
+                self._delete_keys([key])
+                return None
+
             self.stats.hits += 1
-            self._update_access_time(key)
+            self._update_access_time(key, now)
             logger.debug(f"[{self.name}] Cache hit: {key[:16]}...")
-            return value
-            
-        except Exception as e:
-            self.stats.misses += 1
-            logger.error(f"[{self.name}] Error loading cache: {e}")
-            cache_file.unlink()
-            self._remove_from_metadata(key)
-            return None
-    
-    def set(self, key: str, value: T, ttl_hours: Optional[int] = None) -> None:
+            return result
+
+    def set(self, key: str, value: T, ttl_hours: Optional[float] = None) -> None:
         """Set cached value."""
         if not self.enabled:
             return
-        
-        # Evict if at max capacity
-        if self.max_entries and len(self._metadata) >= self.max_entries:
-            self._evict_lru()
-        
-        cache_file = self._get_cache_file(key)
-        
+
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(value, f)
-            
-            # Update metadata
-            self._metadata[key] = {
-                'created': datetime.now().isoformat(),
-                'accessed': datetime.now().isoformat(),
-                'ttl_hours': ttl_hours or self.ttl.total_seconds() / 3600,
-                'size': cache_file.stat().st_size,
-            }
-            self._save_metadata()
-            
-            logger.debug(f"[{self.name}] Cached: {key[:16]}...")
-            
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
         except Exception as e:
             logger.error(f"[{self.name}] Error caching: {e}")
-    
+            return
+
+        now = time.time()
+        ttl = self.ttl_hours if ttl_hours is None else ttl_hours
+        expires = now + ttl * 3600 if ttl is not None else None
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT INTO entries (key, value, created, accessed, expires, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+                    "created = excluded.created, accessed = excluded.accessed, "
+                    "expires = excluded.expires, size = excluded.size",
+                    (key, blob, now, now, expires, len(blob)),
+                )
+            self._pending_access.pop(key, None)
+            self._enforce_limits()
+
+        logger.debug(f"[{self.name}] Cached: {key[:16]}...")
+
     def delete(self, key: str) -> bool:
         """Delete cached value."""
         if not self.enabled:
             return False
-        
-        cache_file = self._get_cache_file(key)
-        
-        if cache_file.exists():
-            cache_file.unlink()
-            self._remove_from_metadata(key)
-            return True
-        
-        return False
-    
+
+        with self._lock:
+            return self._delete_keys([key]) > 0
+
     def exists(self, key: str) -> bool:
         """Check if key exists and is valid."""
         if not self.enabled:
             return False
-        
-        cache_file = self._get_cache_file(key)
-        return cache_file.exists() and not self._is_expired(cache_file)
-    
+
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT 1 FROM entries WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+        return row is not None
+
     def clear(self) -> int:
         """Clear all cache entries."""
         if not self.enabled:
             return 0
-        
-        count = 0
-        for cache_file in self.cache_dir.glob("*.pkl"):
-            cache_file.unlink()
-            count += 1
-        
-        self._metadata.clear()
-        self._save_metadata()
-        
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                count = conn.execute("DELETE FROM entries").rowcount
+            self._pending_access.clear()
+
         logger.info(f"[{self.name}] Cleared {count} entries")
         return count
-    
+
     # =========================================================================
     # Maintenance
     # =========================================================================
-    
+
     def cleanup_expired(self) -> int:
         """Remove expired entries."""
         if not self.enabled:
             return 0
-        
-        count = 0
-        for cache_file in self.cache_dir.glob("*.pkl"):
-            if self._is_expired(cache_file):
-                cache_file.unlink()
-                count += 1
-        
-        # Sync metadata
-        valid_keys = {f.stem for f in self.cache_dir.glob("*.pkl")}
-        self._metadata = {k: v for k, v in self._metadata.items() if k in valid_keys}
-        self._save_metadata()
-        
+
+        with self._lock:
+            count = self._delete_expired()
+
         self.stats.last_cleanup = datetime.now()
         logger.info(f"[{self.name}] Cleaned up {count} expired entries")
         return count
-    
+
+    def delete_older_than(self, max_age_hours: float) -> int:
+        """
+        Delete entries created more than ``max_age_hours`` ago.
+
+        Returns:
+            Number of entries deleted
+        """
+        if not self.enabled:
+            return 0
+
+        cutoff = time.time() - max_age_hours * 3600
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                return conn.execute("DELETE FROM entries WHERE created < ?", (cutoff,)).rowcount
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete all entries whose key starts with ``prefix``.
+
+        Returns:
+            Number of entries deleted
+        """
+        if not self.enabled or not prefix:
+            return 0
+
+        # Key range scan on the primary key index
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                return conn.execute(
+                    "DELETE FROM entries WHERE key >= ? AND key < ?", (prefix, upper)
+                ).rowcount
+
+    def keys(self) -> List[str]:
+        """List all non-expired keys."""
+        if not self.enabled:
+            return []
+
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT key FROM entries WHERE expires IS NULL OR expires > ?", (time.time(),)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def flush(self) -> None:
+        """Write buffered access times to the database."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if not self._pending_access:
+                return
+            pending = [(accessed, key) for key, accessed in self._pending_access.items()]
+            self._pending_access.clear()
+            self._last_flush = time.monotonic()
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "UPDATE entries SET accessed = MAX(accessed, ?) WHERE key = ?", pending
+                )
+
+    def close(self) -> None:
+        """Flush pending writes and close the database connection."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                try:
+                    self.flush()
+                finally:
+                    self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
     def get_stats(self) -> CacheStats:
         """Get cache statistics."""
         if self.enabled:
-            files = list(self.cache_dir.glob("*.pkl"))
-            self.stats.total_entries = len(files)
-            self.stats.size_bytes = sum(f.stat().st_size for f in files)
+            with self._lock:
+                entries, size = self._totals()
+            self.stats.total_entries = entries
+            self.stats.size_bytes = size
         return self.stats
-    
+
     # =========================================================================
     # Internal Methods
     # =========================================================================
-    
-    def _get_cache_file(self, key: str) -> Path:
-        """Get cache file path for key."""
-        return self.cache_dir / f"{key}.pkl"
-    
-    def _is_expired(self, cache_file: Path) -> bool:
-        """Check if cache file is expired."""
-        file_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-        
-        # Check custom TTL from metadata
-        key = cache_file.stem
-        if key in self._metadata:
-            ttl_hours = self._metadata[key].get('ttl_hours', self.ttl.total_seconds() / 3600)
-            ttl = timedelta(hours=ttl_hours)
-        else:
-            ttl = self.ttl
-        
-        return datetime.now() - file_time > ttl
-    
-    def _evict_lru(self) -> None:
-        """Evict least recently used entry."""
-        if not self._metadata:
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this process's connection, (re)opening it after a fork."""
+        pid = os.getpid()
+        if self._conn is None or self._conn_pid != pid:
+            # A connection inherited across fork must not be used by the child
+            self._pending_access.clear()
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA + self.EXTRA_SCHEMA)
+            self._conn = conn
+            self._conn_pid = pid
+        return self._conn
+
+    def _totals(self) -> tuple:
+        """(entry count, total bytes) maintained by triggers."""
+        return self._connection().execute(
+            "SELECT entries, bytes FROM totals WHERE id = 0"
+        ).fetchone()
+
+    def _delete_keys(self, keys: List[str]) -> int:
+        """Delete keys, returning the number removed."""
+        for key in keys:
+            self._pending_access.pop(key, None)
+        conn = self._connection()
+        with conn:
+            return conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in keys]).rowcount
+
+    def _delete_expired(self) -> int:
+        """Delete expired entries via the expires index."""
+        conn = self._connection()
+        with conn:
+            return conn.execute(
+                "DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (time.time(),)
+            ).rowcount
+
+    def _enforce_limits(self) -> None:
+        """Evict expired, then least recently used entries until within limits."""
+        if not self.max_entries and not self.max_bytes:
+            return
+
+        entries, size = self._totals()
+        if not self._over_limits(entries, size):
+            return
+
+        self._delete_expired()
+        entries, size = self._totals()
+        if not self._over_limits(entries, size):
             return
-        
-        # Find LRU entry
-        lru_key = min(
-            self._metadata.keys(),
-            key=lambda k: self._metadata[k].get('accessed', '1970-01-01')
+
+        # LRU order must reflect buffered hits
+        self.flush()
+
+        excess_entries = entries - self.max_entries if self.max_entries else 0
+        excess_bytes = size - self.max_bytes if self.max_bytes else 0
+        victims = []
+        freed = 0
+        cursor = self._connection().execute("SELECT key, size FROM entries ORDER BY accessed")
+        try:
+            for key, entry_size in cursor:
+                if len(victims) >= excess_entries and freed >= excess_bytes:
+                    break
+                victims.append(key)
+                freed += entry_size
+        finally:
+            cursor.close()
+
+        if victims:
+            self._delete_keys(victims)
+            self.stats.evictions += len(victims)
+            logger.debug(f"[{self.name}] Evicted {len(victims)} LRU entries")
+
+    def _over_limits(self, entries: int, size: int) -> bool:
+        return bool(
+            (self.max_entries and entries > self.max_entries)
+            or (self.max_bytes and size > self.max_bytes)
         )
-        
-        # Remove it
-        self.delete(lru_key)
-        self.stats.evictions += 1
-        logger.debug(f"[{self.name}] Evicted LRU: {lru_key[:16]}...")
-    
-    def _update_access_time(self, key: str) -> None:
-        """Update last access time in metadata."""
-        if key in self._metadata:
-            self._metadata[key]['accessed'] = datetime.now().isoformat()
-            self._save_metadata()
-    
-    def _remove_from_metadata(self, key: str) -> None:
-        """Remove key from metadata."""
-        if key in self._metadata:
-            del self._metadata[key]
-            self._save_metadata()
-    
-    def _load_metadata(self) -> None:
-        """Load metadata from file."""
-        if self._metadata_file.exists():
+
+    def _update_access_time(self, key: str, accessed: float) -> None:
+        """Buffer an access time; flushed in batches."""
+        self._pending_access[key] = accessed
+        if (
+            len(self._pending_access) >= self.ACCESS_FLUSH_BATCH
+            or time.monotonic() - self._last_flush >= self.ACCESS_FLUSH_SECONDS
+        ):
+            self.flush()
+
+    def _migrate_legacy_files(self) -> None:
+        """Import entries from the previous one-pickle-per-key layout."""
+        metadata_file = self.cache_dir / "_metadata.json"
+        legacy_files = list(self.cache_dir.glob("*.pkl"))
+        if not legacy_files and not metadata_file.exists():
+            return
+
+        metadata: Dict[str, Any] = {}
+        if metadata_file.exists():
             try:
-                with open(self._metadata_file, 'r') as f:
-                    self._metadata = json.load(f)
+                with open(metadata_file, 'r') as f:
+                    metadata = json.load(f)
             except Exception:
-                self._metadata = {}
-    
-    def _save_metadata(self) -> None:
-        """Save metadata to file."""
-        try:
-            with open(self._metadata_file, 'w') as f:
-                json.dump(self._metadata, f, indent=2)
-        except Exception as e:
-            logger.error(f"[{self.name}] Error saving metadata: {e}")
+                metadata = {}
+
+        rows = []
+        for cache_file in legacy_files:
+            key = cache_file.stem
+            meta = metadata.get(key, {})
+            try:
+                blob = cache_file.read_bytes()
+                created = (
+                    datetime.fromisoformat(meta['created']).timestamp()
+                    if 'created' in meta else cache_file.stat().st_mtime
+                )
+            except Exception as e:
+                logger.warning(f"[{self.name}] Skipping unreadable legacy entry {key}: {e}")
+                continue
+            ttl = meta.get('ttl_hours', self.ttl_hours)
+            expires = created + ttl * 3600 if ttl is not None else None
+            rows.append((key, blob, created, created, expires, len(blob)))
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO entries (key, value, created, accessed, expires, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            for cache_file in legacy_files:
+                cache_file.unlink(missing_ok=True)
+            metadata_file.unlink(missing_ok=True)
+            self._enforce_limits()
+
+        logger.info(f"[{self.name}] Migrated {len(rows)} legacy cache entries")
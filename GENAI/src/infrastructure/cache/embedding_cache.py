@@ -2,13 +2,25 @@
 Tier 2: Embedding Cache
 
 Model-aware caching for embeddings.
-Key: extraction_hash + embedding_model (invalidates on model change)
-TTL: 90 days (embeddings are stable for same model)
+
+EmbeddingCache:
+    Key: extraction_hash + embedding_model (invalidates on model change)
+    TTL: 90 days (embeddings are stable for same model)
+
+TextEmbeddingCache:
+    Key: sha256(normalized text + model + dimension), one vector per text
+    Storage: compact float32/float16 blobs in a single SQLite file
+    TTL: none (same text + model always yields the same vector); LRU-bounded
 """
 
+import hashlib
+import time
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import Dict, Iterable, Optional, List, Any, Sequence
 import logging
+
+import numpy as np
+
 from src.utils import get_logger
 
 from src.infrastructure.cache.base import BaseCache
@@ -39,6 +51,7 @@ class EmbeddingCache(BaseCache[List[Any]]):
         ttl_hours: int = DEFAULT_TTL_HOURS,
         max_entries: Optional[int] = 1000,
         enabled: bool = True,
+        max_bytes: Optional[int] = None,
     ):
         """
         Initialize embedding cache.
@@ -48,6 +61,7 @@ class EmbeddingCache(BaseCache[List[Any]]):
             ttl_hours: TTL in hours (default: 90 days)
             max_entries: Max entries (default: 1000)
             enabled: Enable caching
+            max_bytes: Max total size in bytes (default: unlimited)
         """
         if cache_dir is None:
             from src.core.paths import get_paths
@@ -59,6 +73,7 @@ class EmbeddingCache(BaseCache[List[Any]]):
             ttl_hours=ttl_hours,
             max_entries=max_entries,
             enabled=enabled,
+            max_bytes=max_bytes,
         )
     
     def _get_model_key(self, extraction_hash: str, model: Optional[str] = None) -> str:
@@ -145,10 +160,200 @@ class EmbeddingCache(BaseCache[List[Any]]):
         Returns:
             Number of entries invalidated
         """
-        count = 0
-        for cache_file in self.cache_dir.glob(f"{extraction_hash}_*.pkl"):
-            cache_file.unlink()
-            count += 1
+        count = self.delete_prefix(f"{extraction_hash}_")
         
         logger.info(f"Invalidated {count} embedding caches for {extraction_hash[:12]}...")
         return count
+
+
+class TextEmbeddingCache(BaseCache[List[float]]):
+    """
+    Content-addressed, per-text embedding cache.
+    
+    Vectors are keyed by the hash of the whitespace-normalized text, the
+    embedding model and its dimension, so identical table text repeated
+    across filings (or re-runs with --force) is embedded once per model.
+    Entries live in a BaseCache SQLite file as raw float32 or float16 blobs
+    (not pickles), with the same per-process connections and LRU eviction
+    once ``max_entries`` / ``max_bytes`` are exceeded.
+    
+    Example:
+        >>> cache = TextEmbeddingCache(model="all-MiniLM-L6-v2", dimension=384)
+        >>> found = cache.get_many(texts)          # {index: vector} for hits
+        >>> cache.set_many(missing_texts, vectors)
+        >>> cache.get_stats().hit_rate
+    """
+    
+    DB_NAME = "text_embeddings.sqlite"
+    DEFAULT_MAX_ENTRIES = 200_000
+    
+    # Blob prefix recording the storage dtype ("<f4" / "<f2")
+    _DTYPE_TAG_LEN = 3
+    
+    def __init__(
+        self,
+        model: str,
+        dimension: Optional[int] = None,
+        path: Optional[Path] = None,
+        dtype: str = "float32",
+        enabled: bool = True,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize text embedding cache.
+        
+        Args:
+            model: Embedding model name (part of every key)
+            dimension: Configured embedding dimension (part of every key)
+            path: SQLite file (default: <embedding_cache_dir>/text_embeddings.sqlite)
+            dtype: Storage precision, "float32" or "float16"
+            enabled: Enable caching
+            max_entries: Max vectors before LRU eviction (None = unlimited)
+            max_bytes: Max total vector bytes before LRU eviction (None = unlimited)
+        """
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+        
+        self.model = model
+        self.dimension = dimension
+        self.dtype = np.dtype(dtype).newbyteorder("<")
+        self._namespace = f"{model}\0{dimension or 0}\0".encode("utf-8")
+        
+        if path is None:
+            from src.core.paths import get_paths
+            path = get_paths().embedding_cache_dir / self.DB_NAME
+        path = Path(path)
+        self.DB_NAME = path.name
+        
+        super().__init__(
+            cache_dir=path.parent,
+            name=f"TextEmbeddingCache ({model})",
+            ttl_hours=None,
+            max_entries=max_entries,
+            enabled=enabled,
+            max_bytes=max_bytes,
+        )
+        self.path = self.db_path
+    
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Collapse whitespace so formatting-only differences share an entry."""
+        return " ".join(text.split())
+    
+    def key(self, text: str, kind: str = "document") -> str:
+        """Content hash of normalized text scoped to model + dimension + kind."""
+        payload = self._namespace + kind.encode("utf-8") + b"\0" + self.normalize(text).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+    
+    def get_many(self, texts: Sequence[str], kind: str = "document") -> Dict[int, List[float]]:
+        """
+        Look up vectors for many texts.
+        
+        Args:
+            texts: Texts to look up
+            kind: "document" or "query" (models may embed them differently)
+            
+        Returns:
+            Mapping of input position -> cached vector (misses are absent)
+        """
+        if not self.enabled or not texts:
+            return {}
+        
+        keys = [self.key(t, kind) for t in texts]
+        rows = {}
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            unique = list(dict.fromkeys(keys))
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(unique), 500):
+                part = unique[start:start + 500]
+                placeholders = ",".join("?" * len(part))
+                rows.update(conn.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({placeholders})", part
+                ))
+            for key in rows:
+                self._update_access_time(key, now)
+        
+        found = {}
+        for i, key in enumerate(keys):
+            blob = rows.get(key)
+            if blob is not None:
+                found[i] = self._decode(blob)
+        
+        self.stats.hits += len(found)
+        self.stats.misses += len(texts) - len(found)
+        return found
+    
+    def get(self, text: str, kind: str = "document") -> Optional[List[float]]:
+        """Get cached vector for a single text."""
+        return self.get_many([text], kind).get(0)
+    
+    def set_many(
+        self,
+        texts: Sequence[str],
+        vectors: Iterable[Sequence[float]],
+        kind: str = "document",
+    ) -> None:
+        """Store vectors for texts (existing entries are replaced)."""
+        if not self.enabled:
+            return
+        
+        now = time.time()
+        rows = []
+        for text, vector in zip(texts, vectors):
+            blob = self._encode(vector)
+            rows.append((self.key(text, kind), blob, now, now, len(blob)))
+        if not rows:
+            return
+        
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO entries (key, value, created, accessed, expires, size) "
+                    "VALUES (?, ?, ?, ?, NULL, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+                    "accessed = excluded.accessed, size = excluded.size",
+                    rows,
+                )
+            self._enforce_limits()
+    
+    def set(self, text: str, vector: Sequence[float], kind: str = "document") -> None:
+        """Store vector for a single text."""
+        self.set_many([text], [vector], kind)
+    
+    def _encode(self, vector: Sequence[float]) -> bytes:
+        arr = np.asarray(vector, dtype=self.dtype)
+        return self.dtype.str.encode("ascii") + arr.tobytes()
+    
+    def _decode(self, blob: bytes) -> List[float]:
+        dtype = np.dtype(blob[:self._DTYPE_TAG_LEN].decode("ascii"))
+        return np.frombuffer(blob, dtype=dtype, offset=self._DTYPE_TAG_LEN).astype(np.float32).tolist()
+    
+    def _migrate_legacy_files(self) -> None:
+        """Import vectors from the previous standalone ``text_embeddings`` table."""
+        with self._lock:
+            conn = self._connection()
+            legacy = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'text_embeddings'"
+            ).fetchone()
+            if legacy is None:
+                return
+            
+            now = time.time()
+            rows = []
+            for key, dtype, vector in conn.execute("SELECT key, dtype, vector FROM text_embeddings"):
+                blob = np.dtype(dtype).newbyteorder("<").str.encode("ascii") + vector
+                rows.append((key.hex(), blob, now, now, len(blob)))
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO entries (key, value, created, accessed, expires, size) "
+                    "VALUES (?, ?, ?, ?, NULL, ?)",
+                    rows,
+                )
+                conn.execute("DROP TABLE text_embeddings")
+            self._enforce_limits()
+        
+        logger.info(f"[{self.name}] Migrated {len(rows)} legacy vectors")
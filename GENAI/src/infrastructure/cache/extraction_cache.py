@@ -8,7 +8,7 @@ TTL: 30 days (extraction results don't change)
 
 import hashlib
 from pathlib import Path
-from typing import Optional, Any
+from typing import Dict, Optional, Any
 import logging
 from src.utils import get_logger
 
@@ -16,6 +16,45 @@ from src.infrastructure.cache.base import BaseCache
 
 logger = get_logger(__name__)
 
+# (resolved path, size, mtime_ns) -> content hash, so one run hashes each file once
+_HASH_MEMO: Dict[tuple, str] = {}
+_HASH_MEMO_MAX = 4096
+
+
+def compute_content_hash(pdf_path: Path) -> str:
+    """
+    Compute SHA256 hash of a file's content.
+    
+    Results are memoized per (path, size, mtime) so repeated lookups of an
+    unchanged file within a process don't re-read it.
+    
+    Args:
+        pdf_path: Path to file
+        
+    Returns:
+        SHA256 hash as hex string
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    pdf_path = Path(pdf_path).resolve()
+    stat = pdf_path.stat()
+    memo_key = (str(pdf_path), stat.st_size, stat.st_mtime_ns)
+    
+    content_hash = _HASH_MEMO.get(memo_key)
+    if content_hash is None:
+        sha256 = hashlib.sha256()
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        content_hash = sha256.hexdigest()
+        
+        if len(_HASH_MEMO) >= _HASH_MEMO_MAX:
+            _HASH_MEMO.clear()
+        _HASH_MEMO[memo_key] = content_hash
+    
+    return content_hash
+
 
 class ExtractionCache(BaseCache[Any]):
     """
@@ -40,6 +79,7 @@ class ExtractionCache(BaseCache[Any]):
         ttl_hours: int = DEFAULT_TTL_HOURS,
         max_entries: Optional[int] = 500,
         enabled: bool = True,
+        max_bytes: Optional[int] = None,
     ):
         """
         Initialize extraction cache.
@@ -49,6 +89,7 @@ class ExtractionCache(BaseCache[Any]):
             ttl_hours: TTL in hours (default: 30 days)
             max_entries: Max entries (default: 500)
             enabled: Enable caching
+            max_bytes: Max total size in bytes (default: unlimited)
         """
         if cache_dir is None:
             from src.core.paths import get_paths
@@ -60,6 +101,7 @@ class ExtractionCache(BaseCache[Any]):
             ttl_hours=ttl_hours,
             max_entries=max_entries,
             enabled=enabled,
+            max_bytes=max_bytes,
         )
     
     def compute_content_hash(self, pdf_path: Path) -> str:
@@ -72,14 +114,7 @@ class ExtractionCache(BaseCache[Any]):
         Returns:
             SHA256 hash as hex string
         """
-        pdf_path = Path(pdf_path)
-        sha256 = hashlib.sha256()
-        
-        with open(pdf_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        
-        return sha256.hexdigest()
+        return compute_content_hash(pdf_path)
     
     def get_by_content(self, pdf_path: Path) -> Optional[Any]:
         """
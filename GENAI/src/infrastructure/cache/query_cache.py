@@ -4,13 +4,16 @@ Tier 3: Query Cache
 User query result caching with refresh option.
 Key: query_text + filters + top_k (hashed)
 TTL: 24 hours (RAG results may change with new data)
+
+Each entry records the source documents and tables its response used, in a
+reverse index (``dependencies`` table), so re-ingesting one filing evicts
+only the responses built from it.
 """
 
 import hashlib
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, Set
 import logging
 from src.utils import get_logger
 
@@ -18,13 +21,61 @@ from src.infrastructure.cache.base import BaseCache
 
 logger = get_logger(__name__)
 
+# Dependency tag for responses without recorded sources (e.g. "no data
+# found" answers); any source invalidation evicts them
+ANY_SOURCE = "any"
+
+
+def source_tag(source_doc: str) -> str:
+    """Dependency tag for a source document."""
+    return f"source:{source_doc}"
+
+
+def table_tag(table_id: str) -> str:
+    """Dependency tag for a table."""
+    return f"table:{table_id}"
+
+
+def collect_dependencies(value: Any) -> Set[str]:
+    """
+    Dependency tags for a cached value.
+    
+    Understands RAGResponse-like objects (``sources``), lists of search
+    results (``metadata``), and the metadata objects/dicts themselves.
+    
+    Args:
+        value: Cached response or result list
+        
+    Returns:
+        Set of source/table tags ({ANY_SOURCE} if none were found)
+    """
+    items = getattr(value, 'sources', None)
+    if items is None:
+        items = value if isinstance(value, (list, tuple)) else [value]
+    
+    tags: Set[str] = set()
+    for item in items:
+        metadata = getattr(item, 'metadata', item)
+        if isinstance(metadata, dict):
+            source_doc, table_id = metadata.get('source_doc'), metadata.get('table_id')
+        else:
+            source_doc = getattr(metadata, 'source_doc', None)
+            table_id = getattr(metadata, 'table_id', None)
+        if source_doc:
+            tags.add(source_tag(source_doc))
+        if table_id:
+            tags.add(table_tag(table_id))
+    
+    return tags or {ANY_SOURCE}
+
 
 class QueryCache(BaseCache[Any]):
     """
     Query result cache with refresh support.
     
     Caches RAG responses for identical queries. Users can
-    force a refresh to get fresh results.
+    force a refresh to get fresh results. Entries are invalidated per
+    source document or table through a persisted reverse index.
     
     Example:
         >>> cache = QueryCache()
@@ -36,12 +87,26 @@ class QueryCache(BaseCache[Any]):
     
     DEFAULT_TTL_HOURS = 24  # 24 hours
     
+    # Reverse index: dependency tag -> cache keys (rows removed with entries)
+    EXTRA_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS dependencies (
+        tag TEXT NOT NULL,
+        key TEXT NOT NULL,
+        PRIMARY KEY (tag, key)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_dependencies_key ON dependencies(key);
+    CREATE TRIGGER IF NOT EXISTS dependencies_cleanup AFTER DELETE ON entries BEGIN
+        DELETE FROM dependencies WHERE key = OLD.key;
+    END;
+    """
+    
     def __init__(
         self,
         cache_dir: Optional[Path] = None,
         ttl_hours: int = DEFAULT_TTL_HOURS,
         max_entries: Optional[int] = 200,
         enabled: bool = True,
+        max_bytes: Optional[int] = None,
     ):
         """
         Initialize query cache.
@@ -51,6 +116,7 @@ class QueryCache(BaseCache[Any]):
             ttl_hours: TTL in hours (default: 24)
             max_entries: Max entries (default: 200)
             enabled: Enable caching
+            max_bytes: Max total size in bytes (default: unlimited)
         """
         if cache_dir is None:
             from src.core.paths import get_paths
@@ -62,6 +128,7 @@ class QueryCache(BaseCache[Any]):
             ttl_hours=ttl_hours,
             max_entries=max_entries,
             enabled=enabled,
+            max_bytes=max_bytes,
         )
         
         # Query -> key mapping for invalidation
@@ -126,6 +193,7 @@ class QueryCache(BaseCache[Any]):
         response: Any,
         filters: Optional[Dict[str, Any]] = None,
         top_k: int = 5,
+        dependencies: Optional[Iterable[str]] = None,
     ) -> str:
         """
         Cache RAG response.
@@ -135,6 +203,8 @@ class QueryCache(BaseCache[Any]):
             response: RAGResponse to cache
             filters: Metadata filters
             top_k: Number of results
+            dependencies: Source/table tags the response depends on
+                (default: collected from response.sources)
             
         Returns:
             Cache key used
@@ -142,6 +212,10 @@ class QueryCache(BaseCache[Any]):
         key = self._generate_key(query, filters, top_k)
         self.set(key, response)
         
+        if self.enabled:
+            tags = set(dependencies) if dependencies is not None else collect_dependencies(response)
+            self._set_dependencies(key, tags)
+        
         # Track query -> key mapping
         self._query_keys[query.strip().lower()] = key
         
@@ -174,10 +248,11 @@ class QueryCache(BaseCache[Any]):
     
     def invalidate_by_source(self, source_doc: str) -> int:
         """
-        Invalidate all queries that may have used a source document.
+        Invalidate queries whose responses used a source document.
         
-        Use this when a document is updated/reprocessed.
-        Currently clears all cache (conservative approach).
+        Use this when a document is updated/reprocessed. Responses that
+        recorded no sources are invalidated too, since new data may now
+        answer them.
         
         Args:
             source_doc: Source document filename
@@ -185,10 +260,82 @@ class QueryCache(BaseCache[Any]):
         Returns:
             Number of entries cleared
         """
-        # Conservative: clear all query cache when data changes
-        # Future: track source -> query relationships
-        logger.info(f"Invalidating query cache due to source update: {source_doc}")
-        return self.clear()
+        count = self._invalidate_tags([source_tag(source_doc), ANY_SOURCE])
+        logger.info(f"Invalidated {count} cached queries due to source update: {source_doc}")
+        return count
+    
+    def invalidate_by_table(self, table_id: str) -> int:
+        """
+        Invalidate queries whose responses used a table.
+        
+        Args:
+            table_id: Table identifier
+            
+        Returns:
+            Number of entries cleared
+        """
+        count = self._invalidate_tags([table_tag(table_id)])
+        logger.info(f"Invalidated {count} cached queries using table: {table_id}")
+        return count
+    
+    def get_dependencies(self, query: str, filters: Optional[Dict[str, Any]] = None, top_k: int = 5) -> Set[str]:
+        """
+        Dependency tags recorded for a cached query.
+        
+        Args:
+            query: User query
+            filters: Metadata filters
+            top_k: Number of results
+            
+        Returns:
+            Set of source/table tags (empty if not cached)
+        """
+        if not self.enabled:
+            return set()
+        
+        key = self._generate_key(query, filters, top_k)
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT tag FROM dependencies WHERE key = ?", (key,)
+            ).fetchall()
+        return {row[0] for row in rows}
+    
+    def _set_dependencies(self, key: str, tags: Set[str]) -> None:
+        """Replace the dependency tags of a stored entry."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM dependencies WHERE key = ?", (key,))
+                # Skip if the entry was evicted straight away
+                conn.executemany(
+                    "INSERT OR IGNORE INTO dependencies (tag, key) "
+                    "SELECT ?, key FROM entries WHERE key = ?",
+                    [(tag, key) for tag in tags],
+                )
+    
+    def _invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Delete every entry that depends on any of the tags."""
+        if not self.enabled:
+            return 0
+        
+        tags = list(tags)
+        placeholders = ", ".join("?" * len(tags))
+        with self._lock:
+            conn = self._connection()
+            keys = [
+                row[0] for row in conn.execute(
+                    f"SELECT DISTINCT key FROM dependencies WHERE tag IN ({placeholders})", tags
+                ).fetchall()
+            ]
+            if not keys:
+                return 0
+            
+            count = self._delete_keys(keys)
+        
+        deleted = set(keys)
+        for query in [q for q, k in self._query_keys.items() if k in deleted]:
+            del self._query_keys[query]
+        return count
     
     def invalidate_by_age(self, max_age_hours: int) -> int:
         """
@@ -200,16 +347,7 @@ class QueryCache(BaseCache[Any]):
         Returns:
             Number of entries invalidated
         """
-        count = 0
-        cutoff = datetime.now()
-        
-        for key, meta in list(self._metadata.items()):
-            created = datetime.fromisoformat(meta.get('created', '1970-01-01'))
-            age_hours = (cutoff - created).total_seconds() / 3600
-            
-            if age_hours > max_age_hours:
-                self.delete(key)
-                count += 1
+        count = self.delete_older_than(max_age_hours)
         
         logger.info(f"Invalidated {count} queries older than {max_age_hours} hours")
         return count
@@ -0,0 +1,414 @@
+"""
+Semantic query cache.
+
+Exact-key caches (QueryCache, the search orchestrator cache) miss whenever a
+question is phrased differently: "What was revenue in Q1 2025?" and
+"Q1 2025 revenue?" hash to different keys. ``SemanticQueryCache`` embeds the
+query and looks for a cached query whose embedding is within a cosine
+similarity threshold, among entries with exactly the same filters, top_k,
+namespace (e.g. the search strategy) and period/number terms. Queries that
+differ only in a quarter, year, date or figure ("revenue in Q1 2025" vs
+"revenue in Q2 2025") embed almost identically, so those terms are matched
+exactly rather than by similarity.
+
+Entries live in memory: one small FAISS inner-product index per scope, with
+LRU eviction, a TTL, and invalidation either per source document/table
+(through a reverse dependency index) or wholesale when the vector index
+generation changes.
+"""
+
+import copy
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Set
+
+import numpy as np
+
+from src.infrastructure.cache.base import CacheStats
+from src.infrastructure.cache.query_cache import (
+    ANY_SOURCE,
+    collect_dependencies,
+    source_tag,
+    table_tag,
+)
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+_ORDINAL_QUARTERS = {'first': 'q1', 'second': 'q2', 'third': 'q3', 'fourth': 'q4'}
+
+# Quarters (Q1, 1Q25, first quarter), months, and numbers (years, days, figures)
+_PERIOD_TERM_PATTERN = re.compile(
+    r"\b(?:q([1-4])|([1-4])q(\d{2,4})?|(first|second|third|fourth)\s+quarter"
+    r"|(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t|tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b"
+    r"|(\d[\d,]*(?:\.\d+)?%?))",
+    re.IGNORECASE,
+)
+
+
+def period_terms(query: str) -> tuple:
+    """
+    Period and number terms of a query, normalized and sorted.
+
+    Example:
+        >>> period_terms("What was revenue in the first quarter of 2025?")
+        ('2025', 'q1')
+    """
+    terms = set()
+    for match in _PERIOD_TERM_PATTERN.finditer(query):
+        quarter, short_quarter, short_year, ordinal, month, number = match.groups()
+        if quarter or short_quarter:
+            terms.add(f"q{quarter or short_quarter}")
+            if short_year:
+                terms.add(short_year if len(short_year) == 4 else f"20{short_year}")
+        elif ordinal:
+            terms.add(_ORDINAL_QUARTERS[ordinal.lower()])
+        elif month:
+            terms.add(month.lower()[:3])
+        elif number:
+            terms.add(number.replace(',', '').rstrip('.'))
+    return tuple(sorted(terms))
+
+
+@dataclass
+class _Entry:
+    """One cached response."""
+
+    entry_id: int
+    scope: str
+    query: str
+    value: Any
+    expires: Optional[float]
+    dependencies: Set[str]
+
+
+class _ScopeIndex:
+    """Inner-product index over the cached queries of one scope."""
+
+    def __init__(self, dimension: int):
+        import faiss
+
+        self.index = faiss.IndexIDMap2(faiss.IndexFlatIP(dimension))
+
+    def add(self, entry_id: int, vector: np.ndarray) -> None:
+        self.index.add_with_ids(vector.reshape(1, -1), np.array([entry_id], dtype='int64'))
+
+    def remove(self, entry_id: int) -> None:
+        self.index.remove_ids(np.array([entry_id], dtype='int64'))
+
+    def search(self, vector: np.ndarray, k: int):
+        k = min(k, self.index.ntotal)
+        if k == 0:
+            return []
+        scores, ids = self.index.search(vector.reshape(1, -1), k)
+        return [(int(i), float(s)) for i, s in zip(ids[0], scores[0]) if i >= 0]
+
+    def __len__(self) -> int:
+        return self.index.ntotal
+
+
+class SemanticQueryCache:
+    """
+    In-memory cache of query results, matched by embedding similarity.
+
+    Example:
+        >>> cache = SemanticQueryCache(embed_fn=embeddings.embed_query, threshold=0.95)
+        >>> response = cache.lookup("Q1 2025 revenue?", filters={"year": 2025})
+        >>> if response is None:
+        ...     response = rag.query("What was revenue in Q1 2025?", filters={"year": 2025})
+        ...     cache.store("What was revenue in Q1 2025?", response, filters={"year": 2025})
+
+    Attributes:
+        threshold: Minimum cosine similarity for a hit
+        max_entries: Entries kept before least-recently-used eviction
+        ttl_seconds: Entry lifetime (None = no expiry)
+    """
+
+    # Nearest neighbours examined per lookup (skips expired entries)
+    CANDIDATES = 4
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl_seconds: Optional[float] = 3600,
+        generation_fn: Optional[Callable[[], Any]] = None,
+        enabled: bool = True,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embed_fn: Embeds a query text
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Max entries before LRU eviction
+            ttl_seconds: Entry lifetime in seconds (None = never expires)
+            generation_fn: Returns the vector index generation; all entries
+                are dropped when it changes
+            enabled: Enable/disable caching
+        """
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.generation_fn = generation_fn
+        self.enabled = enabled
+        self.stats = CacheStats()
+
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._scopes: Dict[str, _ScopeIndex] = {}
+        # Reverse index: dependency tag -> entry ids
+        self._dependents: Dict[str, Set[int]] = {}
+        self._next_id = 0
+        self._generation = self._current_generation()
+        # Recent query vectors, so a lookup followed by a store embeds once
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    # =========================================================================
+    # Core Operations
+    # =========================================================================
+
+    def lookup(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 5,
+        namespace: str = "",
+        vector: Optional[Sequence[float]] = None,
+    ) -> Optional[Any]:
+        """
+        Find a cached result for a similar query with the same scope.
+
+        Args:
+            query: Query text (its period/number terms must match exactly)
+            filters: Metadata filters (must match exactly)
+            top_k: Number of results (must match exactly)
+            namespace: Extra scope, e.g. the search strategy
+            vector: Precomputed query embedding (skips embedding)
+
+        Returns:
+            Copy of the cached value, or None
+        """
+        if not self.enabled:
+            return None
+
+        query_vector = self._query_vector(query, vector)
+        scope = self._scope_key(query, filters, top_k, namespace)
+
+        with self._lock:
+            self._check_generation()
+            index = self._scopes.get(scope)
+            if index is not None:
+                now = time.monotonic()
+                for entry_id, score in index.search(query_vector, self.CANDIDATES):
+                    if score < self.threshold:
+                        break
+                    entry = self._entries[entry_id]
+                    if entry.expires is not None and entry.expires <= now:
+                        self._remove(entry_id)
+                        continue
+                    self._entries.move_to_end(entry_id)
+                    self.stats.hits += 1
+                    logger.info(
+                        f"Semantic cache hit ({score:.3f}): '{query[:50]}' ~ '{entry.query[:50]}'"
+                    )
+                    return copy.deepcopy(entry.value)
+
+            self.stats.misses += 1
+            return None
+
+    def store(
+        self,
+        query: str,
+        value: Any,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 5,
+        namespace: str = "",
+        vector: Optional[Sequence[float]] = None,
+        dependencies: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Cache a result for a query.
+
+        Args:
+            query: Query text
+            value: Result to cache (e.g. RAGResponse or List[SearchResult])
+            filters: Metadata filters
+            top_k: Number of results
+            namespace: Extra scope, e.g. the search strategy
+            vector: Precomputed query embedding (skips embedding)
+            dependencies: Source/table tags the result depends on
+                (default: collected from the value)
+        """
+        if not self.enabled:
+            return
+
+        query_vector = self._query_vector(query, vector)
+        scope = self._scope_key(query, filters, top_k, namespace)
+        expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        tags = set(dependencies) if dependencies is not None else collect_dependencies(value)
+
+        with self._lock:
+            self._check_generation()
+            # Replace a near-identical entry instead of stacking duplicates
+            index = self._scopes.get(scope)
+            if index is not None:
+                for entry_id, score in index.search(query_vector, 1):
+                    if score >= 0.9999:
+                        self._remove(entry_id)
+
+            index = self._scopes.get(scope)
+            if index is None:
+                index = self._scopes[scope] = _ScopeIndex(len(query_vector))
+
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = _Entry(entry_id, scope, query, copy.deepcopy(value), expires, tags)
+            index.add(entry_id, query_vector)
+            for tag in tags:
+                self._dependents.setdefault(tag, set()).add(entry_id)
+
+            while self.max_entries and len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def invalidate_by_source(self, source_doc: str) -> int:
+        """
+        Drop entries whose results used a source document (and entries
+        that recorded no sources).
+
+        Returns:
+            Number of entries removed
+        """
+        return self._invalidate_tags([source_tag(source_doc), ANY_SOURCE])
+
+    def invalidate_by_table(self, table_id: str) -> int:
+        """
+        Drop entries whose results used a table.
+
+        Returns:
+            Number of entries removed
+        """
+        return self._invalidate_tags([table_tag(table_id)])
+
+    def invalidate_query(self, query: str) -> int:
+        """
+        Drop entries cached for a query text (case-insensitive, all scopes).
+
+        Returns:
+            Number of entries removed
+        """
+        query_lower = query.strip().lower()
+        with self._lock:
+            matches = [e.entry_id for e in self._entries.values() if e.query.strip().lower() == query_lower]
+            for entry_id in matches:
+                self._remove(entry_id)
+        return len(matches)
+
+    def clear(self) -> int:
+        """Drop all entries."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._scopes.clear()
+            self._dependents.clear()
+        if count:
+            logger.info(f"Semantic cache cleared {count} entries")
+        return count
+
+    def get_stats(self) -> CacheStats:
+        """Get cache statistics."""
+        with self._lock:
+            self.stats.total_entries = len(self._entries)
+        return self.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _query_vector(self, query: str, vector: Optional[Sequence[float]]) -> np.ndarray:
+        """Normalized float32 embedding of the query (memoized briefly)."""
+        if vector is None:
+            with self._lock:
+                cached = self._vectors.get(query)
+            if cached is not None:
+                return cached
+            vector = self.embed_fn(query)
+
+        arr = np.asarray(vector, dtype='float32').ravel()
+        norm = np.linalg.norm(arr)
+        if norm > 0:
+            arr = arr / norm
+
+        with self._lock:
+            self._vectors[query] = arr
+            self._vectors.move_to_end(query)
+            while len(self._vectors) > 64:
+                self._vectors.popitem(last=False)
+        return arr
+
+    @staticmethod
+    def _scope_key(query: str, filters: Optional[Dict[str, Any]], top_k: int, namespace: str) -> str:
+        """Exact-match part of the key: namespace, filters, top_k and period terms."""
+        filters_str = json.dumps(filters or {}, sort_keys=True, default=str)
+        return f"{namespace}|{filters_str}|{top_k}|{','.join(period_terms(query))}"
+
+    def _current_generation(self) -> Any:
+        if self.generation_fn is None:
+            return None
+        try:
+            return self.generation_fn()
+        except Exception as e:
+            logger.debug(f"Could not read index generation: {e}")
+            return None
+
+    def _check_generation(self) -> None:
+        """Drop every entry if the vector index changed. Caller holds the lock."""
+        generation = self._current_generation()
+        if generation != self._generation:
+            if self._entries:
+                logger.info(
+                    f"Vector index generation changed ({self._generation} -> {generation}); "
+                    f"dropping {len(self._entries)} semantic cache entries"
+                )
+            self._entries.clear()
+            self._scopes.clear()
+            self._dependents.clear()
+            self._generation = generation
+
+    def _invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Remove every entry that depends on any of the tags."""
+        with self._lock:
+            entry_ids = set()
+            for tag in tags:
+                entry_ids |= self._dependents.get(tag, set())
+            for entry_id in entry_ids:
+                self._remove(entry_id)
+        return len(entry_ids)
+
+    def _remove(self, entry_id: int) -> None:
+        """Remove one entry. Caller holds the lock."""
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        for tag in entry.dependencies:
+            dependents = self._dependents.get(tag)
+            if dependents is not None:
+                dependents.discard(entry_id)
+                if not dependents:
+                    del self._dependents[tag]
+        index = self._scopes.get(entry.scope)
+        if index is not None:
+            index.remove(entry_id)
+            if not len(index):
+                del self._scopes[entry.scope]
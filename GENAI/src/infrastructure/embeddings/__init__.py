@@ -28,8 +28,9 @@ from src.infrastructure.embeddings.manager import (
     get_embedding_manager,
     reset_embedding_manager,
 )
-from src.infrastructure.embeddings.langchain_wrapper import CustomLangChainEmbeddings
+from src.infrastructure.embeddings.langchain_wrapper import CustomLangChainEmbeddings, CachedEmbeddings
 from src.infrastructure.embeddings.multi_level import MultiLevelEmbeddingGenerator
+from src.infrastructure.embeddings.query_memo import QueryEmbeddingMemo
 
 __version__ = "2.1.0"
 
@@ -40,6 +41,9 @@ __all__ = [
     'reset_embedding_manager',
     # Wrappers
     'CustomLangChainEmbeddings',
+    'CachedEmbeddings',
     # Multi-level
     'MultiLevelEmbeddingGenerator',
+    # Per-request memo
+    'QueryEmbeddingMemo',
 ]
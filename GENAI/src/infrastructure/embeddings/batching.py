@@ -0,0 +1,172 @@
+"""
+Batched, concurrent embedding of many texts.
+
+Groups texts into batches bounded by both a text count and an estimated
+token budget, dispatches the batches through a thread pool with a bounded
+number of in-flight requests, retries failed batches with exponential
+backoff, and returns the vectors in input order.
+
+Example:
+    >>> from src.infrastructure.embeddings import get_embedding_manager
+    >>> from src.infrastructure.embeddings.batching import BatchEmbedder
+    >>>
+    >>> embedder = BatchEmbedder(get_embedding_manager().embed_documents)
+    >>> vectors = embedder.embed(texts)    # vectors[i] belongs to texts[i]
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from config.settings import settings
+from src.utils import get_logger
+from src.utils.retry import RetryConfig, retry
+
+logger = get_logger(__name__)
+
+# Rough characters-per-token ratio for sizing batches without a tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for batch sizing."""
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def make_batches(
+    texts: Sequence[str],
+    max_batch_size: int,
+    max_tokens: int,
+) -> Iterator[List[int]]:
+    """
+    Split texts into consecutive batches of indices.
+
+    A batch is closed when adding the next text would exceed either
+    ``max_batch_size`` texts or ``max_tokens`` estimated tokens. A single
+    text larger than the budget still gets a batch of its own.
+
+    Args:
+        texts: Texts to batch
+        max_batch_size: Maximum texts per batch
+        max_tokens: Maximum estimated tokens per batch
+
+    Yields:
+        Lists of indices into ``texts``
+    """
+    batch: List[int] = []
+    batch_tokens = 0
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if batch and (len(batch) >= max_batch_size or batch_tokens + tokens > max_tokens):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(i)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+
+class BatchEmbedder:
+    """
+    Embed texts in token-budgeted batches over a bounded thread pool.
+
+    Attributes:
+        batch_size: Maximum texts per request
+        max_tokens: Maximum estimated tokens per request
+        max_workers: Concurrent requests (1 = serial, no thread pool)
+        retry_config: Backoff policy applied to each batch
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[List[str]], List[List[float]]],
+        batch_size: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        retry_config: Optional[RetryConfig] = None,
+    ):
+        """
+        Initialize batch embedder.
+
+        Args:
+            embed_fn: Batch embedding callable, e.g. ``EmbeddingManager.embed_documents``
+            batch_size: Texts per batch (default: settings.EMBEDDING_BATCH_SIZE)
+            max_tokens: Token budget per batch (default: settings.EMBEDDING_BATCH_MAX_TOKENS)
+            max_workers: Concurrent batches (default: settings.EMBEDDING_MAX_CONCURRENCY)
+            retry_config: Retry policy (default: settings.EMBEDDING_MAX_RETRIES attempts
+                with settings.EMBEDDING_RETRY_DELAY initial delay)
+        """
+        self.embed_fn = embed_fn
+        self.batch_size = max(1, batch_size or settings.EMBEDDING_BATCH_SIZE)
+        self.max_tokens = max(1, max_tokens or settings.EMBEDDING_BATCH_MAX_TOKENS)
+        self.max_workers = max(1, max_workers or settings.EMBEDDING_MAX_CONCURRENCY)
+        self.retry_config = retry_config or RetryConfig(
+            max_attempts=settings.EMBEDDING_MAX_RETRIES,
+            delay=settings.EMBEDDING_RETRY_DELAY,
+        )
+        self._embed_batch = retry(config=self.retry_config)(self._call)
+
+    def _call(self, texts: List[str]) -> List[List[float]]:
+        vectors = self.embed_fn(texts)
+        if len(vectors) != len(texts):
+            raise ValueError(
+                f"Embedding backend returned {len(vectors)} vectors for {len(texts)} texts"
+            )
+        return vectors
+
+    def embed(
+        self,
+        texts: Sequence[str],
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> List[List[float]]:
+        """
+        Embed all texts, preserving input order.
+
+        At most ``2 * max_workers`` batches are in flight at once, so memory
+        stays bounded for very large inputs.
+
+        Args:
+            texts: Texts to embed
+            on_progress: Called with the number of texts in each finished batch
+
+        Returns:
+            One vector per input text, in input order
+
+        Raises:
+            Exception: The last error of a batch that failed every retry
+        """
+        texts = list(texts)
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        batches = make_batches(texts, self.batch_size, self.max_tokens)
+
+        def store(indices: List[int], vectors: List[List[float]]) -> None:
+            for idx, vector in zip(indices, vectors):
+                results[idx] = vector
+            if on_progress:
+                on_progress(len(indices))
+
+        if self.max_workers == 1:
+            for indices in batches:
+                store(indices, self._embed_batch([texts[i] for i in indices]))
+            return results
+
+        max_in_flight = self.max_workers * 2
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="embed") as pool:
+            pending = {}
+            try:
+                for indices in batches:
+                    if len(pending) >= max_in_flight:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            store(pending.pop(future), future.result())
+                    future = pool.submit(self._embed_batch, [texts[i] for i in indices])
+                    pending[future] = indices
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        store(pending.pop(future), future.result())
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        logger.debug(f"Embedded {len(texts)} texts with {self.max_workers} workers")
+        return results
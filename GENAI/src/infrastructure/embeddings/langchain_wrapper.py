@@ -5,7 +5,7 @@ Provides adapter classes to make custom API providers compatible with
 LangChain's Embeddings interface.
 """
 
-from typing import List
+from typing import Callable, Dict, List
 
 from langchain_core.embeddings import Embeddings
 
@@ -60,3 +60,105 @@ class CustomLangChainEmbeddings(Embeddings):
             Embedding vector
         """
         return self.provider.generate_embedding(text)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Read-through text embedding cache in front of any LangChain Embeddings.
+    
+    Only texts missing from the cache are sent to the wrapped model, in a
+    single call per batch (duplicates within a call are embedded once).
+    Queries are always embedded with the model's query method, so models
+    that prompt queries differently never get document vectors back.
+    
+    Example:
+        >>> from src.infrastructure.cache import TextEmbeddingCache
+        >>> cache = TextEmbeddingCache(model="all-MiniLM-L6-v2", dimension=384)
+        >>> embeddings = CachedEmbeddings(HuggingFaceEmbeddings(...), cache)
+        >>> embeddings.embed_documents(texts)
+    """
+    
+    def __init__(self, embeddings: Embeddings, cache):
+        """
+        Initialize the wrapper.
+        
+        Args:
+            embeddings: Wrapped LangChain embeddings
+            cache: TextEmbeddingCache instance
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed documents, serving cached vectors where available.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            List of embedding vectors, in input order
+        """
+        return self._embed_many(texts, "document", self.embeddings.embed_documents)
+    
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several queries, cached under the query namespace.
+        
+        Misses go to the wrapped model's embed_queries when it has one,
+        otherwise to embed_query one text at a time.
+        
+        Args:
+            texts: Query texts
+            
+        Returns:
+            List of embedding vectors, in input order
+        """
+        return self._embed_many(texts, "query", self._embed_uncached_queries)
+    
+    def _embed_uncached_queries(self, texts: List[str]) -> List[List[float]]:
+        if hasattr(self.embeddings, 'embed_queries'):
+            return self.embeddings.embed_queries(texts)
+        return [self.embeddings.embed_query(text) for text in texts]
+    
+    def _embed_many(
+        self,
+        texts: List[str],
+        kind: str,
+        embed: Callable[[List[str]], List[List[float]]]
+    ) -> List[List[float]]:
+        """Embed only cache misses, each distinct text once."""
+        texts = list(texts)
+        found = self.cache.get_many(texts, kind=kind)
+        if len(found) == len(texts):
+            return [found[i] for i in range(len(texts))]
+        
+        # Embed each distinct missing text once
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if i not in found:
+                missing.setdefault(self.cache.normalize(text), []).append(i)
+        originals = [texts[positions[0]] for positions in missing.values()]
+        vectors = embed(originals)
+        self.cache.set_many(originals, vectors, kind=kind)
+        
+        for positions, vector in zip(missing.values(), vectors):
+            for i in positions:
+                found[i] = vector
+        return [found[i] for i in range(len(texts))]
+    
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Embed a query, serving a cached vector if available.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Embedding vector
+        """
+        vector = self.cache.get(text, kind="query")
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self.cache.set(text, vector, kind="query")
+        return vector
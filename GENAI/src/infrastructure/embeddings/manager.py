@@ -21,6 +21,7 @@ from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from langchain_core.embeddings import Embeddings
 
 from config.settings import settings
+from src.infrastructure.embeddings.langchain_wrapper import CachedEmbeddings
 from src.utils import get_logger
 
 logger = get_logger(__name__)
@@ -57,6 +58,8 @@ class EmbeddingManager:
         model_name: Optional[str] = None, 
         device: str = "cpu",
         provider: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        cache_path: Optional[str] = None,
     ):
         """
         Initialize embedding manager.
@@ -65,14 +68,23 @@ class EmbeddingManager:
             model_name: Model name (uses settings default if not provided)
             device: Device to run on (cpu/cuda)
             provider: Override provider type (uses settings default if not provided)
+            use_cache: Enable the per-text embedding cache (default: settings.EMBEDDING_CACHE_ENABLED)
+            cache_path: SQLite file for the cache (default: data/cache/embeddings/)
         """
         self.provider_type = provider or settings.EMBEDDING_PROVIDER
         self.device = device
         self._cached_dimension: Optional[int] = None
         self._model: Optional[Embeddings] = None
+        self._cache = None
         
         # Initialize based on provider type
         self._initialize_provider(model_name)
+        
+        if settings.EMBEDDING_CACHE_ENABLED if use_cache is None else use_cache:
+            self._init_cache(cache_path)
+        self._embedder: Embeddings = (
+            CachedEmbeddings(self._model, self._cache) if self._cache else self._model
+        )
     
     def _initialize_provider(self, model_name: Optional[str]) -> None:
         """
@@ -89,6 +101,22 @@ class EmbeddingManager:
             # Default to Local (HuggingFace)
             self._init_local(model_name)
     
+    def _init_cache(self, cache_path: Optional[str]) -> None:
+        """Initialize the content-addressed text embedding cache."""
+        from src.infrastructure.cache.embedding_cache import TextEmbeddingCache
+        
+        try:
+            self._cache = TextEmbeddingCache(
+                model=f"{self.provider_type}:{self.model_name}",
+                dimension=settings.EMBEDDING_DIMENSION,
+                path=cache_path,
+                dtype=settings.EMBEDDING_CACHE_DTYPE,
+                max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES or None,
+            )
+        except Exception as e:
+            logger.warning(f"Embedding cache unavailable, continuing without it: {e}")
+            self._cache = None
+    
     def _init_custom(self, model_name: Optional[str]) -> None:
         """Initialize Custom API provider."""
         self.model_name = model_name or settings.EB_MODEL
@@ -175,7 +203,7 @@ class EmbeddingManager:
         Returns:
             List of embedding vectors
         """
-        embeddings = self._model.embed_documents(texts)
+        embeddings = self._embedder.embed_documents(texts)
         # Cache dimension from first embedding
         if embeddings and self._cached_dimension is None:
             self._cached_dimension = len(embeddings[0])
@@ -192,13 +220,32 @@ class EmbeddingManager:
         Returns:
             Embedding vector
         """
-        embedding = self._model.embed_query(text)
+        embedding = self._embedder.embed_query(text)
         # Cache dimension from embedding
         if embedding and self._cached_dimension is None:
             self._cached_dimension = len(embedding)
             logger.info(f"Auto-detected embedding dimension: {self._cached_dimension}")
         return embedding
     
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several query texts.
+        
+        With the embedding cache enabled, cached vectors are served and
+        misses are embedded as queries under the query namespace. Without
+        it this is a single embed_documents request; the configured
+        providers embed queries and documents the same way.
+        
+        Args:
+            texts: Query texts
+            
+        Returns:
+            List of embedding vectors, in input order
+        """
+        if hasattr(self._embedder, 'embed_queries'):
+            return self._embedder.embed_queries(texts)
+        return self.embed_documents(texts)
+    
     # Protocol compliance aliases
     def embed(self, text: str) -> List[float]:
         """Embed single text (implements EmbeddingProvider protocol)."""
@@ -283,9 +330,20 @@ class EmbeddingManager:
         """
         Return LangChain-compatible embeddings object.
         
-        For VectorDB compatibility.
+        For VectorDB compatibility. Includes the text embedding cache when enabled.
+        """
+        return self._embedder
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get text embedding cache statistics (hits, misses, hit rate, size).
+        
+        Returns:
+            Dict of cache stats, or {"enabled": False} if caching is off
         """
-        return self._model
+        if self._cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._cache.get_stats().to_dict()}
     
     def get_model_name(self) -> str:
         """Get the model name."""
@@ -1,32 +1,78 @@
 """
 Multi-level embedding generator for financial tables.
 Creates embeddings at table, row, and cell levels with complete metadata.
+
+All texts of a table are built first (cells are grouped by row once, so
+row texts cost O(rows + cells)), then embedded in large batches through
+``EmbeddingManager.embed_documents``, whose persistent per-text cache
+skips texts embedded before. Results are produced in bounded batches that
+can be written to the vector store as they are ready.
+
+Example:
+    >>> generator = get_embedding_generator()
+    >>> for batch in generator.iter_document_embeddings(document, levels=["row", "cell"]):
+    ...     print(len(batch))
+    >>> generator.store_document_embeddings(document, levels=["table", "row", "cell"])
 """
 
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
-import hashlib
+
+from config.settings import settings
 from src.domain.tables import (
-    EnhancedFinancialTable, EnhancedDocument, RowHeader, 
+    EnhancedFinancialTable, EnhancedDocument, RowHeader,
     ColumnHeader, DataCell
 )
+from src.infrastructure.embeddings.batching import BatchEmbedder
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+# (id, text, metadata) of an embedding that has not been computed yet
+_Item = Tuple[str, str, Dict[str, Any]]
+
+
+@dataclass
+class EmbeddedChunk:
+    """Generated embedding in the chunk shape accepted by the vector stores."""
+    chunk_id: str
+    content: str
+    metadata: Dict[str, Any]
+    embedding: List[float]
 
 
 class MultiLevelEmbeddingGenerator:
     """Generate embeddings at table, row, and cell levels."""
     
-    def __init__(self, embedding_model=None):
+    def __init__(self, embedding_model=None, batch_size: Optional[int] = None):
         """
         Initialize with embedding model.
         
         Args:
-            embedding_model: Model for generating embeddings (sentence-transformers, OpenAI, etc.)
+            embedding_model: Object with ``embed_documents`` (default: the
+                global EmbeddingManager) or a sentence-transformers model
+            batch_size: Items embedded and yielded per batch
+                (default: settings.MULTI_LEVEL_EMBED_BATCH_SIZE)
         """
-        self.embedding_model = embedding_model
-        self.embedding_cache = {}
+        self._embedding_model = embedding_model
+        self.batch_size = max(1, batch_size or settings.MULTI_LEVEL_EMBED_BATCH_SIZE)
+    
+    @property
+    def embedding_model(self):
+        """Embedding model (lazy: the global EmbeddingManager by default)."""
+        if self._embedding_model is None:
+            from src.infrastructure.embeddings.manager import get_embedding_manager
+            self._embedding_model = get_embedding_manager()
+        return self._embedding_model
+    
+    @embedding_model.setter
+    def embedding_model(self, model):
+        self._embedding_model = model
     
     def generate_document_embeddings(
-        self, 
+        self,
         document: EnhancedDocument,
         levels: List[str] = ["table", "row"]
     ) -> List[Dict[str, Any]]:
@@ -41,24 +87,81 @@ class MultiLevelEmbeddingGenerator:
             List of embedding objects with text, vector, and metadata
         """
         all_embeddings = []
+        for batch in self.iter_document_embeddings(document, levels):
+            all_embeddings.extend(batch)
+        return all_embeddings
+    
+    def iter_document_embeddings(
+        self,
+        document: EnhancedDocument,
+        levels: List[str] = ["table", "row"],
+        batch_size: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Generate embeddings for a document in bounded batches.
         
-        for table in document.tables:
-            if "table" in levels:
-                table_embeddings = self.generate_table_level_embeddings(table, document.metadata)
-                all_embeddings.extend(table_embeddings)
-            
-            if "row" in levels:
-                row_embeddings = self.generate_row_level_embeddings(table, document.metadata)
-                all_embeddings.extend(row_embeddings)
-            
-            if "cell" in levels:
-                cell_embeddings = self.generate_cell_level_embeddings(table, document.metadata)
-                all_embeddings.extend(cell_embeddings)
+        Only one batch of texts and vectors is held at a time, so documents
+        with many cell-level items do not have to fit in memory at once.
         
-        return all_embeddings
+        Args:
+            document: Enhanced document with tables
+            levels: Which levels to generate ("table", "row", "cell")
+            batch_size: Items per batch (default: self.batch_size)
+        
+        Yields:
+            Lists of embedding objects, in table/row/cell order per table
+        """
+        batch_size = batch_size or self.batch_size
+        batch: List[_Item] = []
+        for item in self._iter_items(document, levels):
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield self._embed_items(batch)
+                batch = []
+        if batch:
+            yield self._embed_items(batch)
+    
+    def store_document_embeddings(
+        self,
+        document: EnhancedDocument,
+        vector_store: Any = None,
+        levels: List[str] = ["table", "row"],
+        batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Generate embeddings and write them to the vector store batch by batch.
+        
+        Writes are upserts keyed by the deterministic embedding IDs, inside
+        one ``bulk_load()`` session so the store persists once at the end.
+        
+        Args:
+            document: Enhanced document with tables
+            vector_store: VectorDBManager (default: the global manager)
+            levels: Which levels to generate ("table", "row", "cell")
+            batch_size: Items per batch (default: self.batch_size)
+        
+        Returns:
+            Number of embeddings written
+        """
+        if vector_store is None:
+            from src.infrastructure.vectordb import get_vectordb_manager
+            vector_store = get_vectordb_manager()
+        
+        written = 0
+        with vector_store.bulk_load():
+            for batch in self.iter_document_embeddings(document, levels, batch_size):
+                written += vector_store.upsert_chunks(
+                    [
+                        EmbeddedChunk(e["id"], e["text"], e["metadata"], e["vector"])
+                        for e in batch
+                    ],
+                    show_progress=False
+                )
+        logger.info(f"Stored {written} multi-level embeddings ({', '.join(levels)})")
+        return written
     
     def generate_table_level_embeddings(
-        self, 
+        self,
         table: EnhancedFinancialTable,
         doc_metadata: Any
     ) -> List[Dict[str, Any]]:
@@ -68,6 +171,59 @@ class MultiLevelEmbeddingGenerator:
         Level 1: Entire table summarized
         Use case: "Find all income statements for Q1 2025"
         """
+        table_metadata = self._build_table_metadata(table, doc_metadata)
+        return self._embed_items(list(self._table_items(table, doc_metadata, table_metadata)))
+    
+    def generate_row_level_embeddings(
+        self,
+        table: EnhancedFinancialTable,
+        doc_metadata: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate row-level embeddings.
+        
+        Level 2: Individual row/line item
+        Use case: "Show me net revenues across all documents"
+        """
+        table_metadata = self._build_table_metadata(table, doc_metadata)
+        return self._embed_items(list(self._row_items(table, doc_metadata, table_metadata)))
+    
+    def generate_cell_level_embeddings(
+        self,
+        table: EnhancedFinancialTable,
+        doc_metadata: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate cell-level embeddings.
+        
+        Level 3: Individual cell value
+        Use case: "Find all values greater than $1 billion in Q1 2025"
+        """
+        table_metadata = self._build_table_metadata(table, doc_metadata)
+        return self._embed_items(list(self._cell_items(table, doc_metadata, table_metadata)))
+    
+    def _iter_items(self, document: EnhancedDocument, levels: List[str]) -> Iterator[_Item]:
+        """Texts and metadata for every requested level, table by table."""
+        for table in document.tables:
+            # Table metadata is shared (copied) by all rows and cells
+            table_metadata = self._build_table_metadata(table, document.metadata)
+            
+            if "table" in levels:
+                yield from self._table_items(table, document.metadata, table_metadata)
+            
+            if "row" in levels:
+                yield from self._row_items(table, document.metadata, table_metadata)
+            
+            if "cell" in levels:
+                yield from self._cell_items(table, document.metadata, table_metadata)
+    
+    def _table_items(
+        self,
+        table: EnhancedFinancialTable,
+        doc_metadata: Any,
+        table_metadata: Dict[str, Any]
+    ) -> Iterator[_Item]:
+        """Table-level text and metadata."""
         # Build comprehensive text representation
         text_parts = []
         
@@ -99,33 +255,23 @@ class MultiLevelEmbeddingGenerator:
         
         text = "\n".join(text_parts)
         
-        # Generate embedding
-        vector = self._get_embedding(text)
-        
-        # Build metadata
-        metadata = self._build_table_metadata(table, doc_metadata)
+        metadata = dict(table_metadata)
         metadata["embedding_level"] = "table"
         metadata["text_content"] = text
         
-        return [{
-            "id": f"{doc_metadata.file_hash}_{table.table_id}_table",
-            "text": text,
-            "vector": vector,
-            "metadata": metadata
-        }]
+        yield f"{doc_metadata.file_hash}_{table.table_id}_table", text, metadata
     
-    def generate_row_level_embeddings(
+    def _row_items(
         self,
         table: EnhancedFinancialTable,
-        doc_metadata: Any
-    ) -> List[Dict[str, Any]]:
-        """
-        Generate row-level embeddings.
-        
-        Level 2: Individual row/line item
-        Use case: "Show me net revenues across all documents"
-        """
-        embeddings = []
+        doc_metadata: Any,
+        table_metadata: Dict[str, Any]
+    ) -> Iterator[_Item]:
+        """Row-level texts and metadata."""
+        # Group cells by row once instead of scanning all cells per row
+        cells_by_row: Dict[str, List[DataCell]] = defaultdict(list)
+        for cell in table.data_cells:
+            cells_by_row[cell.row_header].append(cell)
         
         for row_header in table.row_headers:
             # Build text representation
@@ -152,7 +298,7 @@ class MultiLevelEmbeddingGenerator:
                 text_parts.append(f"Indent Level: {row_header.indent_level}")
             
             # Values across periods
-            row_cells = [cell for cell in table.data_cells if cell.row_header == row_header.text]
+            row_cells = cells_by_row.get(row_header.text, [])
             if row_cells:
                 value_strs = []
                 for cell in row_cells:
@@ -169,35 +315,21 @@ class MultiLevelEmbeddingGenerator:
             
             text = "\n".join(text_parts)
             
-            # Generate embedding
-            vector = self._get_embedding(text)
-            
-            # Build metadata
-            metadata = self._build_row_metadata(table, doc_metadata, row_header)
+            metadata = self._build_row_metadata(table, doc_metadata, row_header, table_metadata)
             metadata["embedding_level"] = "row"
             metadata["text_content"] = text
             
-            embeddings.append({
-                "id": f"{doc_metadata.file_hash}_{table.table_id}_row_{row_header.row_index}",
-                "text": text,
-                "vector": vector,
-                "metadata": metadata
-            })
-        
-        return embeddings
+            yield f"{doc_metadata.file_hash}_{table.table_id}_row_{row_header.row_index}", text, metadata
     
-    def generate_cell_level_embeddings(
+    def _cell_items(
         self,
         table: EnhancedFinancialTable,
-        doc_metadata: Any
-    ) -> List[Dict[str, Any]]:
-        """
-        Generate cell-level embeddings.
-        
-        Level 3: Individual cell value
-        Use case: "Find all values greater than $1 billion in Q1 2025"
-        """
-        embeddings = []
+        doc_metadata: Any,
+        table_metadata: Dict[str, Any]
+    ) -> Iterator[_Item]:
+        """Cell-level texts and metadata."""
+        # Period lookup once per distinct column header
+        period_by_column: Dict[str, Any] = {}
         
         for cell in table.data_cells:
             # Skip empty cells
@@ -225,7 +357,11 @@ class MultiLevelEmbeddingGenerator:
                 text_parts.append(f"Base Value: ${cell.base_value:,.0f}")
             
             # Period
-            matching_period = next((p for p in table.periods if p.display_label in cell.column_header), None)
+            if cell.column_header not in period_by_column:
+                period_by_column[cell.column_header] = next(
+                    (p for p in table.periods if p.display_label in cell.column_header), None
+                )
+            matching_period = period_by_column[cell.column_header]
             if matching_period:
                 text_parts.append(f"Period: {matching_period.display_label}")
             
@@ -234,52 +370,46 @@ class MultiLevelEmbeddingGenerator:
             
             text = "\n".join(text_parts)
             
-            # Generate embedding
-            vector = self._get_embedding(text)
-            
-            # Build metadata
-            metadata = self._build_cell_metadata(table, doc_metadata, cell)
+            metadata = self._build_cell_metadata(table, doc_metadata, cell, table_metadata)
             metadata["embedding_level"] = "cell"
             metadata["text_content"] = text
             
-            embeddings.append({
-                "id": f"{doc_metadata.file_hash}_{table.table_id}_cell_{cell.row_index}_{cell.column_index}",
-                "text": text,
-                "vector": vector,
-                "metadata": metadata
-            })
-        
-        return embeddings
+            yield f"{doc_metadata.file_hash}_{table.table_id}_cell_{cell.row_index}_{cell.column_index}", text, metadata
+    
+    def _embed_items(self, items: List[_Item]) -> List[Dict[str, Any]]:
+        """Embed a batch of items in one pass and attach the vectors."""
+        vectors = self._embed_texts([text for _, text, _ in items])
+        return [
+            {"id": item_id, "text": text, "vector": vector, "metadata": metadata}
+            for (item_id, text, metadata), vector in zip(items, vectors)
+        ]
     
-    def _get_embedding(self, text: str) -> List[float]:
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
         """
-        Get embedding for text with caching.
+        Embed texts in batches.
+        
+        Duplicate texts are embedded once. EmbeddingManager batches are
+        token-budgeted, run concurrently and read through its persistent
+        cache; sentence-transformers models encode the batch directly.
         
         Args:
-            text: Text to embed
+            texts: Texts to embed
         
         Returns:
-            Embedding vector
+            Embedding vectors, in input order
         """
-        # Create cache key
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        
-        # Check cache
-        if text_hash in self.embedding_cache:
-            return self.embedding_cache[text_hash]
+        if not texts:
+            return []
         
-        # Generate embedding
-        if self.embedding_model:
-            vector = self.embedding_model.encode(text).tolist()
+        unique = list(dict.fromkeys(texts))
+        model = self.embedding_model
+        if hasattr(model, 'embed_documents'):
+            vectors = BatchEmbedder(model.embed_documents).embed(unique)
         else:
-            # Placeholder for development
-            import numpy as np
-            vector = np.random.rand(384).tolist()
-        
-        # Cache it
-        self.embedding_cache[text_hash] = vector
+            vectors = model.encode(unique, batch_size=settings.EMBEDDING_BATCH_SIZE).tolist()
         
-        return vector
+        by_text = dict(zip(unique, vectors))
+        return [by_text[text] for text in texts]
     
     def _build_table_metadata(
         self,
@@ -330,11 +460,12 @@ class MultiLevelEmbeddingGenerator:
         self,
         table: EnhancedFinancialTable,
         doc_metadata: Any,
-        row_header: RowHeader
+        row_header: RowHeader,
+        table_metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Build complete metadata for row-level embedding."""
         # Start with table metadata
-        metadata = self._build_table_metadata(table, doc_metadata)
+        metadata = dict(table_metadata or self._build_table_metadata(table, doc_metadata))
         
         # Add row-specific metadata
         metadata.update({
@@ -353,11 +484,12 @@ class MultiLevelEmbeddingGenerator:
         self,
         table: EnhancedFinancialTable,
         doc_metadata: Any,
-        cell: DataCell
+        cell: DataCell,
+        table_metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Build complete metadata for cell-level embedding."""
         # Start with table metadata
-        metadata = self._build_table_metadata(table, doc_metadata)
+        metadata = dict(table_metadata or self._build_table_metadata(table, doc_metadata))
         
         # Add cell-specific metadata
         metadata.update({
@@ -206,6 +206,8 @@ class CustomAPIEmbeddingProvider(EmbeddingProvider):
         Generate embeddings for multiple texts.
         
         Attempts batch API call first, falls back to sequential if not supported.
+        Connection errors, timeouts, 429 and 5xx responses are raised instead of
+        falling back, so callers can retry the batch with backoff.
         """
         if not texts:
             return []
@@ -225,6 +227,15 @@ class CustomAPIEmbeddingProvider(EmbeddingProvider):
             logger.debug(f"Batch embedding succeeded for {len(texts)} texts")
             return embeddings
             
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            # Transient - let the caller's retry/backoff handle it
+            raise
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is not None and (status == 429 or status >= 500):
+                raise
+            logger.debug(f"Batch API not supported, falling back to sequential: {e}")
+            return [self.generate_embedding(text) for text in texts]
         except Exception as e:
             logger.debug(f"Batch API not supported, falling back to sequential: {e}")
             # Fallback to sequential (for APIs that don't support batch)
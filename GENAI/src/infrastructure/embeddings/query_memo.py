@@ -0,0 +1,148 @@
+"""
+Request-scoped query embedding memo.
+
+One search request can embed the same text several times: hybrid search
+embeds the query for its vector branch, multi-strategy search runs vector,
+hybrid, HyDE and multi-query side by side, and multi-query embeds every
+variation. ``QueryEmbeddingMemo`` makes sure each distinct text is embedded
+once per request, even when strategies ask for it concurrently, and turns
+lists of texts into a single batched embedding call.
+
+Example:
+    >>> memo = QueryEmbeddingMemo(get_embedding_manager())
+    >>> vector = memo.embed_query("revenue in Q1")
+    >>> vectors = memo.embed_queries(["revenue in Q1", "Q1 sales"])  # one call
+    >>> memo.stats()
+    {'calls': 2, 'texts_embedded': 2, 'hits': 1}
+"""
+
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Memo kinds: queries and HyDE documents may be embedded differently
+QUERY = "query"
+DOCUMENT = "document"
+
+
+class _Pending:
+    """An embedding being computed by another thread."""
+
+    __slots__ = ("done", "vector", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.vector = None
+        self.error = None
+
+
+class QueryEmbeddingMemo:
+    """
+    Thread-safe memo of embeddings for a single search request.
+
+    Create one per request and share it between the strategies that serve
+    that request; do not keep it across requests (the persistent embedding
+    cache already covers that).
+
+    Attributes:
+        embedding_manager: Object with embed_query/embed_documents
+            (and optionally embed_queries for batched queries)
+    """
+
+    def __init__(self, embedding_manager):
+        """
+        Initialize the memo.
+
+        Args:
+            embedding_manager: Embedding manager used for cache misses
+        """
+        self.embedding_manager = embedding_manager
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], _Pending] = {}
+        self._calls = 0
+        self._texts_embedded = 0
+        self._hits = 0
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed one query text."""
+        return self._embed([text], QUERY)[0]
+
+    def embed_queries(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embed several query texts; misses go out in one batched call."""
+        return self._embed(texts, QUERY)
+
+    def embed_document(self, text: str) -> List[float]:
+        """Embed one document-style text (e.g. a HyDE hypothetical answer)."""
+        return self._embed([text], DOCUMENT)[0]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Embedding calls made through this memo.
+
+        Returns:
+            Dict with calls (model requests), texts_embedded and hits
+        """
+        with self._lock:
+            return {
+                'calls': self._calls,
+                'texts_embedded': self._texts_embedded,
+                'hits': self._hits,
+            }
+
+    def _embed(self, texts: Sequence[str], kind: str) -> List[List[float]]:
+        """Return vectors for texts, embedding only texts nobody has claimed yet."""
+        entries: List[_Pending] = []
+        owned: Dict[str, _Pending] = {}
+        with self._lock:
+            for text in texts:
+                key = (kind, text)
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = owned.get(text)
+                    if entry is None:
+                        entry = owned[text] = self._entries[key] = _Pending()
+                elif text not in owned:
+                    self._hits += 1
+                entries.append(entry)
+            if owned:
+                self._calls += 1
+                self._texts_embedded += len(owned)
+
+        if owned:
+            self._compute(list(owned), list(owned.values()), kind)
+
+        vectors = []
+        for entry in entries:
+            entry.done.wait()
+            if entry.error is not None:
+                raise entry.error
+            vectors.append(entry.vector)
+        return vectors
+
+    def _compute(self, texts: List[str], entries: List[_Pending], kind: str) -> None:
+        """Embed claimed texts and publish the results (or the error)."""
+        try:
+            if kind == DOCUMENT:
+                vectors = self.embedding_manager.embed_documents(texts)
+            elif len(texts) == 1:
+                vectors = [self.embedding_manager.embed_query(texts[0])]
+            elif hasattr(self.embedding_manager, 'embed_queries'):
+                vectors = self.embedding_manager.embed_queries(texts)
+            else:
+                vectors = self.embedding_manager.embed_documents(texts)
+            for entry, vector in zip(entries, vectors):
+                entry.vector = vector
+        except Exception as e:
+            logger.error(f"Query embedding failed: {e}")
+            with self._lock:
+                # Let a later call retry instead of replaying the failure
+                for text in texts:
+                    self._entries.pop((kind, text), None)
+            for entry in entries:
+                entry.error = e
+        finally:
+            for entry in entries:
+                entry.done.set()
@@ -1,44 +1,71 @@
 """
 Caching mechanism for extraction results.
+
+Results are keyed by the SHA256 of the PDF content plus the extraction
+backend names and versions, so renamed, copied or re-downloaded PDFs hit
+the cache, while upgrading a backend (or changing the backend chain)
+misses it. Inputs are immutable, so entries do not expire by default.
+Results are stored zlib-compressed in the SQLite cache store.
 """
 
-import hashlib
-import json
 import pickle
+import zlib
 from pathlib import Path
 from typing import Optional
-from datetime import datetime, timedelta
+
 from src.utils import get_logger
 
+from src.infrastructure.cache.base import BaseCache
+from src.infrastructure.cache.extraction_cache import compute_content_hash
 from src.infrastructure.extraction.base import ExtractionResult
 
 logger = get_logger(__name__)
 
 
 class ExtractionCache:
-    """File-based cache for extraction results."""
+    """
+    Content-addressed cache for extraction results.
+    
+    Example:
+        >>> cache = ExtractionCache(backend_signature="Docling@2.15.0")
+        >>> result = cache.get(pdf_path)
+        >>> if result is None:
+        ...     result = backend.extract(pdf_path)
+        ...     cache.set(pdf_path, result)
+    """
+    
+    # Bump when the shape of cached ExtractionResults changes
+    FORMAT_VERSION = 2
     
     def __init__(
         self,
         cache_dir: str = ".cache/extraction",
-        ttl_hours: int = 24,
-        enabled: bool = True
+        ttl_hours: Optional[float] = None,
+        enabled: bool = True,
+        backend_signature: str = "",
+        compression_level: int = 6,
     ):
         """
         Initialize extraction cache.
         
         Args:
-            cache_dir: Directory to store cache files
-            ttl_hours: Time-to-live in hours
+            cache_dir: Directory to store the cache database
+            ttl_hours: Time-to-live in hours (None = never expires)
             enabled: Enable/disable caching
+            backend_signature: Backend names and versions, part of every key
+            compression_level: zlib compression level (0-9)
         """
         self.cache_dir = Path(cache_dir)
-        self.ttl = timedelta(hours=ttl_hours)
+        self.ttl_hours = ttl_hours
         self.enabled = enabled
-        
-        if self.enabled:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Extraction cache initialized at {self.cache_dir}")
+        self.backend_signature = backend_signature
+        self.compression_level = compression_level
+        self._store = BaseCache(
+            cache_dir=self.cache_dir,
+            name="ExtractionCache",
+            ttl_hours=ttl_hours,
+            enabled=enabled,
+        )
     
     def get(self, pdf_path: str) -> Optional[ExtractionResult]:
         """
@@ -54,33 +81,31 @@ class ExtractionCache:
             return None
         
         cache_key = self._get_cache_key(pdf_path)
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
-        
-        if not cache_file.exists():
-            logger.debug(f"Cache miss for {pdf_path}")
+        if cache_key is None:
             return None
         
-        # Check if cache is expired
-        if self._is_expired(cache_file):
-            logger.debug(f"Cache expired for {pdf_path}")
-            cache_file.unlink()
+        payload = self._store.get(cache_key)
+        if payload is None:
+            logger.debug(f"Cache miss for {pdf_path}")
             return None
         
         # Load from cache
         try:
-            with open(cache_file, 'rb') as f:
-                result = pickle.load(f)
+            result = pickle.loads(zlib.decompress(payload))
             
             # Post-process: normalize section_name whitespace in cached tables
             # This fixes 'Manageme nt' issues from old cached extraction results
             self._normalize_cached_sections(result)
             
+            # Cached results may come from a copy of the file under another name
+            result.pdf_path = pdf_path
+            
             logger.info(f"Cache hit for {pdf_path} (backend: {result.backend.value})")
             return result
             
         except Exception as e:
             logger.error(f"Error loading cache for {pdf_path}: {e}")
-            cache_file.unlink()
+            self._store.delete(cache_key)
             return None
     
     def _normalize_cached_sections(self, result: ExtractionResult) -> None:
@@ -110,20 +135,24 @@ class ExtractionCache:
             return
         
         cache_key = self._get_cache_key(pdf_path)
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
+        if cache_key is None:
+            return
         
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(result, f)
+            payload = zlib.compress(
+                pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL),
+                self.compression_level,
+            )
+            self._store.set(cache_key, payload)
             
-            logger.info(f"Cached extraction for {pdf_path}")
+            logger.info(f"Cached extraction for {pdf_path} ({len(payload) / 1024:.0f} KB compressed)")
             
         except Exception as e:
             logger.error(f"Error caching result for {pdf_path}: {e}")
     
     def invalidate(self, pdf_path: str) -> None:
         """
-        Invalidate cache for a PDF.
+        Invalidate cache for a PDF (all backend versions).
         
         Args:
             pdf_path: Path to PDF file
@@ -131,49 +160,38 @@ class ExtractionCache:
         if not self.enabled:
             return
         
-        cache_key = self._get_cache_key(pdf_path)
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
+        try:
+            content_hash = compute_content_hash(pdf_path)
+        except (FileNotFoundError, OSError):
+            return
         
-        if cache_file.exists():
-            cache_file.unlink()
+        if self._store.delete_prefix(f"{content_hash}:"):
             logger.info(f"Invalidated cache for {pdf_path}")
     
     def clear(self) -> int:
         """
-        Clear all cache files.
+        Clear all cached results.
         
         Returns:
-            Number of files deleted
+            Number of entries deleted
         """
         if not self.enabled:
             return 0
         
-        count = 0
-        for cache_file in self.cache_dir.glob("*.pkl"):
-            cache_file.unlink()
-            count += 1
-        
-        logger.info(f"Cleared {count} cache files")
+        count = self._store.clear()
+        logger.info(f"Cleared {count} cache entries")
         return count
     
     def cleanup_expired(self) -> int:
         """
-        Remove expired cache files.
+        Remove expired entries (only relevant when a TTL is configured).
         
         Returns:
-            Number of files deleted
+            Number of entries deleted
         """
         if not self.enabled:
             return 0
-        
-        count = 0
-        for cache_file in self.cache_dir.glob("*.pkl"):
-            if self._is_expired(cache_file):
-                cache_file.unlink()
-                count += 1
-        
-        logger.info(f"Cleaned up {count} expired cache files")
-        return count
+        return self._store.cleanup_expired()
     
     def get_stats(self) -> dict:
         """
@@ -185,44 +203,33 @@ class ExtractionCache:
         if not self.enabled:
             return {"enabled": False}
         
-        cache_files = list(self.cache_dir.glob("*.pkl"))
-        total_size = sum(f.stat().st_size for f in cache_files)
-        
-        expired = sum(1 for f in cache_files if self._is_expired(f))
-        
+        stats = self._store.get_stats()
         return {
             "enabled": True,
-            "total_files": len(cache_files),
-            "expired_files": expired,
-            "total_size_mb": total_size / (1024 * 1024),
+            "total_files": stats.total_entries,
+            "total_size_mb": stats.size_bytes / (1024 * 1024),
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "hit_rate": f"{stats.hit_rate:.1%}",
             "cache_dir": str(self.cache_dir),
-            "ttl_hours": self.ttl.total_seconds() / 3600
+            "ttl_hours": self.ttl_hours,
+            "backend_signature": self.backend_signature,
         }
     
-    def _get_cache_key(self, pdf_path: str) -> str:
+    def _get_cache_key(self, pdf_path: str) -> Optional[str]:
         """
-        Generate cache key from PDF path.
+        Generate cache key from PDF content.
         
-        Uses MD5 hash of file path + file modification time.
-        Falls back to path-only key if file doesn't exist.
+        Key: {sha256 of content}:{format version}:{backend signature}.
+        Returns None if the file cannot be read.
         """
-        pdf_file = Path(pdf_path)
-        
         try:
-            # Include file path and modification time in key
-            key_data = f"{pdf_file.absolute()}_{pdf_file.stat().st_mtime}"
-        except (FileNotFoundError, OSError):
-            # File may have been deleted - use path only
-            key_data = str(pdf_file.absolute())
-            logger.debug(f"PDF file not found, using path-only cache key: {pdf_path}")
+            content_hash = compute_content_hash(pdf_path)
+        except (FileNotFoundError, OSError) as e:
+            logger.debug(f"Cannot hash {pdf_path} for cache key: {e}")
+            return None
         
-        return hashlib.md5(key_data.encode()).hexdigest()
-    
-    def _is_expired(self, cache_file: Path) -> bool:
-        """Check if cache file is expired."""
-        file_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-        age = datetime.now() - file_time
-        return age > self.ttl
+        return f"{content_hash}:v{self.FORMAT_VERSION}:{self.backend_signature}"
 
 
 class RedisCache(ExtractionCache):
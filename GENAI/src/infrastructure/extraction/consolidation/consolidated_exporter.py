@@ -12,19 +12,22 @@ Features:
 - Optional transpose (dates as rows)
 """
 
+import copy
 import glob
+import os
 import re
 import pandas as pd
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 from collections import defaultdict
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 
 from src.utils import get_logger
 from src.core import get_paths
 from src.utils.date_utils import DateUtils
 from src.utils.excel_utils import ExcelUtils
+from src.utils.parallel import imap_processes
 from src.utils.metadata_labels import MetadataLabels, TableMetadata
 from src.utils.metadata_builder import MetadataBuilder
 from src.utils.financial_domain import (
@@ -35,9 +38,10 @@ from src.utils.financial_domain import (
 )
 from src.infrastructure.extraction.consolidation.consolidated_exporter_transpose import *
 from src.infrastructure.extraction.exporters.base_exporter import BaseExcelExporter
+from src.infrastructure.extraction.exporters.table_store import read_table_store
 # Import from new focused modules
 from src.infrastructure.extraction.consolidation.table_detection import TableDetector
-from src.infrastructure.extraction.consolidation.table_grouping import TableGrouper
+from src.infrastructure.extraction.consolidation.table_grouping import TableGrouper, TableGroupIndex
 from src.infrastructure.extraction.consolidation.excel_formatting import ExcelFormatter
 from src.infrastructure.extraction.consolidation.period_type_detector import PeriodTypeDetector
 from src.utils.constants import (
@@ -153,13 +157,20 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
         # Collect all tables from all files with metadata
         all_tables_by_full_title = defaultdict(list)
         title_to_sheet_name = {}
+        group_index = TableGroupIndex(all_tables_by_full_title)
+        workers = settings.CONSOLIDATION_WORKERS or os.cpu_count() or 1
         
-        for xlsx_path in xlsx_files:
+        # Read files in parallel; group them in file order so the result
+        # does not depend on which worker finishes first
+        for xlsx_path, payloads in self._iter_xlsx_tables(xlsx_files, workers):
+            if payloads is None:
+                continue
             try:
-                self._process_xlsx_file(
-                    xlsx_path, 
+                self._add_xlsx_tables(
+                    payloads, 
                     all_tables_by_full_title, 
-                    title_to_sheet_name
+                    title_to_sheet_name,
+                    group_index
                 )
             except Exception as e:
                 logger.error(f"Error reading {xlsx_path}: {e}")
@@ -168,144 +179,262 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
             logger.warning("No tables collected for merging")
             return {}
         
-        # Generate BOTH outputs: regular and transposed
+        # Build regular, transposed and index outputs from the single parse
+        # above; with CONSOLIDATION_WORKERS > 1 each runs in its own process
+        shared_input = {
+            'tables': all_tables_by_full_title,
+            'title_to_sheet_name': title_to_sheet_name,
+            'xlsx_files': xlsx_files,
+            'output_filename': output_filename,
+            'processed_dir': self.processed_dir,
+            'consolidate_dir': self.consolidate_dir,
+        }
         results = {}
         
-        for is_transposed in [False, True]:
-            # Determine output filename
-            if is_transposed:
-                base_name = Path(output_filename).stem
-                ext = Path(output_filename).suffix or ".xlsx"
-                current_output_filename = f"{base_name}_transposed{ext}"
-                logger.info("Creating transposed consolidated report...")
-            else:
-                current_output_filename = output_filename
-                logger.info("Creating regular consolidated report...")
-            
-            # PASS 1: Evaluate which tables have data (without creating sheets)
-            non_empty_tables = {}
-            for normalized_key, tables in all_tables_by_full_title.items():
-                if self._evaluate_table_has_data(tables, transpose=is_transposed):
-                    non_empty_tables[normalized_key] = tables
-            
-            logger.info(f"Found {len(non_empty_tables)} non-empty tables out of {len(all_tables_by_full_title)}")
-            
-            # Sort tables by page number for TOC-based ordering
-            def get_sort_key(k):
-                mapping = title_to_sheet_name.get(k, {})
-                min_page = mapping.get('min_page', 9999)
-                return (
-                    min_page,
-                    mapping.get('section', ''),
-                    mapping.get('original_title', k)
-                )
+        if workers > 1:
+            # Split the remaining workers between the two sheet-building tasks
+            shared_input['sheet_workers'] = max(1, (workers - 1) // 2)
+            for outcome in imap_processes(
+                _run_consolidation_task,
+                CONSOLIDATION_TASKS,
+                max_workers=min(len(CONSOLIDATION_TASKS), workers),
+                initializer=_init_consolidation_worker,
+                initargs=(shared_input,)
+            ):
+                if outcome.ok:
+                    results[outcome.item] = outcome.result
+                else:
+                    logger.error(f"Consolidation task '{outcome.item}' failed: {outcome.error}")
+        else:
+            for task in CONSOLIDATION_TASKS:
+                results[task] = self._run_consolidation_task(task, shared_input)
             
-            sorted_keys = sorted(non_empty_tables.keys(), key=get_sort_key)
-            
-            # Assign sheet numbers ONLY to non-empty tables (no gaps)
-            sheet_number = 1
-            for normalized_key in sorted_keys:
-                mapping = title_to_sheet_name.get(normalized_key, {})
-                mapping['unique_sheet_name'] = str(sheet_number)
-                title_to_sheet_name[normalized_key] = mapping
-                sheet_number += 1
-            
-            # Create output file - transposed goes to transpose/ folder
-            if is_transposed:
-                transpose_dir = self.consolidate_dir.parent / "transpose"
-                transpose_dir.mkdir(parents=True, exist_ok=True)
-                output_path = transpose_dir / current_output_filename
-            else:
-                output_path = self.consolidate_dir / current_output_filename
+        index_result = results.get('index')
+        
+        # Return combined results (backward compat: use regular as main result)
+        if results.get('regular'):
+            result = results['regular'].copy()
+            result['transposed_path'] = (results.get('transposed') or {}).get('path')
+            result['index_path'] = index_result.get('path') if index_result else None
+            return result
+        return results.get('transposed') or {}
 
+    def _run_consolidation_task(self, task: str, shared_input: Dict[str, Any]) -> Optional[dict]:
+        """
+        Build one consolidation output from the shared parse.
+        
+        Args:
+            task: 'regular', 'transposed' or 'index'
+            shared_input: Parsed tables, mappings and source files
             
-            try:
-                with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                    # PASS 2: Create sheets with period type splitting
-                    created_tables = {}
-                    split_sheet_mapping = {}  # Track split sheets: sheet_name -> period_type
-                    
-                    for normalized_key in sorted_keys:
-                        tables = non_empty_tables[normalized_key]
-                        mapping = title_to_sheet_name.get(normalized_key, {})
-                        sheet_name = mapping.get('unique_sheet_name')
-                        if sheet_name:
-                            # Use split method - may create multiple sheets (_1, _2, _3)
-                            created_sheets = self._create_merged_table_sheets_with_split(
-                                writer, 
-                                sheet_name, 
-                                tables, 
-                                transpose=is_transposed,
-                                title_to_sheet_name=title_to_sheet_name,
-                                normalized_key=normalized_key
-                            )
-                            
-                            if created_sheets:
-                                # Track all created sheets
-                                split_sheet_mapping.update(created_sheets)
-                                
-                                # If split occurred, update the mapping for Index
-                                if len(created_sheets) > 1:
-                                    # Multiple sheets created - mark original as "split parent"
-                                    mapping['was_split'] = True
-                                    mapping['split_sheets'] = list(created_sheets.keys())
-                                    for split_sheet_name in created_sheets:
-                                        created_tables[f"{normalized_key}::{created_sheets[split_sheet_name]}"] = tables
-                                else:
-                                    # Single sheet created - update mapping to use the actual sheet name
-                                    # This fixes Index links when period-type splitting creates suffix like _3
-                                    actual_sheet_name = list(created_sheets.keys())[0]
-                                    mapping['unique_sheet_name'] = actual_sheet_name
-                                    created_tables[normalized_key] = tables
-                            else:
-                                logger.debug(f"Sheet {sheet_name} was not created (no data after processing)")
+        Returns:
+            Result dict for the output, or None/{} on failure
+        """
+        if task == 'index':
+            # Create Consolidated_Index.xlsx with all Index sheets from source files
+            return self.consolidate_index_sheets(shared_input['xlsx_files'])
+        
+        return self._write_consolidated_output(
+            is_transposed=(task == 'transposed'),
+            output_filename=shared_input['output_filename'],
+            all_tables_by_full_title=shared_input['tables'],
+            title_to_sheet_name=shared_input['title_to_sheet_name'],
+            sources_count=len(shared_input['xlsx_files']),
+            sheet_workers=shared_input.get('sheet_workers', 1)
+        )
+    
+    def _write_consolidated_output(
+        self,
+        is_transposed: bool,
+        output_filename: str,
+        all_tables_by_full_title: Dict[str, List],
+        title_to_sheet_name: Dict[str, dict],
+        sources_count: int,
+        sheet_workers: int = 1
+    ) -> Optional[dict]:
+        """
+        Write the regular or transposed consolidated workbook.
+        
+        Works on its own copy of title_to_sheet_name, so both variants can be
+        built at the same time from the same parse. Sheets are built in
+        parallel when sheet_workers > 1 and always written in page order.
+        
+        Args:
+            is_transposed: Build the transposed variant
+            output_filename: Output filename for the regular report
+            all_tables_by_full_title: Normalized key -> tables to merge
+            title_to_sheet_name: Normalized key -> sheet/index mapping
+            sources_count: Number of source files merged
+            sheet_workers: Worker processes for building sheets (1 = serial)
+            
+        Returns:
+            Dict with path, tables_merged, sources_merged, sheet_names, validation
+            (None if the workbook could not be created)
+        """
+        title_to_sheet_name = copy.deepcopy(title_to_sheet_name)
+        
+        # Determine output filename
+        if is_transposed:
+            base_name = Path(output_filename).stem
+            ext = Path(output_filename).suffix or ".xlsx"
+            current_output_filename = f"{base_name}_transposed{ext}"
+            logger.info("Creating transposed consolidated report...")
+        else:
+            current_output_filename = output_filename
+            logger.info("Creating regular consolidated report...")
+        
+        # PASS 1: Evaluate which tables have data (without creating sheets)
+        non_empty_tables = {}
+        for normalized_key, tables in all_tables_by_full_title.items():
+            if self._evaluate_table_has_data(tables, transpose=is_transposed):
+                non_empty_tables[normalized_key] = tables
+        
+        logger.info(f"Found {len(non_empty_tables)} non-empty tables out of {len(all_tables_by_full_title)}")
+        
+        # Sort tables by page number for TOC-based ordering
+        def get_sort_key(k):
+            mapping = title_to_sheet_name.get(k, {})
+            min_page = mapping.get('min_page', 9999)
+            return (
+                min_page,
+                mapping.get('section', ''),
+                mapping.get('original_title', k)
+            )
+        
+        sorted_keys = sorted(non_empty_tables.keys(), key=get_sort_key)
+        
+        # Assign sheet numbers ONLY to non-empty tables (no gaps)
+        sheet_number = 1
+        for normalized_key in sorted_keys:
+            mapping = title_to_sheet_name.get(normalized_key, {})
+            mapping['unique_sheet_name'] = str(sheet_number)
+            title_to_sheet_name[normalized_key] = mapping
+            sheet_number += 1
+        
+        # Create output file - transposed goes to transpose/ folder
+        if is_transposed:
+            transpose_dir = self.consolidate_dir.parent / "transpose"
+            transpose_dir.mkdir(parents=True, exist_ok=True)
+            output_path = transpose_dir / current_output_filename
+        else:
+            output_path = self.consolidate_dir / current_output_filename
+        
+        try:
+            # PASS 2: Build sheets with period type splitting (possibly in parallel)
+            built_sheets = self._build_all_sheet_frames(
+                sorted_keys, non_empty_tables, title_to_sheet_name, is_transposed, sheet_workers
+            )
+            
+            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+                created_tables = {}
+                split_sheet_mapping = {}  # Track split sheets: sheet_name -> period_type
+                
+                # Write in sorted order regardless of which sheet finished first
+                for normalized_key in sorted_keys:
+                    if normalized_key not in built_sheets:
+                        continue
+                    tables = non_empty_tables[normalized_key]
+                    mapping = title_to_sheet_name.get(normalized_key, {})
+                    sheet_name = mapping.get('unique_sheet_name')
+                    sheets, is_split = built_sheets[normalized_key]
                     
-                    # Create TOC_Sheet with hierarchical section columns
-                    self._create_toc_sheet(writer, created_tables, title_to_sheet_name)
+                    # May write multiple sheets (_1, _2, _3)
+                    created_sheets = self._write_sheet_frames(
+                        writer,
+                        sheets,
+                        is_split,
+                        title_to_sheet_name=title_to_sheet_name,
+                        normalized_key=normalized_key
+                    )
                     
-                    # Create Index with ONLY successfully created sheets
-                    self._create_consolidated_index(writer, created_tables, title_to_sheet_name)
+                    if created_sheets:
+                        # Track all created sheets
+                        split_sheet_mapping.update(created_sheets)
+                        
+                        # If split occurred, update the mapping for Index
+                        if len(created_sheets) > 1:
+                            # Multiple sheets created - mark original as "split parent"
+                            mapping['was_split'] = True
+                            mapping['split_sheets'] = list(created_sheets.keys())
+                            for split_sheet_name in created_sheets:
+                                created_tables[f"{normalized_key}::{created_sheets[split_sheet_name]}"] = tables
+                        else:
+                            # Single sheet created - update mapping to use the actual sheet name
+                            # This fixes Index links when period-type splitting creates suffix like _3
+                            actual_sheet_name = list(created_sheets.keys())[0]
+                            mapping['unique_sheet_name'] = actual_sheet_name
+                            created_tables[normalized_key] = tables
+                    else:
+                        logger.debug(f"Sheet {sheet_name} was not created (no data after processing)")
+                
+                # Create TOC_Sheet with hierarchical section columns
+                self._create_toc_sheet(writer, created_tables, title_to_sheet_name)
+                
+                # Create Index with ONLY successfully created sheets
+                self._create_consolidated_index(writer, created_tables, title_to_sheet_name)
                 
-                # Add hyperlinks
-                self._add_hyperlinks(output_path, created_tables, title_to_sheet_name)
+                # Link, format and validate the in-memory workbook; the
+                # writer serializes it once when the block exits
+                self._add_hyperlinks(writer.book, created_tables, title_to_sheet_name)
                 
                 # Apply currency formatting to numeric cells
-                self._apply_currency_format(output_path, created_tables, title_to_sheet_name)
+                self._apply_currency_format(writer.book, created_tables, title_to_sheet_name)
                 
                 # Validate Index links match sheet names
-                validation_result = self._validate_index_sheet_links(output_path)
-                if not validation_result['valid']:
-                    logger.warning(f"Validation failed - missing sheets: {validation_result['missing_sheets']}")
-                else:
-                    logger.info("Validation passed: all Index links have matching sheets")
-                
-                logger.info(f"Created {'transposed ' if is_transposed else ''}consolidated report at {output_path}")
-                logger.info(f"  - Tables merged: {len(created_tables)}")
-                logger.info(f"  - Sources: {len(xlsx_files)}")
-                
-                key = 'transposed' if is_transposed else 'regular'
-                results[key] = {
-                    'path': str(output_path),
-                    'tables_merged': len(created_tables),
-                    'sources_merged': len(xlsx_files),
-                    'sheet_names': [title_to_sheet_name[k].get('unique_sheet_name', '') for k in created_tables.keys()],
-                    'validation': validation_result
-                }
-                
-            except Exception as e:
-                logger.error(f"Failed to create {'transposed ' if is_transposed else ''}consolidated report: {e}", exc_info=True)
-        
-        # Create Consolidated_Index.xlsx with all Index sheets from source files
-        index_result = self.consolidate_index_sheets(xlsx_files)
+                validation_result = self._validate_index_sheet_links(writer.book)
+            if not validation_result['valid']:
+                logger.warning(f"Validation failed - missing sheets: {validation_result['missing_sheets']}")
+            else:
+                logger.info("Validation passed: all Index links have matching sheets")
+            
+            logger.info(f"Created {'transposed ' if is_transposed else ''}consolidated report at {output_path}")
+            logger.info(f"  - Tables merged: {len(created_tables)}")
+            logger.info(f"  - Sources: {sources_count}")
+            
+            return {
+                'path': str(output_path),
+                'tables_merged': len(created_tables),
+                'sources_merged': sources_count,
+                'sheet_names': [title_to_sheet_name[k].get('unique_sheet_name', '') for k in created_tables.keys()],
+                'validation': validation_result
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to create {'transposed ' if is_transposed else ''}consolidated report: {e}", exc_info=True)
+            return None
+    
+    def _build_all_sheet_frames(
+        self,
+        sorted_keys: List[str],
+        non_empty_tables: Dict[str, List],
+        title_to_sheet_name: Dict[str, dict],
+        transpose: bool,
+        sheet_workers: int = 1
+    ) -> Dict[str, Tuple[List[Tuple[str, str, pd.DataFrame]], bool]]:
+        """
+        Build the sheet frames of every table group.
         
-        # Return combined results (backward compat: use regular as main result)
-        if 'regular' in results:
-            result = results['regular'].copy()
-            result['transposed_path'] = results.get('transposed', {}).get('path')
-            result['index_path'] = index_result.get('path') if index_result else None
-            return result
-        return results.get('transposed', {})
-
+        Returns:
+            Normalized key -> ([(sheet_name, period_type, frame), ...], is_split);
+            callers write them in sorted_keys order
+        """
+        tasks = []
+        for normalized_key in sorted_keys:
+            sheet_name = title_to_sheet_name.get(normalized_key, {}).get('unique_sheet_name')
+            if sheet_name:
+                tasks.append((normalized_key, sheet_name, non_empty_tables[normalized_key], transpose))
+        
+        if sheet_workers <= 1 or len(tasks) <= 1:
+            return {task[0]: self._build_sheet_frames(*task[1:]) for task in tasks}
+        
+        built_sheets = {}
+        for outcome in imap_processes(
+            _build_sheet_frames_task, tasks, max_workers=min(sheet_workers, len(tasks))
+        ):
+            if not outcome.ok:
+                raise outcome.error
+            built_sheets[outcome.item[0]] = outcome.result
+        return built_sheets
     
     def consolidate_index_sheets(
         self,
@@ -406,11 +535,77 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
         self,
         xlsx_path: str,
         all_tables_by_full_title: Dict[str, List],
-        title_to_sheet_name: Dict[str, dict]
+        title_to_sheet_name: Dict[str, dict],
+        group_index: Optional[TableGroupIndex] = None
     ) -> None:
         """Process a single xlsx file and add tables to collection."""
+        self._add_xlsx_tables(
+            self._read_xlsx_tables(xlsx_path),
+            all_tables_by_full_title,
+            title_to_sheet_name,
+            group_index
+        )
+    
+    def _iter_xlsx_tables(self, xlsx_files: List[str], workers: int = 1):
+        """
+        Read processed xlsx files, in worker processes when workers > 1.
+        
+        Yields:
+            (xlsx_path, payloads) in xlsx_files order; payloads is None if
+            the file could not be read
+        """
+        if workers <= 1 or len(xlsx_files) <= 1:
+            for xlsx_path in xlsx_files:
+                try:
+                    yield xlsx_path, self._read_xlsx_tables(xlsx_path)
+                except Exception as e:
+                    logger.error(f"Error reading {xlsx_path}: {e}")
+                    yield xlsx_path, None
+            return
+        
+        results = {}
+        for outcome in imap_processes(
+            _read_xlsx_tables_task, xlsx_files, max_workers=min(workers, len(xlsx_files))
+        ):
+            if not outcome.ok:
+                logger.error(f"Error reading {outcome.item}: {outcome.error}")
+            results[outcome.item] = outcome.result
+        
+        for xlsx_path in xlsx_files:
+            yield xlsx_path, results.get(xlsx_path)
+    
+    def _load_table_store(self, xlsx_path: str):
+        """All stored sheets of a workbook, or None to read the xlsx instead."""
+        stored = read_table_store(xlsx_path)
+        if stored is None:
+            return None
+        try:
+            return stored.load()
+        except Exception as e:
+            logger.warning(f"Table store of {Path(xlsx_path).name} unreadable, reading the xlsx: {e}")
+            return None
+    
+    def _read_xlsx_tables(self, xlsx_path: str) -> List[Dict[str, Any]]:
+        """
+        Read the tables of one processed xlsx file.
+        
+        Reads the sheets TableMerger published to the table store, or opens
+        the workbook once if the store is missing, stale or unreadable.
+        Touches no shared state, so files can be read in worker processes;
+        _add_xlsx_tables groups the result.
+        
+        Args:
+            xlsx_path: Path to a processed *_tables.xlsx file
+            
+        Returns:
+            Table payloads in sheet/sub-table order
+        """
+        xl = self._load_table_store(xlsx_path) if settings.TABLE_STORE_ENABLED else None
+        if xl is None:
+            xl = pd.ExcelFile(xlsx_path)
+        
         # Read Index sheet to get metadata
-        index_df = pd.read_excel(xlsx_path, sheet_name='Index')
+        index_df = xl.parse('Index')
         
         # DEDUPLICATE Index entries: Source files may have duplicate rows for same sheet
         # This happens when tables are split but Index is updated multiple times
@@ -425,7 +620,6 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
             index_df = index_df.drop(columns=['_link_clean'])
         
         # Get all sheet names except Index
-        xl = pd.ExcelFile(xlsx_path)
         table_sheets = [s for s in xl.sheet_names if s != 'Index']
         
         # Create mapping from Link to full Table Title
@@ -438,25 +632,30 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
             if link and full_title:
                 link_to_full_title[link] = full_title
         
+        # Find metadata for each SPECIFIC sheet by matching Link/Table_ID
+        # CRITICAL: Don't match by Table Title alone because multiple tables 
+        # can have the same title (e.g., "Income Statement Information" for IS/WM/IM)
+        # The Link column contains "→ {sheet_name}" format; first row wins
+        link_rows = {}
+        clean_links = index_df['Link'].astype(str).str.replace('→ ', '', regex=False).str.strip()
+        for position, link in enumerate(clean_links):
+            link_rows.setdefault(link, position)
+        
+        # Fallback: try Table_ID column if Link matching fails
+        table_id_rows = {}
+        if 'Table_ID' in index_df.columns:
+            for position, table_id in enumerate(index_df['Table_ID'].astype(str)):
+                table_id_rows.setdefault(table_id, position)
+        
+        payloads = []
+        
         for sheet_name in table_sheets:
             full_title = link_to_full_title.get(sheet_name, sheet_name)
             
-            # Find metadata for this SPECIFIC sheet by matching Link/Table_ID
-            # CRITICAL: Don't match by Table Title alone because multiple tables 
-            # can have the same title (e.g., "Income Statement Information" for IS/WM/IM)
-            # The Link column contains "→ {sheet_name}" format
-            matching_rows = index_df[
-                index_df['Link'].astype(str).str.replace('→ ', '', regex=False).str.strip() == sheet_name
-            ]
-            
-            # Fallback: try Table_ID column if Link matching fails
-            if len(matching_rows) == 0 and 'Table_ID' in index_df.columns:
-                matching_rows = index_df[
-                    index_df['Table_ID'].astype(str) == sheet_name
-                ]
+            position = link_rows.get(sheet_name, table_id_rows.get(sheet_name))
             
-            if len(matching_rows) > 0:
-                row = matching_rows.iloc[0]
+            if position is not None:
+                row = index_df.iloc[position]
                 section = str(row.get('Section', '')) if 'Section' in row.index else ''
                 source_name = str(row.get('Source', Path(xlsx_path).stem))
                 
@@ -495,7 +694,7 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
             
             # Read table content (skip header rows)
             try:
-                table_df = pd.read_excel(xlsx_path, sheet_name=sheet_name, header=None)
+                table_df = xl.parse(sheet_name, header=None)
                 
                 # Extract Main Header (Level 0) from source metadata if present
                 main_header = ''
@@ -706,98 +905,143 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
                     # header_content_fp ensures sub-tables with different column headers stay separate
                     structure_key = f"{structure_fingerprint}::{header_pattern}::{header_content_fp}"
                     
-                    # Find best matching group using fuzzy Section+Title matching
-                    # Use 80% threshold for title AND row label overlap (per merge condition spec)
-                    # Structure fingerprint ensures only same-structure tables merge
-                    best_match_key = self._find_fuzzy_matching_group(
-                        all_tables_by_full_title,
-                        section_title_combo,
-                        structure_key,
-                        threshold=0.80,
-                        row_labels=norm_rows  # Pass row labels for 80% overlap check
-                    )
-                    
-                    if best_match_key:
-                        normalized_key = best_match_key
-                    else:
-                        # No fuzzy match found, create new key
-                        normalized_key = f"{section_title_combo}::{structure_key}"
-                    
-                    # DEBUG: Log Reconciliations keys
-                    if 'reconciliation' in normalized_title.lower():
-                        logger.info(f"RECON KEY: sheet={sheet_name}, combo={section_title_combo[:40]}, struct={structure_key[:30]}, KEY={normalized_key[:80]}")
-                    
-                    # Debug logging removed - was: INC_STMT logger.warning
-
-                    
-                    all_tables_by_full_title[normalized_key].append({
-                        'data': subtable_df,
-                        'metadata': metadata,
-                        'sheet_name': sheet_name,
-                        'original_title': full_title if len(subtables) == 1 else f"{full_title} (Part {subtable_idx + 1})",
-                        'section': section,
-                        'row_sig': row_sig,
-                        'subtable_idx': subtable_idx
+                    payloads.append({
+                        'table': {
+                            'data': subtable_df,
+                            'metadata': metadata,
+                            'sheet_name': sheet_name,
+                            'original_title': full_title if len(subtables) == 1 else f"{full_title} (Part {subtable_idx + 1})",
+                            'section': section,
+                            'row_sig': row_sig,
+                            'subtable_idx': subtable_idx
+                        },
+                        'row_labels': norm_rows,
+                        'full_title': full_title,
+                        'normalized_title': normalized_title,
+                        'section_title_combo': section_title_combo,
+                        'structure_key': structure_key,
+                        'subtable_count': len(subtables)
                     })
                     
-                    if normalized_key not in title_to_sheet_name:
-                        clean_display = full_title.replace('→ ', '').strip() if full_title.startswith('→') else full_title
-                        if len(subtables) > 1:
-                            clean_display = f"{clean_display} (Part {subtable_idx + 1})"
-                        if section and section.strip():
-                            display_with_section = f"{section.strip()} - {clean_display}"
-                        else:
-                            display_with_section = clean_display
-                        
-                        # Parse page number for sorting (prefer 10-Q over 10-K for TOC order)
-                        page_val = metadata.get('page', '')
-                        report_type = metadata.get('report_type', '')
-                        is_10q = '10-Q' in str(report_type).upper() or '10q' in str(metadata.get('source', '')).lower()
-                        
-                        try:
-                            page_num = int(page_val) if page_val and str(page_val) != 'nan' else 9999
-                        except (ValueError, TypeError):
-                            page_num = 9999
-                        
-                        title_to_sheet_name[normalized_key] = {
-                            'display_title': display_with_section,
-                            'section': section.strip() if section else '',
-                            'original_title': full_title,
-                            'min_page': page_num,  # For TOC-based sorting
-                            'has_10q_page': is_10q,  # Prefer 10-Q page numbers
-                        }
-                    else:
-                        # Update min_page: prefer 10-Q pages over 10-K pages
-                        page_val = metadata.get('page', '')
-                        report_type = metadata.get('report_type', '')
-                        is_10q = '10-Q' in str(report_type).upper() or '10q' in str(metadata.get('source', '')).lower()
-                        
-                        try:
-                            page_num = int(page_val) if page_val and str(page_val) != 'nan' else 9999
-                        except (ValueError, TypeError):
-                            page_num = 9999
-                        
-                        existing_entry = title_to_sheet_name[normalized_key]
-                        existing_has_10q = existing_entry.get('has_10q_page', False)
-                        existing_min = existing_entry.get('min_page', 9999)
-                        
-                        # Priority: 10-Q page > 10-K page (regardless of page number)
-                        if is_10q and not existing_has_10q:
-                            # Replace with 10-Q page
-                            existing_entry['min_page'] = page_num
-                            existing_entry['has_10q_page'] = True
-                        elif is_10q and existing_has_10q:
-                            # Both are 10-Q, use min page
-                            if page_num < existing_min:
-                                existing_entry['min_page'] = page_num
-                        elif not is_10q and not existing_has_10q:
-                            # Both are 10-K, use min page
-                            if page_num < existing_min:
-                                existing_entry['min_page'] = page_num
-                        # If existing is 10-Q and new is 10-K, keep existing
-                    
             except Exception as e:
                 logger.debug(f"Skipping sheet {sheet_name}: {e}")
+        
+        xl.close()
+        return payloads
+    
+    def _add_xlsx_tables(
+        self,
+        payloads: List[Dict[str, Any]],
+        all_tables_by_full_title: Dict[str, List],
+        title_to_sheet_name: Dict[str, dict],
+        group_index: Optional[TableGroupIndex] = None
+    ) -> None:
+        """
+        Group the tables read by _read_xlsx_tables into the collection.
+        
+        Args:
+            payloads: Table payloads of one file, in sheet order
+            all_tables_by_full_title: Grouping key -> tables (updated)
+            title_to_sheet_name: Grouping key -> Index mapping (updated)
+            group_index: Optional index over all_tables_by_full_title
+        """
+        for payload in payloads:
+            norm_rows = payload['row_labels']
+            section_title_combo = payload['section_title_combo']
+            structure_key = payload['structure_key']
+            full_title = payload['full_title']
+            normalized_title = payload['normalized_title']
+            sheet_name = payload['table']['sheet_name']
+            section = payload['table']['section']
+            subtable_idx = payload['table']['subtable_idx']
+            
+            # Sub-tables of a sheet share one metadata dict: match with this
+            # sub-table's row labels, then restore the sheet's last ones
+            # (same state as when reading and grouping were interleaved)
+            metadata = payload['table']['metadata']
+            sheet_row_labels = metadata.get('row_labels')
+            metadata['row_labels'] = norm_rows.copy()
+            
+            # Find best matching group using fuzzy Section+Title matching
+            # Use 80% threshold for title AND row label overlap (per merge condition spec)
+            # Structure fingerprint ensures only same-structure tables merge
+            best_match_key = self._find_fuzzy_matching_group(
+                all_tables_by_full_title,
+                section_title_combo,
+                structure_key,
+                threshold=0.80,
+                row_labels=norm_rows,  # Pass row labels for 80% overlap check
+                group_index=group_index
+            )
+            metadata['row_labels'] = sheet_row_labels
+            
+            if best_match_key:
+                normalized_key = best_match_key
+            else:
+                # No fuzzy match found, create new key
+                normalized_key = f"{section_title_combo}::{structure_key}"
+            
+            # DEBUG: Log Reconciliations keys
+            if 'reconciliation' in normalized_title.lower():
+                logger.info(f"RECON KEY: sheet={sheet_name}, combo={section_title_combo[:40]}, struct={structure_key[:30]}, KEY={normalized_key[:80]}")
+            
+            all_tables_by_full_title[normalized_key].append(payload['table'])
+            
+            if normalized_key not in title_to_sheet_name:
+                clean_display = full_title.replace('→ ', '').strip() if full_title.startswith('→') else full_title
+                if payload['subtable_count'] > 1:
+                    clean_display = f"{clean_display} (Part {subtable_idx + 1})"
+                if section and section.strip():
+                    display_with_section = f"{section.strip()} - {clean_display}"
+                else:
+                    display_with_section = clean_display
+                
+                # Parse page number for sorting (prefer 10-Q over 10-K for TOC order)
+                page_val = metadata.get('page', '')
+                report_type = metadata.get('report_type', '')
+                is_10q = '10-Q' in str(report_type).upper() or '10q' in str(metadata.get('source', '')).lower()
+                
+                try:
+                    page_num = int(page_val) if page_val and str(page_val) != 'nan' else 9999
+                except (ValueError, TypeError):
+                    page_num = 9999
+                
+                title_to_sheet_name[normalized_key] = {
+                    'display_title': display_with_section,
+                    'section': section.strip() if section else '',
+                    'original_title': full_title,
+                    'min_page': page_num,  # For TOC-based sorting
+                    'has_10q_page': is_10q,  # Prefer 10-Q page numbers
+                }
+            else:
+                # Update min_page: prefer 10-Q pages over 10-K pages
+                page_val = metadata.get('page', '')
+                report_type = metadata.get('report_type', '')
+                is_10q = '10-Q' in str(report_type).upper() or '10q' in str(metadata.get('source', '')).lower()
+                
+                try:
+                    page_num = int(page_val) if page_val and str(page_val) != 'nan' else 9999
+                except (ValueError, TypeError):
+                    page_num = 9999
+                
+                existing_entry = title_to_sheet_name[normalized_key]
+                existing_has_10q = existing_entry.get('has_10q_page', False)
+                existing_min = existing_entry.get('min_page', 9999)
+                
+                # Priority: 10-Q page > 10-K page (regardless of page number)
+                if is_10q and not existing_has_10q:
+                    # Replace with 10-Q page
+                    existing_entry['min_page'] = page_num
+                    existing_entry['has_10q_page'] = True
+                elif is_10q and existing_has_10q:
+                    # Both are 10-Q, use min page
+                    if page_num < existing_min:
+                        existing_entry['min_page'] = page_num
+                elif not is_10q and not existing_has_10q:
+                    # Both are 10-K, use min page
+                    if page_num < existing_min:
+                        existing_entry['min_page'] = page_num
+                # If existing is 10-Q and new is 10-K, keep existing
     
     def _detect_report_type(self, source: str) -> str:
         """Detect report type from source filename. Delegates to ExcelUtils."""
@@ -892,27 +1136,32 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
         
         return len(all_columns) > 0
     
-    def _validate_index_sheet_links(self, output_path: Path) -> dict:
+    def _validate_index_sheet_links(self, workbook: Union[Workbook, Path]) -> dict:
         """
         Verify all Index links have matching sheets.
         
         Args:
-            output_path: Path to the consolidated xlsx file
+            workbook: In-memory workbook, or path to a saved consolidated xlsx file
             
         Returns:
             Dict with missing_sheets, orphan_sheets, and valid flag
         """
         try:
+            if isinstance(workbook, (str, Path)):
+                workbook = load_workbook(workbook, read_only=True)
             
-            wb = load_workbook(output_path)
-            sheet_names = set(wb.sheetnames) - {'Index'}
-            
-            index_df = pd.read_excel(output_path, sheet_name='Index')
+            sheet_names = set(workbook.sheetnames) - {'Index'}
+            index_rows = workbook['Index'].iter_rows(values_only=True)
+            header = next(index_rows, ())
+            link_col = list(header).index('Link')
             
             # Extract link values (removing → prefix)
             link_values = set()
-            for link in index_df['Link'].dropna().astype(str).tolist():
-                clean_link = link.replace('→ ', '').strip()
+            for row in index_rows:
+                link = row[link_col] if link_col < len(row) else None
+                if link is None:
+                    continue
+                clean_link = str(link).replace('→ ', '').strip()
                 if clean_link:
                     link_values.add(clean_link)
             
@@ -951,14 +1200,19 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
         section_title_combo: str,
         structure_key: str,
         threshold: float = 0.80,
-        row_labels: Optional[List[str]] = None
+        row_labels: Optional[List[str]] = None,
+        group_index: Optional[TableGroupIndex] = None
     ) -> Optional[str]:
         """
         Find an existing group key that fuzzy-matches using 80% conditions.
         
         Delegates to TableGrouper for centralized logic.
         Checks both title similarity (80%) and row label overlap (80%).
+        With a TableGroupIndex over the same groups, only indexed candidates
+        are compared (same result as the full scan).
         """
+        if group_index is not None:
+            return group_index.find_matching_group(section_title_combo, structure_key, threshold, row_labels)
         return TableGrouper.find_fuzzy_matching_group(
             all_tables_by_full_title, section_title_combo, structure_key, threshold, row_labels
         )
@@ -979,6 +1233,33 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
         """
         return TableDetector.get_header_structure_pattern(df)
     
+    def _extract_header_content_fingerprint(self, df: pd.DataFrame) -> str:
+        """
+        Fingerprint the non-period column header text of a table.
+        
+        Period codes, years and "months ended"/"at <date>" headers change
+        from filing to filing and become merged columns, so only the
+        remaining header labels (e.g., "Average Balance" vs "Interest")
+        keep sub-tables with different column headers apart.
+        """
+        _, _, data_start = self._find_header_rows(df)
+        
+        parts = []
+        for row_idx in range(min(data_start, len(df))):
+            for val in df.iloc[row_idx, 1:].tolist():
+                if pd.isna(val):
+                    continue
+                text = str(val).strip()
+                if not text or PeriodTypeDetector.classify_header(text) != 'other':
+                    continue
+                if re.search(r'\b(19|20)\d{2}\b', text) or re.search(r'months ended|^at \w+', text, re.IGNORECASE):
+                    continue
+                part = re.sub(r'[^a-z0-9]', '', text.lower())[:20]
+                if part and part not in parts:
+                    parts.append(part)
+        
+        return '|'.join(parts)
+    
     def _find_header_rows(self, df: pd.DataFrame) -> Tuple[int, int, int]:
         """
         Dynamically find L1 header, L2 header, and data start row indices.
@@ -1295,8 +1576,28 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
         Returns:
             Dict mapping created sheet names to their period types
         """
+        sheets, is_split = self._build_sheet_frames(base_sheet_name, tables, transpose)
+        return self._write_sheet_frames(writer, sheets, is_split, title_to_sheet_name, normalized_key)
+    
+    def _build_sheet_frames(
+        self,
+        base_sheet_name: str,
+        tables: List[Dict[str, Any]],
+        transpose: bool = False
+    ) -> Tuple[List[Tuple[str, str, pd.DataFrame]], bool]:
+        """
+        Build the sheets of one table group, split by period type.
+        
+        Args:
+            base_sheet_name: Base sheet name (e.g., "5")
+            tables: List of table dicts to merge
+            transpose: If True, transpose the output
+            
+        Returns:
+            ([(sheet_name, period_type, frame), ...], whether split by period type)
+        """
         if not tables:
-            return {}
+            return [], False
         
         # First, collect all column headers by running a pre-analysis pass
         all_column_headers = set()
@@ -1337,22 +1638,22 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
             logger.debug(f"Sheet {base_sheet_name}: No period codes found, using single source (no merge)")
             # Use only the first (most recent) table
             single_table = [tables[0]] if tables else tables
-            created = self._create_merged_table_sheet(writer, base_sheet_name, single_table, transpose)
-            if created:
-                return {base_sheet_name: 'no_period'}
-            return {}
+            frame = self._build_merged_table_frame(base_sheet_name, single_table, transpose)
+            if frame is not None:
+                return [(base_sheet_name, 'no_period', frame)], False
+            return [], False
         
         # If only one period type, create single sheet without suffix
         if len(period_types_found) == 1:
-            created = self._create_merged_table_sheet(writer, base_sheet_name, tables, transpose)
-            if created:
-                return {base_sheet_name: list(period_types_found)[0]}
-            return {}
+            frame = self._build_merged_table_frame(base_sheet_name, tables, transpose)
+            if frame is not None:
+                return [(base_sheet_name, list(period_types_found)[0], frame)], False
+            return [], False
         
         # Multiple period types - need to split
         logger.info(f"Sheet {base_sheet_name}: Splitting by period types: {period_types_found}")
         
-        created_sheets = {}
+        sheets = []
         
         # For each period type, filter the column data and create separate sheet
         for period_type in sorted(period_types_found):
@@ -1363,35 +1664,56 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
             if len(split_sheet_name) > 31:
                 split_sheet_name = f"{base_sheet_name[:28]}{suffix}"
             
-            # Create the sheet with period type filter
-            # We pass the period_type to filter columns during sheet creation
-            created = self._create_merged_table_sheet(
-                writer, 
+            # Build the sheet with period type filter
+            frame = self._build_merged_table_frame(
                 split_sheet_name, 
                 tables, 
                 transpose,
                 period_type_filter=period_type
             )
             
-            if created:
-                created_sheets[split_sheet_name] = period_type
+            if frame is not None:
+                sheets.append((split_sheet_name, period_type, frame))
                 
-                # Update title_to_sheet_name mapping for Index
-                if title_to_sheet_name and normalized_key:
-                    label = PeriodTypeDetector.get_label(period_type)
-                    original_mapping = title_to_sheet_name.get(normalized_key, {})
+        return sheets, True
                     
-                    # Create new entry for split sheet
-                    split_key = f"{normalized_key}::{period_type}"
-                    title_to_sheet_name[split_key] = {
-                        'unique_sheet_name': split_sheet_name,
-                        'display_title': f"{original_mapping.get('display_title', '')} {label}",
-                        'section': original_mapping.get('section', ''),
-                        'original_title': original_mapping.get('original_title', ''),
-                        'period_type': period_type,
-                        'is_split_sheet': True,
-                        'parent_key': normalized_key
-                    }
+    def _write_sheet_frames(
+        self,
+        writer: pd.ExcelWriter,
+        sheets: List[Tuple[str, str, pd.DataFrame]],
+        is_split: bool,
+        title_to_sheet_name: Optional[Dict[str, dict]] = None,
+        normalized_key: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Write built sheets and register split sheets for the Index.
+        
+        Returns:
+            Dict mapping created sheet names to their period types
+        """
+        created_sheets = {}
+        
+        for sheet_name, period_type, frame in sheets:
+            # Write without pandas headers (we've included them in the data)
+            frame.to_excel(writer, sheet_name=sheet_name, index=False, header=False)
+            created_sheets[sheet_name] = period_type
+            
+            # Update title_to_sheet_name mapping for Index
+            if is_split and title_to_sheet_name and normalized_key:
+                label = PeriodTypeDetector.get_label(period_type)
+                original_mapping = title_to_sheet_name.get(normalized_key, {})
+                
+                # Create new entry for split sheet
+                split_key = f"{normalized_key}::{period_type}"
+                title_to_sheet_name[split_key] = {
+                    'unique_sheet_name': sheet_name,
+                    'display_title': f"{original_mapping.get('display_title', '')} {label}",
+                    'section': original_mapping.get('section', ''),
+                    'original_title': original_mapping.get('original_title', ''),
+                    'period_type': period_type,
+                    'is_split_sheet': True,
+                    'parent_key': normalized_key
+                }
         
         return created_sheets
     
@@ -1416,9 +1738,39 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
         Returns:
             True if sheet has data, False if empty (sheet not created)
         """
-        if not tables:
+        final_df = self._build_merged_table_frame(title, tables, transpose, period_type_filter)
+        if final_df is None:
             return False
         
+        # Write without pandas headers (we've included them in the data)
+        final_df.to_excel(writer, sheet_name=title, index=False, header=False)
+        return True
+    
+    def _build_merged_table_frame(
+        self,
+        title: str,
+        tables: List[Dict[str, Any]],
+        transpose: bool = False,
+        period_type_filter: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
+        """Build the cell grid of a merged sheet without writing it.
+        
+        Pure function of its inputs, so sheets can be built in worker
+        processes and written in order by the parent.
+        
+        Args:
+            title: Sheet name
+            tables: List of table dicts to merge
+            transpose: If True, transpose the output
+            period_type_filter: If provided, only include columns matching this period type
+                                ('point_in_time', 'period_based', 'annual')
+        
+        Returns:
+            Final DataFrame (metadata + headers + data), or None if empty
+        """
+        if not tables:
+            return None
+        
         all_columns = {}
         row_labels = []
         normalized_row_labels = {}
@@ -1719,8 +2071,8 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
                     }
         
         if not all_columns:
-            # Don't create empty sheets - just return False
-            return False
+            # Don't create empty sheets - just return None
+            return None
         
         # Sort columns by date (ASCENDING - chronological order: oldest first)
         # e.g., Dec 2024, Mar 2025, Jun 2025, Sep 2025
@@ -2242,9 +2594,7 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
             # Stack: metadata + header + transposed data
             final_df = pd.concat([metadata_df_trans, header_row, result_df], ignore_index=True)
             
-            # Write directly
-            final_df.to_excel(writer, sheet_name=title, index=False, header=False)
-            return True
+            return final_df
         
         # REGULAR output: metadata + header rows + data
         frames_to_concat = [metadata_df] + header_frames + [result_df]
@@ -2309,35 +2659,67 @@ class ConsolidatedExcelExporter(BaseExcelExporter):
                         final_df.iloc[row_idx, col_idx] = str(int(val))
 
         
-        # Write without pandas headers (we've included them in the data)
-        final_df.to_excel(writer, sheet_name=title, index=False, header=False)
-        return True  # Sheet has data
+        return final_df
     
     def _add_hyperlinks(
         self,
-        output_path: Path,
+        workbook: Workbook,
         all_tables_by_full_title: Dict[str, List],
         title_to_sheet_name: Dict[str, dict]
     ) -> None:
         """
-        Add hyperlinks to consolidated workbook.
+        Add hyperlinks to the in-memory consolidated workbook.
         
         Delegates to ExcelFormatter for centralized logic.
         """
-        ExcelFormatter.add_hyperlinks(output_path, all_tables_by_full_title, title_to_sheet_name)
+        ExcelFormatter.add_hyperlinks_to_workbook(workbook)
     
     def _apply_currency_format(
         self,
-        output_path: Path,
+        workbook: Workbook,
         all_tables_by_full_title: Dict[str, List],
         title_to_sheet_name: Dict[str, dict]
     ) -> None:
         """
-        Apply US currency number format to numeric data cells.
+        Apply US currency number format to numeric data cells in memory.
         
         Delegates to ExcelFormatter for centralized logic.
         """
-        ExcelFormatter.apply_currency_format(output_path, all_tables_by_full_title, title_to_sheet_name)
+        ExcelFormatter.apply_currency_format_to_workbook(workbook)
+
+
+# =============================================================================
+# PROCESS-POOL WORKERS (module-level so they can be pickled)
+# =============================================================================
+CONSOLIDATION_TASKS = ('regular', 'transposed', 'index')
+
+# Parsed input shared by consolidation workers (set once per worker process)
+_worker_input: Optional[Dict[str, Any]] = None
+
+
+def _init_consolidation_worker(shared_input: Dict[str, Any]) -> None:
+    """Receive the parsed tables once per worker instead of once per task."""
+    global _worker_input
+    _worker_input = shared_input
+
+
+def _run_consolidation_task(task: str) -> Optional[dict]:
+    """Build one consolidation output ('regular', 'transposed' or 'index')."""
+    exporter = ConsolidatedExcelExporter()
+    exporter.processed_dir = _worker_input['processed_dir']
+    exporter.consolidate_dir = _worker_input['consolidate_dir']
+    return exporter._run_consolidation_task(task, _worker_input)
+
+
+def _read_xlsx_tables_task(xlsx_path: str) -> List[Dict[str, Any]]:
+    """Read the table payloads of one processed xlsx file."""
+    return get_consolidated_exporter()._read_xlsx_tables(xlsx_path)
+
+
+def _build_sheet_frames_task(task: Tuple[str, str, List[Dict[str, Any]], bool]):
+    """Build the sheet frames of one table group (normalized_key, sheet_name, tables, transpose)."""
+    _, sheet_name, tables, transpose = task
+    return get_consolidated_exporter()._build_sheet_frames(sheet_name, tables, transpose)
 
 
 # =============================================================================
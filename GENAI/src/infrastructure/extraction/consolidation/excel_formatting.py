@@ -3,6 +3,10 @@ Excel Formatting - Apply formatting to consolidated Excel workbooks.
 
 Standalone module for Excel formatting operations.
 Used by: consolidated_exporter.py
+
+The ``*_to_workbook`` variants work on an in-memory openpyxl Workbook
+(e.g. ``pd.ExcelWriter(...).book`` before it is closed), so a workbook
+is formatted and linked while it is built and written to disk once.
 """
 
 import re
@@ -12,7 +16,7 @@ from typing import Dict, List, Any
 from src.utils import get_logger
 from src.utils.excel_utils import ExcelUtils
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, Alignment
 from openpyxl.styles.numbers import FORMAT_CURRENCY_USD_SIMPLE
 
@@ -53,12 +57,27 @@ class ExcelFormatter:
         all_tables_by_full_title: Dict[str, List],
         title_to_sheet_name: Dict[str, dict]
     ) -> None:
-        """Add hyperlinks to consolidated workbook."""
+        """Add hyperlinks to a saved consolidated workbook (load, link, save)."""
         try:
             wb = load_workbook(output_path)
+            cls.add_hyperlinks_to_workbook(wb)
+            wb.save(output_path)
+        except Exception as e:
+            logger.warning(f"Could not add hyperlinks: {e}")
+    
+    @classmethod
+    def add_hyperlinks_to_workbook(cls, wb: Workbook) -> None:
+        """
+        Add Index → sheet links and sheet → Index back-links in memory.
+        
+        Used before the workbook is first saved, so the file is
+        serialized once instead of being reloaded to add links.
+        """
+        try:
+            sheet_names = set(wb.sheetnames)
             
             # Add hyperlinks in Index sheet
-            if 'Index' in wb.sheetnames:
+            if 'Index' in sheet_names:
                 index_sheet = wb['Index']
                 
                 # Find Link column dynamically
@@ -85,7 +104,7 @@ class ExcelFormatter:
                             else:
                                 sheet_name = raw_str
                         
-                        if sheet_name and sheet_name in wb.sheetnames:
+                        if sheet_name and sheet_name in sheet_names:
                             cell.hyperlink = f"#'{sheet_name}'!A1"
                             cell.value = f"→ {sheet_name}"
                             cell.font = Font(color="0000FF", underline="single")
@@ -103,7 +122,6 @@ class ExcelFormatter:
                 cell.hyperlink = "#'Index'!A1"
                 cell.font = Font(color="0000FF", underline="single")
             
-            wb.save(output_path)
             logger.info(f"Added hyperlinks to consolidated workbook: {len(wb.sheetnames) - 1} sheets")
             
         except Exception as e:
@@ -116,10 +134,22 @@ class ExcelFormatter:
         all_tables_by_full_title: Dict[str, List],
         title_to_sheet_name: Dict[str, dict]
     ) -> None:
-        """Apply US currency number format to numeric data cells."""
+        """Apply US currency number format to a saved workbook (load, format, save)."""
         try:
             wb = load_workbook(output_path)
-            
+            cls.apply_currency_format_to_workbook(wb)
+            wb.save(output_path)
+        except Exception as e:
+            logger.warning(f"Could not apply currency formatting: {e}")
+    
+    @classmethod
+    def apply_currency_format_to_workbook(cls, wb: Workbook) -> None:
+        """
+        Apply US currency number format to numeric data cells in memory.
+        
+        Also fixes float header years and merges spanning header cells.
+        """
+        try:
             # US currency accounting format: $#,##0.00 for positive, ($#,##0.00) for negative
             CURRENCY_FORMAT = '_($* #,##0.00_);_($* (#,##0.00);_($* "-"??_);_(@_)'
             PERCENTAGE_FORMAT = '0.00%'
@@ -157,7 +187,6 @@ class ExcelFormatter:
                 # Apply currency/percentage format using HYBRID detection
                 cls._apply_number_formats(ws, data_start_row, CURRENCY_FORMAT, PERCENTAGE_FORMAT)
             
-            wb.save(output_path)
             logger.info(f"Applied currency/percentage formatting to consolidated workbook")
             
         except Exception as e:
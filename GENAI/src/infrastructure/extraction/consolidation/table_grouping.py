@@ -11,9 +11,16 @@ Merge Conditions (ALL must be satisfied):
 """
 
 import re
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple, Set
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz.distance import Indel
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 
 class TableGrouper:
     """
@@ -264,6 +271,19 @@ class TableGrouper:
         
         return label.strip()
     
+    @classmethod
+    def normalize_row_label_set(cls, rows: List[str]) -> Set[str]:
+        """
+        Normalize row labels into the set used for overlap comparison.
+        
+        Empty and metadata labels (Row Label, $ in millions, ...) are dropped.
+        """
+        normalized = {cls.normalize_row_label(r) for r in rows if r and str(r).strip()}
+        
+        # Filter out empty and metadata labels
+        skip_labels = {'', 'nan', 'none', 'row label', '$ in millions', '$ in billions'}
+        return normalized - skip_labels
+    
     @classmethod
     def calculate_row_label_overlap(
         cls,
@@ -285,14 +305,8 @@ class TableGrouper:
         Returns:
             Tuple of (overlap_ratio, meets_threshold)
         """
-        # Normalize all labels
-        source_normalized = {cls.normalize_row_label(r) for r in source_rows if r and str(r).strip()}
-        target_normalized = {cls.normalize_row_label(r) for r in target_rows if r and str(r).strip()}
-        
-        # Filter out empty and metadata labels
-        skip_labels = {'', 'nan', 'none', 'row label', '$ in millions', '$ in billions'}
-        source_normalized = source_normalized - skip_labels
-        target_normalized = target_normalized - skip_labels
+        source_normalized = cls.normalize_row_label_set(source_rows)
+        target_normalized = cls.normalize_row_label_set(target_rows)
         
         if not source_normalized or not target_normalized:
             return 0.0, False
@@ -375,3 +389,190 @@ class TableGrouper:
             return False, scores
         
         return True, scores
+
+
+class _IndexedGroup:
+    """Per-group data cached by TableGroupIndex."""
+    
+    __slots__ = ('key', 'title', 'matcher', 'row_labels', 'row_label_set')
+    
+    def __init__(self, key: str, title: str):
+        self.key = key
+        self.title = title
+        self.matcher = None  # SequenceMatcher with this title as seq2
+        self.row_labels = None  # row_labels list the cached set was built from
+        self.row_label_set = None
+
+
+class TableGroupIndex:
+    """
+    Candidate index for TableGrouper.find_fuzzy_matching_group.
+    
+    The linear scan compares every new table against every existing group,
+    which makes consolidation quadratic in the number of distinct tables.
+    This index returns the same group for the same inputs while doing far
+    less work per lookup:
+    
+    - Groups are blocked by their exact structure key, so only groups that
+      could pass the structure condition are visited
+    - Titles are rejected with upper bounds on the SequenceMatcher ratio
+      (length bound, then the LCS bound via rapidfuzz or quick_ratio())
+      before the exact ratio is computed
+    - Each group's row labels are normalized once, not on every comparison
+    
+    Every bound is exact, so no candidate that the scan would accept is
+    ever skipped, and candidates are visited in the scan's order so ties
+    resolve identically.
+    
+    The index reads new groups from the dict it wraps; groups may be added
+    (and their tables appended) but not removed.
+    
+    Example:
+        >>> index = TableGroupIndex(all_tables_by_full_title)
+        >>> key = index.find_matching_group(combo, structure_key, 0.80, row_labels)
+    """
+    
+    def __init__(self, groups: Dict[str, List]):
+        """
+        Initialize the index.
+        
+        Args:
+            groups: Existing groups dictionary (grouping key -> tables)
+        """
+        self.groups = groups
+        self._blocks: Dict[str, List[_IndexedGroup]] = defaultdict(list)
+        self._indexed = 0
+    
+    def find_matching_group(
+        self,
+        section_title_combo: str,
+        structure_key: str,
+        threshold: float = 0.80,
+        row_labels: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Find an existing group key that fuzzy-matches using 80% conditions.
+        
+        Same conditions and result as TableGrouper.find_fuzzy_matching_group.
+        
+        Args:
+            section_title_combo: The Section|Title combination to match
+            structure_key: The exact structure (fingerprint::header_pattern) that must match
+            threshold: Minimum similarity ratio (default 0.80 = 80%)
+            row_labels: Optional list of row labels for overlap checking
+        
+        Returns:
+            The matching key if found, None otherwise
+        """
+        self._sync()
+        
+        candidates = self._blocks.get(structure_key)
+        if not candidates:
+            return None
+        
+        input_title = self._split_title(section_title_combo)
+        input_row_labels = TableGrouper.normalize_row_label_set(row_labels) if row_labels else None
+        
+        best_match_key = None
+        best_score = 0.0
+        
+        for group in candidates:
+            # Condition 1: Title fuzzy match (80% threshold)
+            title_ratio = self._title_ratio(input_title, group, threshold)
+            if title_ratio is None:
+                continue
+            
+            # Condition 2: Row label overlap (80% threshold) - if row_labels provided
+            row_overlap = 1.0  # Default to pass if no row_labels
+            existing_tables = self.groups[group.key]
+            if row_labels and existing_tables:
+                # Get row_labels from the first table in the existing group
+                existing_row_labels = existing_tables[0].get('metadata', {}).get('row_labels', [])
+                if existing_row_labels:
+                    row_overlap = self._row_overlap(input_row_labels, group, existing_row_labels, threshold)
+                    if row_overlap is None:
+                        continue
+            
+            # Calculate combined score (average of title and row overlap)
+            combined_score = (title_ratio + row_overlap) / 2
+            
+            if combined_score > best_score:
+                best_match_key = group.key
+                best_score = combined_score
+        
+        return best_match_key
+    
+    def _sync(self) -> None:
+        """Index groups added to the wrapped dict since the last lookup."""
+        if len(self.groups) == self._indexed:
+            return
+        
+        for key in list(self.groups)[self._indexed:]:
+            # Key format: "section|title::structure_fingerprint::header_pattern"
+            parts = key.split('::')
+            if len(parts) >= 2:
+                structure = '::'.join(parts[1:])
+                self._blocks[structure].append(_IndexedGroup(key, self._split_title(parts[0])))
+        self._indexed = len(self.groups)
+    
+    @staticmethod
+    def _split_title(section_title: str) -> str:
+        """Lowercased title part of a Section|Title combination."""
+        if '|' in section_title:
+            _, title = section_title.split('|', 1)
+        else:
+            title = section_title
+        return title.lower().strip()
+    
+    @staticmethod
+    def _title_ratio(input_title: str, group: _IndexedGroup, threshold: float) -> Optional[float]:
+        """
+        SequenceMatcher(None, input_title, group title).ratio(), or None if below threshold.
+        
+        The bounds use SequenceMatcher's own 2*M/T formula with M = shortest
+        length or LCS length; SequenceMatcher never finds more than the LCS.
+        """
+        total = len(input_title) + len(group.title)
+        if total and 2.0 * min(len(input_title), len(group.title)) / total < threshold:
+            return None
+        
+        if RAPIDFUZZ_AVAILABLE and total:
+            lcs = (total - Indel.distance(input_title, group.title)) // 2
+            if 2.0 * lcs / total < threshold:
+                return None
+        
+        if group.matcher is None:
+            group.matcher = SequenceMatcher(None, '', group.title)
+        matcher = group.matcher
+        matcher.set_seq1(input_title)
+        
+        if matcher.quick_ratio() < threshold:
+            return None
+        
+        ratio = matcher.ratio()
+        return ratio if ratio >= threshold else None
+    
+    @staticmethod
+    def _row_overlap(
+        input_row_labels: Set[str],
+        group: _IndexedGroup,
+        existing_row_labels: List[str],
+        threshold: float
+    ) -> Optional[float]:
+        """Jaccard overlap with the group's row labels, or None if below threshold."""
+        # Row labels are re-read each time: the first table's metadata may
+        # be replaced after the group is created
+        if group.row_labels is not existing_row_labels:
+            group.row_labels = existing_row_labels
+            group.row_label_set = TableGrouper.normalize_row_label_set(existing_row_labels)
+        
+        target = group.row_label_set
+        if not input_row_labels or not target:
+            return None
+        
+        # |A & B| / |A | B| <= min / max
+        if min(len(input_row_labels), len(target)) / max(len(input_row_labels), len(target)) < threshold:
+            return None
+        
+        overlap = len(input_row_labels & target) / len(input_row_labels | target)
+        return overlap if overlap >= threshold else None
@@ -32,6 +32,8 @@ from src.utils.financial_domain import (
 # Import from new focused modules
 from src.infrastructure.extraction.exporters.block_detection import BlockDetector
 from src.infrastructure.extraction.exporters.index_manager import IndexManager
+from src.infrastructure.extraction.exporters.table_store import write_table_store
+from config.settings import settings
 from src.utils.constants import (
     TABLE_FILE_PATTERN,
     TABLE_MERGER_MAX_HEADER_SCAN_ROWS as MAX_HEADER_SCAN_ROWS,
@@ -251,17 +253,22 @@ class TableMerger:
             if new_sheets_created:
                 self._update_index_for_split_sheets(wb, new_sheets_created)
             
-            # Save to destination
             output_path = self.dest_dir / source_path.name
-            wb.save(output_path)
-            result['output_path'] = str(output_path)
             
-            # Apply currency/percentage formatting to output file
+            # Apply currency/percentage formatting before the single save
             try:
-                self._apply_number_formatting(output_path)
+                self._apply_number_formatting_to_workbook(wb)
             except Exception as e:
                 logger.debug(f"Could not apply number formatting to {output_path}: {e}")
             
+            # Save to destination
+            wb.save(output_path)
+            result['output_path'] = str(output_path)
+            
+            # Publish the sheets for consolidation (skips re-parsing the xlsx)
+            if settings.TABLE_STORE_ENABLED:
+                write_table_store(output_path, workbook=wb)
+            
             logger.info(f"Processed {source_path.name}: {result['tables_merged']} merges, {result['tables_split']} splits across {result['sheets_processed']} sheets")
             
         except Exception as e:
@@ -1395,15 +1402,13 @@ class TableMerger:
                     max_col = max(max_col, col_num)
         return max_col
     
-    def _apply_number_formatting(self, output_path: Path) -> None:
+    def _apply_number_formatting_to_workbook(self, wb: Workbook) -> None:
         """
-        Apply currency and percentage formatting to merged output file.
+        Apply currency and percentage formatting to the merged workbook in memory.
         
         Uses row label heuristics and value-based detection similar to
         ExcelFormatter.apply_currency_format().
         """
-        from openpyxl import load_workbook
-        
         # US currency accounting format
         CURRENCY_FORMAT = '_($* #,##0.00_);_($* (#,##0.00);_($* "-"??_);_(@_)'
         PERCENTAGE_FORMAT = '0.00%'
@@ -1412,8 +1417,6 @@ class TableMerger:
         CURRENCY_INDICATORS = ['$', 'dollar', 'revenue', 'income', 'expense', 'cost', 'assets', 'liabilities', 'balance']
         PERCENTAGE_INDICATORS = ['%', 'percent', 'ratio', 'margin', 'return', 'rate', 'yield', 'roe', 'roa', 'rotce']
         
-        wb = load_workbook(output_path)
-        
         for sheet_name in wb.sheetnames:
             if sheet_name.lower() == 'index':
                 continue
@@ -1473,9 +1476,6 @@ class TableMerger:
                     cell = ws.cell(row=row, column=col)
                     if isinstance(cell.value, (int, float)) and cell.value is not None:
                         cell.number_format = format_to_apply
-        
-        wb.save(output_path)
-        logger.debug(f"Applied number formatting to {output_path.name}")
 
 # =============================================================================
 # FACTORY FUNCTION (not a singleton - allows directory overrides)
@@ -0,0 +1,295 @@
+"""
+Table store - parsed sheets of a merged workbook, cached beside it.
+
+Consolidation used to re-parse every processed_advanced workbook that
+TableMerger had just written. TableMerger now also publishes the sheets
+of the workbook it saved here, one frame file per sheet, with a JSON
+manifest of titles, sections, pages, periods and sources taken from the
+Index sheet. Consolidation reads the frames (or only the sheets it
+selects from the manifest) and falls back to the xlsx when the store is
+missing, older than the workbook or unreadable.
+
+This is a cache for that one hop (TableMerger -> consolidation). The
+xlsx is still written and stays the source of truth; the other stages
+keep exchanging xlsx files.
+
+Frames are the ``pd.ExcelFile.parse(sheet, header=None)`` result, stored
+column by column as JSON (dtype plus cell values; datetimes are tagged).
+Sheet columns mix labels, numbers and blanks, which typed columnar formats
+such as Parquet only hold after converting them to strings, and JSON is
+neither executable on load nor tied to the pandas version.
+
+Layout (``<stem>.tables/`` next to ``<stem>.xlsx``):
+    manifest.json       workbook stamp, sheet order and per-sheet metadata
+    sheet_<n>.json      columns of the n-th sheet
+
+Example:
+    >>> write_table_store(output_path, workbook=wb)   # after wb.save(output_path)
+    >>> tables = read_table_store(output_path)        # None if missing/stale
+    >>> tables.parse("Index")
+    >>> tables.select(section="Results of Operations")
+"""
+
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+from openpyxl import Workbook
+from pandas.io.parsers import TextParser
+
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 2
+INDEX_SHEET = "Index"
+
+# Index columns copied into the manifest (Index column -> manifest field)
+INDEX_FIELDS = {
+    'Table Title': 'title',
+    'Section': 'section',
+    'Page': 'page',
+    'PageNo': 'page',
+    'Source': 'source',
+    'Year': 'year',
+    'Quarter': 'quarter',
+}
+
+
+def table_store_dir(xlsx_path: Union[str, Path]) -> Path:
+    """Store directory of a workbook (``<stem>.tables`` beside it)."""
+    xlsx_path = Path(xlsx_path)
+    return xlsx_path.with_name(f"{xlsx_path.stem}.tables")
+
+
+def _workbook_stamp(xlsx_path: Path) -> Dict[str, int]:
+    stat = xlsx_path.stat()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _json_value(value: Any) -> Any:
+    if pd.isna(value):
+        return None
+    if hasattr(value, 'item'):
+        return value.item()
+    return value if isinstance(value, (int, float, str, bool)) else str(value)
+
+
+def _encode_cell(value: Any) -> Any:
+    """JSON fallback for cell values (datetimes are tagged for round-trip)."""
+    if value is pd.NaT:
+        return None
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def _decode_cell(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if '__datetime__' in obj:
+            return pd.Timestamp(obj['__datetime__'])
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+def _write_frame(path: Path, df: pd.DataFrame) -> None:
+    """Write a frame as its column labels, dtypes and per-column values."""
+    payload = {
+        'columns': df.columns.tolist(),
+        'dtypes': [str(dtype) for dtype in df.dtypes],
+        'rows': len(df),
+        'values': [df[column].tolist() for column in df.columns],
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, default=_encode_cell, ensure_ascii=False)
+
+
+def _read_frame(path: Path) -> pd.DataFrame:
+    with open(path, encoding='utf-8') as f:
+        payload = json.load(f, object_hook=_decode_cell)
+    df = pd.DataFrame(
+        {
+            position: pd.Series(values, dtype=dtype)
+            for position, (dtype, values) in enumerate(zip(payload['dtypes'], payload['values']))
+        },
+        index=pd.RangeIndex(payload['rows']),
+    )
+    df.columns = payload['columns']
+    return df
+
+
+def _index_metadata(index_df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Index row metadata per linked sheet name (first row wins)."""
+    if 'Link' not in index_df.columns:
+        return {}
+
+    columns = [c for c in INDEX_FIELDS if c in index_df.columns]
+    by_sheet = {}
+    links = index_df['Link'].astype(str).str.replace('→ ', '', regex=False).str.strip()
+    for link, (_, row) in zip(links, index_df.iterrows()):
+        if link not in by_sheet:
+            by_sheet[link] = {INDEX_FIELDS[c]: _json_value(row[c]) for c in columns}
+    return by_sheet
+
+
+@dataclass
+class StoredWorkbook:
+    """Read view of one workbook's store; sheets are loaded on demand."""
+
+    root: Path
+    manifest: Dict[str, Any]
+    _files: Dict[str, str] = field(default_factory=dict)
+    _loaded: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self._files = {s['name']: s['file'] for s in self.manifest['sheets']}
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return [s['name'] for s in self.manifest['sheets']]
+
+    @property
+    def sheets(self) -> List[Dict[str, Any]]:
+        """Manifest entries (name, rows, columns and Index metadata) in sheet order."""
+        return self.manifest['sheets']
+
+    def select(self, **criteria: Any) -> List[str]:
+        """Names of the sheets whose manifest entry matches all criteria."""
+        return [
+            s['name'] for s in self.sheets
+            if all(s.get(key) == value for key, value in criteria.items())
+        ]
+
+    def load(self, sheet_names: Optional[List[str]] = None) -> "StoredWorkbook":
+        """
+        Read sheets into memory up front (default: all).
+
+        Raises on a missing or corrupt sheet file, so callers can fall
+        back to the xlsx before they start using the tables.
+        """
+        for name in self.sheet_names if sheet_names is None else sheet_names:
+            if name not in self._loaded:
+                self._loaded[name] = self._read(name)
+        return self
+
+    def _read(self, sheet_name: str) -> pd.DataFrame:
+        if sheet_name not in self._files:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        return _read_frame(self.root / self._files[sheet_name])
+
+    def parse(self, sheet_name: str, header: Optional[int] = 0) -> pd.DataFrame:
+        """
+        Load one sheet, like ``pd.ExcelFile.parse`` for header=None or 0.
+
+        Returns a fresh frame on every call, so callers may modify it.
+        """
+        if sheet_name in self._loaded:
+            df = self._loaded[sheet_name].copy()
+        else:
+            df = self._read(sheet_name)
+        if header is None:
+            return df
+        if header != 0:
+            raise ValueError("Only header=None or header=0 is supported")
+        if df.empty:
+            return pd.DataFrame()
+        # Re-run the header/dtype inference read_excel applies to the cells
+        rows = df.astype(object).where(df.notna(), '').values.tolist()
+        return TextParser(rows, header=0).read()
+
+    def close(self) -> None:
+        """Drop loaded sheets; mirrors ``pd.ExcelFile.close``."""
+        self._loaded.clear()
+
+
+def write_table_store(
+    xlsx_path: Union[str, Path],
+    workbook: Optional[Workbook] = None,
+) -> Optional[Path]:
+    """
+    Publish the sheets of a saved workbook to its store.
+
+    Call after the workbook is saved; the store is stamped with the
+    file's size and modification time.
+
+    Args:
+        xlsx_path: Saved workbook
+        workbook: The in-memory openpyxl Workbook that was saved, so the
+            sheets are read without parsing the file again (optional)
+
+    Returns:
+        Store directory, or None if it could not be written
+    """
+    xlsx_path = Path(xlsx_path)
+    root = table_store_dir(xlsx_path)
+    try:
+        xl = pd.ExcelFile(workbook if workbook is not None else xlsx_path, engine='openpyxl')
+        frames = {name: xl.parse(name, header=None) for name in xl.sheet_names}
+
+        index_metadata = {}
+        if INDEX_SHEET in frames:
+            index_metadata = _index_metadata(xl.parse(INDEX_SHEET))
+
+        # Remove the previous store first so a failed write leaves no manifest
+        shutil.rmtree(root, ignore_errors=True)
+        root.mkdir(parents=True)
+
+        sheets = []
+        for position, (name, df) in enumerate(frames.items()):
+            file_name = f"sheet_{position:04d}.json"
+            _write_frame(root / file_name, df)
+            entry = {'name': name, 'file': file_name, 'rows': len(df), 'columns': len(df.columns)}
+            entry.update(index_metadata.get(name, {}))
+            sheets.append(entry)
+
+        manifest = {
+            'format_version': FORMAT_VERSION,
+            'workbook': xlsx_path.name,
+            'stamp': _workbook_stamp(xlsx_path),
+            'sheets': sheets,
+        }
+        tmp_manifest = root / f"{MANIFEST_NAME}.tmp"
+        with open(tmp_manifest, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_manifest, root / MANIFEST_NAME)
+    except Exception as e:
+        logger.warning(f"Could not write table store for {xlsx_path.name}: {e}")
+        shutil.rmtree(root, ignore_errors=True)
+        return None
+
+    logger.debug(f"Published {len(sheets)} sheets of {xlsx_path.name} to {root.name}")
+    return root
+
+
+def read_table_store(xlsx_path: Union[str, Path]) -> Optional[StoredWorkbook]:
+    """
+    Open the store of a workbook.
+
+    Returns:
+        StoredWorkbook, or None if there is no store or the workbook
+        changed after it was written (read the xlsx instead)
+    """
+    xlsx_path = Path(xlsx_path)
+    root = table_store_dir(xlsx_path)
+    try:
+        with open(root / MANIFEST_NAME, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format_version') != FORMAT_VERSION:
+            return None
+        if manifest.get('stamp') != _workbook_stamp(xlsx_path):
+            logger.debug(f"Table store of {xlsx_path.name} is stale")
+            return None
+    except (OSError, ValueError):
+        return None
+    return StoredWorkbook(root=root, manifest=manifest)
@@ -6,7 +6,7 @@ Main extractor class that orchestrates multiple backends with fallback strategy.
 
 import os
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
 from src.infrastructure.extraction.base import ExtractionBackend, ExtractionResult, BackendType, ExtractionError
 from src.infrastructure.extraction.strategy import ExtractionStrategy
@@ -22,7 +22,6 @@ from src.utils import get_logger
 from src.utils.metrics import get_metrics_collector
 from src.utils.constants import (
     EXTRACTION_MIN_QUALITY,
-    EXTRACTION_CACHE_TTL_HOURS,
     EXTRACTION_MAX_SIZE_MB,
 )
 from config.settings import settings
@@ -56,7 +55,7 @@ class UnifiedExtractor:
         backends: Optional[List[str]] = None,
         min_quality: float = EXTRACTION_MIN_QUALITY,
         enable_caching: bool = True,
-        cache_ttl_hours: int = EXTRACTION_CACHE_TTL_HOURS
+        cache_ttl_hours: Optional[float] = None
     ):
         """
         Initialize unified extractor.
@@ -65,7 +64,8 @@ class UnifiedExtractor:
             backends: List of backend names (default: from settings)
             min_quality: Minimum quality score threshold
             enable_caching: Enable result caching
-            cache_ttl_hours: Cache time-to-live in hours
+            cache_ttl_hours: Cache time-to-live in hours (None = never expires;
+                entries are keyed by PDF content and backend versions)
         """
         # Use config if not specified
         if backends is None:
@@ -81,6 +81,7 @@ class UnifiedExtractor:
         
         self.min_quality = min_quality
         self.enable_caching = enable_caching
+        self.backend_names = backends
         
         # Initialize backends
         self.backends = self._load_backends(backends)
@@ -95,7 +96,8 @@ class UnifiedExtractor:
         # Initialize cache
         self.cache = ExtractionCache(
             ttl_hours=cache_ttl_hours,
-            enabled=enable_caching
+            enabled=enable_caching,
+            backend_signature=self._backend_signature()
         ) if enable_caching else None
         
         logger.info(
@@ -105,6 +107,11 @@ class UnifiedExtractor:
             f"caching={enable_caching}"
         )
     
+    def _backend_signature(self) -> str:
+        """Backend names and versions (in fallback order) plus quality threshold, for cache keys."""
+        backends = "|".join(f"{b.get_name()}@{b.get_version()}" for b in self.backends)
+        return f"{backends}|q{self.min_quality:g}"
+    
     def extract(
         self,
         pdf_path: str,
@@ -126,7 +133,36 @@ class UnifiedExtractor:
             FileNotFoundError: If PDF file doesn't exist
             ValueError: If file is not a PDF or too large
         """
-        # Input validation
+        pdf_path = self._validate_pdf(pdf_path, kwargs.get('max_size_mb', EXTRACTION_MAX_SIZE_MB))
+        
+        # Check cache
+        if not force:
+            cached = self._get_cached(pdf_path)
+            if cached:
+                return cached
+        
+        # Extract with fallback
+        logger.info(f"Extracting {pdf_path}...")
+        result = self.strategy.extract_with_fallback(
+            pdf_path,
+            min_quality=self.min_quality
+        )
+        
+        self._record_result(pdf_path, result)
+            
+        # Save table report
+        self._save_table_report(result)
+        
+        return result
+    
+    def _validate_pdf(self, pdf_path: str, max_size_mb: float = EXTRACTION_MAX_SIZE_MB) -> str:
+        """
+        Validate a PDF path and resolve it to an absolute path.
+        
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            ValueError: If file is not a PDF or too large
+        """
         pdf_file = Path(pdf_path)
         
         # Check file exists
@@ -142,43 +178,39 @@ class UnifiedExtractor:
             raise ValueError(error_msg)
         
         # Check file size (prevent DoS with huge files)
-        max_size_mb = kwargs.get('max_size_mb', EXTRACTION_MAX_SIZE_MB)
         file_size_mb = pdf_file.stat().st_size / (1024 * 1024)
         if file_size_mb > max_size_mb:
             error_msg = f"PDF too large: {file_size_mb:.1f}MB > {max_size_mb}MB"
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        # Resolve to absolute path
-        pdf_path = str(pdf_file.resolve())
-        
         logger.info(f"Starting extraction: {pdf_file.name} ({file_size_mb:.1f}MB)")
         
-        # Check cache
-        if self.cache and not force:
-            cached = self.cache.get(pdf_path)
-            if cached:
-                logger.info(f"Using cached result for {pdf_path}")
-                # Record cache hit
-                metrics.record_extraction(
-                    pdf_path=pdf_path,
-                    backend=cached.backend.value,
-                    success=True,
-                    tables_found=len(cached.tables),
-                    quality_score=cached.quality_score,
-                    extraction_time=0.0  # Cache hit
-                )
-                self._save_table_report(cached)
-                return cached
-        
-        # Extract with fallback
-        logger.info(f"Extracting {pdf_path}...")
-        result = self.strategy.extract_with_fallback(
-            pdf_path,
-            min_quality=self.min_quality
-        )
-        
-        # Record metrics
+        # Resolve to absolute path
+        return str(pdf_file.resolve())
+    
+    def _get_cached(self, pdf_path: str) -> Optional[ExtractionResult]:
+        """Return a cached result (recording the hit), or None."""
+        if not self.cache:
+            return None
+        
+        cached = self.cache.get(pdf_path)
+        if cached:
+            logger.info(f"Using cached result for {pdf_path}")
+            # Record cache hit
+            metrics.record_extraction(
+                pdf_path=pdf_path,
+                backend=cached.backend.value,
+                success=True,
+                tables_found=len(cached.tables),
+                quality_score=cached.quality_score,
+                extraction_time=0.0  # Cache hit
+            )
+            self._save_table_report(cached)
+        return cached
+    
+    def _record_result(self, pdf_path: str, result: ExtractionResult) -> None:
+        """Record metrics for a fresh extraction and cache it if successful."""
         metrics.record_extraction(
             pdf_path=pdf_path,
             backend=result.backend.value,
@@ -193,22 +225,18 @@ class UnifiedExtractor:
         if self.cache and result.is_successful():
             self.cache.set(pdf_path, result)
             logger.info(f"Cached extraction result for {pdf_path}")
-            
-        # Save table report
-        self._save_table_report(result)
-
         
         logger.info(
             f"Extraction complete: {len(result.tables)} tables, "
             f"quality={result.quality_score:.1f}, time={result.extraction_time:.2f}s"
         )
-        
-        return result
     
     def extract_batch(
         self,
         pdf_paths: List[str],
-        force: bool = False
+        force: bool = False,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> List[ExtractionResult]:
         """
         Extract multiple PDFs.
@@ -216,26 +244,94 @@ class UnifiedExtractor:
         Args:
             pdf_paths: List of PDF paths
             force: Force re-extraction
+            workers: Worker processes (default: settings.EXTRACTION_WORKERS, 1 = serial)
+            timeout: Per-file timeout in seconds for parallel mode
             
         Returns:
-            List of extraction results
+            List of extraction results, in the order of pdf_paths
         """
-        results = []
+        results = dict(self.iter_extract(pdf_paths, force=force, workers=workers, timeout=timeout))
+        return [results[pdf_path] for pdf_path in pdf_paths]
+    
+    def iter_extract(
+        self,
+        pdf_paths: List[str],
+        force: bool = False,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[str, ExtractionResult]]:
+        """
+        Extract multiple PDFs, yielding results as they complete.
+        
+        With more than one worker, documents are converted in a process pool.
+        Each worker loads the Docling models once and reuses them; a file that
+        exceeds the timeout is reported as failed and its worker is replaced.
+        Cache lookups, caching and metrics happen in this process.
+        
+        Args:
+            pdf_paths: List of PDF paths
+            force: Force re-extraction (ignore cache)
+            workers: Worker processes (default: settings.EXTRACTION_WORKERS, 1 = serial)
+            timeout: Per-file timeout in seconds (default: settings.EXTRACTION_FILE_TIMEOUT)
+            
+        Yields:
+            (pdf_path, ExtractionResult) in completion order; failures are
+            yielded as results with ``error`` set
+        """
+        workers = workers or settings.EXTRACTION_WORKERS or os.cpu_count() or 1
+        if timeout is None:
+            timeout = settings.EXTRACTION_FILE_TIMEOUT or None
+        
+        if workers <= 1 or len(pdf_paths) <= 1:
+            for pdf_path in pdf_paths:
+                try:
+                    yield pdf_path, self.extract(pdf_path, force=force)
+                except Exception as e:
+                    logger.error(f"Failed to extract {pdf_path}: {e}")
+                    yield pdf_path, ExtractionResult(pdf_path=pdf_path, error=str(e))
+            return
         
+        from src.infrastructure.extraction.parallel import extract_in_worker, init_worker
+        from src.utils.parallel import imap_processes
+        
+        # Validate and serve cache hits before starting workers; each file is
+        # extracted once, however many spellings of its path were passed
+        to_extract: Dict[str, List[str]] = {}
         for pdf_path in pdf_paths:
             try:
-                result = self.extract(pdf_path, force=force)
-                results.append(result)
+                resolved = self._validate_pdf(pdf_path)
             except Exception as e:
-                logger.error(f"Failed to extract {pdf_path}: {e}")
-                # Create error result
-                error_result = ExtractionResult(
-                    pdf_path=pdf_path,
-                    error=str(e)
-                )
-                results.append(error_result)
-        
-        return results
+                yield pdf_path, ExtractionResult(pdf_path=pdf_path, error=str(e))
+                continue
+            cached = None if force else self._get_cached(resolved)
+            if cached:
+                yield pdf_path, cached
+            else:
+                to_extract.setdefault(resolved, []).append(pdf_path)
+        
+        if not to_extract:
+            return
+        
+        workers = min(workers, len(to_extract))
+        logger.info(f"Extracting {len(to_extract)} PDFs with {workers} worker processes")
+        
+        for outcome in imap_processes(
+            extract_in_worker,
+            list(to_extract),
+            max_workers=workers,
+            timeout=timeout,
+            initializer=init_worker,
+            initargs=(self.backend_names, self.min_quality),
+        ):
+            resolved = outcome.item
+            if outcome.ok:
+                result = outcome.result
+            else:
+                logger.error(f"Failed to extract {resolved}: {outcome.error}")
+                result = ExtractionResult(pdf_path=resolved, error=str(outcome.error))
+            self._record_result(resolved, result)
+            for pdf_path in to_extract[resolved]:
+                yield pdf_path, result
 
     def _save_table_report(self, result: ExtractionResult):
         """
@@ -14,6 +14,8 @@ This module is extraction-specific and belongs in infrastructure layer.
 
 import os
 import re
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -23,6 +25,10 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# DocumentConverter instances (with loaded models) reused per process, keyed by config
+_CONVERTERS: Dict[tuple, Any] = {}
+_CONVERTER_LOCK = threading.Lock()
+
 
 # =============================================================================
 # MODULE-LEVEL COMPILED REGEX PATTERNS (Optimization)
@@ -397,11 +403,38 @@ class DoclingHelper:
         Returns:
             Docling conversion result
             
+        Raises:
+            RuntimeError: If no local model weights found and downloads not allowed
+        """
+        artifacts_path = DoclingHelper._resolve_artifacts()
+        with DoclingHelper._offline_env(enabled=bool(artifacts_path)):
+            converter = DoclingHelper.get_converter(artifacts_path)
+            return converter.convert(pdf_path)
+    
+    @staticmethod
+    def preload_converter() -> None:
+        """
+        Load the Docling models ahead of the first document.
+        
+        Used by extraction worker processes so model loading happens once at
+        start-up instead of inside the first file's time budget.
+        """
+        artifacts_path = DoclingHelper._resolve_artifacts()
+        with DoclingHelper._offline_env(enabled=bool(artifacts_path)):
+            DoclingHelper.get_converter(artifacts_path)
+    
+    @staticmethod
+    def _resolve_artifacts() -> Optional[str]:
+        """
+        Locate local model weights, enforcing the no-download default.
+        
+        Returns:
+            Local artifacts path, or None if downloads are allowed and no local weights exist
+            
         Raises:
             RuntimeError: If no local model weights found and downloads not allowed
         """
         import logging
-        import platform
         logger = logging.getLogger(__name__)
         
         # Check if downloading model weights from internet is allowed (default: NO - local only)
@@ -416,149 +449,192 @@ class DoclingHelper:
         if tableformer_path:
             logger.info(f"Using local tableformer model weights from: {tableformer_path}")
         
-        # If we have local model weights, use them (set offline mode to prevent any downloads)
-        if artifacts_path:
-            # Save original environment values to restore later (prevents global state pollution)
-            original_hf_offline = os.environ.get('HF_HUB_OFFLINE')
-            original_tf_offline = os.environ.get('TRANSFORMERS_OFFLINE')
+        if not artifacts_path and not allow_download:
+            # Default: local only, no downloads
+            error_msg = (
+                "No local docling model weights found and internet downloads are disabled.\n"
+                "Please either:\n"
+                "  1. Add model weights to src/model/doclingPackages/ and src/model/docling-models/\n"
+                "  2. Set DOCLING_ARTIFACTS_PATH environment variable\n"
+                "  3. Set DOCLING_ALLOW_DOWNLOAD=1 to enable downloading"
+            )
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        
+        if not artifacts_path:
+            logger.warning("No local model weights found, downloading from HuggingFace Hub")
+        
+        return artifacts_path
+    
+    @staticmethod
+    @contextmanager
+    def _offline_env(enabled: bool = True):
+        """Temporarily force HF offline mode (restores the original environment)."""
+        if not enabled:
+            yield
+            return
+        
+        # Save original environment values to restore later (prevents global state pollution)
+        original_hf_offline = os.environ.get('HF_HUB_OFFLINE')
+        original_tf_offline = os.environ.get('TRANSFORMERS_OFFLINE')
+        try:
+            # Prevent any accidental model weight downloads when using local files
+            os.environ['HF_HUB_OFFLINE'] = '1'
+            os.environ['TRANSFORMERS_OFFLINE'] = '1'
+            yield
+        finally:
+            if original_hf_offline is None:
+                os.environ.pop('HF_HUB_OFFLINE', None)
+            else:
+                os.environ['HF_HUB_OFFLINE'] = original_hf_offline
+            if original_tf_offline is None:
+                os.environ.pop('TRANSFORMERS_OFFLINE', None)
+            else:
+                os.environ['TRANSFORMERS_OFFLINE'] = original_tf_offline
+    
+    @staticmethod
+    def get_converter(artifacts_path: Optional[str] = None) -> Any:
+        """
+        Get a DocumentConverter, reusing one already built in this process.
+        
+        Building a converter loads the layout, TableFormer and OCR models, so
+        converters are cached per configuration (artifacts path, OCR engine,
+        table mode, image scale) and reused across documents. Each worker
+        process of a parallel extraction therefore loads the models once.
+        
+        Args:
+            artifacts_path: Local model weights directory (None = default models)
             
+        Returns:
+            Docling DocumentConverter
+        """
+        config_key = (
+            artifacts_path,
+            os.environ.get('DOCLING_OCR_ENGINE', '').lower(),
+            os.environ.get('DOCLING_TABLE_MODE', 'accurate').lower(),
+            os.environ.get('DOCLING_IMAGE_SCALE', '1.0'),
+        )
+        with _CONVERTER_LOCK:
+            converter = _CONVERTERS.get(config_key)
+            if converter is None:
+                converter = DoclingHelper._build_converter(artifacts_path)
+                _CONVERTERS[config_key] = converter
+            return converter
+    
+    @staticmethod
+    def _build_converter(artifacts_path: Optional[str]) -> Any:
+        """Build a DocumentConverter configured for local model weights."""
+        import logging
+        import platform
+        logger = logging.getLogger(__name__)
+        
+        if not artifacts_path:
+            return DocumentConverter()
+        
+        from docling.datamodel.pipeline_options import PdfPipelineOptions
+        from docling.datamodel.base_models import InputFormat
+        from docling.document_converter import PdfFormatOption
+        
+        # Determine OCR engine based on platform
+        ocr_override = os.environ.get('DOCLING_OCR_ENGINE', '').lower()
+        system = platform.system()
+        
+        if ocr_override == 'rapidocr':
+            use_rapidocr = True
+        elif ocr_override == 'ocrmac':
+            use_rapidocr = False
+        else:
+            # Auto-detect: macOS uses OcrMac, Windows/Linux use RapidOCR
+            use_rapidocr = (system != 'Darwin')
+        
+        # Configure OCR options
+        ocr_options = None
+        if use_rapidocr:
+            from docling.datamodel.pipeline_options import RapidOcrOptions
+        
+            # Disable RapidOCR visualization font download
             try:
-                # Prevent any accidental model weight downloads when using local files
-                os.environ['HF_HUB_OFFLINE'] = '1'
-                os.environ['TRANSFORMERS_OFFLINE'] = '1'
-                
-                from docling.datamodel.pipeline_options import PdfPipelineOptions
-                from docling.datamodel.base_models import InputFormat
-                from docling.document_converter import PdfFormatOption
-                
-                # Determine OCR engine based on platform
-                ocr_override = os.environ.get('DOCLING_OCR_ENGINE', '').lower()
-                system = platform.system()
-                
-                if ocr_override == 'rapidocr':
-                    use_rapidocr = True
-                elif ocr_override == 'ocrmac':
-                    use_rapidocr = False
-                else:
-                    # Auto-detect: macOS uses OcrMac, Windows/Linux use RapidOCR
-                    use_rapidocr = (system != 'Darwin')
-                
-                # Configure OCR options
-                ocr_options = None
-                if use_rapidocr:
-                    from docling.datamodel.pipeline_options import RapidOcrOptions
-                    
-                    # Disable RapidOCR visualization font download
-                    try:
-                        from rapidocr.utils import vis_res as _rapid_vis
-                        
-                        def _get_font_path_no_download(self, font_path=None, lang_type='en'):
-                            """Return empty path to skip font download."""
-                            return ""
-                        
-                        _rapid_vis.VisRes.get_font_path = _get_font_path_no_download
-                        logger.debug("RapidOCR visualization font download disabled")
-                    except Exception as e:
-                        logger.debug(f"Could not patch RapidOCR visualization: {e}")
-                    
-                    # Build paths to local RapidOCR models
-                    rapidocr_base = Path(artifacts_path) / 'RapidOcr' / 'onnx' / 'PP-OCRv4'
-                    det_model = rapidocr_base / 'det' / 'ch_PP-OCRv4_det_infer.onnx'
-                    rec_model = rapidocr_base / 'rec' / 'ch_PP-OCRv4_rec_infer.onnx'
-                    cls_model = rapidocr_base / 'cls' / 'ch_ppocr_mobile_v2.0_cls_infer.onnx'
-                    
-                    if det_model.exists() and rec_model.exists():
-                        ocr_options = RapidOcrOptions(
-                            det_model_path=str(det_model),
-                            rec_model_path=str(rec_model),
-                            cls_model_path=str(cls_model) if cls_model.exists() else None,
-                        )
-                        logger.info(f"Using RapidOCR with local ONNX models")
-                    else:
-                        ocr_options = RapidOcrOptions()
-                        logger.info("Using RapidOCR with default bundled models")
-                else:
-                    from docling.datamodel.pipeline_options import OcrMacOptions
-                    ocr_options = OcrMacOptions()
-                    logger.info("Using OcrMac (macOS native OCR)")
-                
-                # Configure tableformer mode
-                table_mode = os.environ.get('DOCLING_TABLE_MODE', 'accurate').lower()
-                
-                # Configure image scale
-                try:
-                    image_scale = float(os.environ.get('DOCLING_IMAGE_SCALE', '1.0'))
-                    image_scale = max(1.0, min(4.0, image_scale))
-                except ValueError:
-                    image_scale = 1.0
-                
-                # Import TableFormerMode
-                try:
-                    from docling.datamodel.pipeline_options import TableFormerMode, TableStructureOptions
-                    
-                    if table_mode == 'fast':
-                        table_structure_options = TableStructureOptions(
-                            mode=TableFormerMode.FAST,
-                            do_cell_matching=True
-                        )
-                        logger.info("Using TableFormer FAST mode")
-                    else:
-                        table_structure_options = TableStructureOptions(
-                            mode=TableFormerMode.ACCURATE,
-                            do_cell_matching=True
-                        )
-                        logger.info("Using TableFormer ACCURATE mode")
-                    
-                    pipeline_options = PdfPipelineOptions(
-                        artifacts_path=artifacts_path,
-                        ocr_options=ocr_options,
-                        do_table_structure=True,
-                        table_structure_options=table_structure_options,
-                        images_scale=image_scale,
-                    )
-                except ImportError:
-                    logger.warning("TableFormerMode not available, using default table detection")
-                    pipeline_options = PdfPipelineOptions(
-                        artifacts_path=artifacts_path,
-                        ocr_options=ocr_options,
-                    )
-                
-                if image_scale > 1.0:
-                    logger.info(f"Using image scale: {image_scale}x")
-                
-                converter = DocumentConverter(
-                    format_options={
-                        InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-                    }
+                from rapidocr.utils import vis_res as _rapid_vis
+        
+                def _get_font_path_no_download(self, font_path=None, lang_type='en'):
+                    """Return empty path to skip font download."""
+                    return ""
+        
+                _rapid_vis.VisRes.get_font_path = _get_font_path_no_download
+                logger.debug("RapidOCR visualization font download disabled")
+            except Exception as e:
+                logger.debug(f"Could not patch RapidOCR visualization: {e}")
+        
+            # Build paths to local RapidOCR models
+            rapidocr_base = Path(artifacts_path) / 'RapidOcr' / 'onnx' / 'PP-OCRv4'
+            det_model = rapidocr_base / 'det' / 'ch_PP-OCRv4_det_infer.onnx'
+            rec_model = rapidocr_base / 'rec' / 'ch_PP-OCRv4_rec_infer.onnx'
+            cls_model = rapidocr_base / 'cls' / 'ch_ppocr_mobile_v2.0_cls_infer.onnx'
+        
+            if det_model.exists() and rec_model.exists():
+                ocr_options = RapidOcrOptions(
+                    det_model_path=str(det_model),
+                    rec_model_path=str(rec_model),
+                    cls_model_path=str(cls_model) if cls_model.exists() else None,
                 )
-                return converter.convert(pdf_path)
-            finally:
-                # Restore original environment state
-                if original_hf_offline is None:
-                    os.environ.pop('HF_HUB_OFFLINE', None)
-                else:
-                    os.environ['HF_HUB_OFFLINE'] = original_hf_offline
-                if original_tf_offline is None:
-                    os.environ.pop('TRANSFORMERS_OFFLINE', None)
-                else:
-                    os.environ['TRANSFORMERS_OFFLINE'] = original_tf_offline
-        
-        # No local model weights found - check if downloads are allowed
-        if allow_download:
-            logger.warning("No local model weights found, downloading from HuggingFace Hub")
-            converter = DocumentConverter()
-            return converter.convert(pdf_path)
+                logger.info(f"Using RapidOCR with local ONNX models")
+            else:
+                ocr_options = RapidOcrOptions()
+                logger.info("Using RapidOCR with default bundled models")
+        else:
+            from docling.datamodel.pipeline_options import OcrMacOptions
+            ocr_options = OcrMacOptions()
+            logger.info("Using OcrMac (macOS native OCR)")
+        
+        # Configure tableformer mode
+        table_mode = os.environ.get('DOCLING_TABLE_MODE', 'accurate').lower()
+        
+        # Configure image scale
+        try:
+            image_scale = float(os.environ.get('DOCLING_IMAGE_SCALE', '1.0'))
+            image_scale = max(1.0, min(4.0, image_scale))
+        except ValueError:
+            image_scale = 1.0
+        
+        # Import TableFormerMode
+        try:
+            from docling.datamodel.pipeline_options import TableFormerMode, TableStructureOptions
+        
+            if table_mode == 'fast':
+                table_structure_options = TableStructureOptions(
+                    mode=TableFormerMode.FAST,
+                    do_cell_matching=True
+                )
+                logger.info("Using TableFormer FAST mode")
+            else:
+                table_structure_options = TableStructureOptions(
+                    mode=TableFormerMode.ACCURATE,
+                    do_cell_matching=True
+                )
+                logger.info("Using TableFormer ACCURATE mode")
+        
+            pipeline_options = PdfPipelineOptions(
+                artifacts_path=artifacts_path,
+                ocr_options=ocr_options,
+                do_table_structure=True,
+                table_structure_options=table_structure_options,
+                images_scale=image_scale,
+            )
+        except ImportError:
+            logger.warning("TableFormerMode not available, using default table detection")
+            pipeline_options = PdfPipelineOptions(
+                artifacts_path=artifacts_path,
+                ocr_options=ocr_options,
+            )
+        
+        if image_scale > 1.0:
+            logger.info(f"Using image scale: {image_scale}x")
         
-        # Default: local only, no downloads
-        error_msg = (
-            "No local docling model weights found and internet downloads are disabled.\n"
-            "Please either:\n"
-            "  1. Add model weights to src/model/doclingPackages/ and src/model/docling-models/\n"
-            "  2. Set DOCLING_ARTIFACTS_PATH environment variable\n"
-            "  3. Set DOCLING_ALLOW_DOWNLOAD=1 to enable downloading"
+        return DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+            }
         )
-        logger.error(error_msg)
-        raise RuntimeError(error_msg)
     
     @staticmethod
     def extract_toc_sections(doc) -> dict:
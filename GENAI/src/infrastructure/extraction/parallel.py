@@ -0,0 +1,61 @@
+"""
+Worker-process entry points for parallel PDF extraction.
+
+Each worker process builds one UnifiedExtractor (without a cache - the
+parent process owns caching and metrics) and preloads the Docling models
+once, then reuses them for every document it is given.
+
+Used by ``UnifiedExtractor.iter_extract``; not intended to be called directly.
+"""
+
+from typing import List, Optional
+
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Per-process extractor, created by init_worker
+_worker_extractor = None
+
+
+def init_worker(backends: Optional[List[str]], min_quality: float) -> None:
+    """
+    Initialize an extraction worker process.
+
+    Args:
+        backends: Backend names to load
+        min_quality: Minimum quality score for fallback
+    """
+    global _worker_extractor
+    from src.infrastructure.extraction.base import BackendType
+    from src.infrastructure.extraction.extractor import UnifiedExtractor
+
+    _worker_extractor = UnifiedExtractor(
+        backends=backends,
+        min_quality=min_quality,
+        enable_caching=False,
+    )
+
+    if any(b.get_backend_type() == BackendType.DOCLING for b in _worker_extractor.backends):
+        try:
+            from src.infrastructure.extraction.helpers import DoclingHelper
+            DoclingHelper.preload_converter()
+        except Exception as e:
+            # Loading is retried (and errors reported) on the first document
+            logger.warning(f"Could not preload Docling models: {e}")
+
+
+def extract_in_worker(pdf_path: str):
+    """
+    Extract one PDF in a worker process.
+
+    Args:
+        pdf_path: Resolved path to a validated PDF
+
+    Returns:
+        ExtractionResult
+    """
+    extractor = _worker_extractor
+    result = extractor.strategy.extract_with_fallback(pdf_path, min_quality=extractor.min_quality)
+    extractor._save_table_report(result)
+    return result
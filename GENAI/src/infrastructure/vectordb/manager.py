@@ -20,7 +20,9 @@ Example:
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator, TYPE_CHECKING
 
 from config.settings import settings
 from src.core.singleton import ThreadSafeSingleton
@@ -163,6 +165,8 @@ class VectorDBManager(metaclass=ThreadSafeSingleton):
         self.provider_name = (provider or settings.VECTORDB_PROVIDER).lower()
         self._embedding_manager = embedding_manager
         self._db: Optional[VectorDBInterface] = None
+        # Writes through this manager (generation for backends without one)
+        self._writes = 0
         
         # Initialize based on provider type
         self._initialize_provider(**kwargs)
@@ -212,7 +216,7 @@ class VectorDBManager(metaclass=ThreadSafeSingleton):
             embedding_function=embedding_manager,
             dimension=kwargs.get('dimension'),
             persist_dir=kwargs.get('persist_dir'),
-            index_type=kwargs.get('index_type', 'flat')
+            index_type=kwargs.get('index_type', settings.FAISS_INDEX_TYPE)
         )
     
     def _init_redis(self, **kwargs) -> None:
@@ -230,6 +234,45 @@ class VectorDBManager(metaclass=ThreadSafeSingleton):
         """Get the underlying vector store."""
         return self._db
     
+    @property
+    def index_generation(self) -> Any:
+        """
+        Value that changes whenever the stored vectors change.
+        
+        Uses the backend's own counter when it has one (FAISS); otherwise
+        counts writes made through this manager.
+        """
+        if hasattr(self._db, 'index_generation'):
+            return self._db.index_generation
+        return self._writes
+    
+    @property
+    def store_identity(self) -> str:
+        """
+        Provider and storage location (persist dir, collection or index).
+        
+        Keys state derived from the stored rows, such as ingestion
+        checkpoints, so it is never applied to a different store.
+        """
+        location = getattr(self._db, 'persist_dir', None) or getattr(self._db, 'persist_directory', None)
+        parts = [
+            self.provider_name,
+            str(Path(location).resolve()) if location else None,
+            getattr(self._db, 'collection_name', None) or getattr(self._db, 'index_name', None),
+        ]
+        return ":".join(part for part in parts if part)
+    
+    def count(self) -> Optional[int]:
+        """Number of stored chunks, or None if the backend does not report it."""
+        try:
+            stats = self._db.get_stats()
+        except Exception:
+            return None
+        for key in ('total_chunks', 'count'):
+            if isinstance(stats.get(key), int):
+                return stats[key]
+        return None
+    
     @property
     def name(self) -> str:
         """Provider name (implements BaseProvider protocol)."""
@@ -279,13 +322,15 @@ class VectorDBManager(metaclass=ThreadSafeSingleton):
         Returns:
             Number of chunks added
         """
+        self._writes += 1
         return self._db.add_chunks(chunks, show_progress)
     
     def search(
         self,
         query: str,
         top_k: int = 5,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        **search_params: Any
     ) -> List[Any]:
         """
         Search for similar chunks.
@@ -294,12 +339,87 @@ class VectorDBManager(metaclass=ThreadSafeSingleton):
             query: Search query
             top_k: Number of results
             filters: Optional metadata filters
+            **search_params: Backend recall/latency knobs for this query
+                (FAISS: nprobe for IVF, ef_search for HNSW)
             
         Returns:
             List of SearchResult objects
         """
+        if search_params:
+            return self._db.search(query, top_k, filters, **search_params)
         return self._db.search(query, top_k, filters)
     
+    def search_by_vector(
+        self,
+        embedding: List[float],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        **search_params: Any
+    ) -> List[Any]:
+        """
+        Search with a precomputed query embedding (the text is not re-embedded).
+        
+        Args:
+            embedding: Query vector
+            top_k: Number of results
+            filters: Optional metadata filters
+            **search_params: Backend recall/latency knobs (see ``search``)
+            
+        Returns:
+            List of SearchResult objects
+        """
+        return self.search_by_vectors([embedding], top_k, filters, **search_params)[0]
+    
+    def search_by_vectors(
+        self,
+        embeddings: List[List[float]],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        **search_params: Any
+    ) -> List[List[Any]]:
+        """
+        Search several precomputed query embeddings at once.
+        
+        FAISS searches them as a single (n_queries x d) batch; other
+        backends run one vector search per embedding.
+        
+        Args:
+            embeddings: Query vectors
+            top_k: Number of results per query
+            filters: Optional metadata filters (shared by all queries)
+            **search_params: Backend recall/latency knobs (see ``search``)
+            
+        Returns:
+            One list of SearchResult objects per query, in input order
+        """
+        if hasattr(self._db, 'search_by_vectors'):
+            return self._db.search_by_vectors(embeddings, top_k, filters, **search_params)
+        if hasattr(self._db, 'search_by_vector'):
+            return [
+                self._db.search_by_vector(embedding, top_k, filters, **search_params)
+                for embedding in embeddings
+            ]
+        raise NotImplementedError(
+            f"{self.provider_name} backend does not support vector search"
+        )
+    
+    def build_index(self, index_type: Optional[str] = None, **params: Any) -> Dict[str, Any]:
+        """
+        Rebuild the ANN index from stored vectors (FAISS only).
+        
+        Args:
+            index_type: Target index type (e.g. "ivf", "ivf_pq", "hnsw")
+            **params: Build parameters (nlist, pq_m, sample_size)
+            
+        Returns:
+            Index parameters used for the build
+        """
+        if not hasattr(self._db, 'build_index'):
+            raise NotImplementedError(
+                f"{self.provider_name} backend does not support build_index"
+            )
+        return self._db.build_index(index_type=index_type, **params)
+    
     def get_by_metadata(
         self,
         filters: Dict[str, Any],
@@ -317,6 +437,77 @@ class VectorDBManager(metaclass=ThreadSafeSingleton):
         """
         return self._db.get_by_metadata(filters, limit)
     
+    @contextmanager
+    def bulk_load(self) -> Iterator["VectorDBManager"]:
+        """
+        Batch writes and persist once on exit.
+        
+        Backends without deferred persistence run writes as usual.
+        
+        Example:
+            >>> with vectordb.bulk_load():
+            ...     for batch in batches:
+            ...         vectordb.add_chunks(batch)
+        """
+        session = self._db.bulk_load() if hasattr(self._db, 'bulk_load') else nullcontext()
+        with session:
+            yield self
+    
+    def iter_documents(self, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over every stored chunk (e.g. to build a keyword index).
+        
+        Args:
+            batch_size: Chunks per batch
+            
+        Yields:
+            Lists of dicts with 'id', 'content' and 'metadata'
+        """
+        if not hasattr(self._db, 'iter_documents'):
+            raise NotImplementedError(
+                f"{self.provider_name} backend does not support iter_documents"
+            )
+        return self._db.iter_documents(batch_size)
+    
+    def upsert_chunks(
+        self,
+        chunks: List["TableChunk"],
+        show_progress: bool = True
+    ) -> int:
+        """
+        Insert or replace chunks by chunk_id.
+        
+        Falls back to add_chunks for backends without native upsert.
+        
+        Args:
+            chunks: List of TableChunk objects
+            show_progress: Show progress bar
+            
+        Returns:
+            Number of chunks written
+        """
+        self._writes += 1
+        if hasattr(self._db, 'upsert_chunks'):
+            return self._db.upsert_chunks(chunks, show_progress)
+        return self._db.add_chunks(chunks, show_progress)
+    
+    def delete_by_ids(self, ids: List[str]) -> int:
+        """
+        Delete chunks by chunk ID.
+        
+        Args:
+            ids: Chunk IDs to delete
+            
+        Returns:
+            Number of deleted chunks
+        """
+        if not hasattr(self._db, 'delete_by_ids'):
+            raise NotImplementedError(
+                f"{self.provider_name} backend does not support delete_by_ids"
+            )
+        self._writes += 1
+        return self._db.delete_by_ids(ids)
+    
     def delete_by_source(self, source_doc: str) -> int:
         """
         Delete all chunks from a source document.
@@ -327,10 +518,33 @@ class VectorDBManager(metaclass=ThreadSafeSingleton):
         Returns:
             Number of deleted chunks
         """
+        if not hasattr(self._db, 'delete_by_source'):
+            raise NotImplementedError(
+                f"{self.provider_name} backend does not support delete_by_source"
+            )
+        self._writes += 1
         return self._db.delete_by_source(source_doc)
     
+    def delete_by_sources(self, source_docs: List[str]) -> int:
+        """
+        Delete all chunks of several source documents.
+        
+        Backends without a batched delete remove one document at a time.
+        
+        Args:
+            source_docs: Source document identifiers
+            
+        Returns:
+            Number of deleted chunks
+        """
+        if hasattr(self._db, 'delete_by_sources'):
+            self._writes += 1
+            return self._db.delete_by_sources(source_docs)
+        return sum(self.delete_by_source(source_doc) for source_doc in source_docs)
+    
     def clear(self) -> None:
         """Clear all data from vector store."""
+        self._writes += 1
         return self._db.clear()
     
     def get_stats(self) -> Dict[str, Any]:
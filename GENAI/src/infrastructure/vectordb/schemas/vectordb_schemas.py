@@ -5,7 +5,7 @@ Uses the comprehensive TableMetadata from src.domain as the source of truth.
 Provides provider-specific conversion utilities for each VectorDB backend.
 
 Industry Best Practices:
-- FAISS: In-memory with pickle serialization, supports full Python objects
+- FAISS: In-memory with a columnar JSON sidecar, supports JSON-compatible values and datetimes
 - ChromaDB: Native metadata storage with type restrictions (str, int, float, bool only)
 - Redis: Explicit schema with typed fields (TextField, TagField, NumericField)
 """
@@ -127,8 +127,8 @@ class VectorDBSchemaConverter:
         """
         Convert TableMetadata to FAISS-compatible format.
         
-        FAISS uses pickle serialization, so most Python types are supported.
-        We just ensure datetime is serializable.
+        FAISS stores per-row JSON in its columnar sidecar, so plain values,
+        lists and datetimes are supported. We just ensure datetime is serializable.
         """
         data = metadata.model_dump() if hasattr(metadata, 'model_dump') else metadata.dict()
         result = {}
@@ -0,0 +1,699 @@
+"""
+Inverted BM25 index for keyword search.
+
+Each term maps to a posting list held as two numpy arrays (sorted document
+slots and term frequencies), so a query only reads the posting lists of its
+own terms instead of scoring the whole corpus.
+
+Top-k retrieval uses term-at-a-time MaxScore: query terms are processed in
+decreasing order of their score upper bound, and once the remaining terms
+can no longer lift an unseen document into the top k, they are only probed
+for documents that are already candidates. Results are identical to
+exhaustive BM25 scoring.
+
+Documents are keyed by chunk_id and can be added, replaced or deleted
+incrementally. Deletes leave tombstones that are compacted away once they
+make up a large share of the index (and before every save).
+
+A saved index is one file, replaced atomically. ``load_shared()`` keeps
+one loaded copy per path in the process and reloads it only when the file
+changes, so searches do not re-read the index.
+
+Example:
+    >>> index = BM25Index()
+    >>> index.add(["c1", "c2"], ["Net revenue rose 12%", "Q3 2024 10-Q"])
+    >>> hits = index.search("net revenue", top_k=5)
+    >>> hits[0]['id']
+    'c1'
+"""
+
+import math
+import os
+import pickle
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.infrastructure.vectordb.stores.faiss_filter_index import value_matches
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+# =============================================================================
+# Tokenizer
+# =============================================================================
+
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how',
+    'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to',
+    'was', 'were', 'what', 'when', 'which', 'with',
+})
+
+_CHAR_MAP = str.maketrans({
+    '—': '-',   # Em dash
+    '–': '-',   # En dash
+    '−': '-',   # Minus sign
+    '’': "'",   # Right single quote
+    '\xa0': ' ',     # Non-breaking space
+})
+
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<form>\b\d{1,2}-[a-z]\b)                           # filing types: 10-k, 10-q, 8-k
+    | (?P<quarter>\b(?:q[1-4]|[1-4]q)(?:['-]?\d{2}(?:\d{2})?|\s(?:19|20)\d{2})?\b)  # q3, 3q24, q3 2024
+    | (?P<number>\(?[$€£]?\d[\d,]*(?:\.\d+)?\)?%?)  # $1,234.5  (45)  12.5%
+    | (?P<word>[a-z][a-z0-9]*(?:[&'.-][a-z0-9]+)*)          # s&p, year-over-year, u.s, cet1
+    """,
+    re.VERBOSE,
+)
+
+
+def _normalize_number(raw: str) -> str:
+    """'$1,234.50' -> '1234.5', '(45)' -> '-45', '12%' -> '12'."""
+    negative = raw.startswith('(') and raw.endswith(')')
+    value = raw.strip('()%$€£').replace(',', '')
+    if '.' in value:
+        value = value.rstrip('0').rstrip('.')
+    return f"-{value}" if negative else value
+
+
+def _quarter_tokens(raw: str) -> List[str]:
+    """'3Q24' / 'Q3 2024' / 'q3' -> ['q3', '2024'] / ['q3']."""
+    digits = re.sub(r'\D', '', raw)
+    tokens = [f"q{digits[0]}"]
+    year = digits[1:]
+    if len(year) == 2:
+        year = f"20{year}"
+    if year:
+        tokens.append(year)
+    return tokens
+
+
+def _word_tokens(raw: str) -> List[str]:
+    """Words, with compounds kept whole and also split into their parts."""
+    if raw.endswith("'s"):
+        raw = raw[:-2]
+    raw = raw.replace('.', '').replace("'", '')
+    if not raw or raw in STOPWORDS:
+        return []
+    parts = re.split(r'[&-]', raw)
+    if len(parts) == 1:
+        return [raw]
+    return [raw] + [part for part in parts if part and part not in STOPWORDS]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Tokenize financial text for BM25.
+
+    Lowercases, drops common stopwords, and keeps financial tokens intact:
+    filing types (``10-k``), fiscal quarters (``3Q24`` -> ``q3``, ``2024``),
+    and numbers with currency symbols, thousands separators, percentages and
+    accounting negatives (``(1,250)`` -> ``-1250``). Hyphenated and ``&``
+    compounds are indexed both whole and by part.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        List of tokens (with repeats)
+    """
+    tokens: List[str] = []
+    for match in _TOKEN_RE.finditer(text.lower().translate(_CHAR_MAP)):
+        kind = match.lastgroup
+        raw = match.group(kind)
+        if kind == 'word':
+            tokens.extend(_word_tokens(raw))
+        elif kind == 'number':
+            tokens.append(_normalize_number(raw))
+        elif kind == 'quarter':
+            tokens.extend(_quarter_tokens(raw))
+        else:
+            tokens.append(raw)
+    return tokens
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+class BM25Index:
+    """
+    Incremental inverted index with BM25 (Okapi) scoring.
+
+    Attributes:
+        k1: Term-frequency saturation
+        b: Document-length normalization
+    """
+
+    INDEX_FILE = "bm25_index.pkl"
+    FORMAT_VERSION = 1
+
+    # Compact when tombstones exceed this share of document slots
+    COMPACT_RATIO = 0.25
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        tokenizer: Callable[[str], List[str]] = tokenize,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.tokenizer = tokenizer
+
+        # Per-slot document state (slot = insertion position)
+        self._doc_ids: List[Optional[str]] = []
+        self._documents: List[Optional[Dict[str, Any]]] = []
+        self._doc_len = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._slot_by_id: Dict[str, int] = {}
+
+        # term -> (sorted slots int32, term frequencies float32)
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        # term -> (slots, tfs) appended since the term's postings were last merged
+        self._pending: Dict[str, Tuple[List[int], List[int]]] = {}
+        # Live document frequency per term
+        self._df: Dict[str, int] = {}
+
+        self._n_live = 0
+        self._total_len = 0
+        self._generation = 0
+        # term -> (generation, max normalized tf) for MaxScore bounds
+        self._bounds: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._n_live
+
+    def __contains__(self, chunk_id: str) -> bool:
+        return chunk_id in self._slot_by_id
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def add(
+        self,
+        ids: List[str],
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        """
+        Add documents (existing chunk_ids are replaced).
+
+        Args:
+            ids: Chunk IDs
+            texts: Document texts
+            metadatas: Optional metadata per document
+
+        Returns:
+            Number of documents indexed
+        """
+        if metadatas is None:
+            metadatas = [{}] * len(ids)
+
+        with self._lock:
+            self.delete([chunk_id for chunk_id in ids if chunk_id in self._slot_by_id])
+
+            start = len(self._doc_ids)
+            self._reserve(start + len(ids))
+            for offset, (chunk_id, text, metadata) in enumerate(zip(ids, texts, metadatas)):
+                slot = start + offset
+                if chunk_id in self._slot_by_id:
+                    # Duplicate ID within this batch: last one wins
+                    self._delete_slot(self._slot_by_id[chunk_id])
+
+                text = text or ''
+                counts = Counter(self.tokenizer(text))
+                for term, tf in counts.items():
+                    pending = self._pending.get(term)
+                    if pending is None:
+                        pending = self._pending[term] = ([], [])
+                    pending[0].append(slot)
+                    pending[1].append(tf)
+                    self._df[term] = self._df.get(term, 0) + 1
+
+                length = sum(counts.values())
+                self._doc_ids.append(chunk_id)
+                self._documents.append({'content': text, 'metadata': metadata or {}})
+                self._doc_len[slot] = length
+                self._alive[slot] = True
+                self._slot_by_id[chunk_id] = slot
+                self._n_live += 1
+                self._total_len += length
+
+            self._generation += 1
+        return len(ids)
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """
+        Delete documents by chunk ID (unknown IDs are ignored).
+
+        Returns:
+            Number of documents deleted
+        """
+        with self._lock:
+            deleted = 0
+            for chunk_id in ids:
+                slot = self._slot_by_id.get(chunk_id)
+                if slot is not None:
+                    self._delete_slot(slot)
+                    deleted += 1
+
+            if deleted:
+                self._generation += 1
+                n_slots = len(self._doc_ids)
+                if n_slots - self._n_live > self.COMPACT_RATIO * n_slots:
+                    self.compact()
+        return deleted
+
+    def delete_where(self, filters: Dict[str, Any], exact: bool = False) -> int:
+        """
+        Delete all documents whose metadata matches the filters.
+
+        Args:
+            filters: Metadata filters (search matching semantics)
+            exact: Match values by equality only, e.g. to delete one
+                source_doc without its substring matches
+
+        Returns:
+            Number of documents deleted
+        """
+        with self._lock:
+            ids = [
+                self._doc_ids[slot] for slot in self._slot_by_id.values()
+                if self._matches(slot, filters, exact)
+            ]
+            return self.delete(ids)
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        with self._lock:
+            self.__init__(k1=self.k1, b=self.b, tokenizer=self.tokenizer)
+
+    def compact(self) -> None:
+        """Drop tombstoned slots and renumber postings."""
+        with self._lock:
+            n_slots = len(self._doc_ids)
+            if self._n_live == n_slots:
+                return
+
+            alive = self._alive[:n_slots]
+            new_slot = np.cumsum(alive, dtype=np.int64) - 1
+
+            postings = {}
+            for term in set(self._postings) | set(self._pending):
+                slots, tfs = self._term_postings(term)
+                keep = alive[slots]
+                if keep.any():
+                    postings[term] = (new_slot[slots[keep]].astype(np.int32), tfs[keep])
+
+            live = np.flatnonzero(alive)
+            self._postings = postings
+            self._pending = {}
+            self._doc_ids = [self._doc_ids[i] for i in live]
+            self._documents = [self._documents[i] for i in live]
+            self._doc_len = self._doc_len[live].copy()
+            self._alive = np.ones(len(live), dtype=bool)
+            self._slot_by_id = {chunk_id: i for i, chunk_id in enumerate(self._doc_ids)}
+            self._bounds = {}
+            self._generation += 1
+            logger.debug(f"BM25 index compacted: {n_slots} -> {len(live)} slots")
+
+    def _reserve(self, n_slots: int) -> None:
+        """Grow per-slot arrays geometrically."""
+        capacity = len(self._doc_len)
+        if n_slots <= capacity:
+            return
+        capacity = max(n_slots, capacity * 2, 1024)
+        doc_len = np.zeros(capacity, dtype=np.float32)
+        doc_len[:len(self._doc_len)] = self._doc_len
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(self._alive)] = self._alive
+        self._doc_len, self._alive = doc_len, alive
+
+    def _delete_slot(self, slot: int) -> None:
+        """Tombstone a slot. Caller must hold ``self._lock``."""
+        document = self._documents[slot]
+        for term in set(self.tokenizer(document['content'])):
+            df = self._df.get(term, 0) - 1
+            if df > 0:
+                self._df[term] = df
+            else:
+                self._df.pop(term, None)
+
+        del self._slot_by_id[self._doc_ids[slot]]
+        self._doc_ids[slot] = None
+        self._documents[slot] = None
+        self._alive[slot] = False
+        self._total_len -= int(self._doc_len[slot])
+        self._n_live -= 1
+
+    def _term_postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Merged posting arrays for a term. Caller must hold ``self._lock``."""
+        postings = self._postings.get(term)
+        pending = self._pending.pop(term, None)
+        if pending is not None:
+            # New slots are always larger than merged ones, so order is kept
+            new_slots = np.asarray(pending[0], dtype=np.int32)
+            new_tfs = np.asarray(pending[1], dtype=np.float32)
+            if postings is not None:
+                new_slots = np.concatenate([postings[0], new_slots])
+                new_tfs = np.concatenate([postings[1], new_tfs])
+            postings = self._postings[term] = (new_slots, new_tfs)
+        if postings is None:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        return postings
+
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (non-negative variant)."""
+        df = self._df.get(term, 0)
+        return math.log(1.0 + (self._n_live - df + 0.5) / (df + 0.5))
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the top-k documents by BM25 score.
+
+        Args:
+            query: Query text
+            top_k: Number of results
+            filters: Metadata filters (FAISS store matching semantics)
+
+        Returns:
+            Dicts with 'id', 'content', 'metadata' and 'score', best first
+        """
+        with self._lock:
+            scores = self.score(query, top_k, filters)
+            return [
+                {
+                    'id': self._doc_ids[slot],
+                    'content': self._documents[slot]['content'],
+                    'metadata': self._documents[slot]['metadata'],
+                    'score': score,
+                }
+                for slot, score in scores
+            ]
+
+    def score(
+        self,
+        query: str,
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        MaxScore top-k over the query's posting lists.
+
+        Returns:
+            (slot, score) pairs, best first (ties by insertion order)
+        """
+        with self._lock:
+            if top_k <= 0 or not self._n_live:
+                return []
+
+            terms = [t for t in dict.fromkeys(self.tokenizer(query)) if t in self._df]
+            if not terms:
+                return []
+
+            avgdl = self._total_len / self._n_live or 1.0
+            weights = {t: self.idf(t) for t in terms}
+            bounds = {t: weights[t] * self._max_norm_tf(t, avgdl) for t in terms}
+            terms.sort(key=lambda t: bounds[t], reverse=True)
+
+            # remaining[i]: best possible score from the terms after i; once
+            # bound(i) + remaining[i] falls below the k-th best score, unseen
+            # documents cannot make the top k and term i is only probed
+            remaining = np.cumsum([bounds[t] for t in terms][::-1])[::-1].tolist()[1:] + [0.0]
+
+            cand_slots = np.empty(0, dtype=np.int32)
+            cand_scores = np.empty(0, dtype=np.float64)
+            threshold = -math.inf
+            filter_cache: Dict[int, bool] = {}
+
+            for i, term in enumerate(terms):
+                slots, tfs = self._term_postings(term)
+
+                if bounds[term] + remaining[i] >= threshold:
+                    # Essential term: unseen documents can still make the top k
+                    keep = self._alive[slots]
+                    slots, tfs = slots[keep], tfs[keep]
+                    if filters:
+                        keep = self._filter_mask(slots, filters, filter_cache)
+                        slots, tfs = slots[keep], tfs[keep]
+                    contrib = weights[term] * self._norm_tf(tfs, slots, avgdl)
+
+                    all_slots = np.concatenate([cand_slots, slots])
+                    cand_slots, inverse = np.unique(all_slots, return_inverse=True)
+                    cand_scores = np.bincount(
+                        inverse, weights=np.concatenate([cand_scores, contrib]),
+                        minlength=len(cand_slots),
+                    )
+                else:
+                    # Non-essential term: only probe existing candidates
+                    if len(slots) and len(cand_slots):
+                        pos = np.minimum(np.searchsorted(slots, cand_slots), len(slots) - 1)
+                        hit = slots[pos] == cand_slots
+                        if hit.any():
+                            cand_scores[hit] += weights[term] * self._norm_tf(
+                                tfs[pos[hit]], cand_slots[hit], avgdl
+                            )
+
+                if len(cand_slots) >= top_k:
+                    threshold = np.partition(cand_scores, -top_k)[-top_k]
+                    # Drop candidates that can no longer reach the top k
+                    viable = cand_scores + remaining[i] >= threshold
+                    if not viable.all():
+                        cand_slots, cand_scores = cand_slots[viable], cand_scores[viable]
+
+            if not len(cand_slots):
+                return []
+
+            k = min(top_k, len(cand_slots))
+            top = np.argpartition(-cand_scores, k - 1)[:k] if k < len(cand_slots) else np.arange(k)
+            order = np.lexsort((cand_slots[top], -cand_scores[top]))
+            return [(int(cand_slots[j]), float(cand_scores[j])) for j in top[order]]
+
+    def _norm_tf(self, tfs: np.ndarray, slots: np.ndarray, avgdl: float) -> np.ndarray:
+        """Saturated, length-normalized term frequency."""
+        k1, b = self.k1, self.b
+        dl = self._doc_len[slots]
+        return tfs * (k1 + 1) / (tfs + k1 * (1 - b + b * dl / avgdl))
+
+    def _max_norm_tf(self, term: str, avgdl: float) -> float:
+        """Upper bound of ``_norm_tf`` over a term's postings (cached per generation)."""
+        cached = self._bounds.get(term)
+        if cached is not None and cached[0] == self._generation:
+            return cached[1]
+        slots, tfs = self._term_postings(term)
+        bound = float(self._norm_tf(tfs, slots, avgdl).max()) if len(slots) else 0.0
+        self._bounds[term] = (self._generation, bound)
+        return bound
+
+    def _filter_mask(
+        self,
+        slots: np.ndarray,
+        filters: Dict[str, Any],
+        cache: Dict[int, bool],
+    ) -> np.ndarray:
+        """Metadata filter result per slot (memoized for the query)."""
+        mask = np.empty(len(slots), dtype=bool)
+        for i, slot in enumerate(slots.tolist()):
+            ok = cache.get(slot)
+            if ok is None:
+                ok = cache[slot] = self._matches(slot, filters)
+            mask[i] = ok
+        return mask
+
+    def _matches(self, slot: int, filters: Dict[str, Any], exact: bool = False) -> bool:
+        metadata = self._documents[slot]['metadata']
+        if exact:
+            return all(metadata.get(key) == value for key, value in filters.items())
+        return all(value_matches(key, metadata.get(key), value) for key, value in filters.items())
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """
+        Save the index to a directory (compacted, one file replaced atomically).
+
+        Args:
+            path: Target directory
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            self.compact()
+            terms = sorted(set(self._postings) | set(self._pending))
+            merged = [self._term_postings(term) for term in terms]
+            lengths = np.array([len(slots) for slots, _ in merged], dtype=np.int64)
+            payload = {
+                'version': self.FORMAT_VERSION,
+                'k1': self.k1,
+                'b': self.b,
+                'terms': terms,
+                'df': self._df,
+                'doc_ids': self._doc_ids,
+                'documents': self._documents,
+                'offsets': np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+                'slots': np.concatenate([s for s, _ in merged]) if merged else np.empty(0, np.int32),
+                'tfs': np.concatenate([t for _, t in merged]) if merged else np.empty(0, np.float32),
+                'doc_len': self._doc_len[:len(self._doc_ids)].copy(),
+            }
+
+            tmp_file = path / f"{self.INDEX_FILE}.tmp"
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, path / self.INDEX_FILE)
+            _share(path, self)
+
+        logger.info(f"BM25 index saved: {self._n_live} documents, {len(terms)} terms")
+
+    @classmethod
+    def load(cls, path: str, tokenizer: Callable[[str], List[str]] = tokenize) -> Optional["BM25Index"]:
+        """
+        Load an index saved with ``save()``.
+
+        Returns:
+            BM25Index, or None if no index (of this format) exists at path
+        """
+        index_file = Path(path) / cls.INDEX_FILE
+        if not index_file.exists():
+            return None
+
+        with open(index_file, 'rb') as f:
+            payload = pickle.load(f)
+        if not isinstance(payload, dict) or payload.get('version') != cls.FORMAT_VERSION:
+            logger.warning(f"Ignoring BM25 index with unknown format: {index_file}")
+            return None
+
+        offsets, slots, tfs = payload['offsets'], payload['slots'], payload['tfs']
+        doc_len = payload['doc_len']
+
+        index = cls(k1=payload['k1'], b=payload['b'], tokenizer=tokenizer)
+        index._postings = {
+            term: (slots[offsets[i]:offsets[i + 1]], tfs[offsets[i]:offsets[i + 1]])
+            for i, term in enumerate(payload['terms'])
+        }
+        index._df = payload['df']
+        index._doc_ids = payload['doc_ids']
+        index._documents = payload['documents']
+        index._doc_len = doc_len.astype(np.float32)
+        index._alive = np.ones(len(doc_len), dtype=bool)
+        index._slot_by_id = {chunk_id: i for i, chunk_id in enumerate(index._doc_ids)}
+        index._n_live = len(index._doc_ids)
+        index._total_len = int(doc_len.sum())
+        return index
+
+    @classmethod
+    def build_from(cls, vectordb: Any, batch_size: int = 1000, **kwargs: Any) -> "BM25Index":
+        """
+        Build an index from every chunk in a vector store.
+
+        Args:
+            vectordb: VectorDBManager (or any store with ``iter_documents``)
+            batch_size: Chunks read per batch
+            **kwargs: BM25Index constructor arguments
+        """
+        index = cls(**kwargs)
+        for batch in vectordb.iter_documents(batch_size):
+            index.add(
+                [doc['id'] for doc in batch],
+                [doc['content'] for doc in batch],
+                [doc['metadata'] for doc in batch],
+            )
+        return index
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size statistics."""
+        with self._lock:
+            n_postings = sum(len(s) for s, _ in self._postings.values())
+            n_postings += sum(len(s) for s, _ in self._pending.values())
+            return {
+                'documents': self._n_live,
+                'terms': len(self._df),
+                'postings': n_postings,
+                'tombstones': len(self._doc_ids) - self._n_live,
+                'avg_doc_length': self._total_len / self._n_live if self._n_live else 0.0,
+            }
+
+
+# =============================================================================
+# Shared loaded indexes
+# =============================================================================
+
+# Resolved directory -> (stamp of the saved file, loaded index)
+_shared_indexes: Dict[str, Tuple[Optional[Tuple[int, int]], Optional[BM25Index]]] = {}
+_shared_lock = threading.Lock()
+
+
+def default_index_dir() -> str:
+    """Saved index directory: settings.BM25_INDEX_DIR, else data/cache/bm25_index."""
+    from config.settings import settings
+    if settings.BM25_INDEX_DIR:
+        return settings.BM25_INDEX_DIR
+    from src.core.paths import get_paths
+    return str(get_paths().bm25_index_dir)
+
+
+def saved_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Modification time and size of the saved index file (None if not saved)."""
+    try:
+        stat = (Path(path) / BM25Index.INDEX_FILE).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_shared(path: str) -> Optional[BM25Index]:
+    """
+    Process-wide loaded index for a directory.
+
+    The saved file is read once and again only when its stamp changes
+    (another process saved it); indexes saved in this process are shared
+    as they are.
+
+    Returns:
+        BM25Index, or None if no index is saved at path
+    """
+    key = str(Path(path).resolve())
+    stamp = saved_stamp(path)
+    with _shared_lock:
+        cached = _shared_indexes.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        index = BM25Index.load(path) if stamp is not None else None
+        _shared_indexes[key] = (stamp, index)
+        return index
+
+
+def _share(path: Path, index: BM25Index) -> None:
+    """Record an index just saved to path as the shared copy."""
+    with _shared_lock:
+        _shared_indexes[str(path.resolve())] = (saved_stamp(path), index)
+
+
+__all__ = [
+    'BM25Index',
+    'STOPWORDS',
+    'default_index_dir',
+    'load_shared',
+    'saved_stamp',
+    'tokenize',
+]
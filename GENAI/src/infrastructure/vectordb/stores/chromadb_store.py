@@ -15,7 +15,7 @@ Example:
     >>> results = store.search("revenue Q1", top_k=5)
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import uuid
 
 from langchain_chroma import Chroma
@@ -113,7 +113,8 @@ class VectorStore(metaclass=ThreadSafeSingleton):
         Add chunks to vector store.
         
         Args:
-            chunks: List of TableChunk objects
+            chunks: TableChunk objects, or any chunk objects whose metadata
+                is a dict (e.g. multi-level EmbeddedChunk)
             show_progress: Whether to show progress bar
             
         Returns:
@@ -126,9 +127,11 @@ class VectorStore(metaclass=ThreadSafeSingleton):
         ids = []
         
         for chunk in chunks:
+            metadata = chunk.metadata if isinstance(chunk.metadata, dict) else chunk.metadata.dict()
+            
             # Convert metadata values to strings/ints/floats (Chroma restriction)
             clean_metadata = {}
-            for k, v in chunk.metadata.dict().items():
+            for k, v in metadata.items():
                 if v is not None:
                     if isinstance(v, (str, int, float, bool)):
                         clean_metadata[k] = v
@@ -150,6 +153,22 @@ class VectorStore(metaclass=ThreadSafeSingleton):
             logger.error(f"Failed to add chunks: {e}")
             raise
 
+    def delete_by_source(self, source_doc: str) -> int:
+        """
+        Delete all chunks from a source document.
+
+        Args:
+            source_doc: Source document identifier
+
+        Returns:
+            Number of chunks deleted
+        """
+        ids = self.vector_db.get(where={'source_doc': source_doc}, include=[]).get('ids') or []
+        if ids:
+            self.vector_db.delete(ids=ids)
+            logger.info(f"Deleted {len(ids)} chunks from {source_doc}")
+        return len(ids)
+
     def search(
         self,
         query_text: Optional[str] = None,
@@ -214,6 +233,24 @@ class VectorStore(metaclass=ThreadSafeSingleton):
             logger.error(f"Search failed: {e}")
             return []
             
+    def search_by_vector(
+        self,
+        embedding: List[float],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List["SearchResult"]:
+        """Search with a precomputed query embedding."""
+        return self.search(query_embedding=embedding, top_k=top_k, filter=filters)
+    
+    def search_by_vectors(
+        self,
+        embeddings: List[List[float]],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[List["SearchResult"]]:
+        """Search several precomputed query embeddings."""
+        return [self.search_by_vector(embedding, top_k, filters) for embedding in embeddings]
+    
     def as_retriever(self, **kwargs):
         """Return LangChain retriever."""
         return self.vector_db.as_retriever(**kwargs)
@@ -226,6 +263,33 @@ class VectorStore(metaclass=ThreadSafeSingleton):
         """Run similarity search with score."""
         return self.vector_db.similarity_search_with_score(query, k=k, **kwargs)
 
+    def iter_documents(self, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all stored chunks in pages.
+        
+        Args:
+            batch_size: Chunks per page
+            
+        Yields:
+            Lists of dicts with 'id', 'content' and 'metadata'
+        """
+        offset = 0
+        while True:
+            page = self.vector_db.get(
+                include=['documents', 'metadatas'],
+                limit=batch_size,
+                offset=offset
+            )
+            ids = page.get('ids') or []
+            if not ids:
+                return
+            metadatas = page.get('metadatas') or [{}] * len(ids)
+            yield [
+                {'id': chunk_id, 'content': content or '', 'metadata': meta or {}}
+                for chunk_id, content, meta in zip(ids, page['documents'], metadatas)
+            ]
+            offset += len(ids)
+    
     def get_langchain_store(self):
         """Return underlying LangChain vector store."""
         return self.vector_db
@@ -0,0 +1,258 @@
+"""
+Columnar, memory-mapped sidecar for the FAISS vector store.
+
+Replaces the single ``metadata.pkl`` pickle with per-column files that are
+opened with mmap, so loading is near-instant, pages are shared between
+worker processes, and rows are only decoded when they are actually read
+(e.g. the top-k hits of a search).
+
+Layout (one generation per save, committed by ``manifest.json``):
+    index.<gen>.faiss            FAISS index
+    vectors.<gen>.npy            normalized float32 vectors (N x d)
+    labels.<gen>.npy             int64 FAISS labels (N)
+    ids.<gen>.bin/.offsets.npy   chunk IDs as an offsets-indexed UTF-8 blob
+    documents.<gen>.bin/...      document text, same encoding
+    metadata.<gen>.bin/...       per-row metadata as JSON, same encoding
+    col_<field>.<gen>.npy        int32 category codes for filterable fields
+
+Example:
+    >>> write_sidecar(persist_dir, generation=3, ids=ids, documents=docs, ...)
+    >>> sidecar = read_sidecar(persist_dir)
+    >>> sidecar.documents[42]    # decodes a single row
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+# Metadata fields stored as categorical columns (used for filtering and stats)
+FILTER_COLUMNS = ("source_doc", "year", "quarter", "report_type", "statement_type", "table_type")
+
+
+class MappedStrings(Sequence):
+    """Read-only sequence of strings backed by an mmapped UTF-8 blob + offsets."""
+
+    def __init__(self, blob_path: Path, offsets_path: Path):
+        self._offsets = np.load(offsets_path, mmap_mode="r")
+        if os.path.getsize(blob_path) > 0:
+            self._blob = np.memmap(blob_path, dtype=np.uint8, mode="r")
+        else:
+            self._blob = np.empty((0,), dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _decode(self, raw: bytes) -> Any:
+        return raw.decode("utf-8")
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        return self._decode(self._blob[start:end].tobytes())
+
+
+class MappedRecords(MappedStrings):
+    """Read-only sequence of metadata dicts stored as per-row JSON."""
+
+    def _decode(self, raw: bytes) -> Dict[str, Any]:
+        return json.loads(raw, object_hook=_decode_value)
+
+
+@dataclass
+class Sidecar:
+    """Memory-mapped view of one persisted generation."""
+
+    generation: int
+    ids: MappedStrings
+    documents: MappedStrings
+    metadata: MappedRecords
+    labels: np.ndarray
+    vectors: np.ndarray
+    index_path: Path
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+    categories: Dict[str, List[Any]] = field(default_factory=dict)
+    manifest: Dict[str, Any] = field(default_factory=dict)
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON fallback for metadata values (datetimes are tagged for round-trip)."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, (np.integer, np.floating)):
+        return value.item()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _decode_value(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+    return obj
+
+
+def _write_strings(blob_path: Path, offsets_path: Path, values: Iterable[bytes]) -> None:
+    offsets = [0]
+    with open(blob_path, "wb") as f:
+        for raw in values:
+            f.write(raw)
+            offsets.append(offsets[-1] + len(raw))
+    with open(offsets_path, "wb") as f:
+        np.save(f, np.asarray(offsets, dtype=np.int64))
+
+
+def _category_key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def encode_column(values: Iterable[Any]) -> tuple:
+    """Encode values as (int32 codes, categories) preserving first-seen order."""
+    lookup: Dict[str, int] = {}
+    categories: List[Any] = []
+    codes = []
+    for value in values:
+        key = _category_key(value)
+        code = lookup.get(key)
+        if code is None:
+            code = lookup[key] = len(categories)
+            categories.append(value)
+        codes.append(code)
+    return np.asarray(codes, dtype=np.int32), categories
+
+
+def sidecar_exists(directory: str) -> bool:
+    return (Path(directory) / MANIFEST_NAME).exists()
+
+
+def write_sidecar(
+    directory: str,
+    generation: int,
+    index_writer,
+    ids: Sequence[str],
+    documents: Sequence[str],
+    metadata: Sequence[Dict[str, Any]],
+    labels: np.ndarray,
+    vectors: np.ndarray,
+    extra: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Write a new generation and atomically commit it via the manifest.
+
+    Files of the previous generation are removed after the commit.
+
+    Args:
+        directory: Persist directory
+        generation: New generation number (must differ from the current one)
+        index_writer: Callable taking a path, writes the FAISS index there
+        ids, documents, metadata: Row-aligned store contents
+        labels, vectors: Row-aligned FAISS labels and normalized vectors
+        extra: Additional manifest fields (index_type, dimension, ...)
+    """
+    root = Path(directory)
+    files: List[str] = []
+
+    def path(name: str) -> Path:
+        files.append(name)
+        return root / name
+
+    index_writer(str(path(f"index.{generation}.faiss")))
+    with open(path(f"vectors.{generation}.npy"), "wb") as f:
+        np.save(f, np.ascontiguousarray(vectors, dtype=np.float32))
+    with open(path(f"labels.{generation}.npy"), "wb") as f:
+        np.save(f, np.asarray(labels, dtype=np.int64))
+
+    _write_strings(
+        path(f"ids.{generation}.bin"), path(f"ids.{generation}.offsets.npy"),
+        (str(v).encode("utf-8") for v in ids),
+    )
+    _write_strings(
+        path(f"documents.{generation}.bin"), path(f"documents.{generation}.offsets.npy"),
+        (str(v).encode("utf-8") for v in documents),
+    )
+    _write_strings(
+        path(f"metadata.{generation}.bin"), path(f"metadata.{generation}.offsets.npy"),
+        (json.dumps(m, default=_encode_value, ensure_ascii=False).encode("utf-8") for m in metadata),
+    )
+
+    categories = {}
+    for name in FILTER_COLUMNS:
+        codes, cats = encode_column(m.get(name) for m in metadata)
+        with open(path(f"col_{name}.{generation}.npy"), "wb") as f:
+            np.save(f, codes)
+        categories[name] = cats
+
+    previous = read_manifest(directory)
+
+    manifest = dict(extra or {})
+    manifest.update({
+        "format_version": FORMAT_VERSION,
+        "generation": generation,
+        "n_rows": len(ids),
+        "files": files,
+        "categories": categories,
+    })
+    tmp_manifest = root / f"{MANIFEST_NAME}.tmp"
+    with open(tmp_manifest, "w") as f:
+        json.dump(manifest, f, default=_encode_value)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_manifest, root / MANIFEST_NAME)
+
+    if previous:
+        for name in set(previous.get("files", [])) - set(files):
+            try:
+                (root / name).unlink()
+            except FileNotFoundError:
+                pass
+
+
+def read_manifest(directory: str) -> Optional[Dict[str, Any]]:
+    manifest_path = Path(directory) / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    with open(manifest_path) as f:
+        return json.load(f, object_hook=_decode_value)
+
+
+def read_sidecar(directory: str) -> Sidecar:
+    """Open the committed generation with mmap (no rows are decoded)."""
+    root = Path(directory)
+    manifest = read_manifest(directory)
+    if manifest is None:
+        raise FileNotFoundError(f"No {MANIFEST_NAME} in {directory}")
+    gen = manifest["generation"]
+
+    return Sidecar(
+        generation=gen,
+        ids=MappedStrings(root / f"ids.{gen}.bin", root / f"ids.{gen}.offsets.npy"),
+        documents=MappedStrings(root / f"documents.{gen}.bin", root / f"documents.{gen}.offsets.npy"),
+        metadata=MappedRecords(root / f"metadata.{gen}.bin", root / f"metadata.{gen}.offsets.npy"),
+        labels=np.load(root / f"labels.{gen}.npy", mmap_mode="r"),
+        vectors=np.load(root / f"vectors.{gen}.npy", mmap_mode="r"),
+        index_path=root / f"index.{gen}.faiss",
+        columns={
+            name: np.load(root / f"col_{name}.{gen}.npy", mmap_mode="r")
+            for name in manifest.get("categories", {})
+        },
+        categories=manifest.get("categories", {}),
+        manifest=manifest,
+    )
@@ -0,0 +1,110 @@
+"""
+Inverted metadata index for pre-filtered FAISS search.
+
+Maps each filterable field to ``value -> sorted row positions`` so a
+metadata filter resolves to a candidate row set before the vector search,
+instead of over-fetching and discarding hits in Python.
+
+Matching semantics are the same as ``FAISSVectorStore._matches_filters``:
+- Text fields: case-insensitive substring match
+- Other fields: exact equality
+- ``{"$in": [...]}``: any of the listed values
+
+Example:
+    >>> index = MetadataFilterIndex.build(n_rows, ["year", "report_type"], column_codes)
+    >>> rows, residual = index.candidates({"year": 2021, "report_type": "10-Q"})
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Fields matched by case-insensitive substring instead of equality
+TEXT_FILTER_FIELDS = frozenset({'table_title', 'source_doc', 'report_type', 'company_name'})
+
+
+def value_matches(key: str, meta_value: Any, value: Any) -> bool:
+    """Check a single metadata value against a filter value."""
+    if isinstance(value, dict) and '$in' in value:
+        return any(value_matches(key, meta_value, v) for v in value['$in'])
+
+    if key in TEXT_FILTER_FIELDS and isinstance(meta_value, str) and isinstance(value, str):
+        return value.lower() in meta_value.lower()
+    return meta_value == value
+
+
+class MetadataFilterIndex:
+    """
+    Inverted index over categorical metadata columns.
+
+    Attributes:
+        n_rows: Number of rows indexed
+        postings: field -> list of (value, row positions) per distinct value
+    """
+
+    def __init__(self, n_rows: int, postings: Dict[str, List[Tuple[Any, np.ndarray]]]):
+        self.n_rows = n_rows
+        self.postings = postings
+
+    @classmethod
+    def build(
+        cls,
+        n_rows: int,
+        fields: List[str],
+        column_codes: Callable[[str], Tuple[np.ndarray, List[Any]]],
+    ) -> "MetadataFilterIndex":
+        """
+        Build postings from per-row category codes.
+
+        Args:
+            n_rows: Number of rows
+            fields: Fields to index
+            column_codes: Callable returning (int codes per row, categories) for a field
+        """
+        postings = {}
+        for name in fields:
+            codes, categories = column_codes(name)
+            codes = np.asarray(codes, dtype=np.int64)
+            order = np.argsort(codes, kind='stable')
+            counts = np.bincount(codes, minlength=len(categories)) if len(codes) else \
+                np.zeros(len(categories), dtype=np.int64)
+            groups = np.split(order, np.cumsum(counts)[:-1]) if len(categories) else []
+            postings[name] = [
+                (categories[code], rows) for code, rows in enumerate(groups) if len(rows)
+            ]
+        return cls(n_rows, postings)
+
+    def supports(self, key: str) -> bool:
+        return key in self.postings
+
+    def rows(self, key: str, value: Any) -> np.ndarray:
+        """Sorted row positions whose ``key`` matches ``value``."""
+        matched = [
+            rows for category, rows in self.postings[key]
+            if value_matches(key, category, value)
+        ]
+        if not matched:
+            return np.empty((0,), dtype=np.int64)
+        if len(matched) == 1:
+            return matched[0]
+        return np.sort(np.concatenate(matched))
+
+    def candidates(self, filters: Dict[str, Any]) -> Tuple[Optional[np.ndarray], Dict[str, Any]]:
+        """
+        Resolve the indexed part of a filter.
+
+        Returns:
+            (rows, residual) where rows are the sorted positions matching every
+            indexed key (None if no key is indexed) and residual holds the
+            filters that still need to be checked per row.
+        """
+        rows: Optional[np.ndarray] = None
+        residual = {}
+        for key, value in filters.items():
+            if not self.supports(key):
+                residual[key] = value
+                continue
+            matched = self.rows(key, value)
+            rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+        return rows, residual
@@ -1,11 +1,14 @@
 """FAISS-based vector store for fast similarity search."""
 
 import faiss
+import math
 import numpy as np
 import pickle
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Iterable, Type
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Type
 import os
+import threading
 import uuid
 
 from langchain_core.vectorstores import VectorStore
@@ -15,11 +18,27 @@ from langchain_core.embeddings import Embeddings
 from config.settings import settings
 from src.domain.tables import TableChunk
 from src.infrastructure.embeddings.manager import get_embedding_manager
+from src.infrastructure.vectordb.stores.faiss_columnar import (
+    FILTER_COLUMNS,
+    encode_column,
+    read_sidecar,
+    sidecar_exists,
+    write_sidecar,
+)
+from src.infrastructure.vectordb.stores.faiss_filter_index import (
+    MetadataFilterIndex,
+    value_matches,
+)
 from src.utils import get_logger
 
 logger = get_logger(__name__)
 
 
+# Index types that need k-means training before vectors can be added
+TRAINABLE_INDEX_TYPES = ("ivf", "ivf_pq", "ivf_sq8")
+INDEX_TYPES = ("flat", "hnsw") + TRAINABLE_INDEX_TYPES
+
+
 class FAISSVectorStore(VectorStore):
     """
     FAISS-based vector store for fast similarity search.
@@ -28,14 +47,44 @@ class FAISSVectorStore(VectorStore):
     - Faster similarity search for large datasets
     - Lower memory footprint
     - Optimized for high-dimensional vectors
+    
+    Rows are addressable by ID: the FAISS index is wrapped in an
+    ``IndexIDMap2`` keyed by a monotonically increasing int64 label, and the
+    normalized float32 vectors are kept alongside ``ids``/``metadata``/
+    ``documents``. Deletes and upserts therefore touch only the affected rows
+    and never require re-embedding the rest of the corpus.
+    
+    Writes are persisted after every call unless they happen inside a
+    ``bulk_load()`` session, which defers persistence to a single atomic
+    save at commit and (optionally) appends each write to a delta log so a
+    crashed ingest can be replayed on the next load.
+    
+    Persistence uses a columnar, memory-mapped sidecar (see
+    ``faiss_columnar``): ``load()`` only maps files, and ``ids``/``metadata``/
+    ``documents`` decode individual rows on access until the first write
+    materializes them into lists.
+    
+    Metadata filters on indexed fields (``FILTER_COLUMNS``) are resolved
+    through an inverted index before the vector search, so filtered queries
+    only score matching rows and return up to ``k`` exact results.
+    
+    ANN index lifecycle: ``hnsw`` is built directly, while trainable types
+    (``ivf``, ``ivf_pq``, ``ivf_sq8``) are served by a flat index until
+    ``build_index()`` trains them on a sample of the stored vectors and
+    swaps them in. ``nprobe``/``ef_search`` can be set per query.
     """
     
+    # Candidate sets up to this size are scored exactly with numpy instead
+    # of running a selector-restricted FAISS search
+    BRUTE_FORCE_MAX_ROWS = 4096
+    
     def __init__(
         self, 
         embedding_function: Embeddings,
         dimension: int = None,
         persist_dir: str = None,
-        index_type: str = "flat"
+        index_type: str = "flat",
+        delta_log: Optional[bool] = None
     ):
         """
         Initialize FAISS vector store.
@@ -44,11 +93,20 @@ class FAISSVectorStore(VectorStore):
             embedding_function: LangChain embeddings interface
             dimension: Vector dimension (auto-detected if not provided)
             persist_dir: Directory to persist index
-            index_type: Type of FAISS index (flat, ivf, hnsw)
+            index_type: Type of FAISS index (flat, hnsw, ivf, ivf_pq, ivf_sq8);
+                trainable types stay flat until build_index() is called
+            delta_log: Append bulk_load() writes to a recovery log
+                (uses settings.FAISS_DELTA_LOG if not provided)
         """
         self.embedding_function = embedding_function
         self.persist_dir = persist_dir or str(Path(settings.PROJECT_ROOT) / "faiss_index")
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type: {index_type}. Supported: {INDEX_TYPES}")
         self.index_type = index_type
+        self.index_params: Dict[str, Any] = {}
+        self.nprobe = settings.FAISS_NPROBE
+        self.ef_search = settings.FAISS_EF_SEARCH
+        self.delta_log = settings.FAISS_DELTA_LOG if delta_log is None else delta_log
         
         Path(self.persist_dir).mkdir(parents=True, exist_ok=True)
         
@@ -68,6 +126,28 @@ class FAISSVectorStore(VectorStore):
         self.documents = []
         self.ids = []
         
+        # Row-aligned vector storage (same order as ids/metadata/documents)
+        self._vectors = np.empty((0, self.dimension), dtype='float32')
+        self._vector_blocks: List[np.ndarray] = []
+        self.labels = np.empty((0,), dtype='int64')
+        self._next_label = 0
+        self._row_by_id_cache: Optional[Dict[str, int]] = {}
+        self._lock = threading.RLock()
+        
+        # Memory-mapped sidecar state (None once rows are materialized)
+        self._generation = 0
+        # Bumped on every write or reload; see index_generation
+        self._data_version = 0
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+        self._categories: Optional[Dict[str, List[Any]]] = None
+        self._filter_index: Optional[MetadataFilterIndex] = None
+        
+        # Deferred persistence (bulk_load sessions)
+        self._batch_depth = 0
+        self._dirty = False
+        # Index still holds removed rows (HNSW inside a session); rebuilt on exit
+        self._index_stale = False
+        
         # Try to load existing index
         if self._index_exists():
             self.load()
@@ -75,20 +155,253 @@ class FAISSVectorStore(VectorStore):
         logger.info(f"FAISS vector store initialized: {self.persist_dir}")
         logger.info(f"Index type: {self.index_type}, Dimension: {self.dimension}")
     
+    @property
+    def vectors(self) -> np.ndarray:
+        """Row-aligned normalized vectors (appended blocks are merged lazily)."""
+        if self._vector_blocks:
+            self._vectors = np.vstack([self._vectors, *self._vector_blocks])
+            self._vector_blocks = []
+        return self._vectors
+    
+    @vectors.setter
+    def vectors(self, value: np.ndarray) -> None:
+        self._vectors = value
+        self._vector_blocks = []
+    
+    @property
+    def _row_by_id(self) -> Dict[str, int]:
+        """chunk_id -> row position (built lazily after a mapped load)."""
+        if self._row_by_id_cache is None:
+            self._row_by_id_cache = {chunk_id: i for i, chunk_id in enumerate(self.ids)}
+        return self._row_by_id_cache
+    
+    @_row_by_id.setter
+    def _row_by_id(self, value: Optional[Dict[str, int]]) -> None:
+        self._row_by_id_cache = value
+    
+    def _materialize(self) -> None:
+        """
+        Decode memory-mapped rows into Python lists before a write.
+        
+        Read-only processes never call this, so they keep sharing the
+        mapped pages. Caller must hold ``self._lock``.
+        """
+        if self._columns is None:
+            return
+        self.ids = list(self.ids)
+        self.metadata = list(self.metadata)
+        self.documents = list(self.documents)
+        self.vectors = np.array(self.vectors, dtype='float32')
+        self.labels = np.array(self.labels, dtype='int64')
+        self._columns = None
+        self._categories = None
+    
+    def _column_values(self, name: str) -> List[Any]:
+        """Per-row values of a metadata field, read from columns when mapped."""
+        if self._columns is not None and name in self._columns:
+            categories = self._categories[name]
+            return [categories[code] for code in self._columns[name]]
+        return [meta.get(name) for meta in self.metadata]
+    
+    def _column_codes(self, name: str) -> tuple:
+        """(int codes per row, categories) for a metadata field."""
+        if self._columns is not None and name in self._columns:
+            return self._columns[name], self._categories[name]
+        return encode_column(meta.get(name) for meta in self.metadata)
+    
+    def _get_filter_index(self) -> MetadataFilterIndex:
+        """
+        Inverted index over FILTER_COLUMNS (rebuilt lazily after writes).
+        
+        Caller must hold ``self._lock``.
+        """
+        if self._filter_index is None:
+            self._filter_index = MetadataFilterIndex.build(
+                len(self.ids), list(FILTER_COLUMNS), self._column_codes
+            )
+        return self._filter_index
+    
+    @property
+    def index_generation(self) -> int:
+        """
+        Counter that changes whenever stored vectors change.
+        
+        Incremented by adds, upserts, deletes, clears, index rebuilds and
+        reloads, so caches of search results can detect stale entries.
+        """
+        return self._data_version
+    
     def _create_index(self):
-        """Create FAISS index based on type."""
-        if self.index_type == "flat":
-            # Flat index with inner product (for cosine similarity)
-            return faiss.IndexFlatIP(self.dimension)
-        elif self.index_type == "ivf":
-            # IVF index for faster search on large datasets
-            quantizer = faiss.IndexFlatIP(self.dimension)
-            return faiss.IndexIVFFlat(quantizer, self.dimension, 100)
-        elif self.index_type == "hnsw":
+        """Create FAISS index based on type, wrapped for ID-addressable rows."""
+        return faiss.IndexIDMap2(self._create_base_index())
+    
+    def _create_base_index(self, index_type: Optional[str] = None):
+        """
+        Create an empty underlying FAISS index based on type.
+        
+        Trainable types start as a flat index; build_index() replaces it
+        once there are enough vectors to train on.
+        """
+        if (index_type or self.index_type) == "hnsw":
             # HNSW index for very fast approximate search
-            return faiss.IndexHNSWFlat(self.dimension, 32)
+            return faiss.IndexHNSWFlat(
+                self.dimension, settings.FAISS_HNSW_M, faiss.METRIC_INNER_PRODUCT
+            )
+        # Flat index with inner product (for cosine similarity)
+        return faiss.IndexFlatIP(self.dimension)
+    
+    def _create_trainable_index(self, index_type: str, nlist: int, pq_m: int):
+        """Create an untrained IVF index (inner product metric)."""
+        quantizer = faiss.IndexFlatIP(self.dimension)
+        if index_type == "ivf":
+            return faiss.IndexIVFFlat(
+                quantizer, self.dimension, nlist, faiss.METRIC_INNER_PRODUCT
+            )
+        if index_type == "ivf_pq":
+            # 8 bits per sub-quantizer code
+            return faiss.IndexIVFPQ(
+                quantizer, self.dimension, nlist, pq_m, 8, faiss.METRIC_INNER_PRODUCT
+            )
+        if index_type == "ivf_sq8":
+            return faiss.IndexIVFScalarQuantizer(
+                quantizer, self.dimension, nlist,
+                faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+        raise ValueError(f"Index type is not trainable: {index_type}")
+    
+    @staticmethod
+    def auto_nlist(n_vectors: int) -> int:
+        """
+        Pick an IVF list count from corpus size.
+        
+        Uses the common ~4*sqrt(N) heuristic, capped so every centroid gets
+        at least 39 training points (FAISS's minimum recommendation).
+        """
+        return max(1, min(int(4 * math.sqrt(n_vectors)), n_vectors // 39))
+    
+    def _auto_pq_m(self) -> int:
+        """Largest sub-quantizer count (<= 64) dividing dimension with >= 4 dims each."""
+        for m in (64, 48, 32, 24, 16, 12, 8, 4, 2, 1):
+            if self.dimension % m == 0 and self.dimension // m >= 4:
+                return m
+        return 1
+    
+    def _active_index_kind(self) -> str:
+        """Kind of index currently serving searches: flat, ivf or hnsw."""
+        base = faiss.downcast_index(self.index.index)
+        if isinstance(base, faiss.IndexIVF):
+            return "ivf"
+        if isinstance(base, faiss.IndexHNSW):
+            return "hnsw"
+        return "flat"
+    
+    def build_index(
+        self,
+        index_type: Optional[str] = None,
+        nlist: Optional[int] = None,
+        pq_m: Optional[int] = None,
+        sample_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        (Re)build the ANN index from stored vectors.
+        
+        Trains IVF variants on a random sample of the stored vectors, adds
+        every row under its existing label and swaps the new index in. Also
+        used offline to convert a flat index to an ANN one; no re-embedding.
+        
+        Args:
+            index_type: Target type (defaults to the configured index_type)
+            nlist: IVF list count (settings.FAISS_NLIST, or auto from corpus size)
+            pq_m: PQ sub-quantizers for ivf_pq (settings.FAISS_PQ_M, or auto)
+            sample_size: Training sample size (settings.FAISS_TRAIN_SAMPLE_SIZE)
+            
+        Returns:
+            Index parameters used for the build
+        """
+        index_type = index_type or self.index_type
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type: {index_type}. Supported: {INDEX_TYPES}")
+        
+        with self._lock:
+            n_vectors = len(self.ids)
+            params: Dict[str, Any] = {'index_type': index_type, 'n_vectors': n_vectors}
+            
+            if index_type in TRAINABLE_INDEX_TYPES:
+                nlist = nlist or settings.FAISS_NLIST or self.auto_nlist(n_vectors)
+                pq_m = pq_m or settings.FAISS_PQ_M or self._auto_pq_m()
+                sample_size = sample_size or settings.FAISS_TRAIN_SAMPLE_SIZE
+                
+                min_points = max(nlist, 256 if index_type == "ivf_pq" else 1)
+                if n_vectors < min_points:
+                    raise ValueError(
+                        f"Need at least {min_points} vectors to train {index_type} "
+                        f"(have {n_vectors})"
+                    )
+                
+                base = self._create_trainable_index(index_type, nlist, pq_m)
+                sample = self._training_sample(sample_size)
+                base.train(sample)
+                params.update({'nlist': nlist, 'train_size': len(sample)})
+                if index_type == "ivf_pq":
+                    params['pq_m'] = pq_m
+            else:
+                base = self._create_base_index(index_type)
+                if index_type == "hnsw":
+                    params['hnsw_m'] = settings.FAISS_HNSW_M
+            
+            index = faiss.IndexIDMap2(base)
+            if n_vectors:
+                index.add_with_ids(np.ascontiguousarray(self.vectors), np.ascontiguousarray(self.labels))
+            
+            self.index = index
+            self.index_type = index_type
+            self.index_params = params
+            self._data_version += 1
+            logger.info(f"Built FAISS {index_type} index: {params}")
+            self._persist()
+        
+        return params
+    
+    def _training_sample(self, sample_size: int) -> np.ndarray:
+        """Uniform random sample of stored vectors for training."""
+        n_vectors = len(self.ids)
+        if n_vectors <= sample_size:
+            return np.ascontiguousarray(self.vectors, dtype='float32')
+        rng = np.random.default_rng(0)
+        rows = np.sort(rng.choice(n_vectors, size=sample_size, replace=False))
+        return np.ascontiguousarray(self.vectors[rows], dtype='float32')
+    
+    def _search_params(
+        self,
+        k: int,
+        selector: Optional[Any] = None,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ) -> Optional[Any]:
+        """
+        Per-query FAISS search parameters for the active index.
+        
+        Args:
+            k: Number of results requested (efSearch is raised to at least k)
+            selector: Optional IDSelector restricting the search
+            nprobe: IVF lists to probe (defaults to self.nprobe)
+            ef_search: HNSW candidate list size (defaults to self.ef_search)
+        """
+        kind = self._active_index_kind()
+        if kind == "ivf":
+            params = faiss.SearchParametersIVF()
+            params.nprobe = nprobe or self.nprobe
+        elif kind == "hnsw":
+            params = faiss.SearchParametersHNSW()
+            params.efSearch = max(ef_search or self.ef_search, k)
+        elif selector is not None:
+            params = faiss.SearchParameters()
         else:
-            raise ValueError(f"Unknown index type: {self.index_type}")
+            return None
+        
+        if selector is not None:
+            params.sel = selector
+        return params
     
     def add_texts(
         self,
@@ -98,11 +411,12 @@ class FAISSVectorStore(VectorStore):
         **kwargs: Any,
     ) -> List[str]:
         """Run more texts through the embeddings and add to the vectorstore."""
+        texts = list(texts)
         if not texts:
             return []
             
         # Generate embeddings
-        embeddings = self.embedding_function.embed_documents(list(texts))
+        embeddings = self.embedding_function.embed_documents(texts)
         
         # Add to index
         return self._add_vectors(embeddings, texts, metadatas, ids)
@@ -114,50 +428,116 @@ class FAISSVectorStore(VectorStore):
         metadatas: Optional[List[dict]] = None,
         ids: Optional[List[str]] = None,
     ) -> List[str]:
-        """Add vectors to the store."""
+        """
+        Add vectors to the store.
+        
+        IDs that already exist are replaced (upsert semantics), so the
+        ``ids``/``metadata``/``documents``/``vectors`` rows stay unique and aligned.
+        """
+        texts = list(texts)
         if ids is None:
             ids = [str(uuid.uuid4()) for _ in texts]
             
         if metadatas is None:
             metadatas = [{} for _ in texts]
-            
+        
+        # Last occurrence wins for duplicate IDs within one batch
+        if len(set(ids)) != len(ids):
+            last = {chunk_id: i for i, chunk_id in enumerate(ids)}
+            keep = sorted(last.values())
+            embeddings = [embeddings[i] for i in keep]
+            texts = [texts[i] for i in keep]
+            metadatas = [metadatas[i] for i in keep]
+            ids = [ids[i] for i in keep]
+        
         # Normalize embeddings for cosine similarity
-        norm_embeddings = []
-        for emb in embeddings:
-            emb_np = np.array(emb, dtype='float32')
-            emb_np = emb_np / np.linalg.norm(emb_np)
-            norm_embeddings.append(emb_np)
-            
+        embeddings_matrix = self._normalize(embeddings)
+        
+        with self._lock:
+            self._apply_add(ids, embeddings_matrix, metadatas, texts)
+            self._log_delta({
+                'op': 'add',
+                'ids': ids,
+                'vectors': embeddings_matrix,
+                'metadata': metadatas,
+                'documents': texts,
+            })
+            self._persist()
+        return ids
+    
+    def _apply_add(
+        self,
+        ids: List[str],
+        embeddings_matrix: np.ndarray,
+        metadatas: List[dict],
+        texts: List[str],
+    ) -> None:
+        """
+        Append normalized vectors and their rows, replacing existing IDs.
+        
+        Caller must hold ``self._lock``.
+        """
+        self._materialize()
+        self._filter_index = None
+        self._data_version += 1
+        existing = [chunk_id for chunk_id in ids if chunk_id in self._row_by_id]
+        if existing:
+            self._remove_rows([self._row_by_id[chunk_id] for chunk_id in existing])
+        
+        new_labels = np.arange(
+            self._next_label, self._next_label + len(ids), dtype='int64'
+        )
+        self._next_label += len(ids)
+        
         # Store data
+        start = len(self.ids)
         self.ids.extend(ids)
         self.metadata.extend(metadatas)
         self.documents.extend(texts)
+        self._vector_blocks.append(embeddings_matrix)
+        self.labels = np.concatenate([self.labels, new_labels])
+        for offset, chunk_id in enumerate(ids):
+            self._row_by_id[chunk_id] = start + offset
         
         # Add to FAISS index
-        embeddings_matrix = np.vstack(norm_embeddings)
-        self.index.add(embeddings_matrix)
+        self.index.add_with_ids(embeddings_matrix, new_labels)
         
+        if existing:
+            logger.info(f"Replaced {len(existing)} existing chunks in FAISS index")
         logger.info(f"Added {len(texts)} chunks to FAISS index (total: {self.index.ntotal})")
-        self.save()
-        return ids
+    
+    def _normalize(self, embeddings: List[List[float]]) -> np.ndarray:
+        """Convert embeddings to a contiguous, L2-normalized float32 matrix."""
+        matrix = np.ascontiguousarray(np.asarray(embeddings, dtype='float32'))
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
 
-    def add_chunks(self, chunks: List, show_progress: bool = True):
+    def add_chunks(self, chunks: List, show_progress: bool = True) -> int:
         """
-        Add chunks to FAISS index (Legacy wrapper for compatibility).
+        Add chunks to FAISS index.
+        
+        Chunks whose ``chunk_id`` already exists replace the stored row.
         
         Args:
             chunks: List of chunk objects
             show_progress: Show progress bar
+            
+        Returns:
+            Number of chunks added
         """
         if not chunks:
-            return
+            return 0
             
         texts = []
         metadatas = []
         ids = []
         embeddings = []
+        missing = []
         
-        for chunk in chunks:
+        for i, chunk in enumerate(chunks):
             texts.append(chunk.content)
             ids.append(chunk.chunk_id)
             
@@ -168,15 +548,35 @@ class FAISSVectorStore(VectorStore):
                 metadatas.append(chunk.metadata.dict())
                 
             # Use pre-computed embedding if available
-            if hasattr(chunk, 'embedding') and chunk.embedding:
-                embeddings.append(chunk.embedding)
+            embedding = getattr(chunk, 'embedding', None)
+            embeddings.append(embedding)
+            if not embedding:
+                missing.append(i)
         
-        if embeddings:
-            # Use pre-computed embeddings
-            self._add_vectors(embeddings, texts, metadatas, ids)
-        else:
-            # Generate embeddings
-            self.add_texts(texts, metadatas, ids)
+        # Generate embeddings only for chunks that don't carry one
+        if missing:
+            generated = self.embedding_function.embed_documents([texts[i] for i in missing])
+            for i, embedding in zip(missing, generated):
+                embeddings[i] = embedding
+        
+        self._add_vectors(embeddings, texts, metadatas, ids)
+        return len(chunks)
+    
+    def upsert_chunks(self, chunks: List, show_progress: bool = True) -> int:
+        """
+        Insert or replace chunks by ``chunk_id``.
+        
+        Only the rows for the given chunk IDs are touched; the rest of the
+        index is left as-is.
+        
+        Args:
+            chunks: List of chunk objects
+            show_progress: Show progress bar
+            
+        Returns:
+            Number of chunks written
+        """
+        return self.add_chunks(chunks, show_progress)
 
     def similarity_search(
         self,
@@ -188,7 +588,7 @@ class FAISSVectorStore(VectorStore):
         """Return docs most similar to query."""
         embedding = self.embedding_function.embed_query(query)
         docs_and_scores = self.similarity_search_by_vector_with_score(
-            embedding, k, filter=filter
+            embedding, k, filter=filter, **kwargs
         )
         return [doc for doc, _ in docs_and_scores]
 
@@ -201,7 +601,7 @@ class FAISSVectorStore(VectorStore):
     ) -> List[Document]:
         """Return docs most similar to embedding vector."""
         docs_and_scores = self.similarity_search_by_vector_with_score(
-            embedding, k, filter=filter
+            embedding, k, filter=filter, **kwargs
         )
         return [doc for doc, _ in docs_and_scores]
 
@@ -215,14 +615,16 @@ class FAISSVectorStore(VectorStore):
         """Run similarity search with distance."""
         embedding = self.embedding_function.embed_query(query)
         return self.similarity_search_by_vector_with_score(
-            embedding, k, filter=filter
+            embedding, k, filter=filter, **kwargs
         )
 
     def search(
         self,
         query: str,
         top_k: int = 5,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None
     ) -> List["SearchResult"]:
         """
         Search vector store.
@@ -231,18 +633,77 @@ class FAISSVectorStore(VectorStore):
             query: Search query
             top_k: Number of results
             filters: Metadata filters
+            nprobe: IVF lists to probe for this query (recall vs latency)
+            ef_search: HNSW candidate list size for this query
             
         Returns:
             List of SearchResult objects
         """
-        from src.domain import SearchResult, TableMetadata
-        
         # Use similarity_search_with_score
         docs_and_scores = self.similarity_search_with_score(
             query,
             k=top_k,
-            filter=filters
+            filter=filters,
+            nprobe=nprobe,
+            ef_search=ef_search
         )
+        return self._to_search_results(docs_and_scores)
+    
+    def search_by_vector(
+        self,
+        embedding: List[float],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None
+    ) -> List["SearchResult"]:
+        """
+        Search with a precomputed query embedding (no re-embedding).
+        
+        Args:
+            embedding: Query vector
+            top_k: Number of results
+            filters: Metadata filters
+            nprobe: IVF lists to probe for this query
+            ef_search: HNSW candidate list size for this query
+            
+        Returns:
+            List of SearchResult objects
+        """
+        return self.search_by_vectors([embedding], top_k, filters, nprobe, ef_search)[0]
+    
+    def search_by_vectors(
+        self,
+        embeddings: List[List[float]],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None
+    ) -> List[List["SearchResult"]]:
+        """
+        Search several query embeddings in one batched FAISS call.
+        
+        The queries are searched as one (n_queries x d) matrix, and metadata
+        filters are resolved once for the whole batch.
+        
+        Args:
+            embeddings: Query vectors
+            top_k: Number of results per query
+            filters: Metadata filters (shared by all queries)
+            nprobe: IVF lists to probe
+            ef_search: HNSW candidate list size
+            
+        Returns:
+            One list of SearchResult objects per query, in input order
+        """
+        batches = self.similarity_search_by_vectors_with_score(
+            embeddings, top_k, filter=filters, nprobe=nprobe, ef_search=ef_search
+        )
+        return [self._to_search_results(docs_and_scores) for docs_and_scores in batches]
+    
+    def _to_search_results(self, docs_and_scores: List[tuple]) -> List["SearchResult"]:
+        """Convert (Document, score) pairs to domain SearchResult objects."""
+        from src.domain import SearchResult, TableMetadata
         
         results = []
         for doc, score in docs_and_scores:
@@ -289,39 +750,135 @@ class FAISSVectorStore(VectorStore):
     ) -> List[tuple[Document, float]]:
         """
         Return docs most similar to embedding vector, with score.
+        
+        Filters are applied before scoring: indexed fields narrow the
+        candidate rows via the inverted index, remaining keys are checked
+        per candidate, and only those rows are searched.
+        
+        Keyword args ``nprobe`` (IVF) and ``ef_search`` (HNSW) override the
+        store defaults for this query.
         """
-        # Normalize query embedding
-        query = np.array([embedding], dtype='float32')
-        query = query / np.linalg.norm(query)
+        return self.similarity_search_by_vectors_with_score([embedding], k, filter=filter, **kwargs)[0]
+    
+    def similarity_search_by_vectors_with_score(
+        self,
+        embeddings: List[List[float]],
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[List[tuple[Document, float]]]:
+        """
+        Batched ``similarity_search_by_vector_with_score``.
         
-        # Search FAISS index
-        # Get more results if filtering to ensure we have enough after filtering
-        search_k = k * 3 if filter else k
-        distances, indices = self.index.search(query, min(search_k, self.index.ntotal))
+        All queries go to FAISS as one matrix; filters are resolved once.
         
-        results = []
-        for i, idx in enumerate(indices[0]):
-            if idx < 0 or idx >= len(self.documents):
-                continue
+        Returns:
+            One list of (Document, score) per query, in input order
+        """
+        nprobe = kwargs.get('nprobe')
+        ef_search = kwargs.get('ef_search')
+        if len(embeddings) == 0:
+            return []
+        
+        # Normalize query embeddings
+        queries = self._normalize(embeddings)
+        
+        with self._lock:
+            if self.index.ntotal == 0:
+                return [[] for _ in range(len(queries))]
             
-            # Check filters
-            metadata = self.metadata[idx]
             if filter:
-                if not self._matches_filters(metadata, filter):
-                    continue
+                hits = self._filtered_search(queries, k, filter, nprobe, ef_search)
+            else:
+                k = min(k, self.index.ntotal)
+                distances, labels = self.index.search(
+                    queries, k, params=self._search_params(k, nprobe=nprobe, ef_search=ef_search)
+                )
+                hits = [(self._rows_for_labels(labels[i]), distances[i]) for i in range(len(queries))]
             
-            doc = Document(
-                page_content=self.documents[idx],
-                metadata=metadata
+            batches = []
+            for rows, scores in hits:
+                results = []
+                for idx, score in zip(rows, scores):
+                    if idx < 0:
+                        continue
+                    doc = Document(
+                        page_content=self.documents[idx],
+                        metadata=self.metadata[idx]
+                    )
+                    results.append((doc, float(score)))
+                batches.append(results)
+        
+        return batches
+    
+    def _filter_rows(self, filters: Dict[str, Any]) -> np.ndarray:
+        """
+        Sorted row positions matching all filters.
+        
+        Caller must hold ``self._lock``.
+        """
+        rows, residual = self._get_filter_index().candidates(filters)
+        if rows is None:
+            rows = np.arange(len(self.ids))
+        if residual and len(rows):
+            rows = np.asarray(
+                [r for r in rows if self._matches_filters(self.metadata[r], residual)],
+                dtype=np.int64,
             )
-            score = float(distances[0][i])
-            
-            results.append((doc, score))
-            
-            if len(results) >= k:
-                break
-                
-        return results
+        return rows
+    
+    def _filtered_search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        filters: Dict[str, Any],
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ) -> List[tuple]:
+        """
+        Search only rows matching ``filters``.
+        
+        Small candidate sets are scored exactly against the stored vectors;
+        larger ones are passed to FAISS as an ``IDSelectorBatch``.
+        
+        Caller must hold ``self._lock``.
+        
+        Returns:
+            Per query: (row positions, scores) ordered by descending score
+        """
+        rows = self._filter_rows(filters)
+        if len(rows) == 0:
+            return [([], []) for _ in range(len(queries))]
+        
+        k = min(k, len(rows))
+        if len(rows) <= self.BRUTE_FORCE_MAX_ROWS:
+            all_scores = self.vectors[rows] @ queries.T
+            hits = []
+            for scores in all_scores.T:
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top], kind='stable')]
+                hits.append(([int(r) for r in rows[top]], scores[top]))
+            return hits
+        
+        selector = faiss.IDSelectorBatch(np.ascontiguousarray(self.labels[rows]))
+        distances, labels = self.index.search(
+            queries, k, params=self._search_params(k, selector, nprobe, ef_search)
+        )
+        return [(self._rows_for_labels(labels[i]), distances[i]) for i in range(len(queries))]
+    
+    def _rows_for_labels(self, labels: np.ndarray) -> List[int]:
+        """
+        Map FAISS labels to row positions (-1 for unknown labels).
+        
+        Labels are assigned in increasing order and rows are compacted in
+        place, so ``self.labels`` is always sorted and a binary search suffices.
+        """
+        if len(self.labels) == 0:
+            return [-1] * len(labels)
+        positions = np.searchsorted(self.labels, labels)
+        positions = np.minimum(positions, len(self.labels) - 1)
+        found = (self.labels[positions] == labels) & (labels >= 0)
+        return [int(p) if ok else -1 for p, ok in zip(positions, found)]
     
     def _matches_filters(self, metadata: Dict[str, Any], filters: Dict[str, Any]) -> bool:
         """
@@ -331,25 +888,11 @@ class FAISSVectorStore(VectorStore):
         - Exact match for numeric fields (year, page_no)
         - Contains/substring match for text fields (table_title, source_doc)
         """
-        text_fields = {'table_title', 'source_doc', 'report_type', 'company_name'}
-        
         for key, value in filters.items():
             if key not in metadata:
                 return False
-            
-            meta_value = metadata[key]
-            
-            # For text fields, use case-insensitive contains matching
-            if key in text_fields:
-                if isinstance(meta_value, str) and isinstance(value, str):
-                    if value.lower() not in meta_value.lower():
-                        return False
-                elif meta_value != value:
-                    return False
-            else:
-                # Exact match for other fields (year, page_no, etc.)
-                if meta_value != value:
-                    return False
+            if not value_matches(key, metadata[key], value):
+                return False
         
         return True
     
@@ -366,102 +909,424 @@ class FAISSVectorStore(VectorStore):
         faiss_store.add_texts(texts, metadatas, **kwargs)
         return faiss_store
 
-    def delete_by_source(self, source_doc: str):
+    def delete_by_ids(self, ids: List[str]) -> int:
+        """
+        Delete chunks by chunk ID.
+        
+        Args:
+            ids: Chunk IDs to delete (unknown IDs are ignored)
+            
+        Returns:
+            Number of chunks deleted
+        """
+        with self._lock:
+            ids = [chunk_id for chunk_id in set(ids) if chunk_id in self._row_by_id]
+            if not ids:
+                return 0
+            self._remove_rows([self._row_by_id[chunk_id] for chunk_id in ids])
+            logger.info(f"Deleted {len(ids)} chunks from FAISS index (total: {self.index.ntotal})")
+            self._log_delta({'op': 'delete', 'ids': ids})
+            self._persist()
+        return len(ids)
+    
+    def delete_by_source(self, source_doc: str) -> int:
         """
         Delete all chunks from a specific source document.
+        
+        Only the matching rows are removed; remaining vectors stay in the
+        index, so re-ingesting one filing does not require a full re-embed.
+        
+        Returns:
+            Number of chunks deleted
         """
-        # Find indices to keep
-        keep_indices = [
-            i for i, meta in enumerate(self.metadata)
-            if meta.get('source_doc') != source_doc
-        ]
+        return self.delete_by_sources([source_doc])
+    
+    def delete_by_sources(self, source_docs: Iterable[str]) -> int:
+        """
+        Delete all chunks of several source documents.
         
-        if len(keep_indices) == len(self.metadata):
-            logger.warning(f"No chunks found from {source_doc}")
-            return
+        The rows are compacted once for all documents, so replacing a batch
+        of re-ingested filings costs one pass over the store.
         
-        # Rebuild index with remaining items
-        self.metadata = [self.metadata[i] for i in keep_indices]
-        self.documents = [self.documents[i] for i in keep_indices]
-        self.ids = [self.ids[i] for i in keep_indices]
+        Returns:
+            Number of chunks deleted
+        """
+        source_docs = set(source_docs)
+        with self._lock:
+            ids = [
+                self.ids[i] for i, value in enumerate(self._column_values('source_doc'))
+                if value in source_docs
+            ]
         
-        # Recreate index
-        self.index = self._create_index()
+        if not ids:
+            logger.debug(f"No chunks found from {', '.join(sorted(source_docs))}")
+            return 0
         
-        # Re-add embeddings (we need to regenerate them if we don't store them)
-        # For now, we assume this is a rare operation or we accept re-indexing.
-        # A better approach would be to store vectors or use FAISS remove_ids (if supported by index type)
-        logger.info(f"Deleted chunks from {source_doc}. Index cleared (re-indexing required).")
-        self.save()
+        deleted = self.delete_by_ids(ids)
+        logger.info(f"Deleted {deleted} chunks from {len(source_docs)} source documents")
+        return deleted
     
-    def clear(self):
-        """Clear all data from the index."""
+    def _remove_rows(self, rows: List[int]) -> None:
+        """
+        Remove rows from the index and compact the aligned row storage.
+        
+        Caller must hold ``self._lock``.
+        """
+        self._materialize()
+        self._filter_index = None
+        self._data_version += 1
+        rows = sorted(set(rows))
+        removed_labels = self.labels[rows]
+        
+        rebuild = self._index_stale
+        if not rebuild:
+            try:
+                self.index.remove_ids(faiss.IDSelectorBatch(removed_labels))
+            except RuntimeError:
+                # Some index types (e.g. HNSW) don't support removal
+                rebuild = True
+        
+        keep = np.ones(len(self.ids), dtype=bool)
+        keep[rows] = False
+        removed = set(rows)
+        
+        self.ids = [v for i, v in enumerate(self.ids) if i not in removed]
+        self.metadata = [v for i, v in enumerate(self.metadata) if i not in removed]
+        self.documents = [v for i, v in enumerate(self.documents) if i not in removed]
+        self.vectors = self.vectors[keep]
+        self.labels = self.labels[keep]
+        self._row_by_id = {chunk_id: i for i, chunk_id in enumerate(self.ids)}
+        
+        if rebuild:
+            if self._batch_depth > 0:
+                # Removed labels no longer map to rows, so searches skip them
+                # until the session rebuilds the index once on exit
+                self._index_stale = True
+            else:
+                self._rebuild_index()
+    
+    def _rebuild_index(self) -> None:
+        """
+        Recreate the FAISS index from stored vectors (no re-embedding).
+        
+        Trained IVF indexes are cloned and reset so their centroids are kept.
+        """
+        self._index_stale = False
+        if self._active_index_kind() == "ivf":
+            index = faiss.clone_index(self.index)
+            index.reset()
+            self.index = index
+        else:
+            self.index = self._create_index()
+        if len(self.labels):
+            self.index.add_with_ids(self.vectors, self.labels)
+    
+    def _reset_rows(self) -> None:
+        """Drop all in-memory rows. Caller must hold ``self._lock``."""
         self.index = self._create_index()
         self.metadata = []
         self.documents = []
         self.ids = []
-        logger.info("FAISS index cleared")
-        self.save()
+        self.vectors = np.empty((0, self.dimension), dtype='float32')
+        self.labels = np.empty((0,), dtype='int64')
+        self._next_label = 0
+        self._row_by_id = {}
+        self._columns = None
+        self._categories = None
+        self._filter_index = None
+        self._index_stale = False
+        self._data_version += 1
+    
+    def clear(self):
+        """Clear all data from the index."""
+        with self._lock:
+            self._reset_rows()
+            logger.info("FAISS index cleared")
+            self._log_delta({'op': 'clear'})
+            self._persist()
+    
+    def iter_documents(self, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all stored chunks in row order.
+        
+        Args:
+            batch_size: Chunks per batch
+            
+        Yields:
+            Lists of dicts with 'id', 'content' and 'metadata'
+        """
+        with self._lock:
+            ids, documents, metadata = self.ids, self.documents, self.metadata
+            n_rows = len(ids)
+        
+        # Adds only append and deletes/materialization replace the lists,
+        # so the first n_rows of the references above stay consistent
+        for start in range(0, n_rows, batch_size):
+            stop = min(start + batch_size, n_rows)
+            yield [
+                {'id': ids[i], 'content': documents[i], 'metadata': metadata[i]}
+                for i in range(start, stop)
+            ]
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector store."""
-        unique_sources = set()
-        unique_years = set()
-        
-        for metadata in self.metadata:
-            if 'source_doc' in metadata:
-                unique_sources.add(metadata['source_doc'])
-            if 'year' in metadata:
-                unique_years.add(metadata['year'])
+        unique_sources = {v for v in self._column_values('source_doc') if v is not None}
+        unique_years = {v for v in self._column_values('year') if v is not None}
         
         return {
-            'total_chunks': self.index.ntotal,
+            'total_chunks': len(self.ids),
             'unique_documents': len(unique_sources),
             'years': sorted(list(unique_years)),
             'sources': sorted(list(unique_sources)),
             'index_type': self.index_type,
+            'active_index': self._active_index_kind(),
+            'index_params': self.index_params,
             'dimension': self.dimension
         }
     
+    @contextmanager
+    def bulk_load(self) -> Iterator["FAISSVectorStore"]:
+        """
+        Defer persistence for a batch of writes.
+        
+        Adds and deletes inside the session update the in-memory index only;
+        a single atomic save runs when the outermost session exits cleanly.
+        With ``delta_log`` enabled each write is also appended to
+        ``delta.log`` so a crash mid-ingest is replayed on the next load.
+        Without it, a session that exits with an exception is rolled back
+        to the last saved state. Indexes that cannot remove rows (HNSW) are
+        rebuilt once when the session exits instead of on every delete.
+        
+        Example:
+            >>> with store.bulk_load():
+            ...     for batch in batches:
+            ...         store.add_chunks(batch)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        committed = False
+        try:
+            yield self
+            committed = True
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._index_stale and (committed or self.delta_log):
+                    self._rebuild_index()
+                if self._batch_depth == 0 and self._dirty:
+                    if committed:
+                        self.save()
+                    elif self.delta_log:
+                        logger.warning("bulk_load aborted; uncommitted writes kept in delta log")
+                    else:
+                        self._rollback()
+    
+    def _rollback(self) -> None:
+        """Discard unsaved writes by reloading the last saved state."""
+        self._reset_rows()
+        self._dirty = False
+        if self._index_exists():
+            self.load()
+        logger.warning("bulk_load aborted; uncommitted writes rolled back")
+    
+    def _persist(self) -> None:
+        """Save now, or mark dirty when inside a bulk_load session."""
+        if self._batch_depth > 0:
+            self._dirty = True
+        else:
+            self.save()
+    
+    def _log_delta(self, record: Dict[str, Any]) -> None:
+        """Append a write record to the delta log (bulk_load sessions only)."""
+        if self._batch_depth == 0 or not self.delta_log:
+            return
+        with open(self._delta_log_path, 'ab') as f:
+            pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    @property
+    def _delta_log_path(self) -> Path:
+        return Path(self.persist_dir) / 'delta.log'
+    
+    def _replay_delta_log(self) -> int:
+        """
+        Apply records left in the delta log by an interrupted bulk_load.
+        
+        A truncated trailing record (crash during append) is ignored.
+        
+        Returns:
+            Number of records replayed
+        """
+        if not self._delta_log_path.exists():
+            return 0
+        
+        replayed = 0
+        with open(self._delta_log_path, 'rb') as f:
+            while True:
+                try:
+                    record = pickle.load(f)
+                except EOFError:
+                    break
+                except Exception as e:
+                    logger.warning(f"Stopping delta log replay at truncated record: {e}")
+                    break
+                
+                if record['op'] == 'add':
+                    self._apply_add(
+                        record['ids'], record['vectors'], record['metadata'], record['documents']
+                    )
+                elif record['op'] == 'delete':
+                    rows = [self._row_by_id[i] for i in record['ids'] if i in self._row_by_id]
+                    if rows:
+                        self._remove_rows(rows)
+                elif record['op'] == 'clear':
+                    self._materialize()
+                    self.index = self._create_index()
+                    self.metadata, self.documents, self.ids = [], [], []
+                    self.vectors = np.empty((0, self.dimension), dtype='float32')
+                    self.labels = np.empty((0,), dtype='int64')
+                    self._row_by_id = {}
+                    self._filter_index = None
+                    self._data_version += 1
+                replayed += 1
+        
+        return replayed
+    
     def _index_exists(self) -> bool:
         """Check if persisted index exists."""
         return (
-            Path(f'{self.persist_dir}/index.faiss').exists() and
-            Path(f'{self.persist_dir}/metadata.pkl').exists()
+            sidecar_exists(self.persist_dir) or
+            Path(f'{self.persist_dir}/metadata.pkl').exists() or
+            self._delta_log_path.exists()
         )
     
     def save(self):
-        """Persist index to disk."""
-        faiss.write_index(self.index, f'{self.persist_dir}/index.faiss')
-        
-        with open(f'{self.persist_dir}/metadata.pkl', 'wb') as f:
-            pickle.dump({
-                'metadata': self.metadata,
-                'documents': self.documents,
-                'ids': self.ids,
-                'index_type': self.index_type,
-                'dimension': self.dimension
-            }, f)
+        """
+        Persist index, row vectors and metadata to disk.
+        
+        Writes a new generation of the columnar sidecar and commits it by
+        atomically replacing manifest.json; the previous generation (and any
+        legacy pickle files) are removed afterwards, followed by the delta log.
+        """
+        with self._lock:
+            if self._index_stale:
+                self._rebuild_index()
+            generation = self._generation + 1
+            write_sidecar(
+                self.persist_dir,
+                generation=generation,
+                index_writer=lambda path: faiss.write_index(self.index, path),
+                ids=self.ids,
+                documents=self.documents,
+                metadata=self.metadata,
+                labels=self.labels,
+                vectors=self.vectors,
+                extra={
+                    'next_label': self._next_label,
+                    'index_type': self.index_type,
+                    'index_params': self.index_params,
+                    'dimension': self.dimension,
+                },
+            )
+            self._generation = generation
+            
+            for legacy in ('index.faiss', 'vectors.npy', 'metadata.pkl'):
+                legacy_path = Path(self.persist_dir) / legacy
+                if legacy_path.exists():
+                    legacy_path.unlink()
+            
+            if self._delta_log_path.exists():
+                self._delta_log_path.unlink()
+            self._dirty = False
         
         logger.info(f"FAISS index saved to {self.persist_dir}")
     
     def load(self):
-        """Load index from disk."""
+        """
+        Load index from disk.
+        
+        The columnar sidecar is memory-mapped; rows are decoded on access.
+        Stores saved as metadata.pkl are read with the legacy loader and
+        converted on the next save. Any records left in the delta log by an
+        interrupted bulk_load are replayed afterwards.
+        """
         try:
-            self.index = faiss.read_index(f'{self.persist_dir}/index.faiss')
+            if sidecar_exists(self.persist_dir):
+                self._load_sidecar()
+            elif Path(f'{self.persist_dir}/metadata.pkl').exists():
+                self._load_pickle_snapshot()
             
-            with open(f'{self.persist_dir}/metadata.pkl', 'rb') as f:
-                data = pickle.load(f)
-                self.metadata = data['metadata']
-                self.documents = data['documents']
-                self.ids = data['ids']
-                self.index_type = data.get('index_type', 'flat')
-                self.dimension = data.get('dimension', self.dimension)
+            with self._lock:
+                replayed = self._replay_delta_log()
+                if replayed:
+                    logger.info(f"Recovered {replayed} writes from FAISS delta log")
+                    self.save()
             
             logger.info(f"FAISS index loaded from {self.persist_dir} ({self.index.ntotal} vectors)")
         except Exception as e:
             logger.error(f"Failed to load FAISS index: {e}")
             logger.warning("Starting with empty index")
+    
+    def _load_sidecar(self) -> None:
+        """Map the committed columnar generation without decoding rows."""
+        sidecar = read_sidecar(self.persist_dir)
+        manifest = sidecar.manifest
+        
+        with self._lock:
+            self.index = faiss.read_index(str(sidecar.index_path))
+            self.ids = sidecar.ids
+            self.documents = sidecar.documents
+            self.metadata = sidecar.metadata
+            self.vectors = sidecar.vectors
+            self.labels = sidecar.labels
+            self._columns = sidecar.columns
+            self._categories = sidecar.categories
+            self._generation = sidecar.generation
+            self._filter_index = None
+            self._data_version += 1
+            self._next_label = manifest.get('next_label', len(self.labels))
+            self.index_type = manifest.get('index_type', self.index_type)
+            self.index_params = manifest.get('index_params', {})
+            self.dimension = manifest.get('dimension', self.dimension)
+            self._row_by_id = None
+    
+    def _load_pickle_snapshot(self) -> None:
+        """Load a store saved as metadata.pkl (pre-columnar layout)."""
+        index = faiss.read_index(f'{self.persist_dir}/index.faiss')
+        
+        with open(f'{self.persist_dir}/metadata.pkl', 'rb') as f:
+            data = pickle.load(f)
+        
+        with self._lock:
+            self.metadata = data['metadata']
+            self.documents = data['documents']
+            self.ids = data['ids']
+            self.index_type = data.get('index_type', 'flat')
+            self.dimension = data.get('dimension', self.dimension)
+            
+            vectors_path = Path(f'{self.persist_dir}/vectors.npy')
+            if 'labels' in data and vectors_path.exists():
+                self.index = index
+                self.labels = np.asarray(data['labels'], dtype='int64')
+                self.vectors = np.load(vectors_path)
+                self._next_label = data.get('next_label', int(self.labels.max()) + 1 if len(self.labels) else 0)
+                if self.index.ntotal != len(self.ids) and len(self.vectors) == len(self.ids):
+                    # Files were replaced individually; trust metadata + vectors
+                    logger.warning("FAISS index out of sync with metadata; rebuilding from stored vectors")
+                    self._rebuild_index()
+            else:
+                # Plain (un-mapped) index: reconstruct vectors, labels 0..N-1
+                self.vectors = index.reconstruct_n(0, index.ntotal) if index.ntotal else \
+                    np.empty((0, self.dimension), dtype='float32')
+                self.labels = np.arange(len(self.vectors), dtype='int64')
+                self._next_label = len(self.labels)
+                self._rebuild_index()
+                logger.info("Migrated legacy FAISS index to ID-mapped layout")
+            
+            self._row_by_id = {chunk_id: i for i, chunk_id in enumerate(self.ids)}
+            self._filter_index = None
+            self._data_version += 1
 
 
 # Thread-safe module-level singleton
@@ -0,0 +1,101 @@
+"""
+Ingestion checkpoints - resume points for the streaming embed pipeline.
+
+A document is checkpointed once all of its chunks are embedded, written
+to the vector store and persisted. Re-running ingestion skips documents
+whose checkpoint matches their current content, so a failure at document
+N resumes after the last committed document instead of starting over.
+
+Example:
+    >>> checkpoint = IngestionCheckpoint(namespace="faiss:/srv/genai/faiss_db:all-MiniLM-L6-v2")
+    >>> fp = document_fingerprint(chunks)
+    >>> if not checkpoint.is_committed("10q_2025.pdf", fp):
+    ...     store(chunks)
+    ...     checkpoint.commit({"10q_2025.pdf": fp})
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from src.infrastructure.cache.base import BaseCache
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def document_fingerprint(chunks: Iterable[Any]) -> str:
+    """
+    Fingerprint a document by its chunk IDs and contents.
+    
+    Changes to the extracted tables or to the chunking settings change
+    the fingerprint, so the document is ingested again.
+    
+    Args:
+        chunks: Objects with ``chunk_id`` and ``content``
+    
+    Returns:
+        SHA256 hex digest
+    """
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk.chunk_id.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(chunk.content.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class IngestionCheckpoint(BaseCache[str]):
+    """
+    Committed documents per vector store location and embedding model.
+    
+    Keys are ``<namespace>:<source_doc>`` and values are document
+    fingerprints. Entries never expire; ``clear()`` forces a full re-run.
+    """
+    
+    def __init__(
+        self,
+        namespace: str,
+        cache_dir: Optional[Path] = None,
+        enabled: bool = True,
+    ):
+        """
+        Initialize ingestion checkpoints.
+        
+        Args:
+            namespace: Target identity, e.g. "<store identity>:<embedding model>"
+                (see VectorDBManager.store_identity)
+            cache_dir: Checkpoint directory (default: data/cache/checkpoints)
+            enabled: Enable checkpointing
+        """
+        if cache_dir is None:
+            from src.core.paths import get_paths
+            cache_dir = get_paths().checkpoint_dir
+        
+        self.namespace = namespace
+        super().__init__(
+            cache_dir=cache_dir,
+            name="IngestionCheckpoint",
+            ttl_hours=None,
+            enabled=enabled,
+        )
+    
+    def is_committed(self, source_doc: str, fingerprint: str) -> bool:
+        """Check whether this version of a document is already stored."""
+        return self.get(self._key(source_doc)) == fingerprint
+    
+    def commit(self, fingerprints: Dict[str, str]) -> None:
+        """
+        Record documents as fully stored.
+        
+        Call only after the vector store has persisted their chunks.
+        
+        Args:
+            fingerprints: source_doc -> fingerprint
+        """
+        for source_doc, fingerprint in fingerprints.items():
+            self.set(self._key(source_doc), fingerprint)
+    
+    def _key(self, source_doc: str) -> str:
+        return f"{self.namespace}:{source_doc}"
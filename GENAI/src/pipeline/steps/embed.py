@@ -6,9 +6,11 @@ Uses infrastructure managers (same pattern as rest of system).
 """
 
 import hashlib
-from typing import Dict, Any
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from tqdm import tqdm
 
+from src.domain.tables import TableChunk
 from src.pipeline.base import StepInterface, StepResult, StepStatus, PipelineContext
 from src.utils import get_logger
 
@@ -22,21 +24,53 @@ class EmbedStep(StepInterface):
     Implements StepInterface (like VectorDBInterface pattern).
     Uses infrastructure managers (EmbeddingManager, VectorDBManager).
     
-    Reads: context.extracted_data
-    Writes: context.chunks
+    Runs as a streaming pipeline: documents are extracted (or read from
+    context.extracted_data) one at a time, their tables are split with
+    TableChunker, and whole documents are grouped into commits of about
+    EMBED_COMMIT_BATCH_SIZE chunks that are embedded, written and persisted
+    before the next group is pulled. Memory is bounded by one commit, and
+    every committed document is checkpointed so a re-run resumes after the
+    last commit. Checkpoints are kept per store location and embedding
+    model, and are ignored while the store is empty.
+    
+    Reads: context.extracted_data (or context.source_dir when empty)
+    Writes: context.chunks (only when not storing in VectorDB)
     """
     
     name = "embed"
     
-    def __init__(self, store_in_vectordb: bool = True):
+    def __init__(
+        self,
+        store_in_vectordb: bool = True,
+        batch_size: Optional[int] = None,
+        resume: bool = True,
+        force: bool = False
+    ):
+        """
+        Initialize embed step.
+        
+        Args:
+            store_in_vectordb: Write chunks to the vector store
+            batch_size: Chunks per commit (default: settings.EMBED_COMMIT_BATCH_SIZE)
+            resume: Skip documents already committed with the same content
+            force: Re-extract and re-embed everything (ignores checkpoints)
+        """
         self.store_in_vectordb = store_in_vectordb
+        self.batch_size = batch_size
+        self.resume = resume
+        self.force = force
     
     def validate(self, context: PipelineContext) -> bool:
-        """Validate extracted data exists."""
-        if not context.extracted_data:
-            logger.error("No extracted data - run ExtractStep first")
-            return False
-        return True
+        """Validate extracted data or a PDF source directory exists."""
+        if context.extracted_data:
+            return True
+        
+        from src.pipeline.steps.extract import ExtractStep
+        if ExtractStep().validate(context):
+            return True
+        
+        logger.error("No extracted data - run ExtractStep first")
+        return False
     
     def get_step_info(self) -> Dict[str, Any]:
         """Get step metadata."""
@@ -44,19 +78,26 @@ class EmbedStep(StepInterface):
         return {
             "name": self.name,
             "description": "Generate embeddings and store in VectorDB",
-            "reads": ["context.extracted_data"],
+            "reads": ["context.extracted_data", "context.source_dir"],
             "writes": ["context.chunks"],
             "store_in_vectordb": self.store_in_vectordb,
             "vectordb_provider": settings.VECTORDB_PROVIDER,
-            "embedding_provider": settings.EMBEDDING_PROVIDER
+            "embedding_provider": settings.EMBEDDING_PROVIDER,
+            "embedding_batch_size": settings.EMBEDDING_BATCH_SIZE,
+            "embedding_concurrency": settings.EMBEDDING_MAX_CONCURRENCY,
+            "commit_batch_size": self.batch_size or settings.EMBED_COMMIT_BATCH_SIZE,
+            "chunking_enabled": settings.ENABLE_CHUNKING,
+            "resume": self.resume,
         }
     
     def execute(self, context: PipelineContext) -> StepResult:
-        """Generate embeddings and store."""
+        """Generate embeddings and store, one commit at a time."""
         from config.settings import settings
         from src.infrastructure.embeddings.manager import get_embedding_manager
+        from src.infrastructure.embeddings.batching import BatchEmbedder
         from src.infrastructure.vectordb.manager import get_vectordb_manager
-        from src.domain.tables import TableChunk, TableMetadata
+        from src.infrastructure.vectordb.stores.bm25_index import default_index_dir, load_shared
+        from src.pipeline.checkpoint import IngestionCheckpoint
         
         # Use infrastructure managers (standard pattern)
         embedding_manager = get_embedding_manager()
@@ -64,135 +105,305 @@ class EmbedStep(StepInterface):
         
         vectordb_provider = settings.VECTORDB_PROVIDER
         embedding_model = embedding_manager.get_model_name()
-        embedding_provider = settings.EMBEDDING_PROVIDER
+        force = self.force or context.force
         
-        all_chunks = []
+        checkpoint = None
+        if self.store_in_vectordb and self.resume:
+            checkpoint = IngestionCheckpoint(namespace=f"{vector_store.store_identity}:{embedding_model}")
+            if not force and vector_store.count() == 0:
+                # Cleared, moved or failed to load: checkpoints no longer describe the store
+                logger.info("Vector store is empty; ignoring ingestion checkpoints")
+                force = True
+        
+        # Saved keyword index, updated in memory per commit and saved once
+        keyword_index = load_shared(default_index_dir()) if self.store_in_vectordb else None
+        
+        kept_chunks = []
         stats = {
             'total_embeddings': 0,
             'stored': 0,
+            'documents': 0,
+            'skipped_documents': 0,
+            'commits': 0,
             'vectordb_provider': vectordb_provider,
             'embedding_model': embedding_model
         }
         
-        total_tables = sum(len(doc.get('tables', [])) for doc in context.extracted_data)
+        pbar = tqdm(
+            total=len(context.extracted_data) or None,
+            desc="Embedding",
+            unit="doc",
+            ncols=80,
+            bar_format='{desc}: {n_fmt}/{total_fmt} docs [{elapsed}]'
+        )
         
         try:
-            pbar = tqdm(
-                total=total_tables,
-                desc="Embedding",
-                unit="table",
-                ncols=80,
-                bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]'
-            )
+            embedder = BatchEmbedder(embedding_manager.embed_documents)
+            documents = self._iter_chunked_documents(context, embedding_model, settings.EMBEDDING_PROVIDER)
             
-            for doc_result in context.extracted_data:
-                filename = doc_result['file']
-                pbar.set_description(f"{filename[:25]}")
+            for group in self._iter_commit_groups(
+                documents, checkpoint, force, stats, pbar,
+                self.batch_size or settings.EMBED_COMMIT_BATCH_SIZE
+            ):
+                chunks = [chunk for _, _, doc_chunks in group for chunk in doc_chunks]
                 
-                pdf_hash = hashlib.md5(filename.encode()).hexdigest()
+                # Embed in token-budgeted batches across concurrent requests
+                embeddings = embedder.embed([chunk.content for chunk in chunks])
+                embedded_date = datetime.now()
+                for chunk, embedding in zip(chunks, embeddings):
+                    chunk.embedding = embedding
+                    chunk.metadata.embedding_dimension = len(embedding)
+                    chunk.metadata.embedded_date = embedded_date
+                stats['total_embeddings'] += len(chunks)
                 
-                for i, table in enumerate(doc_result.get('tables', [])):
-                    # Handle table formats
-                    if hasattr(table, 'content'):
-                        content = table.content
-                        table_meta = table.metadata if hasattr(table, 'metadata') else {}
-                        if hasattr(table_meta, 'model_dump'):
-                            table_meta = table_meta.model_dump()
-                    else:
-                        content = table.get('content', '')
-                        table_meta = table.get('metadata', {})
-                    
-                    if not content:
-                        pbar.update(1)
-                        continue
+                if self.store_in_vectordb:
+                    filenames = [filename for filename, _, _ in group]
                     
-                    # Use embedding manager
-                    embedding = embedding_manager.generate_embedding(content)
+                    # Persisted on exit, so the checkpoint never runs ahead of the store
+                    with vector_store.bulk_load():
+                        self._delete_previous_versions(vector_store, filenames)
+                        if chunks:
+                            vector_store.upsert_chunks(chunks, show_progress=False)
+                    stats['stored'] += len(chunks)
                     
-                    metadata_dict = doc_result.get('metadata', {})
-                    
-                    metadata = TableMetadata.from_extraction(
-                        table_meta=table_meta,
-                        doc_metadata=metadata_dict,
-                        filename=filename,
-                        table_index=i,
-                        embedding=embedding,
-                        embedding_model=embedding_model,
-                        embedding_provider=embedding_provider,
-                    )
-                    
-                    chunk = TableChunk(
-                        chunk_id=f"{pdf_hash}_{i}",
-                        content=content,
-                        embedding=embedding,
-                        metadata=metadata
-                    )
-                    
-                    all_chunks.append(chunk)
-                    stats['total_embeddings'] += 1
-                    pbar.update(1)
+                    if checkpoint is not None:
+                        checkpoint.commit({filename: fp for filename, fp, _ in group})
+                    if keyword_index is not None:
+                        self._update_keyword_index(keyword_index, filenames, chunks)
+                    self._invalidate_cached_queries(filenames)
+                else:
+                    kept_chunks.extend(chunks)
+                
+                stats['commits'] += 1
+                pbar.update(len(group))
             
             pbar.set_description("Embedding Complete")
             pbar.close()
+            self._save_keyword_index(keyword_index, stats)
             
-            # Store using vectordb manager
-            if self.store_in_vectordb and all_chunks:
-                store_pbar = tqdm(
-                    total=1,
-                    desc=f"Storing in {vectordb_provider.upper()}",
-                    ncols=80,
-                    bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt}'
-                )
-                vector_store.add_chunks(all_chunks)
-                stats['stored'] = len(all_chunks)
-                store_pbar.update(1)
-                store_pbar.set_description(f"Stored {len(all_chunks)} chunks")
-                store_pbar.close()
+            cache_stats = embedding_manager.get_cache_stats()
+            if cache_stats.get('enabled'):
+                stats['embedding_cache_hit_rate'] = cache_stats['hit_rate']
+                logger.info(f"Embedding cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses ({cache_stats['hit_rate']})")
+            
+            # Write to context (chunks are only kept when they were not stored)
+            context.chunks = kept_chunks
             
-            # Write to context
-            context.chunks = all_chunks
+            message = f"Generated {stats['total_embeddings']} embeddings, stored {stats['stored']}"
+            if stats['skipped_documents']:
+                message += f" ({stats['skipped_documents']} unchanged documents skipped)"
             
             return StepResult(
                 step_name=self.name,
                 status=StepStatus.SUCCESS,
-                data=all_chunks,
-                message=f"Generated {stats['total_embeddings']} embeddings, stored {stats['stored']}",
+                data=kept_chunks,
+                message=message,
                 metadata=stats
             )
             
         except Exception as e:
+            pbar.close()
+            self._save_keyword_index(keyword_index, stats)
             logger.error(f"Embedding failed: {e}")
+            if stats['commits'] and checkpoint is not None:
+                logger.info(f"{stats['commits']} commits were checkpointed; re-run to resume")
             return StepResult(
                 step_name=self.name,
                 status=StepStatus.FAILED,
-                error=str(e)
+                error=str(e),
+                metadata=stats
             )
+    
+    def _iter_documents(self, context: PipelineContext) -> Iterator[Dict[str, Any]]:
+        """Documents from context.extracted_data, or extracted lazily from source_dir."""
+        if context.extracted_data:
+            return iter(context.extracted_data)
+        
+        from src.pipeline.steps.extract import ExtractStep
+        return ExtractStep(force=self.force or context.force).iter_documents(context)
+    
+    def _iter_chunked_documents(
+        self,
+        context: PipelineContext,
+        embedding_model: str,
+        embedding_provider: str
+    ) -> Iterator[Tuple[str, List[TableChunk]]]:
+        """
+        Split each document's tables into chunks (not yet embedded).
+        
+        Yields:
+            (filename, chunks) per document
+        """
+        from config.settings import settings
+        from src.domain.tables import TableMetadata
+        from src.infrastructure.embeddings.chunking import TableChunker
+        
+        chunker = None
+        if settings.ENABLE_CHUNKING:
+            chunker = TableChunker(chunk_size=settings.CHUNK_SIZE, overlap=settings.CHUNK_OVERLAP)
+        
+        for doc_result in self._iter_documents(context):
+            filename = doc_result['file']
+            pdf_hash = hashlib.md5(filename.encode()).hexdigest()
+            chunks = []
+            
+            for i, table in enumerate(doc_result.get('tables', [])):
+                # Handle table formats
+                if hasattr(table, 'content'):
+                    content = table.content
+                    table_meta = table.metadata if hasattr(table, 'metadata') else {}
+                    if hasattr(table_meta, 'model_dump'):
+                        table_meta = table_meta.model_dump()
+                else:
+                    content = table.get('content', '')
+                    table_meta = table.get('metadata', {})
+                
+                if not content:
+                    continue
+                
+                metadata = TableMetadata.from_extraction(
+                    table_meta=table_meta,
+                    doc_metadata=doc_result.get('metadata', {}),
+                    filename=filename,
+                    table_index=i,
+                    embedding_model=embedding_model,
+                    embedding_provider=embedding_provider,
+                )
+                
+                if chunker is not None:
+                    pieces = chunker.chunk_table(content, metadata)
+                else:
+                    pieces = [TableChunk(content=content, metadata=metadata)]
+                
+                # Unsplit tables keep their original chunk ID
+                for k, piece in enumerate(pieces, 1):
+                    piece.chunk_id = f"{pdf_hash}_{i}" if len(pieces) == 1 else f"{pdf_hash}_{i}_{k}"
+                    chunks.append(piece)
+            
+            yield filename, chunks
+    
+    def _iter_commit_groups(
+        self,
+        documents: Iterable[Tuple[str, List[TableChunk]]],
+        checkpoint: Optional[Any],
+        force: bool,
+        stats: Dict[str, Any],
+        pbar: Any,
+        batch_size: int
+    ) -> Iterator[List[Tuple[str, str, List[TableChunk]]]]:
+        """
+        Group whole documents into commits of about ``batch_size`` chunks.
+        
+        The next document is only pulled (and extracted) once the current
+        group has been consumed, which bounds memory to one group.
+        Documents whose checkpoint matches their fingerprint are skipped.
+        
+        Yields:
+            Lists of (filename, fingerprint, chunks)
+        """
+        from src.pipeline.checkpoint import document_fingerprint
+        
+        group = []
+        size = 0
+        for filename, chunks in documents:
+            stats['documents'] += 1
+            
+            # Documents without tables still commit, so rows of an earlier version are removed
+            fingerprint = document_fingerprint(chunks)
+            if checkpoint is not None and not force and checkpoint.is_committed(filename, fingerprint):
+                stats['skipped_documents'] += 1
+                pbar.update(1)
+                continue
+            
+            group.append((filename, fingerprint, chunks))
+            size += len(chunks)
+            if size >= batch_size:
+                yield group
+                group = []
+                size = 0
+        
+        if group:
+            yield group
+    
+    def _delete_previous_versions(self, vector_store: Any, filenames: List[str]) -> None:
+        """
+        Remove the stored chunks of documents that are about to be re-ingested.
+        
+        Upserts only replace matching chunk IDs; tables that were dropped or
+        split into a different number of pieces would otherwise stay
+        searchable next to the new chunks. The whole commit is deleted in
+        one call, so stores compact their rows once per commit.
+        """
+        try:
+            vector_store.delete_by_sources(filenames)
+        except NotImplementedError as e:
+            logger.warning(f"Previous chunks of {', '.join(filenames)} not removed: {e}")
+    
+    def _update_keyword_index(self, index: Any, filenames: List[str], chunks: List[TableChunk]) -> None:
+        """
+        Apply a commit to the loaded BM25 keyword index (in memory).
+        
+        Chunks of the committed documents are replaced, as in the vector
+        store. The index is saved once by ``_save_keyword_index``.
+        """
+        try:
+            for filename in filenames:
+                index.delete_where({'source_doc': filename}, exact=True)
+            index.add(
+                [chunk.chunk_id for chunk in chunks],
+                [chunk.content for chunk in chunks],
+                [chunk.metadata.model_dump() for chunk in chunks],
+            )
+        except Exception as e:
+            logger.warning(f"Could not update keyword index (run rebuild_index to refresh it): {e}")
+    
+    def _save_keyword_index(self, index: Any, stats: Dict[str, Any]) -> None:
+        """
+        Save the keyword index after the commits of this run.
+        
+        Without a saved index nothing is done; keyword search builds it
+        from the vector store on first use.
+        """
+        if index is None or not stats['commits']:
+            return
+        
+        from src.infrastructure.vectordb.stores.bm25_index import default_index_dir
+        
+        try:
+            index.save(default_index_dir())
+        except Exception as e:
+            logger.warning(f"Could not save keyword index (run rebuild_index to refresh it): {e}")
+    
+    def _invalidate_cached_queries(self, filenames: List[str]) -> None:
+        """Evict cached query responses that used the (re)ingested documents."""
+        try:
+            from src.application import get_query_use_case
+            
+            count = get_query_use_case().invalidate_sources(filenames)
+            if count:
+                logger.info(f"Invalidated {count} cached query responses")
+        except Exception as e:
+            logger.warning(f"Could not invalidate query cache: {e}")
 
 
 # Backward-compatible function for main.py
 def run_embed(
     extracted_data: list = None,
     source_dir: str = None,
-    store_in_vectordb: bool = True
+    store_in_vectordb: bool = True,
+    force: bool = False
 ):
-    """Legacy wrapper for backward compatibility with main.py CLI."""
+    """
+    Legacy wrapper for backward compatibility with main.py CLI.
+    
+    Without extracted_data, PDFs in source_dir are extracted one at a time
+    as the embed pipeline pulls them.
+    """
     from src.pipeline import PipelineStep, PipelineResult
-    from src.pipeline.steps.extract import ExtractStep
     
-    # If no extracted_data, run extract first
-    ctx = PipelineContext(source_dir=source_dir)
+    ctx = PipelineContext(source_dir=source_dir, force=force)
     if extracted_data:
         ctx.extracted_data = extracted_data
-    else:
-        extract_step = ExtractStep()
-        if extract_step.validate(ctx):
-            extract_result = extract_step.execute(ctx)
-            if extract_result.failed:
-                return PipelineResult(
-                    step=PipelineStep.EMBED,
-                    success=False,
-                    error=f"Extract failed: {extract_result.error}"
-                )
     
     step = EmbedStep(store_in_vectordb=store_in_vectordb)
     result = step.execute(ctx) if step.validate(ctx) else StepResult(
@@ -5,7 +5,7 @@ Implements StepInterface following system architecture pattern.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterator, Optional
 from tqdm import tqdm
 
 from src.pipeline.base import StepInterface, StepResult, StepStatus, PipelineContext
@@ -27,9 +27,10 @@ class ExtractStep(StepInterface):
     name = "extract"
     
 
-    def __init__(self, enable_caching: bool = True, force: bool = False):
+    def __init__(self, enable_caching: bool = True, force: bool = False, workers: Optional[int] = None):
         self.enable_caching = enable_caching
         self.force = force
+        self.workers = workers
     
     def validate(self, context: PipelineContext) -> bool:
         """Validate source directory exists."""
@@ -57,17 +58,16 @@ class ExtractStep(StepInterface):
             "reads": ["context.source_dir"],
             "writes": ["context.extracted_data"],
             "caching_enabled": self.enable_caching,
-            "force_extraction": self.force
+            "force_extraction": self.force,
+            "workers": self.workers,
         }
     
     def execute(self, context: PipelineContext) -> StepResult:
         """Extract tables from PDFs."""
         from config.settings import settings
-        from src.infrastructure.extraction.extractor import UnifiedExtractor
         
         source_dir = context.source_dir or settings.RAW_DATA_DIR
-        source_path = Path(source_dir)
-        pdf_files = list(source_path.glob("*.pdf"))
+        pdf_files = list(Path(source_dir).glob("*.pdf"))
         
         all_results = []
         stats = {
@@ -77,8 +77,6 @@ class ExtractStep(StepInterface):
         }
         
         try:
-            extractor = UnifiedExtractor(enable_caching=self.enable_caching)
-            
             pbar = tqdm(
                 total=len(pdf_files),
                 desc="Extracting",
@@ -87,30 +85,19 @@ class ExtractStep(StepInterface):
                 bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]'
             )
             
-            for pdf_path in pdf_files:
-                pbar.set_description(f"{pdf_path.name[:25]}")
-                
-                # Pass force flag to extractor
-                result = extractor.extract(str(pdf_path), force=self.force)
-                
-                if result.is_successful():
-                    all_results.append({
-                        'file': pdf_path.name,
-                        'tables': result.tables,
-                        'metadata': result.metadata,
-                        'quality_score': result.quality_score,
-                    })
-                    stats['processed'] += 1
-                    stats['total_tables'] += len(result.tables)
-                else:
-                    stats['failed'] += 1
-                    logger.error(f"Failed: {pdf_path.name}: {result.error}")
-                
+            def on_file(name: str) -> None:
+                pbar.set_description(f"{name[:25]}")
                 pbar.update(1)
             
+            all_results = list(self.iter_documents(context, stats=stats, on_file=on_file))
+            
             pbar.set_description("Extraction Complete")
             pbar.close()
             
+            # Keep downstream order deterministic regardless of completion order
+            file_order = {p.name: i for i, p in enumerate(pdf_files)}
+            all_results.sort(key=lambda r: file_order[r['file']])
+            
             # Write to context for next step
             context.extracted_data = all_results
             
@@ -132,18 +119,76 @@ class ExtractStep(StepInterface):
                 status=StepStatus.FAILED,
                 error=str(e)
             )
+    
+    def iter_documents(
+        self,
+        context: PipelineContext,
+        stats: Optional[Dict[str, int]] = None,
+        on_file: Optional[Callable[[str], None]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Extract PDFs lazily, yielding one document result at a time.
+        
+        Extraction only advances when the consumer asks for the next
+        document, so a downstream stage (e.g. EmbedStep) bounds how much
+        extracted data is held in memory.
+        
+        Args:
+            context: Pipeline context (reads source_dir)
+            stats: Optional counters updated in place
+                ('processed', 'failed', 'total_tables')
+            on_file: Called with the file name after each PDF
+            
+        Yields:
+            Dicts with 'file', 'tables', 'metadata' and 'quality_score',
+            in completion order; failed files are logged and skipped
+        """
+        from config.settings import settings
+        from src.infrastructure.extraction.extractor import UnifiedExtractor
+        
+        source_dir = context.source_dir or settings.RAW_DATA_DIR
+        pdf_files = list(Path(source_dir).glob("*.pdf"))
+        if stats is None:
+            stats = {}
+        
+        extractor = UnifiedExtractor(enable_caching=self.enable_caching)
+        
+        # Results stream back in completion order (parallel when workers > 1)
+        for path_str, result in extractor.iter_extract(
+            [str(p) for p in pdf_files],
+            force=self.force,
+            workers=self.workers,
+        ):
+            pdf_path = Path(path_str)
+            if on_file:
+                on_file(pdf_path.name)
+            
+            if not result.is_successful():
+                stats['failed'] = stats.get('failed', 0) + 1
+                logger.error(f"Failed: {pdf_path.name}: {result.error}")
+                continue
+            
+            stats['processed'] = stats.get('processed', 0) + 1
+            stats['total_tables'] = stats.get('total_tables', 0) + len(result.tables)
+            yield {
+                'file': pdf_path.name,
+                'tables': result.tables,
+                'metadata': result.metadata,
+                'quality_score': result.quality_score,
+            }
 
 
 # Backward-compatible function for main.py
 def run_extract(
     source_dir: str = None,
     force: bool = False,
-    enable_caching: bool = True
+    enable_caching: bool = True,
+    workers: Optional[int] = None
 ):
     """Legacy wrapper for backward compatibility with main.py CLI."""
     from src.pipeline import PipelineStep, PipelineResult
     
-    step = ExtractStep(enable_caching=enable_caching, force=force)
+    step = ExtractStep(enable_caching=enable_caching, force=force, workers=workers)
     ctx = PipelineContext(source_dir=source_dir)
     result = step.execute(ctx) if step.validate(ctx) else StepResult(
         step_name="extract",
@@ -3,9 +3,10 @@ Query Step - RAG query with LLM response.
 
 Implements StepInterface following system architecture pattern.
 Uses QueryUseCase for caching support.
+Can stream the answer to callbacks as it is generated.
 """
 
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 
 from src.pipeline.base import StepInterface, StepResult, StepStatus, PipelineContext
 from src.utils import get_logger
@@ -22,13 +23,25 @@ class QueryStep(StepInterface):
     
     Reads: context.query, context.top_k
     Writes: context.results["query"]
+    
+    With ``on_token`` set, the answer is streamed: ``on_sources`` is called
+    with the retrieved sources before generation starts, then ``on_token``
+    with each piece of text as it arrives.
     """
     
     name = "query"
     
-    def __init__(self, use_cache: bool = True, force_refresh: bool = False):
+    def __init__(
+        self,
+        use_cache: bool = True,
+        force_refresh: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
+        on_sources: Optional[Callable[[List[Any]], None]] = None,
+    ):
         self.use_cache = use_cache
         self.force_refresh = force_refresh
+        self.on_token = on_token
+        self.on_sources = on_sources
     
     def validate(self, context: PipelineContext) -> bool:
         """Validate query exists."""
@@ -46,6 +59,7 @@ class QueryStep(StepInterface):
             "reads": ["context.query", "context.top_k"],
             "writes": ["context.results['query']"],
             "use_cache": self.use_cache,
+            "streaming": self.on_token is not None,
             "llm_provider": settings.LLM_PROVIDER
         }
     
@@ -56,11 +70,16 @@ class QueryStep(StepInterface):
             from src.application import get_query_use_case
             
             query_uc = get_query_use_case()
-            response = query_uc.query(
-                query=context.query,
-                top_k=context.top_k,
-                force_refresh=self.force_refresh or not self.use_cache,
-            )
+            force_refresh = self.force_refresh or not self.use_cache
+            metrics: Dict[str, float] = {}
+            if self.on_token is not None:
+                response, metrics = self._stream(query_uc, context, force_refresh)
+            else:
+                response = query_uc.query(
+                    query=context.query,
+                    top_k=context.top_k,
+                    force_refresh=force_refresh,
+                )
             
             return StepResult(
                 step_name=self.name,
@@ -76,6 +95,7 @@ class QueryStep(StepInterface):
                     'question': context.query,
                     'retrieved_chunks': response.retrieved_chunks,
                     'from_cache': response.from_cache,
+                    **metrics,
                 }
             )
         except ImportError:
@@ -107,6 +127,24 @@ class QueryStep(StepInterface):
                 error=str(e)
             )
 
+    
+    def _stream(self, query_uc, context: PipelineContext, force_refresh: bool):
+        """Stream the answer to the callbacks; return (response, metrics)."""
+        for event in query_uc.stream_query(
+            query=context.query,
+            top_k=context.top_k,
+            force_refresh=force_refresh,
+        ):
+            if event.type == "sources" and self.on_sources is not None:
+                self.on_sources(event.sources)
+            elif event.type == "token":
+                self.on_token(event.text)
+            elif event.type == "done":
+                if event.error is not None:
+                    raise RuntimeError(event.error)
+                return event.response, event.metrics
+        raise RuntimeError("Stream ended without a response")
+
 
 # Backward-compatible function for main.py
 def run_query(
@@ -114,11 +152,18 @@ def run_query(
     top_k: int = 5,
     use_cache: bool = True,
     force_refresh: bool = False,
+    on_token: Optional[Callable[[str], None]] = None,
+    on_sources: Optional[Callable[[List[Any]], None]] = None,
 ):
     """Legacy wrapper for backward compatibility with main.py CLI."""
     from src.pipeline import PipelineStep, PipelineResult
     
-    step = QueryStep(use_cache=use_cache, force_refresh=force_refresh)
+    step = QueryStep(
+        use_cache=use_cache,
+        force_refresh=force_refresh,
+        on_token=on_token,
+        on_sources=on_sources,
+    )
     ctx = PipelineContext(query=question, top_k=top_k)
     result = step.execute(ctx) if step.validate(ctx) else StepResult(
         step_name="query",
@@ -6,6 +6,9 @@ Provides thread-safe singleton access to the RAG pipeline with support for:
 - Caching integration
 - Automatic evaluation
 - Source extraction
+- Concurrent use: retrieved chunks are request state, never engine state
+- Async (aquery) and batched (batch_query) execution
+- Streaming (stream_query): sources first, then tokens as they arrive
 
 Example:
     >>> from src.rag import get_query_engine
@@ -13,16 +16,27 @@ Example:
     >>> engine = get_query_engine()
     >>> response = engine.query("What was the revenue in Q1?")
     >>> print(response.answer)
+    >>> 
+    >>> response = await engine.aquery("What was the revenue in Q1?", filters={"year": 2025})
+    >>> responses = engine.batch_query(["Revenue in Q1?", "Net income in Q1?"])
+    >>> 
+    >>> for event in engine.stream_query("Explain the change in margins"):
+    ...     if event.type == "token":
+    ...         print(event.text, end="")
 """
 
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+import asyncio
+import time
+from contextvars import ContextVar
+from operator import itemgetter
+from typing import Optional, Dict, Any, Iterator, List, Sequence, TYPE_CHECKING
 
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough, RunnableParallel
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough, RunnableParallel
 
 from config.settings import settings
 from src.core.singleton import ThreadSafeSingleton
-from src.domain import RAGResponse, TableMetadata
+from src.domain import RAGResponse, RAGStreamEvent, TableMetadata
 from src.prompts import FINANCIAL_CHAT_PROMPT, COT_PROMPT, REACT_PROMPT
 from src.utils import get_logger
 
@@ -32,12 +46,17 @@ if TYPE_CHECKING:
     from src.retrieval.retriever import Retriever
     from src.infrastructure.llm.manager import LLMManager
 
+# Chunks retrieved by the latest query in the current thread / asyncio task
+_last_retrieved_chunks: ContextVar[List[Any]] = ContextVar("last_retrieved_chunks", default=[])
+
 
 class QueryEngine(metaclass=ThreadSafeSingleton):
     """
     Main RAG pipeline using LangChain LCEL.
     
-    Thread-safe singleton manager for RAG query processing.
+    Thread-safe singleton manager for RAG query processing. All per-query
+    state (filters, top_k, retrieved chunks) travels through the chain
+    input/output, so one engine serves concurrent queries without cross-talk.
     
     Orchestrates:
     1. Retrieval (using LangChain Retriever)
@@ -72,9 +91,6 @@ class QueryEngine(metaclass=ThreadSafeSingleton):
         self._cache = cache
         self.prompt_strategy = prompt_strategy
         
-        # Store last retrieved chunks for export
-        self._last_retrieved_chunks: List[Any] = []
-        
         # Initialize components
         self._initialize_chain()
         
@@ -88,15 +104,20 @@ class QueryEngine(metaclass=ThreadSafeSingleton):
         # Select prompt based on strategy
         self.prompt = self._get_prompt_for_strategy(self.prompt_strategy)
         
-        # Build LCEL Chain
-        self.chain = (
-            RunnableParallel(
-                {"context": self._get_retriever_runnable, "question": RunnablePassthrough()}
-            )
+        # Generation: {"question", "context"} -> answer text
+        self.answer_chain = (
+            {"context": itemgetter("context"), "question": itemgetter("question")}
             | self.prompt
             | self.llm
             | StrOutputParser()
         )
+        
+        # Build LCEL Chain: {"question", "filters", "top_k"} -> {"answer", "chunks"}
+        self.chain = (
+            RunnablePassthrough.assign(chunks=RunnableLambda(self._retrieve))
+            | RunnablePassthrough.assign(context=lambda x: self._format_context(x["chunks"]))
+            | RunnableParallel(answer=self.answer_chain, chunks=itemgetter("chunks"))
+        )
     
     @property
     def retriever(self) -> "Retriever":
@@ -173,21 +194,111 @@ class QueryEngine(metaclass=ThreadSafeSingleton):
         else:  # "standard"
             return FINANCIAL_CHAT_PROMPT
 
-    def _get_retriever_runnable(self, query: str) -> str:
-        """Helper to use retriever in LCEL."""
-        if hasattr(self.retriever, 'get_relevant_documents'):
-            # LangChain Retriever
-            docs = self.retriever.get_relevant_documents(query)
-            self._last_retrieved_chunks = docs
-            return "\n\n".join([d.page_content for d in docs])
-        else:
-            # Legacy retriever
-            results = self.retriever.retrieve(query)
-            self._last_retrieved_chunks = results
-            return "\n\n".join([
-                r.content if hasattr(r, 'content') else r.get('content', '') 
-                for r in results
-            ])
+    def _retrieve(self, inputs: Dict[str, Any]) -> List[Any]:
+        """Retrieve chunks for one chain input, honouring its filters and top_k."""
+        query = inputs["question"]
+        filters = inputs.get("filters")
+        top_k = inputs.get("top_k") or settings.TOP_K
+        
+        if hasattr(self.retriever, 'retrieve'):
+            return self.retriever.retrieve(query, top_k=top_k, filters=filters)
+        
+        # LangChain retriever: no per-call filters, so match metadata here
+        docs = self.retriever.invoke(query)
+        if filters:
+            docs = [
+                d for d in docs
+                if all(d.metadata.get(k) == v for k, v in filters.items())
+            ]
+        return docs[:top_k]
+    
+    def _retrieve_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]],
+        top_k: int
+    ) -> List[List[Any]]:
+        """Retrieve chunks for several queries, sharing work where the retriever can."""
+        if hasattr(self.retriever, 'retrieve_batch'):
+            return self.retriever.retrieve_batch(queries, top_k=top_k, filters=filters)
+        return [
+            self._retrieve({"question": q, "filters": filters, "top_k": top_k})
+            for q in queries
+        ]
+    
+    @staticmethod
+    def _format_context(chunks: Sequence[Any]) -> str:
+        """Join chunk texts into the prompt context."""
+        return "\n\n".join([
+            c.page_content if hasattr(c, 'page_content')
+            else c.content if hasattr(c, 'content')
+            else c.get('content', '')
+            for c in chunks
+        ])
+    
+    def _get_cached_response(
+        self,
+        query: str,
+        context_key: str,
+        use_cache: bool
+    ) -> Optional[RAGResponse]:
+        """Return a cached answer, if any."""
+        if use_cache and self.cache:
+            cached_response = self.cache.get_llm_response(query, context_key)
+            if cached_response:
+                logger.info("Using cached response")
+                return RAGResponse(
+                    answer=cached_response,
+                    sources=[],
+                    confidence=1.0,
+                    retrieved_chunks=0,
+                    from_cache=True
+                )
+        return None
+    
+    def _build_response(
+        self,
+        query: str,
+        response_text: str,
+        chunks: List[Any],
+        context_key: str,
+        use_cache: bool
+    ) -> RAGResponse:
+        """Cache, evaluate and wrap a generated answer."""
+        _last_retrieved_chunks.set(chunks)
+        
+        # Extract sources from retrieved chunks
+        sources = self._extract_sources(chunks)
+        
+        # Save to cache
+        if use_cache and self.cache:
+            self.cache.set_llm_response(query, response_text, context_key)
+        
+        # Run evaluation if enabled
+        evaluation_result = None
+        confidence = 0.8
+        
+        if settings.EVALUATION_ENABLED and settings.EVALUATION_AUTO_RUN:
+            evaluation_result, confidence = self._run_evaluation(query, response_text, chunks)
+        
+        return RAGResponse(
+            answer=response_text,
+            sources=sources,
+            confidence=confidence,
+            retrieved_chunks=len(chunks),
+            evaluation=evaluation_result
+        )
+    
+    @staticmethod
+    def _error_response(error: Exception) -> RAGResponse:
+        """Response returned when the pipeline fails."""
+        logger.error(f"Pipeline failed: {error}")
+        return RAGResponse(
+            answer=f"I encountered an error: {str(error)}",
+            sources=[],
+            confidence=0.0,
+            retrieved_chunks=0
+        )
 
     def query(
         self,
@@ -212,61 +323,209 @@ class QueryEngine(metaclass=ThreadSafeSingleton):
         
         # Check cache
         context_key = f"{query}_{filters}_{top_k}"
-        if use_cache and self.cache:
-            cached_response = self.cache.get_llm_response(query, context_key)
-            if cached_response:
-                logger.info("Using cached response")
-                return RAGResponse(
-                    answer=cached_response,
-                    sources=[],
-                    confidence=1.0,
-                    retrieved_chunks=0,
-                    from_cache=True
-                )
+        cached_response = self._get_cached_response(query, context_key, use_cache)
+        if cached_response:
+            return cached_response
         
         logger.info("Executing LangChain pipeline...")
         
         try:
             # Execute chain
-            response_text = self.chain.invoke(query)
+            result = self.chain.invoke({"question": query, "filters": filters, "top_k": top_k})
+            return self._build_response(
+                query, result["answer"], result["chunks"], context_key, use_cache
+            )
+            
+        except Exception as e:
+            return self._error_response(e)
+    
+    async def aquery(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        use_cache: bool = True
+    ) -> RAGResponse:
+        """
+        Execute RAG query asynchronously (chain ``ainvoke``).
+        
+        Same arguments and result as ``query``; blocking cache and
+        evaluation work runs in a worker thread.
+        """
+        top_k = top_k or settings.TOP_K
+        
+        context_key = f"{query}_{filters}_{top_k}"
+        cached_response = await asyncio.to_thread(
+            self._get_cached_response, query, context_key, use_cache
+        )
+        if cached_response:
+            return cached_response
+        
+        logger.info("Executing LangChain pipeline (async)...")
+        
+        try:
+            result = await self.chain.ainvoke({"question": query, "filters": filters, "top_k": top_k})
+            response = await asyncio.to_thread(
+                self._build_response,
+                query, result["answer"], result["chunks"], context_key, use_cache
+            )
+            _last_retrieved_chunks.set(result["chunks"])
+            return response
             
-            # Extract sources from retrieved chunks
-            sources = self._extract_sources()
+        except Exception as e:
+            return self._error_response(e)
+    
+    def batch_query(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        use_cache: bool = True,
+        max_concurrency: Optional[int] = None
+    ) -> List[RAGResponse]:
+        """
+        Execute several RAG queries together.
+        
+        Retrieval is shared: distinct uncached queries are embedded and
+        searched in one batch, and duplicates are answered once. LLM calls
+        then run with at most ``max_concurrency`` in flight.
+        
+        Args:
+            queries: User queries
+            filters: Metadata filters shared by all queries
+            top_k: Number of documents to retrieve per query
+            use_cache: Whether to use cache
+            max_concurrency: Concurrent LLM calls (default: settings.LLM_MAX_CONCURRENCY)
             
-            # Save to cache
-            if use_cache and self.cache:
-                self.cache.set_llm_response(query, response_text, context_key)
+        Returns:
+            One RAGResponse per query, in input order
+        """
+        top_k = top_k or settings.TOP_K
+        max_concurrency = max_concurrency or settings.LLM_MAX_CONCURRENCY
+        
+        responses: List[Optional[RAGResponse]] = [None] * len(queries)
+        pending: Dict[str, List[int]] = {}
+        for i, query in enumerate(queries):
+            context_key = f"{query}_{filters}_{top_k}"
+            responses[i] = self._get_cached_response(query, context_key, use_cache)
+            if responses[i] is None:
+                pending.setdefault(query, []).append(i)
+        
+        if not pending:
+            return responses
+        
+        distinct = list(pending)
+        logger.info(
+            f"Executing LangChain pipeline for {len(distinct)} queries "
+            f"(max_concurrency={max_concurrency})..."
+        )
+        
+        try:
+            chunk_lists = self._retrieve_batch(distinct, filters, top_k)
+        except Exception as e:
+            error_response = self._error_response(e)
+            return [r if r is not None else error_response for r in responses]
+        
+        answers = self.answer_chain.batch(
+            [
+                {"question": query, "context": self._format_context(chunks)}
+                for query, chunks in zip(distinct, chunk_lists)
+            ],
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True
+        )
+        
+        for query, chunks, answer in zip(distinct, chunk_lists, answers):
+            if isinstance(answer, Exception):
+                response = self._error_response(answer)
+            else:
+                context_key = f"{query}_{filters}_{top_k}"
+                response = self._build_response(query, answer, chunks, context_key, use_cache)
+            for i in pending[query]:
+                responses[i] = response
+        
+        return responses
+    
+    def stream_query(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        use_cache: bool = True
+    ) -> Iterator[RAGStreamEvent]:
+        """
+        Execute RAG query, streaming the answer as it is generated.
+        
+        Yields a ``sources`` event once retrieval finishes (before the LLM
+        starts), a ``token`` event per generated chunk, and a final ``done``
+        event with the complete RAGResponse and timing metrics. The full
+        text is cached only once generation completes.
+        
+        Args:
+            query: User query
+            filters: Optional metadata filters
+            top_k: Number of documents to retrieve
+            use_cache: Whether to use cache
             
-            # Run evaluation if enabled
-            evaluation_result = None
-            confidence = 0.8
+        Yields:
+            RAGStreamEvent objects
+        """
+        top_k = top_k or settings.TOP_K
+        start = time.perf_counter()
+        
+        context_key = f"{query}_{filters}_{top_k}"
+        cached_response = self._get_cached_response(query, context_key, use_cache)
+        if cached_response:
+            yield RAGStreamEvent(type="sources")
+            yield RAGStreamEvent(type="token", text=cached_response.answer)
+            yield RAGStreamEvent(
+                type="done",
+                response=cached_response,
+                metrics={"total_ms": (time.perf_counter() - start) * 1000}
+            )
+            return
+        
+        logger.info("Executing LangChain pipeline (streaming)...")
+        
+        try:
+            chunks = self._retrieve({"question": query, "filters": filters, "top_k": top_k})
+            retrieval_ms = (time.perf_counter() - start) * 1000
+            sources = self._extract_sources(chunks)
+            yield RAGStreamEvent(type="sources", sources=sources)
             
-            if settings.EVALUATION_ENABLED and settings.EVALUATION_AUTO_RUN:
-                evaluation_result, confidence = self._run_evaluation(query, response_text)
+            parts: List[str] = []
+            first_token_at = None
+            generation_start = time.perf_counter()
+            for text in self.answer_chain.stream(
+                {"question": query, "context": self._format_context(chunks)}
+            ):
+                if not text:
+                    continue
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                parts.append(text)
+                yield RAGStreamEvent(type="token", text=text)
             
-            return RAGResponse(
-                answer=response_text,
-                sources=sources,
-                confidence=confidence,
-                retrieved_chunks=len(self._last_retrieved_chunks),
-                evaluation=evaluation_result
+            end = time.perf_counter()
+            response = self._build_response(query, "".join(parts), chunks, context_key, use_cache)
+            metrics = stream_metrics(start, generation_start, first_token_at, end, len(parts))
+            metrics["retrieval_ms"] = retrieval_ms
+            logger.info(
+                f"Streamed answer: ttft={metrics.get('time_to_first_token_ms', 0):.0f}ms, "
+                f"{metrics['tokens_per_sec']:.1f} tokens/s"
             )
             
+            yield RAGStreamEvent(type="done", sources=sources, response=response, metrics=metrics)
+            
         except Exception as e:
-            logger.error(f"Pipeline failed: {e}")
-            return RAGResponse(
-                answer=f"I encountered an error: {str(e)}",
-                sources=[],
-                confidence=0.0,
-                retrieved_chunks=0
-            )
+            yield RAGStreamEvent(type="done", response=self._error_response(e), error=str(e))
     
-    def _extract_sources(self) -> List[TableMetadata]:
-        """Extract source metadata from last retrieved chunks."""
+    def _extract_sources(self, chunks: Sequence[Any]) -> List[TableMetadata]:
+        """Extract source metadata from retrieved chunks."""
         sources = []
         seen_ids = set()
         
-        for chunk in self._last_retrieved_chunks:
+        for chunk in chunks:
             try:
                 # Handle LangChain Document objects
                 if hasattr(chunk, 'metadata'):
@@ -308,13 +567,13 @@ class QueryEngine(metaclass=ThreadSafeSingleton):
         
         return sources
     
-    def _run_evaluation(self, query: str, answer: str) -> tuple:
+    def _run_evaluation(self, query: str, answer: str, chunks: Sequence[Any]) -> tuple:
         """Run evaluation on the response."""
         try:
             from src.evaluation import get_evaluation_manager
             
             contexts = []
-            for doc in self._last_retrieved_chunks:
+            for doc in chunks:
                 if hasattr(doc, 'page_content'):
                     contexts.append(doc.page_content)
                 elif hasattr(doc, 'content'):
@@ -338,12 +597,45 @@ class QueryEngine(metaclass=ThreadSafeSingleton):
 
     def get_last_retrieved_chunks(self) -> List[Any]:
         """
-        Get chunks from last query execution.
+        Get chunks from the last query executed by the calling thread
+        (or asyncio task).
+        
+        Prefer the chunks of a specific response over this helper when
+        queries run concurrently in the same context.
         
         Returns:
             List of retrieved chunks (SearchResult or LangChain Document objects)
         """
-        return self._last_retrieved_chunks
+        return _last_retrieved_chunks.get()
+
+
+def stream_metrics(
+    start: float,
+    generation_start: float,
+    first_token_at: Optional[float],
+    end: float,
+    tokens: int
+) -> Dict[str, float]:
+    """
+    Timing metrics of a streamed answer (perf_counter timestamps).
+    
+    Tokens are counted as streamed chunks, which is one token per chunk
+    for the supported chat models.
+    
+    Returns:
+        Dict with total_ms, tokens, tokens_per_sec and, once a token
+        arrived, time_to_first_token_ms (measured from ``start``)
+    """
+    metrics = {
+        "total_ms": (end - start) * 1000,
+        "tokens": float(tokens),
+        "tokens_per_sec": 0.0,
+    }
+    if first_token_at is not None:
+        metrics["time_to_first_token_ms"] = (first_token_at - start) * 1000
+        elapsed = end - generation_start
+        metrics["tokens_per_sec"] = tokens / elapsed if elapsed > 0 else 0.0
+    return metrics
 
 
 def get_query_engine(
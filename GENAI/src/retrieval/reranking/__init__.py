@@ -8,9 +8,9 @@ Two-stage retrieval (industry standard):
 2. Second stage: Slow re-ranking (cross-encoder) - high precision
 
 Usage:
-    from src.retrieval.reranking import CrossEncoderReranker
+    from src.retrieval.reranking import get_reranker
     
-    reranker = CrossEncoderReranker(model_name='cross-encoder/ms-marco-MiniLM-L-6-v2')
+    reranker = get_reranker()  # shared, lazily loaded, cached, micro-batched
     reranked = reranker.rerank(query="question", results=search_results)
 """
 
@@ -8,74 +8,330 @@ Industry standard: Two-stage retrieval
 Cross-encoders are more accurate than bi-encoders but slower.
 Use for final ranking of top-k results.
 
+To keep reranking cheap on CPU:
+- The model loads lazily, once per process, and is shared by all rerankers
+- (query, chunk) scores are kept in an LRU cache
+- Long chunks (e.g. table markdown) are truncated to a token budget
+- The model can run int8-quantized, or through the ONNX runtime
+- Rerank calls arriving concurrently from different threads are merged
+  into one ``predict`` call (micro-batching)
+
 Reference: sentence-transformers cross-encoders
 """
 
-from typing import List, Optional
-import logging
-from src.utils import get_logger
-
-from sentence_transformers import CrossEncoder
-import numpy as np
+import hashlib
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from config.settings import settings
+from src.infrastructure.cache.base import CacheStats
+from src.infrastructure.embeddings.batching import CHARS_PER_TOKEN
 from src.retrieval.search.base import SearchResult
+from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Quantized ONNX export shipped with the sentence-transformers cross-encoders
+ONNX_QUANTIZED_FILE = "onnx/model_quint8_avx2.onnx"
+
+# Process-wide models: (model_name, backend, quantize, max_length) -> CrossEncoder
+_models: Dict[tuple, Any] = {}
+_models_lock = threading.Lock()
+
+
+def _load_model(model_name: str, backend: str, quantize: bool, max_length: int) -> Any:
+    """
+    Load a cross-encoder, once per process and configuration.
+
+    Falls back to the full-precision torch model if the ONNX runtime or
+    quantization is unavailable.
+    """
+    key = (model_name, backend, quantize, max_length)
+    with _models_lock:
+        if key in _models:
+            return _models[key]
+
+        from sentence_transformers import CrossEncoder
+
+        logger.info(f"Loading cross-encoder model: {model_name} (backend={backend}, int8={quantize})")
+        model = None
+        if backend == "onnx":
+            try:
+                model_kwargs = {"file_name": ONNX_QUANTIZED_FILE} if quantize else None
+                model = CrossEncoder(
+                    model_name, max_length=max_length, backend="onnx", model_kwargs=model_kwargs
+                )
+            except Exception as e:
+                logger.warning(f"ONNX cross-encoder unavailable ({e}), using torch")
+
+        if model is None:
+            model = CrossEncoder(model_name, max_length=max_length)
+            if quantize:
+                try:
+                    import torch
+
+                    model.model = torch.quantization.quantize_dynamic(
+                        model.model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                except Exception as e:
+                    logger.warning(f"Cross-encoder quantization failed ({e}), using float32")
+
+        logger.info("Cross-encoder model loaded successfully")
+        _models[key] = model
+        return model
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text to an estimated token budget, keeping whole leading lines.
+
+    Table markdown keeps its header and first rows, which carry most of the
+    relevance signal; a single overlong line is cut mid-line.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", 0, max_chars)
+    return text[:cut] if cut > 0 else text[:max_chars]
+
+
+class _ScoreCache:
+    """Thread-safe LRU of (query hash, chunk id) -> (content digest, score)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str], digest: str) -> Optional[float]:
+        with self._lock:
+            entry = self._entries.get(key)
+            # A chunk re-ingested under the same id has a new digest
+            if entry is None or entry[0] != digest:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple[str, str], digest: str, score: float) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._entries[key] = (digest, score)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _MicroBatcher:
+    """
+    Merge concurrent scoring requests into single model calls.
+
+    Callers block on a future while one worker thread drains the queue:
+    it takes the first request, waits up to ``max_wait`` seconds for more
+    (or until ``max_pairs`` pairs are queued), then scores all of them in
+    one call.
+    """
+
+    def __init__(self, predict_fn: Callable[[List[Tuple[str, str]]], Sequence[float]],
+                 max_wait: float, max_pairs: int):
+        self.predict_fn = predict_fn
+        self.max_wait = max_wait
+        self.max_pairs = max_pairs
+        self._queue: "queue.Queue[Tuple[List[Tuple[str, str]], Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_pid: Optional[int] = None
+
+    def score(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """Score pairs, possibly together with other callers' pairs."""
+        future: Future = Future()
+        self._ensure_worker()
+        self._queue.put((pairs, future))
+        return future.result()
+
+    def _ensure_worker(self) -> None:
+        # Threads do not survive fork; start a fresh worker per process
+        pid = os.getpid()
+        with self._lock:
+            if self._worker is None or self._worker_pid != pid or not self._worker.is_alive():
+                if self._worker_pid != pid:
+                    self._queue = queue.Queue()
+                self._worker = threading.Thread(
+                    target=self._run, name="rerank-batcher", daemon=True
+                )
+                self._worker_pid = pid
+                self._worker.start()
+
+    def _run(self) -> None:
+        requests = self._queue
+        while True:
+            batch = [requests.get()]
+            size = len(batch[0][0])
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_pairs:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                size += len(item[0])
+
+            pairs = [pair for item_pairs, _ in batch for pair in item_pairs]
+            try:
+                scores = self.predict_fn(pairs)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            if len(batch) > 1:
+                logger.debug(f"Micro-batched {len(batch)} rerank requests ({len(pairs)} pairs)")
+            offset = 0
+            for item_pairs, future in batch:
+                future.set_result([float(s) for s in scores[offset:offset + len(item_pairs)]])
+                offset += len(item_pairs)
+
 
 class CrossEncoderReranker:
     """
     Re-rank search results using cross-encoder model.
-    
+
     How it works:
     1. Take top-N results from initial search
     2. Score each (query, document) pair with cross-encoder
     3. Re-sort by cross-encoder scores
     4. Return top-K re-ranked results
-    
+
     Why it's better:
     - Cross-encoder sees query and document together
     - More accurate than bi-encoder (embedding) similarity
     - Better at nuanced relevance judgments
-    
+
     Trade-off:
     - Much slower than bi-encoder
     - Use only for final re-ranking of small result set
-    
+
     Recommended usage:
     - Retrieve 20-50 results with fast search
     - Re-rank to get best 5-10 results
+    - Share one instance (``get_reranker()``) so concurrent requests
+      are micro-batched and hit the same score cache
     """
-    
+
     def __init__(
         self,
-        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
-        batch_size: int = 32
+        model_name: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        cache_size: Optional[int] = None,
+        backend: Optional[str] = None,
+        quantize: Optional[bool] = None,
+        batch_wait_ms: Optional[float] = None,
     ):
         """
         Initialize cross-encoder re-ranker.
-        
+
+        The model is not loaded until the first rerank call.
+
         Args:
-            model_name: Cross-encoder model name
-            batch_size: Batch size for inference
+            model_name: Cross-encoder model name (default: settings.RERANK_MODEL)
+            batch_size: Batch size for inference (default: settings.RERANK_BATCH_SIZE)
+            max_tokens: Token budget per pair (default: settings.RERANK_MAX_TOKENS)
+            cache_size: LRU score cache entries (default: settings.RERANK_CACHE_SIZE)
+            backend: "torch" or "onnx" (default: settings.RERANK_BACKEND)
+            quantize: Run int8 on CPU (default: settings.RERANK_QUANTIZE)
+            batch_wait_ms: Micro-batching window (default: settings.RERANK_BATCH_WAIT_MS)
         """
-        self.model_name = model_name
-        self.batch_size = batch_size
-        self.model = None
-        
-        # Lazy load model
-        self._load_model()
-    
-    def _load_model(self):
-        """Load cross-encoder model."""
-        try:
-            logger.info(f"Loading cross-encoder model: {self.model_name}")
-            self.model = CrossEncoder(self.model_name)
-            logger.info("Cross-encoder model loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load cross-encoder model: {e}")
-            self.model = None
-    
+        self.model_name = model_name or settings.RERANK_MODEL
+        self.batch_size = batch_size or settings.RERANK_BATCH_SIZE
+        self.max_tokens = max_tokens or settings.RERANK_MAX_TOKENS
+        self.backend = backend or settings.RERANK_BACKEND
+        self.quantize = settings.RERANK_QUANTIZE if quantize is None else quantize
+        self.batch_wait_ms = settings.RERANK_BATCH_WAIT_MS if batch_wait_ms is None else batch_wait_ms
+        self._model = None
+        self._load_failed = False
+        self._score_cache = _ScoreCache(
+            settings.RERANK_CACHE_SIZE if cache_size is None else cache_size
+        )
+        self._batcher = (
+            _MicroBatcher(self._predict, self.batch_wait_ms / 1000.0, self.batch_size * 4)
+            if self.batch_wait_ms > 0 else None
+        )
+
+    @property
+    def model(self) -> Any:
+        """Cross-encoder model (lazy, shared per process; None if unavailable)."""
+        if self._model is None and not self._load_failed:
+            try:
+                self._model = _load_model(
+                    self.model_name, self.backend, self.quantize, self.max_tokens
+                )
+            except Exception as e:
+                logger.error(f"Failed to load cross-encoder model: {e}")
+                self._load_failed = True
+        return self._model
+
+    def _predict(self, pairs: List[Tuple[str, str]]) -> Sequence[float]:
+        return self.model.predict(
+            pairs,
+            batch_size=self.batch_size,
+            show_progress_bar=False
+        )
+
+    def score(self, query: str, results: List[SearchResult]) -> List[float]:
+        """
+        Cross-encoder scores for results, using the score cache.
+
+        Args:
+            query: Search query
+            results: Results to score
+
+        Returns:
+            One score per result, in input order
+        """
+        query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()[:16]
+        scores: List[Optional[float]] = [None] * len(results)
+        missing: List[Tuple[int, Tuple[str, str], str, str]] = []
+
+        for i, result in enumerate(results):
+            text = truncate_to_tokens(result.content, self.max_tokens)
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+            key = (query_hash, result.id or digest)
+            scores[i] = self._score_cache.get(key, digest)
+            if scores[i] is None:
+                missing.append((i, key, digest, text))
+
+        if missing:
+            pairs = [(query, text) for _, _, _, text in missing]
+            if self._batcher is not None:
+                new_scores = self._batcher.score(pairs)
+            else:
+                new_scores = [float(s) for s in self._predict(pairs)]
+            for (i, key, digest, _), score in zip(missing, new_scores):
+                scores[i] = score
+                self._score_cache.put(key, digest, score)
+
+        return scores
+
     def rerank(
         self,
         query: str,
@@ -84,78 +340,81 @@ class CrossEncoderReranker:
     ) -> List[SearchResult]:
         """
         Re-rank search results using cross-encoder.
-        
+
         Args:
             query: Search query
             results: Initial search results to re-rank
             top_k: Number of top results to return (default: all)
-            
+
         Returns:
             Re-ranked search results
         """
+        if not results:
+            return results
+
         if not self.model:
             logger.warning("Cross-encoder model not available, skipping re-ranking")
             return results
-        
-        if not results:
-            return results
-        
+
         logger.info(f"Re-ranking {len(results)} results...")
-        
+
         try:
-            # Prepare (query, document) pairs
-            pairs = [(query, result.content) for result in results]
-            
-            # Get cross-encoder scores
-            scores = self.model.predict(
-                pairs,
-                batch_size=self.batch_size,
-                show_progress_bar=False
-            )
-            
             # Update results with rerank scores
-            for result, score in zip(results, scores):
-                result.rerank_score = float(score)
-            
+            for result, score in zip(results, self.score(query, results)):
+                result.rerank_score = score
+
             # Sort by rerank score
             reranked_results = sorted(
                 results,
                 key=lambda x: x.rerank_score,
                 reverse=True
             )
-            
+
             logger.info(f"Re-ranking complete")
-            
+
             # Return top-k if specified
             if top_k:
                 return reranked_results[:top_k]
-            
+
             return reranked_results
-            
+
         except Exception as e:
             logger.error(f"Re-ranking failed: {e}", exc_info=True)
             return results
-    
+
+    def clear_cache(self) -> None:
+        """Drop cached scores."""
+        self._score_cache.clear()
+
     def get_model_info(self) -> dict:
         """Get model information."""
+        stats = self._score_cache.stats
+        stats.total_entries = len(self._score_cache)
         return {
             "model_name": self.model_name,
             "batch_size": self.batch_size,
-            "loaded": self.model is not None
+            "max_tokens": self.max_tokens,
+            "backend": self.backend,
+            "quantized": self.quantize,
+            "micro_batching": self._batcher is not None,
+            "loaded": self._model is not None,
+            "score_cache": stats.to_dict(),
         }
 
 
 # Global reranker instance
 _reranker: Optional[CrossEncoderReranker] = None
+_reranker_lock = threading.Lock()
 
 
 def get_reranker(
-    model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    model_name: Optional[str] = None
 ) -> CrossEncoderReranker:
     """Get or create global reranker instance."""
     global _reranker
-    
-    if _reranker is None:
-        _reranker = CrossEncoderReranker(model_name=model_name)
-    
+
+    with _reranker_lock:
+        if _reranker is None:
+            _reranker = CrossEncoderReranker(model_name=model_name)
+
     return _reranker
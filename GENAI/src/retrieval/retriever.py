@@ -122,6 +122,42 @@ class Retriever(metaclass=ThreadSafeSingleton):
         # Apply threshold if needed
         return results[:top_k]
     
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[List["SearchResult"]]:
+        """
+        Retrieve chunks for several queries at once.
+        
+        Distinct queries are embedded in one batched call and searched
+        together (FAISS runs them as a single matrix search); repeated
+        queries share their results.
+        
+        Args:
+            queries: Search queries
+            top_k: Number of results per query
+            filters: Metadata filters shared by all queries
+        
+        Returns:
+            One list of SearchResult objects per query, in input order
+        """
+        distinct = list(dict.fromkeys(queries))
+        
+        try:
+            from src.infrastructure.embeddings.manager import get_embedding_manager
+        
+            vectors = get_embedding_manager().embed_queries(distinct)
+            batches = self.vector_store.search_by_vectors(
+                vectors, top_k=top_k * 2, filters=filters
+            )
+            by_query = {q: results[:top_k] for q, results in zip(distinct, batches)}
+        except NotImplementedError:
+            by_query = {q: self.retrieve(q, top_k=top_k, filters=filters) for q in distinct}
+        
+        return [list(by_query[q]) for q in queries]
+    
     def build_context(
         self,
         retrieved_chunks: List["SearchResult"],
@@ -144,6 +144,29 @@ class BaseSearchStrategy(BaseRetriever):
         """Return strategy name."""
         pass
     
+    def get_branch_outcomes(self) -> Dict[str, Any]:
+        """
+        Per-branch outcomes of the last search, for composite strategies.
+        
+        Returns:
+            Branch name -> TaskOutcome (empty for single-branch strategies)
+        """
+        return {}
+    
+    def _get_embedding_memo(self, kwargs: Dict[str, Any]):
+        """
+        Return the request's shared query embedding memo.
+        
+        The orchestrator passes one ``embedding_memo`` per request so every
+        strategy serving it embeds each text once; direct callers get a
+        fresh memo.
+        """
+        memo = kwargs.get('embedding_memo')
+        if memo is None:
+            from src.infrastructure.embeddings.query_memo import QueryEmbeddingMemo
+            memo = QueryEmbeddingMemo(self.embedding_manager)
+        return memo
+    
     def validate_config(self) -> bool:
         """Validate configuration."""
         if self.config.top_k <= 0:
@@ -152,12 +175,27 @@ class BaseSearchStrategy(BaseRetriever):
         
     def _convert_to_search_results(
         self,
-        raw_results: List[Dict[str, Any]],
+        raw_results: List[Any],
         strategy_name: str
     ) -> List[SearchResult]:
-        """Convert raw results to SearchResult objects."""
+        """Convert raw results (dicts or vector store SearchResults) to SearchResult objects."""
         search_results = []
         for result in raw_results:
+            if not isinstance(result, dict):
+                # Domain SearchResult from the vector store
+                metadata = result.metadata
+                if hasattr(metadata, 'model_dump'):
+                    metadata = metadata.model_dump()
+                elif hasattr(metadata, 'dict'):
+                    metadata = metadata.dict()
+                search_results.append(SearchResult(
+                    id=result.chunk_id,
+                    content=result.content,
+                    metadata=dict(metadata or {}),
+                    score=result.score,
+                    strategy=strategy_name
+                ))
+                continue
             search_results.append(SearchResult(
                 id=result.get('id', ''),
                 content=result.get('content', result.get('document', '')),
@@ -20,6 +20,7 @@ Example:
     >>> results = orchestrator.search("revenue in Q1", top_k=5)
 """
 
+import threading
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from datetime import datetime
 
@@ -30,6 +31,7 @@ from src.retrieval.search.base import (
     SearchResult
 )
 from src.retrieval.search.factory import SearchStrategyFactory
+from src.infrastructure.embeddings.query_memo import QueryEmbeddingMemo
 from src.utils import get_logger
 
 logger = get_logger(__name__)
@@ -50,10 +52,10 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
     
     Features:
     - Strategy selection and execution
-    - Result caching (optional)
+    - Result caching (optional, exact and semantic)
     - Re-ranking (optional)
     - Performance monitoring
-    - Multi-strategy ensemble (RRF fusion)
+    - Multi-strategy ensemble (concurrent branches, RRF fusion)
     - Fallback strategies
     
     Attributes:
@@ -78,7 +80,8 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
         llm_manager: Optional["LLMManager"] = None,
         default_strategy: SearchStrategy = SearchStrategy.HYBRID,
         enable_caching: bool = False,
-        enable_reranking: bool = False
+        enable_reranking: bool = False,
+        enable_semantic_cache: bool = False
     ):
         """
         Initialize search orchestrator.
@@ -90,6 +93,8 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
             default_strategy: Default search strategy
             enable_caching: Enable result caching
             enable_reranking: Enable cross-encoder re-ranking
+            enable_semantic_cache: Reuse results of similar queries
+                (same strategy, filters and top_k)
         """
         # Lazy initialization of dependencies
         self._vector_store = vector_store
@@ -100,24 +105,30 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
         # Components
         self.factory = SearchStrategyFactory()
         self.cache = None
+        self.semantic_cache = None
         self.reranker = None
         
         # Initialize cache if enabled
         if enable_caching:
             self._init_cache()
         
+        if enable_semantic_cache:
+            self._init_semantic_cache()
+        
         # Initialize reranker if enabled
         if enable_reranking:
             self._init_reranker()
         
         # Performance tracking
+        self._metrics_lock = threading.Lock()
         self.metrics: Dict[str, Any] = {
             "total_searches": 0,
             "cache_hits": 0,
             "cache_misses": 0,
             "strategy_usage": {},
             "average_latency_ms": 0.0,
-            "total_latency_ms": 0.0
+            "total_latency_ms": 0.0,
+            "branch_latency": {}
         }
         
         logger.info(
@@ -136,11 +147,30 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
         except Exception as e:
             logger.warning(f"Failed to initialize cache: {e}")
     
+    def _init_semantic_cache(self) -> None:
+        """Initialize in-memory semantic result cache."""
+        try:
+            from config.settings import settings
+            from src.infrastructure.cache import SemanticQueryCache
+            
+            self.semantic_cache = SemanticQueryCache(
+                embed_fn=lambda text: self.embedding_manager.embed_query(text),
+                threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS or None,
+                generation_fn=lambda: self.vector_store.index_generation,
+            )
+            logger.info("Semantic search caching enabled")
+        except Exception as e:
+            logger.warning(f"Failed to initialize semantic cache: {e}")
+    
     def _init_reranker(self) -> None:
         """Initialize cross-encoder reranker."""
         try:
-            from src.retrieval.reranking.cross_encoder import CrossEncoderReranker
-            self.reranker = CrossEncoderReranker()
+            # Shared service: one model per process, one score cache, and
+            # concurrent searches micro-batched together
+            from src.retrieval.reranking.cross_encoder import get_reranker
+            self.reranker = get_reranker()
             logger.info("Search re-ranking enabled")
         except Exception as e:
             logger.warning(f"Failed to initialize reranker: {e}")
@@ -254,9 +284,10 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
             config.filters = filters
         
         # Update metrics
-        self.metrics["total_searches"] += 1
-        self.metrics["strategy_usage"][strategy.value] = \
-            self.metrics["strategy_usage"].get(strategy.value, 0) + 1
+        with self._metrics_lock:
+            self.metrics["total_searches"] += 1
+            self.metrics["strategy_usage"][strategy.value] = \
+                self.metrics["strategy_usage"].get(strategy.value, 0) + 1
         
         logger.info(
             f"Search request: query='{query[:50]}...', "
@@ -269,11 +300,28 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
             cached_results = self._get_from_cache(cache_key)
             
             if cached_results:
-                self.metrics["cache_hits"] += 1
+                with self._metrics_lock:
+                    self.metrics["cache_hits"] += 1
                 logger.info("Cache hit")
                 return cached_results
             
-            self.metrics["cache_misses"] += 1
+            with self._metrics_lock:
+                self.metrics["cache_misses"] += 1
+        
+        # Embed each distinct text once per request, across strategies
+        if self.embedding_manager is not None and kwargs.get('embedding_memo') is None:
+            kwargs['embedding_memo'] = QueryEmbeddingMemo(self.embedding_manager)
+        
+        # Check semantic cache (similar query, same strategy/filters/top_k)
+        if use_cache and self.semantic_cache is not None:
+            cached_results = self._get_from_semantic_cache(
+                query, strategy, config, kwargs.get('embedding_memo')
+            )
+            
+            if cached_results:
+                with self._metrics_lock:
+                    self.metrics["cache_hits"] += 1
+                return cached_results
         
         try:
             # Create strategy instance
@@ -293,6 +341,10 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
                 **kwargs
             )
             
+            # Record sub-branch latency of composite strategies (e.g. hybrid)
+            for name, outcome in search_strategy.get_branch_outcomes().items():
+                self._record_branch(f"{strategy.value}.{name}", outcome)
+            
             # Re-rank if enabled
             if use_reranking and self.reranker and len(results) > 1:
                 logger.info("Re-ranking results...")
@@ -305,13 +357,18 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
             # Cache results
             if use_cache and self.cache:
                 self._save_to_cache(cache_key, results)
+            if use_cache and self.semantic_cache is not None:
+                self._save_to_semantic_cache(
+                    query, strategy, config, kwargs.get('embedding_memo'), results
+                )
             
             # Update metrics
             latency_ms = (datetime.now() - start_time).total_seconds() * 1000
-            self.metrics["total_latency_ms"] += latency_ms
-            self.metrics["average_latency_ms"] = (
-                self.metrics["total_latency_ms"] / self.metrics["total_searches"]
-            )
+            with self._metrics_lock:
+                self.metrics["total_latency_ms"] += latency_ms
+                self.metrics["average_latency_ms"] = (
+                    self.metrics["total_latency_ms"] / self.metrics["total_searches"]
+                )
             
             logger.info(
                 f"Search complete: found={len(results)}, "
@@ -335,6 +392,7 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
         strategies: List[SearchStrategy],
         fusion_method: str = "rrf",
         config: Optional[SearchConfig] = None,
+        timeout: Optional[float] = None,
         **kwargs
     ) -> List[SearchResult]:
         """
@@ -345,40 +403,65 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
         - Fuse results for better recall/precision
         - More robust than single strategy
         
+        Strategies run concurrently on a shared bounded thread pool, so
+        latency is that of the slowest branch rather than the sum. A branch
+        that fails or exceeds ``timeout`` is left out of the fusion.
+        
         Args:
             query: Search query
             strategies: List of strategies to use
             fusion_method: How to fuse results ("rrf" or "weighted")
             config: Search configuration
+            timeout: Seconds to wait per strategy
+                (default: settings.SEARCH_STRATEGY_TIMEOUT, 0 = no limit)
             **kwargs: Additional parameters
             
         Returns:
             Fused search results
         """
+        from config.settings import settings
+        from src.utils.parallel import fan_out
+        
         config = config or SearchConfig()
+        if timeout is None:
+            timeout = settings.SEARCH_STRATEGY_TIMEOUT
+        
+        # All strategies share one query embedding
+        if self.embedding_manager is not None and kwargs.get('embedding_memo') is None:
+            kwargs['embedding_memo'] = QueryEmbeddingMemo(self.embedding_manager)
         
         logger.info(
             f"Multi-strategy search: query='{query[:50]}...', "
             f"strategies={[s.value for s in strategies]}"
         )
         
-        all_results = []
+        def run(strategy: SearchStrategy):
+            return lambda: self.search(
+                query=query,
+                strategy=strategy,
+                config=config,
+                use_reranking=False,  # Rerank after fusion
+                **kwargs
+            )
         
-        # Execute each strategy
-        for strategy in strategies:
-            try:
-                results = self.search(
-                    query=query,
-                    strategy=strategy,
-                    config=config,
-                    use_reranking=False,  # Rerank after fusion
-                    **kwargs
-                )
-                all_results.append(results)
-                logger.info(f"{strategy.value}: {len(results)} results")
-            except Exception as e:
-                logger.error(f"Strategy {strategy} failed: {e}")
-                all_results.append([])
+        # Execute strategies concurrently
+        outcomes = fan_out(
+            {strategy.value: run(strategy) for strategy in dict.fromkeys(strategies)},
+            pool="search",
+            max_workers=settings.SEARCH_MAX_CONCURRENCY,
+            timeout=timeout or None,
+        )
+        
+        all_results = []
+        for name, outcome in outcomes.items():
+            self._record_branch(name, outcome)
+            if outcome.ok:
+                all_results.append(outcome.result)
+                logger.info(f"{name}: {len(outcome.result)} results ({outcome.elapsed * 1000:.0f}ms)")
+            elif outcome.timed_out:
+                logger.warning(f"Strategy {name} timed out; fusing partial results")
+            else:
+                logger.error(f"Strategy {name} failed: {outcome.error}")
         
         # Fuse results
         if fusion_method == "rrf":
@@ -458,13 +541,42 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
                 self.metrics["cache_hits"] / self.metrics["total_searches"]
             )
         
+        with self._metrics_lock:
+            branch_latency = {
+                name: {
+                    **stats,
+                    "average_latency_ms": stats["total_latency_ms"] / stats["calls"] if stats["calls"] else 0.0,
+                }
+                for name, stats in self.metrics["branch_latency"].items()
+            }
+        
         return {
             **self.metrics,
+            "branch_latency": branch_latency,
             "cache_hit_rate": cache_hit_rate,
             "cache_enabled": self.cache is not None,
             "reranking_enabled": self.reranker is not None
         }
     
+    def _record_branch(self, name: str, outcome: Any) -> None:
+        """Accumulate latency/timeout/error counts for one search branch."""
+        with self._metrics_lock:
+            stats = self.metrics["branch_latency"].setdefault(name, {
+                "calls": 0,
+                "total_latency_ms": 0.0,
+                "max_latency_ms": 0.0,
+                "timeouts": 0,
+                "errors": 0,
+            })
+            latency_ms = (outcome.elapsed or 0.0) * 1000
+            stats["calls"] += 1
+            stats["total_latency_ms"] += latency_ms
+            stats["max_latency_ms"] = max(stats["max_latency_ms"], latency_ms)
+            if outcome.timed_out:
+                stats["timeouts"] += 1
+            elif not outcome.ok:
+                stats["errors"] += 1
+    
     def reset_metrics(self) -> None:
         """Reset performance metrics."""
         self.metrics = {
@@ -473,7 +585,8 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
             "cache_misses": 0,
             "strategy_usage": {},
             "average_latency_ms": 0.0,
-            "total_latency_ms": 0.0
+            "total_latency_ms": 0.0,
+            "branch_latency": {}
         }
         logger.info("Metrics reset")
     
@@ -500,6 +613,47 @@ class SearchOrchestrator(metaclass=ThreadSafeSingleton):
             logger.error(f"Cache get failed: {e}")
             return None
     
+    def _get_from_semantic_cache(
+        self,
+        query: str,
+        strategy: SearchStrategy,
+        config: SearchConfig,
+        memo: Optional[QueryEmbeddingMemo]
+    ) -> Optional[List[SearchResult]]:
+        """Get results cached for a similar query (reuses the request's query embedding)."""
+        try:
+            return self.semantic_cache.lookup(
+                query,
+                filters=config.filters,
+                top_k=config.top_k,
+                namespace=strategy.value,
+                vector=memo.embed_query(query) if memo else None
+            )
+        except Exception as e:
+            logger.error(f"Semantic cache get failed: {e}")
+            return None
+    
+    def _save_to_semantic_cache(
+        self,
+        query: str,
+        strategy: SearchStrategy,
+        config: SearchConfig,
+        memo: Optional[QueryEmbeddingMemo],
+        results: List[SearchResult]
+    ) -> None:
+        """Save results to the semantic cache."""
+        try:
+            self.semantic_cache.store(
+                query,
+                results,
+                filters=config.filters,
+                top_k=config.top_k,
+                namespace=strategy.value,
+                vector=memo.embed_query(query) if memo else None
+            )
+        except Exception as e:
+            logger.error(f"Semantic cache set failed: {e}")
+    
     def _save_to_cache(self, key: str, results: List[SearchResult]) -> None:
         """Save results to cache."""
         if not self.cache:
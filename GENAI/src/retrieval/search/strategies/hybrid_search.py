@@ -18,6 +18,7 @@ class HybridSearchStrategy(BaseSearchStrategy):
     # Sub-strategies (not Pydantic fields, internal use)
     _vector_strategy: Optional[VectorSearchStrategy] = None
     _keyword_strategy: Optional[KeywordSearchStrategy] = None
+    _branch_outcomes: Optional[Dict[str, Any]] = None
     
     def __init__(self, **kwargs):
         """Initialize hybrid search."""
@@ -49,32 +50,61 @@ class HybridSearchStrategy(BaseSearchStrategy):
         filters: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> List[SearchResult]:
-        """Execute hybrid search."""
+        """
+        Execute hybrid search.
+        
+        Vector and keyword searches run concurrently; a branch that fails or
+        exceeds SEARCH_STRATEGY_TIMEOUT is left out of the fusion.
+        """
+        from config.settings import settings
+        from src.utils.parallel import fan_out
+        
         top_k = top_k or self.config.top_k
         filters = filters or self.config.filters
         
         try:
-            # Execute both searches
-            vector_results = self._vector_strategy.search(
-                query, top_k=top_k * 2, filters=filters
-            )
-            
-            keyword_results = self._keyword_strategy.search(
-                query, top_k=top_k * 2, filters=filters
+            # Execute both searches concurrently; the vector branch reuses the
+            # request's query embedding memo
+            memo = self._get_embedding_memo(kwargs)
+            branches = {
+                "vector": lambda: self._vector_strategy.search(
+                    query, top_k=top_k * 2, filters=filters, embedding_memo=memo
+                ),
+                "keyword": lambda: self._keyword_strategy.search(query, top_k=top_k * 2, filters=filters),
+            }
+            outcomes = fan_out(
+                branches,
+                pool="search-branches",
+                max_workers=settings.SEARCH_MAX_CONCURRENCY,
+                timeout=settings.SEARCH_STRATEGY_TIMEOUT or None,
             )
+            self._branch_outcomes = outcomes
             
-            # Fuse results
+            # Fuse whatever finished
             weights = self.config.hybrid_weights or {"vector": 0.6, "keyword": 0.4}
-            weight_list = [weights.get("vector", 0.6), weights.get("keyword", 0.4)]
+            default_weights = {"vector": 0.6, "keyword": 0.4}
+            result_lists, weight_list = [], []
+            for name, outcome in outcomes.items():
+                if not outcome.ok:
+                    logger.warning(f"Hybrid {name} branch dropped: {outcome.error}")
+                    continue
+                result_lists.append(outcome.result)
+                weight_list.append(weights.get(name, default_weights[name]))
+            
+            if not result_lists:
+                return []
+            if len(result_lists) < len(outcomes):
+                total = sum(weight_list) or 1.0
+                weight_list = [w / total for w in weight_list]
             
             if self.config.hybrid_fusion_method == "weighted":
                 fused_results = weighted_score_fusion(
-                    [vector_results, keyword_results],
+                    result_lists,
                     weights=weight_list
                 )
             else:
                 fused_results = reciprocal_rank_fusion(
-                    [vector_results, keyword_results],
+                    result_lists,
                     weights=weight_list
                 )
             
@@ -84,5 +114,9 @@ class HybridSearchStrategy(BaseSearchStrategy):
             logger.error(f"Hybrid search failed: {e}")
             return []
     
+    def get_branch_outcomes(self) -> Dict[str, Any]:
+        """Per-branch outcomes (latency, errors, timeouts) of the last search."""
+        return dict(self._branch_outcomes or {})
+    
     def get_strategy_name(self) -> str:
         return "hybrid"
@@ -16,7 +16,7 @@ import logging
 from src.utils import get_logger
 
 from src.retrieval.search.base import BaseSearchStrategy, SearchResult
-from src.prompts.search_strategies import HYDE_PROMPT
+from src.prompts import HYDE_PROMPT
 
 logger = get_logger(__name__)
 
@@ -44,6 +44,9 @@ class HyDESearchStrategy(BaseSearchStrategy):
     NOTE: Requires LLM for generating hypothetical documents.
     """
     
+    # Pydantic field (BaseRetriever rejects undeclared attributes)
+    prompt_template: Optional[str] = None
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
@@ -59,7 +62,7 @@ class HyDESearchStrategy(BaseSearchStrategy):
         
         self.prompt_template = (
             self.config.hyde_prompt_template or
-            HYDE_PROMPT.template
+            (HYDE_PROMPT.template if HYDE_PROMPT is not None else None)
         )
     
     def search(
@@ -93,19 +96,16 @@ class HyDESearchStrategy(BaseSearchStrategy):
             if not hypothetical_doc:
                 # Fallback to regular vector search
                 logger.warning("HyDE generation failed, falling back to vector search")
-                return self._fallback_vector_search(query, top_k, filters)
+                return self._fallback_vector_search(query, top_k, filters, **kwargs)
             
             logger.debug(f"Generated hypothetical doc: {hypothetical_doc[:100]}...")
             
-            # Step 2: Embed hypothetical document
-            hyde_embedding = self.embedding_manager.generate_embedding(
-                hypothetical_doc
-            )
+            # Step 2: Embed hypothetical document (as a document, not a query)
+            hyde_embedding = self._get_embedding_memo(kwargs).embed_document(hypothetical_doc)
             
             # Step 3: Search using hypothetical embedding
-            # Note: We search with the embedding directly, not the text
-            raw_results = self.vector_store.search(
-                query=hypothetical_doc,  # Some stores need text
+            raw_results = self.vector_store.search_by_vector(
+                hyde_embedding,
                 top_k=top_k,
                 filters=filters
             )
@@ -126,7 +126,7 @@ class HyDESearchStrategy(BaseSearchStrategy):
             
         except Exception as e:
             logger.error(f"HyDE search failed: {e}", exc_info=True)
-            return self._fallback_vector_search(query, top_k, filters)
+            return self._fallback_vector_search(query, top_k, filters, **kwargs)
     
     def _generate_hypothetical_document(self, query: str) -> Optional[str]:
         """
@@ -135,8 +135,8 @@ class HyDESearchStrategy(BaseSearchStrategy):
         NOTE: LLM call is COMMENTED OUT by default.
         Uncomment to enable LLM-based HyDE search.
         """
-        if not self.llm_manager:
-            logger.debug("No LLM manager available for HyDE")
+        if not self.llm_manager or not self.prompt_template:
+            logger.debug("No LLM manager or prompt available for HyDE")
             return None
         
         try:
@@ -175,15 +175,16 @@ class HyDESearchStrategy(BaseSearchStrategy):
         self,
         query: str,
         top_k: int,
-        filters: Optional[Dict[str, Any]]
+        filters: Optional[Dict[str, Any]],
+        **kwargs
     ) -> List[SearchResult]:
         """Fallback to regular vector search if HyDE fails."""
         logger.info("Using fallback vector search")
         
-        query_embedding = self.embedding_manager.generate_embedding(query)
+        query_embedding = self._get_embedding_memo(kwargs).embed_query(query)
         
-        raw_results = self.vector_store.search(
-            query=query,
+        raw_results = self.vector_store.search_by_vector(
+            query_embedding,
             top_k=top_k,
             filters=filters
         )
@@ -6,18 +6,18 @@ Industry standard: Sparse retrieval
 - BM25 scoring algorithm
 - Fast exact-match retrieval
 
-Uses rank-bm25 library for efficient BM25 implementation.
+Uses a native inverted index (``BM25Index``) with numpy posting lists and
+MaxScore top-k, so query latency follows the query terms' posting-list
+sizes rather than the corpus size. The saved index is loaded once per
+process and shared by every strategy instance.
 """
 
 from typing import List, Dict, Any, Optional
 import logging
 from src.utils import get_logger
-import pickle
-from pathlib import Path
-
-from rank_bm25 import BM25Okapi
-import numpy as np
 
+from config.settings import settings
+from src.infrastructure.vectordb.stores.bm25_index import BM25Index, default_index_dir, load_shared
 from src.retrieval.search.base import BaseSearchStrategy, SearchResult
 
 logger = get_logger(__name__)
@@ -32,16 +32,21 @@ class KeywordSearchStrategy(BaseSearchStrategy):
     - Exact term matching
     - Document relevance scoring
     
-    Works independently of vector store - uses separate BM25 index.
+    Works independently of vector store - uses separate BM25 index, which
+    is built from the vector store on first use. EmbedStep updates the
+    saved index during ingestion. Strategies share the process-wide copy
+    from ``load_shared()``, which is reloaded only when the saved file
+    changes, so new instances are cheap and see new and removed chunks.
     """
     
+    # Pydantic fields (BaseRetriever rejects undeclared attributes)
+    index_path: str = ""
+    bm25_index: Optional[Any] = None
+    
     def __init__(self, *args, index_path: Optional[str] = None, **kwargs):
         super().__init__(*args, **kwargs)
         
-        self.index_path = index_path or ".cache/bm25_index"
-        self.bm25_index = None
-        self.documents = []
-        self.doc_ids = []
+        self.index_path = index_path or default_index_dir()
         
         # Load index if exists
         self._load_index()
@@ -61,14 +66,18 @@ class KeywordSearchStrategy(BaseSearchStrategy):
             top_k: Number of results to return
             filters: Metadata filters
             **kwargs: Additional parameters
-            
+        
         Returns:
             List of search results sorted by BM25 score
         """
         top_k = top_k or self.config.top_k
+        filters = filters or self.config.filters
         
         logger.info(f"BM25 search: query='{query[:50]}...', top_k={top_k}")
         
+        # Cheap when unchanged: the shared copy is only reloaded after a save
+        self._load_index()
+        
         if not self.bm25_index:
             logger.warning("BM25 index not loaded, building from vector store...")
             self._build_index_from_vector_store()
@@ -78,37 +87,13 @@ class KeywordSearchStrategy(BaseSearchStrategy):
             return []
         
         try:
-            # Tokenize query
-            tokenized_query = query.lower().split()
-            
-            # Get BM25 scores
-            scores = self.bm25_index.get_scores(tokenized_query)
-            
-            # Get top-k indices
-            top_indices = np.argsort(scores)[::-1][:top_k * 2]  # Get more for filtering
-            
-            # Convert to SearchResult
-            search_results = []
-            for idx in top_indices:
-                if scores[idx] > 0:  # Only include non-zero scores
-                    doc = self.documents[idx]
-                    
-                    # Apply filters if specified
-                    if filters and not self._matches_filters(doc.get('metadata', {}), filters):
-                        continue
-                    
-                    search_results.append(SearchResult(
-                        id=self.doc_ids[idx],
-                        content=doc.get('content', ''),
-                        metadata=doc.get('metadata', {}),
-                        score=float(scores[idx]),
-                        strategy="keyword"
-                    ))
+            raw_results = self.bm25_index.search(query, top_k=top_k, filters=filters)
+            search_results = self._convert_to_search_results(raw_results, strategy_name="keyword")
             
             logger.info(f"BM25 search complete: found={len(search_results)}")
             
-            return search_results[:top_k]
-            
+            return search_results
+        
         except Exception as e:
             logger.error(f"BM25 search failed: {e}", exc_info=True)
             return []
@@ -116,90 +101,99 @@ class KeywordSearchStrategy(BaseSearchStrategy):
     def get_strategy_name(self) -> str:
         return "keyword"
     
+    def add_chunks(self, chunks: List[Any], save: bool = True) -> int:
+        """
+        Index new or updated chunks (replaced by chunk_id).
+        
+        Args:
+            chunks: Chunk objects with chunk_id, content and metadata
+            save: Persist the index afterwards
+        
+        Returns:
+            Number of chunks indexed
+        """
+        if not chunks:
+            return 0
+        if self.bm25_index is None:
+            self.bm25_index = BM25Index(k1=settings.BM25_K1, b=settings.BM25_B)
+        
+        metadatas = [
+            chunk.metadata if isinstance(chunk.metadata, dict) else chunk.metadata.dict()
+            for chunk in chunks
+        ]
+        count = self.bm25_index.add(
+            [chunk.chunk_id for chunk in chunks],
+            [chunk.content for chunk in chunks],
+            metadatas,
+        )
+        if save:
+            self._save_index()
+        return count
+    
+    def delete_chunks(self, chunk_ids: List[str], save: bool = True) -> int:
+        """
+        Remove chunks from the index by chunk_id.
+        
+        Args:
+            chunk_ids: Chunk IDs to remove
+            save: Persist the index afterwards
+        
+        Returns:
+            Number of chunks removed
+        """
+        if not self.bm25_index:
+            return 0
+        
+        deleted = self.bm25_index.delete(chunk_ids)
+        if deleted and save:
+            self._save_index()
+        return deleted
+    
     def _build_index_from_vector_store(self):
         """Build BM25 index from vector store documents."""
         try:
             logger.info("Building BM25 index from vector store...")
             
-            # Get all documents from vector store
-            all_docs = self.vector_store.collection.get(
-                include=['documents', 'metadatas']
-            )
-            
-            if not all_docs or not all_docs.get('documents'):
+            index = BM25Index.build_from(self.vector_store, k1=settings.BM25_K1, b=settings.BM25_B)
+            if not len(index):
                 logger.warning("No documents found in vector store")
                 return
             
-            # Prepare documents for BM25
-            self.documents = []
-            self.doc_ids = all_docs['ids']
-            
-            tokenized_corpus = []
-            for i, doc_text in enumerate(all_docs['documents']):
-                self.documents.append({
-                    'content': doc_text,
-                    'metadata': all_docs['metadatas'][i] if all_docs.get('metadatas') else {}
-                })
-                
-                # Tokenize for BM25
-                tokenized_corpus.append(doc_text.lower().split())
-            
-            # Build BM25 index
-            self.bm25_index = BM25Okapi(tokenized_corpus)
-            
-            logger.info(f"BM25 index built: {len(self.documents)} documents")
+            self.bm25_index = index
+            logger.info(f"BM25 index built: {len(index)} documents")
             
             # Save index
             self._save_index()
-            
+        
         except Exception as e:
             logger.error(f"Failed to build BM25 index: {e}", exc_info=True)
     
     def _load_index(self):
-        """Load BM25 index from disk."""
-        index_file = Path(self.index_path) / "bm25_index.pkl"
-        
-        if not index_file.exists():
-            logger.debug("BM25 index file not found")
-            return
-        
+        """Use the process-wide BM25 index saved at index_path."""
         try:
-            with open(index_file, 'rb') as f:
-                data = pickle.load(f)
-                self.bm25_index = data['index']
-                self.documents = data['documents']
-                self.doc_ids = data['doc_ids']
+            index = load_shared(self.index_path)
             
-            logger.info(f"BM25 index loaded: {len(self.documents)} documents")
+            if index is None:
+                # Keep an index built here but not saved
+                logger.debug("BM25 index file not found")
+                return
             
+            if index is not self.bm25_index:
+                logger.info(f"BM25 index loaded: {len(index)} documents")
+            self.bm25_index = index
+        
         except Exception as e:
             logger.error(f"Failed to load BM25 index: {e}")
+            self.bm25_index = None
     
     def _save_index(self):
-        """Save BM25 index to disk."""
-        index_file = Path(self.index_path)
-        index_file.mkdir(parents=True, exist_ok=True)
-        
+        """Save BM25 index to disk (it becomes the shared copy)."""
         try:
-            with open(index_file / "bm25_index.pkl", 'wb') as f:
-                pickle.dump({
-                    'index': self.bm25_index,
-                    'documents': self.documents,
-                    'doc_ids': self.doc_ids
-                }, f)
-            
-            logger.info("BM25 index saved")
-            
+            self.bm25_index.save(self.index_path)
+        
         except Exception as e:
             logger.error(f"Failed to save BM25 index: {e}")
     
-    def _matches_filters(self, metadata: Dict, filters: Dict) -> bool:
-        """Check if metadata matches filters."""
-        for key, value in filters.items():
-            if metadata.get(key) != value:
-                return False
-        return True
-    
     def rebuild_index(self):
         """Force rebuild of BM25 index."""
         logger.info("Forcing BM25 index rebuild...")
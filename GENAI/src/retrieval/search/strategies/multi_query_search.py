@@ -15,7 +15,7 @@ import logging
 from src.utils import get_logger
 
 from src.retrieval.search.base import BaseSearchStrategy, SearchResult
-from src.prompts.search_strategies import MULTI_QUERY_PROMPT
+from src.prompts import MULTI_QUERY_PROMPT
 
 logger = get_logger(__name__)
 
@@ -95,32 +95,23 @@ class MultiQuerySearchStrategy(BaseSearchStrategy):
             if len(queries) == 1:
                 # Fallback to single query
                 logger.warning("Multi-query generation failed, using single query")
-                return self._fallback_vector_search(query, top_k, filters)
+                return self._fallback_vector_search(query, top_k, filters, **kwargs)
             
             logger.info(f"Generated {len(queries)} query variations")
             
-            # Step 2: Search with each query
-            all_results = []
-            for i, q in enumerate(queries):
-                logger.debug(f"Searching with query {i+1}: {q[:50]}...")
-                
-                # Generate embedding
-                embedding = self.embedding_manager.generate_embedding(q)
-                
-                # Search
-                raw_results = self.vector_store.search(
-                    query=q,
-                    top_k=top_k * 2,  # Get more results for fusion
-                    filters=filters
-                )
-                
-                # Convert to SearchResult
-                search_results = self._convert_to_search_results(
-                    raw_results,
-                    strategy_name="multi_query"
-                )
-                
-                all_results.append(search_results)
+            # Step 2: Embed all variations in one batch, then search them
+            # with a single batched vector store call
+            embeddings = self._get_embedding_memo(kwargs).embed_queries(queries)
+            raw_result_lists = self.vector_store.search_by_vectors(
+                embeddings,
+                top_k=top_k * 2,  # Get more results for fusion
+                filters=filters
+            )
+            
+            all_results = [
+                self._convert_to_search_results(raw_results, strategy_name="multi_query")
+                for raw_results in raw_result_lists
+            ]
             
             # Step 3: Fuse results using RRF
             fused_results = self._reciprocal_rank_fusion(all_results)
@@ -131,7 +122,7 @@ class MultiQuerySearchStrategy(BaseSearchStrategy):
             
         except Exception as e:
             logger.error(f"Multi-query search failed: {e}", exc_info=True)
-            return self._fallback_vector_search(query, top_k, filters)
+            return self._fallback_vector_search(query, top_k, filters, **kwargs)
     
     def _generate_query_variations(
         self,
@@ -144,8 +135,8 @@ class MultiQuerySearchStrategy(BaseSearchStrategy):
         NOTE: LLM call is COMMENTED OUT by default.
         Uncomment to enable LLM-based multi-query search.
         """
-        if not self.llm_manager:
-            logger.debug("No LLM manager available for multi-query")
+        if not self.llm_manager or MULTI_QUERY_PROMPT is None:
+            logger.debug("No LLM manager or prompt available for multi-query")
             return [query]  # Return original only
         
         try:
@@ -251,15 +242,16 @@ class MultiQuerySearchStrategy(BaseSearchStrategy):
         self,
         query: str,
         top_k: int,
-        filters: Optional[Dict[str, Any]]
+        filters: Optional[Dict[str, Any]],
+        **kwargs
     ) -> List[SearchResult]:
         """Fallback to regular vector search if multi-query fails."""
         logger.info("Using fallback vector search")
         
-        query_embedding = self.embedding_manager.generate_embedding(query)
+        query_embedding = self._get_embedding_memo(kwargs).embed_query(query)
         
-        raw_results = self.vector_store.search(
-            query=query,
+        raw_results = self.vector_store.search_by_vector(
+            query_embedding,
             top_k=top_k,
             filters=filters
         )
@@ -31,12 +31,12 @@ class VectorSearchStrategy(BaseSearchStrategy):
         filters = filters or self.config.filters
         
         try:
-            # Generate embedding
-            query_embedding = self.embedding_manager.generate_embedding(query)
+            # Generate embedding (shared with other strategies in this request)
+            query_embedding = self._get_embedding_memo(kwargs).embed_query(query)
             
             # Search vector store
-            raw_results = self.vector_store.search(
-                query_embedding=query_embedding,
+            raw_results = self.vector_store.search_by_vector(
+                query_embedding,
                 top_k=top_k,
                 filters=filters
             )
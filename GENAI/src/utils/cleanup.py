@@ -179,6 +179,38 @@ def clear_chroma_db(dry_run: bool = False) -> bool:
     return False
 
 
+def clear_ingestion_state(dry_run: bool = False) -> int:
+    """
+    Clear state derived from the vector store contents.
+    
+    Removes ingestion checkpoints and the saved BM25 keyword index, so
+    the next embed run re-ingests every document into the cleared store.
+    
+    Args:
+        dry_run: If True, only print what would be deleted
+        
+    Returns:
+        Number of files removed
+    """
+    from src.core.paths import get_paths
+    from src.infrastructure.vectordb.stores.bm25_index import default_index_dir
+    
+    count = 0
+    for state_dir in (get_paths().checkpoint_dir, Path(default_index_dir())):
+        if not state_dir.exists():
+            continue
+        for item in state_dir.iterdir():
+            if item.is_file():
+                if dry_run:
+                    print(f"  Would delete: {item}")
+                else:
+                    item.unlink()
+                    logger.debug(f"Removed: {item}")
+                count += 1
+    
+    return count
+
+
 def clear_extraction_reports(dry_run: bool = False) -> int:
     """
     Clear extraction report files.
@@ -271,7 +303,8 @@ def clear_all_cache(
     Args:
         include_pycache: Clear __pycache__ directories
         include_app_cache: Clear application caches (extraction, embedding, query)
-        include_vectordb: Clear vector databases (FAISS, ChromaDB) - DESTRUCTIVE!
+        include_vectordb: Clear vector databases (FAISS, ChromaDB), ingestion checkpoints
+            and the keyword index - DESTRUCTIVE!
         include_reports: Clear extraction reports
         dry_run: If True, only show what would be deleted
         
@@ -311,9 +344,11 @@ def clear_all_cache(
         results['faiss'] = clear_faiss_index(dry_run=dry_run)
         results['chromadb'] = clear_chroma_db(dry_run=dry_run)
         results['redis'] = clear_redis_index(dry_run=dry_run)
+        results['ingestion_state'] = clear_ingestion_state(dry_run=dry_run)
         print(f"   FAISS: {'cleared' if results['faiss'] else 'not found'}")
         print(f"   ChromaDB: {'cleared' if results['chromadb'] else 'not found'}")
         print(f"   Redis: {'cleared' if results['redis'] else 'not found/disabled'}")
+        print(f"   Checkpoints + keyword index: {results['ingestion_state']} files")
     
     # 4. Clear extraction reports (optional)
     if include_reports:
@@ -0,0 +1,281 @@
+"""
+Process-pool execution with per-task timeouts, and thread fan-out.
+
+``ProcessPoolExecutor`` cannot cancel a task that is already running, so a
+single hung document would stall the whole pool. ``imap_processes`` keeps
+at most one task per worker in flight, tracks how long each has been
+running, and when one exceeds its timeout it terminates the pool's workers,
+reports the timeout, and resubmits the other in-flight tasks to a fresh
+pool. Results are yielded in completion order.
+
+``fan_out`` runs a few I/O-bound calls concurrently on a shared, bounded
+thread pool and waits at most ``timeout`` seconds, returning whatever
+finished (e.g. search branches that are fused from partial results).
+
+Usage:
+    from src.utils.parallel import imap_processes
+
+    for outcome in imap_processes(convert, paths, max_workers=8, timeout=600,
+                                  initializer=load_models):
+        if outcome.ok:
+            save(outcome.item, outcome.result)
+        else:
+            log_failure(outcome.item, outcome.error)
+
+    outcomes = fan_out({"vector": run_vector, "keyword": run_keyword},
+                       pool="search", max_workers=8, timeout=5)
+"""
+
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class TaskOutcome:
+    """Result of one task run by ``imap_processes``."""
+
+    item: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _terminate(pool: ProcessPoolExecutor) -> None:
+    """Kill the pool's worker processes (running tasks cannot be cancelled)."""
+    processes = list((getattr(pool, '_processes', None) or {}).values())
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.join(timeout=5)
+
+
+def imap_processes(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int,
+    timeout: Optional[float] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple = (),
+    start_method: str = "spawn",
+    max_attempts: int = 2,
+) -> Iterator[TaskOutcome]:
+    """
+    Run ``func(item)`` for every item in worker processes.
+
+    Args:
+        func: Picklable (module-level) function
+        items: Work items (picklable)
+        max_workers: Number of worker processes
+        timeout: Per-task wall-clock limit in seconds (None = no limit)
+        initializer: Called once per worker process (e.g. to load models)
+        initargs: Arguments for ``initializer``
+        start_method: multiprocessing start method ("spawn" is safe with
+            threaded native libraries such as torch/onnxruntime)
+        max_attempts: Attempts for tasks lost to a crashed worker
+
+    Yields:
+        TaskOutcome per item, in completion order
+    """
+    queue = deque(enumerate(items))
+    attempts = {}
+    context = multiprocessing.get_context(start_method)
+
+    def new_pool() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=initializer,
+            initargs=initargs,
+        )
+
+    pool = new_pool()
+    running = {}  # future -> (index, item, start time)
+    try:
+        while queue or running:
+            # One task per worker, so submit time ~ start time for timeouts
+            while queue and len(running) < max_workers:
+                index, item = queue.popleft()
+                attempts[index] = attempts.get(index, 0) + 1
+                running[pool.submit(func, item)] = (index, item, time.monotonic())
+
+            wait_for = None
+            if timeout is not None:
+                oldest = min(start for _, _, start in running.values())
+                wait_for = max(0.0, oldest + timeout - time.monotonic())
+            done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            broken = []
+            for future in done:
+                index, item, start = running.pop(future)
+                elapsed = time.monotonic() - start
+                try:
+                    yield TaskOutcome(item=item, result=future.result(), elapsed=elapsed)
+                except BrokenProcessPool as e:
+                    broken.append((index, item, e))
+                except Exception as e:
+                    yield TaskOutcome(item=item, error=e, elapsed=elapsed)
+
+            if broken:
+                # A worker died; every in-flight task on the pool is lost
+                broken.extend((index, item, None) for index, item, _ in running.values())
+                running.clear()
+                _terminate(pool)
+                pool = new_pool()
+                for index, item, error in reversed(broken):
+                    if attempts[index] < max_attempts:
+                        queue.appendleft((index, item))
+                    else:
+                        yield TaskOutcome(
+                            item=item,
+                            error=error or BrokenProcessPool("Worker process terminated"),
+                        )
+                logger.warning(f"Worker process crashed; restarted pool, {len(queue)} tasks queued")
+                continue
+
+            if timeout is None:
+                continue
+
+            now = time.monotonic()
+            expired = [f for f, (_, _, start) in running.items() if now - start >= timeout]
+            if not expired:
+                continue
+
+            for future in expired:
+                _, item, start = running.pop(future)
+                logger.warning(f"Task timed out after {timeout:.0f}s: {item}")
+                yield TaskOutcome(
+                    item=item,
+                    error=TimeoutError(f"Timed out after {timeout:.0f}s"),
+                    elapsed=now - start,
+                    timed_out=True,
+                )
+
+            # Hung workers can only be killed; innocent in-flight tasks are resubmitted
+            survivors = [(index, item) for index, item, _ in running.values()]
+            running.clear()
+            _terminate(pool)
+            pool = new_pool()
+            for index, item in reversed(survivors):
+                attempts[index] -= 1
+                queue.appendleft((index, item))
+    finally:
+        if running:
+            _terminate(pool)
+        else:
+            pool.shutdown(wait=True)
+
+
+# Shared thread pools by name, and the pool name of the current worker thread
+_THREAD_POOLS: Dict[str, ThreadPoolExecutor] = {}
+_THREAD_POOLS_LOCK = threading.Lock()
+_current_pool = threading.local()
+
+
+def _mark_worker(name: str) -> None:
+    _current_pool.name = name
+
+
+def get_thread_pool(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """
+    Get a process-wide bounded thread pool by name (created on first use).
+
+    Args:
+        name: Pool name (also the worker thread name prefix)
+        max_workers: Pool size (only used when the pool is created)
+    """
+    with _THREAD_POOLS_LOCK:
+        pool = _THREAD_POOLS.get(name)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=max(1, max_workers),
+                thread_name_prefix=name,
+                initializer=_mark_worker,
+                initargs=(name,),
+            )
+            _THREAD_POOLS[name] = pool
+        return pool
+
+
+def _timed_call(func: Callable[[], Any]) -> Tuple[Any, Optional[BaseException], float]:
+    start = time.monotonic()
+    try:
+        return func(), None, time.monotonic() - start
+    except Exception as e:
+        return None, e, time.monotonic() - start
+
+
+def fan_out(
+    calls: Dict[str, Callable[[], Any]],
+    pool: str = "fan-out",
+    max_workers: int = 8,
+    timeout: Optional[float] = None,
+) -> Dict[str, TaskOutcome]:
+    """
+    Run named zero-argument calls concurrently and collect their outcomes.
+
+    Calls still running at the deadline are reported as timed out and
+    their results discarded (threads cannot be interrupted, so they finish
+    in the background; the bounded pool caps how many can pile up). When
+    called from a worker of the same pool, calls run inline to avoid
+    waiting on tasks queued behind the caller.
+
+    Args:
+        calls: name -> callable
+        pool: Shared pool name (see ``get_thread_pool``)
+        max_workers: Pool size if the pool has to be created
+        timeout: Seconds to wait for all calls (None = no limit)
+
+    Returns:
+        name -> TaskOutcome (``item`` is the name), in ``calls`` order
+    """
+    if getattr(_current_pool, 'name', None) == pool:
+        outcomes = {}
+        for name, func in calls.items():
+            result, error, elapsed = _timed_call(func)
+            outcomes[name] = TaskOutcome(item=name, result=result, error=error, elapsed=elapsed)
+        return outcomes
+
+    executor = get_thread_pool(pool, max_workers)
+    futures = {name: executor.submit(_timed_call, func) for name, func in calls.items()}
+    done, _ = wait(futures.values(), timeout=timeout)
+
+    outcomes = {}
+    for name, future in futures.items():
+        if future in done:
+            result, error, elapsed = future.result()
+            outcomes[name] = TaskOutcome(item=name, result=result, error=error, elapsed=elapsed)
+        else:
+            future.cancel()
+            logger.warning(f"{name} did not finish within {timeout}s")
+            outcomes[name] = TaskOutcome(
+                item=name,
+                error=TimeoutError(f"Timed out after {timeout}s"),
+                elapsed=timeout,
+                timed_out=True,
+            )
+    return outcomes
+
+
+__all__ = [
+    'TaskOutcome',
+    'fan_out',
+    'get_thread_pool',
+    'imap_processes',
+]
@@ -0,0 +1,181 @@
+"""
+Tests for the inverted BM25 keyword index.
+
+Tests:
+- Financial tokenizer (filing types, quarters, numbers, compounds)
+- MaxScore top-k matches exhaustive BM25 scoring (with filters and deletes)
+- Incremental add / replace / delete by chunk_id or exact metadata, compaction
+- Save / load round trip (one atomically replaced file)
+- Building from a vector store's iter_documents
+- KeywordSearchStrategy instances share one loaded index, reloaded only
+  when another writer saves it
+"""
+
+import math
+import random
+
+import pytest
+
+from src.infrastructure.vectordb.stores.bm25_index import BM25Index, tokenize
+
+
+def _brute_force(index, query, top_k, filters=None):
+    """Exhaustive BM25 scores over live documents, best first."""
+    docs = {cid: index._documents[slot] for cid, slot in index._slot_by_id.items()}
+    tokens = {cid: tokenize(d['content']) for cid, d in docs.items()}
+    n = len(docs)
+    avgdl = sum(len(t) for t in tokens.values()) / n
+    terms = list(dict.fromkeys(tokenize(query)))
+    df = {t: sum(1 for toks in tokens.values() if t in toks) for t in terms}
+
+    scores = []
+    for cid, toks in tokens.items():
+        if filters and any(docs[cid]['metadata'].get(k) != v for k, v in filters.items()):
+            continue
+        score = 0.0
+        for t in terms:
+            tf = toks.count(t)
+            if tf:
+                idf = math.log(1 + (n - df[t] + 0.5) / (df[t] + 0.5))
+                score += idf * tf * (index.k1 + 1) / (
+                    tf + index.k1 * (1 - index.b + index.b * len(toks) / avgdl)
+                )
+        if score > 0:
+            scores.append(score)
+    return sorted(scores, reverse=True)[:top_k]
+
+
+@pytest.fixture
+def corpus_index():
+    rng = random.Random(7)
+    vocab = [f"term{i}" for i in range(200)]
+    weights = [1 / (i + 1) for i in range(200)]
+    index = BM25Index()
+    ids = [f"c{i}" for i in range(1500)]
+    texts = [" ".join(rng.choices(vocab, weights, k=rng.randint(3, 50))) for _ in ids]
+    metadatas = [{"year": 2020 + i % 4} for i in range(len(ids))]
+    index.add(ids, texts, metadatas)
+    return index
+
+
+class TestTokenizer:
+    """Test the financial tokenizer."""
+
+    def test_financial_tokens(self):
+        tokens = tokenize("Net revenue for 3Q24 rose 12.5% to $1,234.50 in the 10-Q; loss (45)")
+        assert tokens == ['net', 'revenue', 'q3', '2024', 'rose', '12.5', '1234.5', '10-q', 'loss', '-45']
+
+    def test_quarter_forms_agree(self):
+        assert tokenize("Q3 2024") == tokenize("3Q24") == tokenize("q3-2024") == ['q3', '2024']
+
+    def test_compounds_indexed_whole_and_split(self):
+        assert tokenize("year-over-year S&P") == ['year-over-year', 'year', 'over', 'year', 's&p', 's', 'p']
+
+
+class TestSearch:
+    """Test MaxScore retrieval."""
+
+    @pytest.mark.parametrize("query", ["term0 term5 term150", "term1", "term199 term3 term2 term90", "term7 term7"])
+    @pytest.mark.parametrize("top_k", [1, 10, 40])
+    def test_matches_exhaustive_scoring(self, corpus_index, query, top_k):
+        got = [hit['score'] for hit in corpus_index.search(query, top_k)]
+        assert got == pytest.approx(_brute_force(corpus_index, query, top_k), rel=1e-5)
+
+    def test_filters_and_deletes(self, corpus_index):
+        corpus_index.delete([f"c{i}" for i in range(0, 1500, 9)])
+        hits = corpus_index.search("term0 term120", 20, filters={"year": 2021})
+        assert all(hit['metadata']['year'] == 2021 for hit in hits)
+        assert [h['score'] for h in hits] == pytest.approx(
+            _brute_force(corpus_index, "term0 term120", 20, {"year": 2021}), rel=1e-5
+        )
+
+    def test_unknown_terms(self, corpus_index):
+        assert corpus_index.search("nothing matches", 5) == []
+
+
+class TestIncrementalUpdates:
+    """Test add/replace/delete by chunk_id."""
+
+    def test_replace_and_delete(self):
+        index = BM25Index()
+        index.add(["a", "b"], ["goodwill impairment", "credit losses"])
+        index.add(["a"], ["deferred revenue"])
+        assert len(index) == 2
+        assert index.search("goodwill", 5) == []
+        assert index.search("deferred revenue", 5)[0]['id'] == "a"
+
+        assert index.delete(["a", "missing"]) == 1
+        assert "a" not in index
+        assert index.search("deferred", 5) == []
+        assert index.get_stats()['terms'] == 2
+
+    def test_delete_where_exact(self):
+        index = BM25Index()
+        index.add(["a", "b"], ["net revenue", "net revenue"],
+                  [{"source_doc": "report.pdf"}, {"source_doc": "annual_report.pdf"}])
+
+        assert index.delete_where({"source_doc": "report.pdf"}, exact=True) == 1
+        assert [r["id"] for r in index.search("revenue", 5)] == ["b"]
+        assert index.delete_where({"source_doc": "report.pdf"}) == 1
+
+    def test_compaction_keeps_results(self, corpus_index):
+        before = corpus_index.search("term4 term60", 10)
+        corpus_index.add(["extra"], ["unrelated words"])
+        corpus_index.delete(["extra"])
+        corpus_index.compact()
+        assert corpus_index.get_stats()['tombstones'] == 0
+        assert corpus_index.search("term4 term60", 10) == before
+
+
+class TestPersistence:
+    """Test save/load and building from a store."""
+
+    def test_round_trip(self, corpus_index, tmp_path):
+        corpus_index.delete(["c1", "c2"])
+        corpus_index.save(tmp_path)
+        loaded = BM25Index.load(tmp_path)
+        assert len(loaded) == len(corpus_index)
+        assert loaded.search("term3 term77", 10) == corpus_index.search("term3 term77", 10)
+
+        loaded.add(["new"], ["term199 term199 term199"])
+        assert loaded.search("term199", 1)[0]['id'] == "new"
+
+    def test_load_missing(self, tmp_path):
+        assert BM25Index.load(tmp_path / "none") is None
+
+    def test_build_from_store(self):
+        class Store:
+            def iter_documents(self, batch_size):
+                yield [{'id': 'x', 'content': 'total assets', 'metadata': {'year': 2024}}]
+                yield [{'id': 'y', 'content': 'total liabilities', 'metadata': {}}]
+
+        index = BM25Index.build_from(Store())
+        assert len(index) == 2
+        assert index.search("liabilities", 5)[0]['id'] == 'y'
+
+    def test_saved_as_one_file(self, corpus_index, tmp_path):
+        corpus_index.save(tmp_path)
+        assert [p.name for p in tmp_path.iterdir()] == [BM25Index.INDEX_FILE]
+
+    def test_strategies_share_loaded_index(self, tmp_path, monkeypatch):
+        from src.retrieval.search.strategies.keyword_search import KeywordSearchStrategy
+
+        index = BM25Index()
+        index.add(['x'], ['total assets'], [{'source_doc': 'a.pdf'}])
+        index.save(tmp_path / "writer")
+        (tmp_path / "writer" / BM25Index.INDEX_FILE).replace(tmp_path / BM25Index.INDEX_FILE)
+
+        loads = []
+        load = BM25Index.load.__func__
+        monkeypatch.setattr(BM25Index, "load", classmethod(lambda cls, path: loads.append(path) or load(cls, path)))
+        strategies = [KeywordSearchStrategy(vector_store=None, index_path=str(tmp_path)) for _ in range(3)]
+        assert all(s.search("assets", top_k=5) for s in strategies)
+        assert len(loads) == 1
+
+        # Saved by EmbedStep in another process
+        index.add(['y'], ['total liabilities'], [{'source_doc': 'b.pdf'}])
+        index.save(tmp_path / "writer")
+        (tmp_path / "writer" / BM25Index.INDEX_FILE).replace(tmp_path / BM25Index.INDEX_FILE)
+        results = strategies[0].search("liabilities", top_k=5)
+        assert [r.metadata['source_doc'] for r in results] == ['b.pdf']
+        assert len(loads) == 2
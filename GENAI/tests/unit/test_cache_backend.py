@@ -0,0 +1,207 @@
+"""
+Tests for the SQLite-backed BaseCache.
+
+Tests:
+- get/set/delete/clear/exists API
+- TTL expiration
+- LRU eviction by entry count and by bytes (with buffered access times)
+- Prefix, age and source/table invalidation used by EmbeddingCache / QueryCache
+- Migration of the legacy one-pickle-per-key layout
+- Concurrent writers from several processes
+- Content hashing for the extraction cache
+"""
+
+import hashlib
+import json
+import multiprocessing
+import pickle
+import time
+
+import pytest
+
+from src.infrastructure.cache.base import BaseCache
+from src.infrastructure.cache.embedding_cache import EmbeddingCache
+from src.infrastructure.cache.extraction_cache import compute_content_hash
+from src.infrastructure.cache.query_cache import QueryCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = BaseCache(tmp_path / "cache", name="Test", ttl_hours=1)
+    yield c
+    c.close()
+
+
+class TestCoreOperations:
+    """Test the public cache API."""
+
+    def test_set_get_delete(self, cache):
+        cache.set("a", {"answer": 42})
+        assert cache.get("a") == {"answer": 42}
+        assert cache.exists("a")
+        assert cache.delete("a")
+        assert cache.get("a") is None
+        assert not cache.delete("a")
+
+    def test_overwrite_keeps_totals(self, cache):
+        cache.set("a", "x" * 100)
+        cache.set("a", "y" * 10)
+        stats = cache.get_stats()
+        assert stats.total_entries == 1
+        assert stats.size_bytes == len(pickle.dumps("y" * 10, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def test_clear_and_stats(self, cache):
+        for i in range(5):
+            cache.set(f"k{i}", i)
+        cache.get("k0")
+        cache.get("missing")
+        assert cache.clear() == 5
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.total_entries, stats.size_bytes) == (1, 1, 0, 0)
+
+    def test_ttl_expiration(self, cache):
+        cache.set("short", 1, ttl_hours=-1)
+        cache.set("long", 2)
+        assert not cache.exists("short")
+        assert cache.get("short") is None
+        assert cache.cleanup_expired() == 0  # already removed on read
+        cache.set("short2", 3, ttl_hours=-1)
+        assert cache.cleanup_expired() == 1
+        assert cache.keys() == ["long"]
+
+    def test_disabled(self, tmp_path):
+        c = BaseCache(tmp_path / "off", enabled=False)
+        c.set("a", 1)
+        assert c.get("a") is None
+        assert not (tmp_path / "off").exists()
+
+
+class TestEviction:
+    """Test LRU eviction."""
+
+    def test_max_entries_evicts_least_recently_used(self, tmp_path):
+        c = BaseCache(tmp_path / "lru", max_entries=3)
+        for key in ("a", "b", "c"):
+            c.set(key, key)
+            time.sleep(0.01)
+        c.get("a")  # buffered access time must still count
+        c.set("d", "d")
+        assert sorted(c.keys()) == ["a", "c", "d"]
+        assert c.get_stats().evictions == 1
+        c.close()
+
+    def test_max_bytes(self, tmp_path):
+        c = BaseCache(tmp_path / "bytes", max_bytes=2500)
+        for i in range(5):
+            c.set(f"k{i}", b"x" * 1000)
+            time.sleep(0.01)
+        stats = c.get_stats()
+        assert stats.size_bytes <= 2500
+        assert sorted(c.keys()) == ["k3", "k4"]
+        c.close()
+
+
+class TestInvalidation:
+    """Test subclass invalidation helpers."""
+
+    def test_embedding_cache_invalidate_for_extraction(self, tmp_path):
+        c = EmbeddingCache(cache_dir=tmp_path / "emb")
+        c.set_embeddings("abc", [1], model="m1")
+        c.set_embeddings("abc", [2], model="m2")
+        c.set_embeddings("abd", [3], model="m1")
+        assert c.invalidate_for_extraction("abc") == 2
+        assert c.get_embeddings("abd", model="m1") == [3]
+        c.close()
+
+    def test_query_cache_invalidate_by_age(self, tmp_path):
+        c = QueryCache(cache_dir=tmp_path / "q")
+        c.set_response("what was revenue", {"answer": 1})
+        assert c.invalidate_by_age(1) == 0
+        assert c.invalidate_by_age(-1) == 1
+        c.close()
+
+    def test_query_cache_invalidate_by_source(self, tmp_path):
+        c = QueryCache(cache_dir=tmp_path / "q")
+        c.set_response("q1 revenue", {"answer": 1}, dependencies=["source:10q0325.pdf"])
+        c.set_response("q2 revenue", {"answer": 2}, dependencies=["source:10q0625.pdf", "table:t7"])
+        c.set_response("unanswered", {"answer": None})
+        assert c.get_dependencies("q2 revenue") == {"source:10q0625.pdf", "table:t7"}
+        assert c.get_dependencies("unanswered") == {"any"}
+
+        # Only the response built from the re-ingested filing (and the
+        # source-less one) is evicted
+        assert c.invalidate_by_source("10q0625.pdf") == 2
+        assert c.get_response("q1 revenue") == {"answer": 1}
+        assert c.get_response("q2 revenue") is None
+        assert c.get_dependencies("q2 revenue") == set()
+        c.close()
+
+    def test_query_cache_invalidate_by_table(self, tmp_path):
+        c = QueryCache(cache_dir=tmp_path / "q")
+        c.set_response("q1", {"answer": 1}, dependencies=["table:t1"])
+        c.set_response("q2", {"answer": 2}, dependencies=["table:t2"])
+        assert c.invalidate_by_table("t1") == 1
+        assert c.get_response("q2") == {"answer": 2}
+        c.close()
+
+
+class TestLegacyMigration:
+    """Test import of the old pickle-per-key layout."""
+
+    def test_migrates_pickles(self, tmp_path):
+        root = tmp_path / "legacy"
+        root.mkdir()
+        (root / "old.pkl").write_bytes(pickle.dumps({"v": 1}))
+        (root / "_metadata.json").write_text(json.dumps({"old": {"created": "2099-01-01T00:00:00", "ttl_hours": 24}}))
+
+        c = BaseCache(root, ttl_hours=24)
+        assert c.get("old") == {"v": 1}
+        assert not list(root.glob("*.pkl"))
+        assert not (root / "_metadata.json").exists()
+        c.close()
+
+
+def _writer(cache_dir, worker, n):
+    c = BaseCache(cache_dir, max_entries=1000)
+    for i in range(n):
+        c.set(f"w{worker}_{i}", i)
+    c.close()
+
+
+class TestMultiProcess:
+    """Test concurrent access from several processes."""
+
+    def test_concurrent_writers(self, tmp_path):
+        cache_dir = tmp_path / "shared"
+        BaseCache(cache_dir).close()
+        ctx = multiprocessing.get_context("spawn")
+        procs = [ctx.Process(target=_writer, args=(cache_dir, w, 25)) for w in range(3)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(60)
+            assert p.exitcode == 0
+
+        c = BaseCache(cache_dir)
+        assert c.get_stats().total_entries == 75
+        assert c.get("w2_24") == 24
+        c.close()
+
+
+class TestContentHash:
+    """Test the shared content hash used for extraction cache keys."""
+
+    def test_same_content_same_hash(self, tmp_path):
+        a = tmp_path / "a.pdf"
+        b = tmp_path / "renamed copy.pdf"
+        a.write_bytes(b"%PDF-1.4 same bytes")
+        b.write_bytes(b"%PDF-1.4 same bytes")
+        assert compute_content_hash(a) == compute_content_hash(b)
+        assert compute_content_hash(a) == hashlib.sha256(b"%PDF-1.4 same bytes").hexdigest()
+
+    def test_rehashes_modified_file(self, tmp_path):
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"v1")
+        first = compute_content_hash(path)
+        path.write_bytes(b"version 2")
+        assert compute_content_hash(path) != first
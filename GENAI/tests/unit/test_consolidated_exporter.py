@@ -6,8 +6,12 @@ Tests the ConsolidatedExcelExporter's ability to:
 2. Properly deduplicate columns
 3. Use INDEX_COLUMN_WIDTHS from settings
 4. Extract Main Header (Level 0) from source files
+5. Group tables by their non-period column header labels
 """
 
+from collections import defaultdict
+
+import pandas as pd
 import pytest
 from config.settings import settings
 
@@ -109,5 +113,62 @@ class TestMetadataLabels:
             assert label.endswith(':')
 
 
+
+def _write_processed(path, source, period, headers):
+    """A processed *_tables.xlsx with one 'Net Interest' sheet."""
+    index = pd.DataFrame({
+        "Source": [source],
+        "PageNo": [12],
+        "Section": ["Results"],
+        "Table Title": ["Net Interest"],
+        "Link": ["→ 1"],
+    })
+    rows = [
+        ["← Back to Index", None, None],
+        [f"Source(s): {source}, Page 12", None, None],
+        [period, period, period],
+        ["$ in millions", *headers],
+        ["Loans", 10.0, 1.0],
+        ["Deposits", 20.0, 2.0],
+    ]
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        index.to_excel(writer, sheet_name="Index", index=False)
+        pd.DataFrame(rows).to_excel(writer, sheet_name="1", index=False, header=False)
+
+
+class TestHeaderContentGrouping:
+    """Test that column header labels, not periods, split merge groups."""
+    
+    def _group(self, tmp_path, *files):
+        from src.infrastructure.extraction.consolidation.consolidated_exporter import (
+            ConsolidatedExcelExporter
+        )
+        exporter = ConsolidatedExcelExporter()
+        tables, mapping = defaultdict(list), {}
+        for i, (period, headers) in enumerate(files):
+            path = tmp_path / f"{i}_tables.xlsx"
+            _write_processed(path, f"10q{i}.pdf", period, headers)
+            exporter._process_xlsx_file(str(path), tables, mapping)
+        return {key: len(group) for key, group in tables.items()}
+    
+    def test_headers_differing_only_by_period_merge(self, tmp_path):
+        """Verify the same labels under different periods form one group."""
+        groups = self._group(
+            tmp_path,
+            ("Three Months Ended Mar 2025", ["Average Balance", "Interest"]),
+            ("Three Months Ended Jun 2024", ["Average Balance", "Interest"]),
+        )
+        assert list(groups.values()) == [2]
+        assert next(iter(groups)).endswith("::averagebalance|interest")
+    
+    def test_different_header_labels_stay_separate(self, tmp_path):
+        """Verify sub-tables with different column labels are not merged."""
+        groups = self._group(
+            tmp_path,
+            ("Three Months Ended Mar 2025", ["Average Balance", "Interest"]),
+            ("Three Months Ended Sep 2024", ["Average Balance", "Average Rate"]),
+        )
+        assert sorted(groups.values()) == [1, 1]
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
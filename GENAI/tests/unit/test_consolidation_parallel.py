@@ -0,0 +1,178 @@
+"""
+Tests for parallel consolidation.
+
+Tests:
+- Regular, transposed and index outputs are built from one parse
+- Process-parallel output matches the serial output, sheet for sheet
+- Sheets are written in page order regardless of completion order
+- Files read in worker processes group exactly like serial reads
+"""
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from config.settings import settings
+from src.infrastructure.extraction.consolidation import consolidated_exporter as exporter_module
+from src.infrastructure.extraction.consolidation.consolidated_exporter import ConsolidatedExcelExporter
+
+TITLES = ["Net Revenues", "Balance Sheet", "Borrowings", "Capital Ratios"]
+
+
+def _write_processed(path, source, month, year, value):
+    """A processed *_tables.xlsx with an Index and one sheet per title."""
+    index = pd.DataFrame({
+        "Source": [source] * len(TITLES),
+        "PageNo": [40 - 10 * i for i in range(len(TITLES))],
+        "Section": ["Results"] * len(TITLES),
+        "Table Title": TITLES,
+        "Link": [f"→ {i + 1}" for i in range(len(TITLES))],
+    })
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        index.to_excel(writer, sheet_name="Index", index=False)
+        for i, title in enumerate(TITLES):
+            rows = [
+                [f"Source: {source}, Page {40 - 10 * i}", None, None],
+                [f"Three Months Ended {month} 31,", f"Three Months Ended {month} 31,", None],
+                ["$ in millions", year, year - 1],
+                [f"{title} item A", value + i, value - i],
+                [f"{title} item B", value + 10 * i, value - 10 * i],
+            ]
+            pd.DataFrame(rows).to_excel(writer, sheet_name=str(i + 1), index=False, header=False)
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    exporter = ConsolidatedExcelExporter()
+    exporter.processed_dir = tmp_path / "processed_advanced"
+    exporter.consolidate_dir = tmp_path / "consolidate"
+    exporter.processed_dir.mkdir()
+    exporter.consolidate_dir.mkdir()
+    _write_processed(exporter.processed_dir / "10q0325_tables.xlsx", "10q0325.pdf", "March", 2025, 100.0)
+    _write_processed(exporter.processed_dir / "10q0624_tables.xlsx", "10q0624.pdf", "June", 2024, 200.0)
+    return exporter
+
+
+def _cells(path):
+    workbook = load_workbook(path)
+    return {
+        name: [[cell.value for cell in row] for row in workbook[name].iter_rows()]
+        for name in workbook.sheetnames
+    }
+
+
+def _merge(exporter, monkeypatch, workers):
+    monkeypatch.setattr(settings, "CONSOLIDATION_WORKERS", workers)
+    result = exporter.merge_processed_files()
+    outputs = (result["path"], result["transposed_path"], result["index_path"])
+    return result, [_cells(path) for path in outputs]
+
+
+class TestSharedParse:
+    """Test that all outputs come from one parse."""
+
+    def test_inputs_parsed_once(self, exporter, monkeypatch):
+        parsed = []
+        read = ConsolidatedExcelExporter._read_xlsx_tables
+        monkeypatch.setattr(
+            ConsolidatedExcelExporter, "_read_xlsx_tables",
+            lambda self, path: parsed.append(path) or read(self, path)
+        )
+
+        result, (regular, transposed, index) = _merge(exporter, monkeypatch, workers=1)
+
+        assert len(parsed) == 2
+        assert result["tables_merged"] == len(TITLES)
+        assert result["sources_merged"] == 2
+        assert "Index" in regular and "Index" in transposed
+        # Both filings merged side by side: label + 3 distinct periods
+        assert max(len(row) for row in regular["1"]) == 4
+        assert set(index) == {"10q0325", "10q0624", "Summary"}
+
+
+class TestParallel:
+    """Test process-parallel consolidation."""
+
+    def test_sheets_written_in_page_order(self, exporter, monkeypatch):
+        real_build = ConsolidatedExcelExporter._build_all_sheet_frames
+
+        def reversed_completion(self, sorted_keys, *args):
+            built = real_build(self, sorted_keys, *args)
+            return dict(reversed(list(built.items())))
+
+        monkeypatch.setattr(ConsolidatedExcelExporter, "_build_all_sheet_frames", reversed_completion)
+        result, _ = _merge(exporter, monkeypatch, workers=1)
+
+        # Lowest page first: Capital Ratios (page 10) ... Net Revenues (page 40)
+        sheets = load_workbook(result["path"]).sheetnames
+        assert sheets[:len(TITLES)] == ["1", "2", "3", "4"]
+        index = pd.read_excel(result["path"], sheet_name="Index")
+        assert [t.split(" - ")[-1] for t in index["Table Title"]] == TITLES[::-1]
+
+    def test_matches_serial_output(self, exporter, monkeypatch):
+        serial_result, serial = _merge(exporter, monkeypatch, workers=1)
+        parallel_result, parallel = _merge(exporter, monkeypatch, workers=4)
+
+        assert parallel == serial
+        assert parallel_result["sheet_names"] == serial_result["sheet_names"]
+
+    def test_sheet_builds_match_serial(self, exporter):
+        tables, mapping = exporter_module.defaultdict(list), {}
+        for path in sorted(exporter.processed_dir.glob("*_tables.xlsx")):
+            exporter._process_xlsx_file(str(path), tables, mapping)
+        keys = sorted(tables)
+        for number, key in enumerate(keys, start=1):
+            mapping[key]["unique_sheet_name"] = str(number)
+
+        serial = exporter._build_all_sheet_frames(keys, tables, mapping, False, sheet_workers=1)
+        parallel = exporter._build_all_sheet_frames(keys, tables, mapping, False, sheet_workers=2)
+
+        assert set(serial) == set(parallel) == set(keys)
+        for key in keys:
+            (serial_sheets, serial_split), (parallel_sheets, parallel_split) = serial[key], parallel[key]
+            assert serial_split == parallel_split
+            assert [(name, kind) for name, kind, _ in serial_sheets] == [
+                (name, kind) for name, kind, _ in parallel_sheets
+            ]
+            for (_, _, a), (_, _, b) in zip(serial_sheets, parallel_sheets):
+                pd.testing.assert_frame_equal(a, b)
+
+
+class TestIngestion:
+    """Test per-file reading and grouping."""
+
+    def test_parallel_read_matches_serial(self, exporter):
+        files = sorted(str(path) for path in exporter.processed_dir.glob("*_tables.xlsx"))
+
+        def group(workers):
+            tables, mapping = exporter_module.defaultdict(list), {}
+            for _, payloads in exporter._iter_xlsx_tables(files, workers):
+                exporter._add_xlsx_tables(payloads, tables, mapping)
+            return tables, mapping
+
+        (serial, serial_mapping), (parallel, parallel_mapping) = group(1), group(2)
+
+        assert list(parallel) == list(serial)
+        assert parallel_mapping == serial_mapping
+        for key in serial:
+            assert [t["metadata"] for t in parallel[key]] == [t["metadata"] for t in serial[key]]
+            for a, b in zip(serial[key], parallel[key]):
+                pd.testing.assert_frame_equal(a["data"], b["data"])
+
+    def test_index_rows_matched_by_link(self, exporter):
+        path = exporter.processed_dir / "10q0325_tables.xlsx"
+        index = pd.read_excel(path, sheet_name="Index")
+        duplicate = index.iloc[[0]].assign(Section="Duplicate")
+        index = pd.concat([index, duplicate], ignore_index=True)
+        index.loc[1, "Link"] = None
+        index["Table_ID"] = [str(i + 1) for i in range(len(index))]
+        with pd.ExcelWriter(path, engine="openpyxl", mode="a", if_sheet_exists="replace") as writer:
+            index.to_excel(writer, sheet_name="Index", index=False)
+
+        payloads = exporter._read_xlsx_tables(str(path))
+        sections = {p["table"]["sheet_name"]: p["table"]["metadata"]["section"] for p in payloads}
+
+        # First Index row wins; sheet "2" falls back to Table_ID
+        assert sections["1"] == "Results"
+        assert sections["2"] == "Results"
+
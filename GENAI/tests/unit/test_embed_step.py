@@ -0,0 +1,241 @@
+"""
+Tests for the streaming embed pipeline.
+
+Tests:
+- Whole documents are grouped into commits of about batch_size chunks
+- Documents are pulled lazily (bounded memory)
+- Committed documents are checkpointed and skipped on re-run
+- Checkpoints are kept per store and ignored while the store is empty
+- A failed commit resumes from the last checkpoint
+- Re-ingested documents replace all of their previous chunks and cached answers
+- Commits are applied to the saved keyword index, saved once per run
+- Large tables are split with TableChunker
+"""
+
+from contextlib import contextmanager
+from functools import partial
+
+import pytest
+
+from config.settings import settings
+from src.infrastructure.embeddings import manager as embedding_manager_module
+from src.infrastructure.vectordb import manager as vectordb_manager_module
+from src.pipeline import checkpoint as checkpoint_module
+from src.pipeline.base import PipelineContext
+from src.infrastructure.vectordb.stores.bm25_index import BM25Index
+from src.pipeline.steps.embed import EmbedStep
+
+
+class FakeEmbeddingManager:
+    """Embeds text as [len(text)]."""
+
+    def get_model_name(self):
+        return "fake-model"
+
+    def embed_documents(self, texts):
+        return [[float(len(t))] for t in texts]
+
+    def get_cache_stats(self):
+        return {"enabled": False}
+
+
+class FakeVectorStore:
+    """Records upserts per bulk-load session; can fail on a given session."""
+
+    def __init__(self, fail_on=None):
+        self.sessions = []
+        self.fail_on = fail_on
+        self.rows = {}
+        self.store_identity = "fake:/stores/a"
+
+    def count(self):
+        return len(self.rows)
+
+    @contextmanager
+    def bulk_load(self):
+        self.sessions.append([])
+        yield self
+
+    def upsert_chunks(self, chunks, show_progress=True):
+        if len(self.sessions) == self.fail_on:
+            raise RuntimeError("disk full")
+        self.sessions[-1].extend(chunks)
+        self.rows.update((c.chunk_id, c) for c in chunks)
+        return len(chunks)
+
+    def delete_by_sources(self, source_docs):
+        ids = [i for i, c in self.rows.items() if c.metadata.source_doc in source_docs]
+        for chunk_id in ids:
+            del self.rows[chunk_id]
+        return len(ids)
+
+
+def _document(name, tables=2, rows=3):
+    table = "| Item | 2025 |\n|---|---|\n" + "\n".join(f"| Row {r} | {r} |" for r in range(rows))
+    return {
+        "file": name,
+        "tables": [
+            {"content": table, "metadata": {"page_no": 1, "table_title": f"T{i}"}}
+            for i in range(tables)
+        ],
+        "metadata": {"year": 2025, "report_type": "10-Q"},
+    }
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    store = FakeVectorStore()
+    monkeypatch.setattr(embedding_manager_module, "get_embedding_manager", FakeEmbeddingManager)
+    monkeypatch.setattr(vectordb_manager_module, "get_vectordb_manager", lambda: store)
+    monkeypatch.setattr(
+        checkpoint_module, "IngestionCheckpoint",
+        partial(checkpoint_module.IngestionCheckpoint, cache_dir=tmp_path)
+    )
+    store.invalidated = []
+    monkeypatch.setattr(
+        EmbedStep, "_invalidate_cached_queries", lambda self, filenames: store.invalidated.append(filenames)
+    )
+    monkeypatch.setattr(settings, "BM25_INDEX_DIR", str(tmp_path / "bm25"))
+    return store
+
+
+def _run(documents, **kwargs):
+    context = PipelineContext(extracted_data=documents)
+    return EmbedStep(**kwargs).execute(context)
+
+
+class TestStreaming:
+    """Test grouping and laziness."""
+
+    def test_commits_group_whole_documents(self, env):
+        result = _run([_document(f"d{i}.pdf") for i in range(5)], batch_size=4)
+
+        assert result.success
+        assert [len(session) for session in env.sessions] == [4, 4, 2]
+        assert result.metadata["stored"] == 10
+        assert result.data == []
+        assert env.sessions[0][0].embedding == [float(len(env.sessions[0][0].content))]
+
+    def test_documents_pulled_lazily(self, env, monkeypatch):
+        pulled = []
+
+        def iter_documents(self, context):
+            for i in range(6):
+                pulled.append(i)
+                yield _document(f"d{i}.pdf")
+
+        monkeypatch.setattr(EmbedStep, "_iter_documents", iter_documents)
+        pulled_at_commit = []
+        upsert = env.upsert_chunks
+        env.upsert_chunks = lambda chunks, show_progress=True: (
+            pulled_at_commit.append(len(pulled)) or upsert(chunks, show_progress)
+        )
+
+        EmbedStep(batch_size=4).execute(PipelineContext())
+
+        assert pulled_at_commit == [2, 4, 6]
+
+
+class TestCheckpoints:
+    """Test resume behaviour."""
+
+    def test_rerun_skips_committed_documents(self, env):
+        documents = [_document(f"d{i}.pdf") for i in range(3)]
+        _run(documents, batch_size=2)
+
+        result = _run(documents, batch_size=2)
+        assert result.metadata["skipped_documents"] == 3
+        assert result.metadata["stored"] == 0
+
+        # Changed content is ingested again
+        documents[1] = _document("d1.pdf", rows=4)
+        result = _run(documents, batch_size=2)
+        assert result.metadata["stored"] == 2
+
+    def test_checkpoints_follow_the_store(self, env):
+        documents = [_document(f"d{i}.pdf") for i in range(2)]
+        _run(documents)
+
+        # Store cleared (or failed to load): everything is ingested again
+        env.rows.clear()
+        assert _run(documents).metadata["stored"] == 4
+
+        # Different store location: its own checkpoints
+        env.store_identity = "fake:/stores/b"
+        assert _run(documents).metadata["skipped_documents"] == 0
+        assert _run(documents).metadata["skipped_documents"] == 2
+
+    def test_resume_after_failure(self, env):
+        documents = [_document(f"d{i}.pdf") for i in range(3)]
+        env.fail_on = 2
+        failed = _run(documents, batch_size=2)
+        assert failed.failed
+        assert failed.metadata["commits"] == 1
+
+        env.fail_on = None
+        env.sessions.clear()
+        resumed = _run(documents, batch_size=2)
+        assert resumed.metadata["skipped_documents"] == 1
+        assert [{c.metadata.source_doc for c in s} for s in env.sessions] == [{"d1.pdf"}, {"d2.pdf"}]
+
+    def test_changed_document_replaces_old_rows(self, env):
+        _run([_document("d0.pdf", tables=3, rows=25), _document("d1.pdf")], batch_size=100)
+        old_ids = {i for i in env.rows if env.rows[i].metadata.source_doc == "d0.pdf"}
+        assert len(old_ids) > 3
+
+        # Fewer, smaller tables: pieces and dropped tables must not stay searchable
+        _run([_document("d0.pdf", tables=1), _document("d1.pdf")], batch_size=100)
+        d0 = sorted(i for i, c in env.rows.items() if c.metadata.source_doc == "d0.pdf")
+        assert len(d0) == 1 and d0[0].endswith("_0")
+        assert sum(c.metadata.source_doc == "d1.pdf" for c in env.rows.values()) == 2
+
+        # A document that lost all its tables is removed as well, with its cached answers
+        env.invalidated.clear()
+        _run([_document("d0.pdf", tables=0), _document("d1.pdf")], batch_size=100)
+        assert {c.metadata.source_doc for c in env.rows.values()} == {"d1.pdf"}
+        assert env.invalidated == [["d0.pdf"]]
+
+    def test_keyword_index_follows_commits(self, env, monkeypatch):
+        _run([_document("d0.pdf", tables=3)])
+        assert BM25Index.load(settings.BM25_INDEX_DIR) is None  # Built on first keyword search
+
+        BM25Index().save(settings.BM25_INDEX_DIR)
+        saves = []
+        save = BM25Index.save
+        monkeypatch.setattr(BM25Index, "save", lambda self, path: saves.append(path) or save(self, path))
+        _run([_document("d0.pdf", tables=3), _document("d1.pdf")], force=True, batch_size=2)
+        assert len(saves) == 1
+        index = BM25Index.load(settings.BM25_INDEX_DIR)
+        assert len(index) == 5
+        assert index.search("Row", top_k=10, filters={"source_doc": "d1.pdf"})
+
+        _run([_document("d0.pdf", tables=1)], force=True)
+        index = BM25Index.load(settings.BM25_INDEX_DIR)
+        assert len(index) == 3
+        assert sorted({r["metadata"]["source_doc"] for r in index.search("Row", top_k=10)}) == ["d0.pdf", "d1.pdf"]
+
+    def test_keyword_index_replaces_exact_source(self, env):
+        BM25Index().save(settings.BM25_INDEX_DIR)
+        _run([_document("report.pdf"), _document("annual_report.pdf")])
+
+        _run([_document("report.pdf", tables=1)], force=True)
+        index = BM25Index.load(settings.BM25_INDEX_DIR)
+        sources = [r["metadata"]["source_doc"] for r in index.search("Row", top_k=10)]
+        assert sorted(sources) == ["annual_report.pdf"] * 2 + ["report.pdf"]
+
+    def test_force_ignores_checkpoints(self, env):
+        documents = [_document("d0.pdf")]
+        _run(documents)
+        assert _run(documents, force=True).metadata["stored"] == 2
+
+
+class TestChunking:
+    """Test table splitting."""
+
+    def test_large_tables_split(self, env):
+        result = _run([_document("big.pdf", tables=1, rows=25)], batch_size=100)
+
+        chunks = env.sessions[0]
+        assert result.metadata["stored"] == len(chunks) > 1
+        assert chunks[0].chunk_id.endswith("_0_1")
+        assert all("| Item | 2025 |" in c.content for c in chunks)
@@ -0,0 +1,110 @@
+"""
+Tests for batched, concurrent embedding.
+
+Tests:
+- Token/count budgeted batch splitting
+- Ordered results with concurrent batches
+- Retry with backoff on transient failures
+- Bounded number of in-flight batches
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.embeddings.batching import BatchEmbedder, make_batches
+from src.utils.retry import RetryConfig
+
+
+def fake_embed(texts):
+    """Deterministic embedding: [len(text), first char code]."""
+    return [[float(len(t)), float(ord(t[0]))] for t in texts]
+
+
+NO_WAIT = RetryConfig(max_attempts=3, delay=0.0)
+
+
+class TestMakeBatches:
+    """Test batch splitting."""
+
+    def test_count_limit(self):
+        batches = list(make_batches(["a"] * 10, max_batch_size=4, max_tokens=1000))
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert [i for b in batches for i in b] == list(range(10))
+
+    def test_token_limit(self):
+        texts = ["x" * 400] * 5  # ~100 tokens each
+        batches = list(make_batches(texts, max_batch_size=100, max_tokens=250))
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_oversized_text_gets_own_batch(self):
+        texts = ["a", "x" * 10000, "b"]
+        batches = list(make_batches(texts, max_batch_size=100, max_tokens=100))
+        assert batches == [[0], [1], [2]]
+
+
+class TestBatchEmbedder:
+    """Test concurrent embedding."""
+
+    def test_preserves_order(self):
+        texts = [chr(ord("a") + i % 26) * (i + 1) for i in range(200)]
+        embedder = BatchEmbedder(
+            fake_embed, batch_size=7, max_tokens=10_000, max_workers=4, retry_config=NO_WAIT
+        )
+        assert embedder.embed(texts) == fake_embed(texts)
+
+    def test_serial_mode(self):
+        texts = ["alpha", "beta", "gamma"]
+        embedder = BatchEmbedder(fake_embed, batch_size=2, max_workers=1, retry_config=NO_WAIT)
+        assert embedder.embed(texts) == fake_embed(texts)
+
+    def test_progress_counts_every_text(self):
+        seen = []
+        embedder = BatchEmbedder(fake_embed, batch_size=3, max_workers=2, retry_config=NO_WAIT)
+        embedder.embed(["t"] * 10, on_progress=seen.append)
+        assert sum(seen) == 10
+
+    def test_retries_transient_failure(self):
+        calls = {"n": 0}
+
+        def flaky(texts):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise ConnectionError("reset by peer")
+            return fake_embed(texts)
+
+        embedder = BatchEmbedder(flaky, batch_size=10, max_workers=1, retry_config=NO_WAIT)
+        assert embedder.embed(["abc"]) == fake_embed(["abc"])
+        assert calls["n"] == 2
+
+    def test_raises_after_exhausting_retries(self):
+        def broken(texts):
+            raise ConnectionError("down")
+
+        embedder = BatchEmbedder(broken, batch_size=1, max_workers=2, retry_config=NO_WAIT)
+        with pytest.raises(ConnectionError):
+            embedder.embed(["a", "b", "c"])
+
+    def test_rejects_short_response(self):
+        embedder = BatchEmbedder(lambda texts: [[0.0]], batch_size=5, max_workers=1, retry_config=NO_WAIT)
+        with pytest.raises(ValueError):
+            embedder.embed(["a", "b"])
+
+    def test_bounded_concurrency(self):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow(texts):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return fake_embed(texts)
+
+        embedder = BatchEmbedder(slow, batch_size=1, max_workers=3, retry_config=NO_WAIT)
+        texts = ["q"] * 30
+        assert embedder.embed(texts) == fake_embed(texts)
+        assert state["peak"] <= 3
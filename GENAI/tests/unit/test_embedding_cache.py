@@ -0,0 +1,184 @@
+"""
+Tests for the per-text embedding cache.
+
+Tests:
+- Content-addressed keys (normalization, model/dimension/kind scoping)
+- Compact float32/float16 storage in a single SQLite file
+- LRU size bound, per-process connections and import of the old table layout
+- Read-through CachedEmbeddings only embedding misses (queries as queries)
+- Hit-rate reporting
+"""
+
+import os
+import sqlite3
+import time
+from typing import List
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from src.infrastructure.cache.embedding_cache import TextEmbeddingCache
+from src.infrastructure.embeddings.langchain_wrapper import CachedEmbeddings
+
+
+class CountingEmbeddings(Embeddings):
+    """Fake model recording every text it embeds."""
+
+    def __init__(self):
+        self.embedded: List[str] = []
+
+    def _vector(self, text: str) -> List[float]:
+        return [float(len(text)), 0.5, -1.0]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.embedded.extend(texts)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        self.embedded.append(text)
+        return self._vector(text)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = TextEmbeddingCache(model="test-model", dimension=3, path=tmp_path / "vectors.sqlite")
+    yield c
+    c.close()
+
+
+class TestTextEmbeddingCache:
+    """Test cache storage and keys."""
+
+    def test_roundtrip_and_stats(self, cache):
+        cache.set_many(["alpha", "beta"], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        found = cache.get_many(["beta", "gamma", "alpha"])
+        assert found == {0: [4.0, 5.0, 6.0], 2: [1.0, 2.0, 3.0]}
+
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.total_entries) == (2, 1, 2)
+        assert stats.size_bytes > 0
+
+    def test_whitespace_normalized(self, cache):
+        cache.set("Revenue   2024\n| 100 |", [1.0, 1.0, 1.0])
+        assert cache.get("Revenue 2024 | 100 |") == [1.0, 1.0, 1.0]
+
+    def test_scoped_by_model_and_dimension(self, cache, tmp_path):
+        cache.set("text", [1.0, 2.0, 3.0])
+        other_model = TextEmbeddingCache(model="other", dimension=3, path=cache.path)
+        other_dim = TextEmbeddingCache(model="test-model", dimension=4, path=cache.path)
+        try:
+            assert other_model.get("text") is None
+            assert other_dim.get("text") is None
+        finally:
+            other_model.close()
+            other_dim.close()
+
+    def test_query_and_document_kinds_separate(self, cache):
+        cache.set("text", [1.0, 2.0, 3.0], kind="query")
+        assert cache.get("text") is None
+        assert cache.get("text", kind="query") == [1.0, 2.0, 3.0]
+
+    def test_float16_storage(self, tmp_path):
+        c = TextEmbeddingCache(model="m", dimension=3, path=tmp_path / "f16.sqlite", dtype="float16")
+        try:
+            c.set("x", [0.25, -0.5, 1.0])
+            assert c.get("x") == [0.25, -0.5, 1.0]
+        finally:
+            c.close()
+
+    def test_persists_across_instances(self, cache):
+        cache.set("persisted", [7.0, 8.0, 9.0])
+        reopened = TextEmbeddingCache(model="test-model", dimension=3, path=cache.path)
+        try:
+            assert reopened.get("persisted") == [7.0, 8.0, 9.0]
+        finally:
+            reopened.close()
+
+    def test_disabled(self, tmp_path):
+        c = TextEmbeddingCache(model="m", path=tmp_path / "x.sqlite", enabled=False)
+        c.set("a", [1.0])
+        assert c.get("a") is None
+        assert not (tmp_path / "x.sqlite").exists()
+
+    def test_max_entries_evicts_least_recently_used(self, tmp_path):
+        c = TextEmbeddingCache(model="m", dimension=3, path=tmp_path / "lru.sqlite", max_entries=2)
+        try:
+            c.set("a", [1.0, 1.0, 1.0])
+            time.sleep(0.01)
+            c.set("b", [2.0, 2.0, 2.0])
+            time.sleep(0.01)
+            c.get("a")
+            c.set("c", [3.0, 3.0, 3.0])
+
+            assert c.get_many(["a", "b", "c"]).keys() == {0, 2}
+            assert c.get_stats().evictions == 1
+        finally:
+            c.close()
+
+    def test_reopens_connection_in_child_process(self, cache):
+        cache.set("a", [1.0, 2.0, 3.0])
+        inherited = cache._conn
+        cache._conn_pid = os.getpid() + 1  # as seen from a forked child
+
+        assert cache.get("a") == [1.0, 2.0, 3.0]
+        assert cache._conn is not inherited
+
+    def test_imports_previous_table(self, tmp_path):
+        path = tmp_path / "old.sqlite"
+        key = TextEmbeddingCache(model="m", dimension=3, path=path, enabled=False).key("legacy")
+        conn = sqlite3.connect(str(path))
+        conn.execute(
+            "CREATE TABLE text_embeddings (key BLOB PRIMARY KEY, dtype TEXT NOT NULL,"
+            " dim INTEGER NOT NULL, vector BLOB NOT NULL) WITHOUT ROWID"
+        )
+        conn.execute(
+            "INSERT INTO text_embeddings VALUES (?, ?, ?, ?)",
+            (bytes.fromhex(key), "float16", 3, np.array([0.5, 1.0, 2.0], dtype=np.float16).tobytes()),
+        )
+        conn.commit()
+        conn.close()
+
+        c = TextEmbeddingCache(model="m", dimension=3, path=path)
+        try:
+            assert c.get("legacy") == [0.5, 1.0, 2.0]
+            assert c.get_stats().total_entries == 1
+        finally:
+            c.close()
+
+
+class TestCachedEmbeddings:
+    """Test read-through wrapper."""
+
+    def test_only_misses_are_embedded(self, cache):
+        model = CountingEmbeddings()
+        embeddings = CachedEmbeddings(model, cache)
+
+        first = embeddings.embed_documents(["a", "bb", "a", "ccc"])
+        assert model.embedded == ["a", "bb", "ccc"]  # duplicate embedded once
+
+        model.embedded.clear()
+        second = embeddings.embed_documents(["ccc", "dddd", "bb"])
+        assert model.embedded == ["dddd"]
+        assert first == [[1.0, 0.5, -1.0], [2.0, 0.5, -1.0], [1.0, 0.5, -1.0], [3.0, 0.5, -1.0]]
+        assert second == [[3.0, 0.5, -1.0], [4.0, 0.5, -1.0], [2.0, 0.5, -1.0]]
+
+    def test_query_cached(self, cache):
+        model = CountingEmbeddings()
+        embeddings = CachedEmbeddings(model, cache)
+        assert embeddings.embed_query("what was revenue") == embeddings.embed_query("what was revenue")
+        assert model.embedded == ["what was revenue"]
+        assert cache.get_stats().hit_rate == 0.5
+
+    def test_batched_queries_use_query_embeddings(self, cache):
+        class PromptedEmbeddings(CountingEmbeddings):
+            def embed_query(self, text):
+                return [-v for v in super().embed_query(text)]
+
+        model = PromptedEmbeddings()
+        embeddings = CachedEmbeddings(model, cache)
+
+        batched = embeddings.embed_queries(["what was revenue", "net income"])
+        assert batched == [model.embed_query("what was revenue"), model.embed_query("net income")]
+        assert embeddings.embed_query("net income") == batched[1]
+        assert embeddings.embed_documents(["net income"]) == [model._vector("net income")]
@@ -0,0 +1,81 @@
+"""
+Tests for in-memory consolidated workbook formatting.
+
+Tests:
+- Hyperlinks, number formats and Index validation work on the workbook
+  before it is saved (single serialization)
+- In-memory results match the load/format/save path
+"""
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from src.infrastructure.extraction.consolidation.excel_formatting import ExcelFormatter
+
+
+def _write_sheets(writer):
+    """Index with two links (one missing) and one data sheet."""
+    pd.DataFrame({"#": [1, 2], "Table Title": ["Revenue", "Gone"], "Link": ["1", "9"]}).to_excel(
+        writer, sheet_name="Index", index=False
+    )
+    rows = [["Source"], ["Row Label", 2025.0, 2024.0], ["Net revenues", 1500.0, 1400.0], ["ROE", 0.12, 0.11]]
+    pd.DataFrame(rows).to_excel(writer, sheet_name="1", index=False, header=False)
+
+
+def _format_in_memory(writer):
+    ExcelFormatter.add_hyperlinks_to_workbook(writer.book)
+    ExcelFormatter.apply_currency_format_to_workbook(writer.book)
+
+
+class TestInMemoryFormatting:
+    """Test formatting before the first save."""
+
+    def test_links_and_formats_written_once(self, tmp_path):
+        path = tmp_path / "consolidated.xlsx"
+        with pd.ExcelWriter(path, engine="openpyxl") as writer:
+            _write_sheets(writer)
+            _format_in_memory(writer)
+
+        wb = load_workbook(path)
+        assert wb["Index"]["C2"].hyperlink.target == "#'1'!A1"
+        assert wb["Index"]["C2"].value == "→ 1"
+        assert wb["1"]["A1"].value == "← Back to Index"
+        assert wb["1"]["B2"].value == 2025
+        assert wb["1"]["B3"].number_format.startswith("_($*")
+        assert wb["1"]["B4"].number_format == "0.00%"
+
+    def test_matches_load_and_save_path(self, tmp_path):
+        in_memory = tmp_path / "in_memory.xlsx"
+        with pd.ExcelWriter(in_memory, engine="openpyxl") as writer:
+            _write_sheets(writer)
+            _format_in_memory(writer)
+
+        reloaded = tmp_path / "reloaded.xlsx"
+        with pd.ExcelWriter(reloaded, engine="openpyxl") as writer:
+            _write_sheets(writer)
+        ExcelFormatter.add_hyperlinks(reloaded, {}, {})
+        ExcelFormatter.apply_currency_format(reloaded, {}, {})
+
+        a, b = load_workbook(in_memory), load_workbook(reloaded)
+        for name in ("Index", "1"):
+            cells_a = [(c.coordinate, c.value, c.number_format) for row in a[name].iter_rows() for c in row]
+            cells_b = [(c.coordinate, c.value, c.number_format) for row in b[name].iter_rows() for c in row]
+            assert cells_a == cells_b
+
+
+class TestIndexValidation:
+    """Test Index link validation on an unsaved workbook."""
+
+    def test_validates_in_memory(self, tmp_path):
+        from src.infrastructure.extraction.consolidation.consolidated_exporter import (
+            ConsolidatedExcelExporter,
+        )
+
+        with pd.ExcelWriter(tmp_path / "v.xlsx", engine="openpyxl") as writer:
+            _write_sheets(writer)
+            _format_in_memory(writer)
+            result = ConsolidatedExcelExporter._validate_index_sheet_links(None, writer.book)
+
+        assert result["missing_sheets"] == {"9"}
+        assert result["total_sheets"] == 1
+        assert not result["valid"]
@@ -0,0 +1,547 @@
+"""
+Tests for FAISSVectorStore incremental writes.
+
+Tests the FAISSVectorStore's ability to:
+1. Keep ids/metadata/documents/vectors aligned after deletes
+2. Delete only the rows of one source document (no re-embedding)
+3. Upsert chunks by chunk_id
+4. Persist and reload stored vectors
+5. Defer persistence (and HNSW rebuilds) in bulk_load() sessions and recover
+   from the delta log
+6. Memory-map the columnar sidecar and decode rows lazily
+7. Pre-filter searches through the metadata inverted index
+8. Iterate stored chunks in batches (keyword index builds)
+9. Search precomputed query vectors, one at a time or as one batch
+10. Bump the index generation on every write
+"""
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from langchain_core.embeddings import Embeddings
+
+from src.domain.tables import TableChunk, TableMetadata
+from src.infrastructure.vectordb.stores.faiss_store import FAISSVectorStore
+
+
+DIM = 8
+
+
+class CountingEmbeddings(Embeddings):
+    """Deterministic fake embeddings that count how many texts were embedded."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def _vector(self, text: str):
+        rng = np.random.default_rng(abs(hash(text)) % (2 ** 32))
+        return rng.random(DIM).tolist()
+
+    def embed_documents(self, texts):
+        self.calls += len(texts)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+def make_chunk(chunk_id: str, source_doc: str, content: str, year: int = 2024) -> TableChunk:
+    return TableChunk(
+        chunk_id=chunk_id,
+        content=content,
+        metadata=TableMetadata(
+            table_id=chunk_id,
+            source_doc=source_doc,
+            page_no=1,
+            table_title=content,
+            year=year,
+            report_type="10-Q",
+        ),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FAISSVectorStore(
+        embedding_function=CountingEmbeddings(),
+        dimension=DIM,
+        persist_dir=str(tmp_path / "faiss"),
+    )
+
+
+def _assert_aligned(store):
+    n = len(store.ids)
+    assert len(store.metadata) == n
+    assert len(store.documents) == n
+    assert store.vectors.shape == (n, DIM)
+    assert len(store.labels) == n
+    assert store.index.ntotal == n
+
+
+class TestIncrementalDelete:
+    """Test row-level deletes."""
+
+    def test_delete_by_source_keeps_other_vectors(self, store):
+        store.add_chunks([make_chunk(f"a{i}", "10q0325.pdf", f"a table {i}") for i in range(5)])
+        store.add_chunks([make_chunk(f"b{i}", "10q0625.pdf", f"b table {i}") for i in range(3)])
+        calls_before = store.embedding_function.calls
+
+        deleted = store.delete_by_source("10q0625.pdf")
+
+        assert deleted == 3
+        assert store.embedding_function.calls == calls_before
+        assert store.ids == [f"a{i}" for i in range(5)]
+        _assert_aligned(store)
+
+        results = store.similarity_search("a table 2", k=1)
+        assert results[0].page_content == "a table 2"
+
+    def test_delete_by_sources_compacts_once(self, store, monkeypatch):
+        for doc in range(3):
+            store.add_chunks([make_chunk(f"{doc}_{i}", f"doc{doc}.pdf", f"t {doc} {i}") for i in range(2)])
+        removals = []
+        remove_rows = store._remove_rows
+        monkeypatch.setattr(store, "_remove_rows", lambda rows: removals.append(rows) or remove_rows(rows))
+
+        assert store.delete_by_sources(["doc0.pdf", "doc2.pdf", "missing.pdf"]) == 4
+        assert len(removals) == 1
+        assert store.ids == ["1_0", "1_1"]
+        _assert_aligned(store)
+
+    def test_delete_by_ids(self, store):
+        store.add_chunks([make_chunk(f"a{i}", "10q0325.pdf", f"a table {i}") for i in range(4)])
+
+        assert store.delete_by_ids(["a1", "a3", "missing"]) == 2
+        assert store.ids == ["a0", "a2"]
+        _assert_aligned(store)
+
+    def test_delete_unknown_source_returns_zero(self, store):
+        store.add_chunks([make_chunk("a0", "10q0325.pdf", "a table")])
+        assert store.delete_by_source("10k1224.pdf") == 0
+
+
+class TestUpsert:
+    """Test upsert by chunk_id."""
+
+    def test_upsert_replaces_existing_row(self, store):
+        store.add_chunks([make_chunk(f"a{i}", "10q0325.pdf", f"a table {i}") for i in range(3)])
+
+        store.upsert_chunks([make_chunk("a1", "10q0325.pdf", "restated table")])
+
+        assert len(store.ids) == 3
+        assert store.ids.count("a1") == 1
+        _assert_aligned(store)
+
+        results = store.similarity_search("restated table", k=1)
+        assert results[0].page_content == "restated table"
+
+
+class TestIterDocuments:
+    """Test batched iteration over stored chunks."""
+
+    def test_iter_documents_after_mapped_load(self, store):
+        store.add_chunks([make_chunk(f"a{i}", "10q0325.pdf", f"a table {i}") for i in range(5)])
+        store.delete_by_ids(["a2"])
+        reloaded = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=store.persist_dir,
+        )
+
+        batches = list(reloaded.iter_documents(batch_size=2))
+
+        assert [len(b) for b in batches] == [2, 2]
+        docs = [doc for batch in batches for doc in batch]
+        assert [d['id'] for d in docs] == ["a0", "a1", "a3", "a4"]
+        assert docs[2]['content'] == "a table 3"
+        assert docs[2]['metadata']['source_doc'] == "10q0325.pdf"
+
+
+class TestPersistence:
+    """Test save/load round trip."""
+
+    def test_reload_preserves_vectors(self, store):
+        store.add_chunks([make_chunk(f"a{i}", "10q0325.pdf", f"a table {i}") for i in range(3)])
+        store.delete_by_ids(["a0"])
+
+        reloaded = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=store.persist_dir,
+        )
+
+        assert list(reloaded.ids) == ["a1", "a2"]
+        np.testing.assert_allclose(reloaded.vectors, store.vectors)
+        _assert_aligned(reloaded)
+
+        reloaded.add_chunks([make_chunk("a3", "10q0325.pdf", "a table 3")])
+        assert len(set(reloaded.labels.tolist())) == 3
+
+    def test_load_migrates_legacy_layout(self, tmp_path):
+        """Indexes saved before vectors were stored are reconstructed on load."""
+        import pickle
+
+        persist_dir = tmp_path / "legacy"
+        persist_dir.mkdir()
+        vectors = np.eye(DIM, dtype='float32')[:3]
+        index = faiss.IndexFlatIP(DIM)
+        index.add(vectors)
+        faiss.write_index(index, str(persist_dir / "index.faiss"))
+        with open(persist_dir / "metadata.pkl", "wb") as f:
+            pickle.dump({
+                'metadata': [{'source_doc': 'old.pdf'}] * 3,
+                'documents': ['x', 'y', 'z'],
+                'ids': ['c0', 'c1', 'c2'],
+                'index_type': 'flat',
+                'dimension': DIM,
+            }, f)
+
+        store = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=str(persist_dir),
+        )
+
+        np.testing.assert_allclose(store.vectors, vectors)
+        _assert_aligned(store)
+        assert store.delete_by_ids(['c1']) == 1
+        assert store.documents == ['x', 'z']
+
+
+class TestBulkLoad:
+    """Test deferred persistence and delta log recovery."""
+
+    def test_bulk_load_saves_once(self, store, monkeypatch):
+        saves = []
+        original_save = store.save
+        monkeypatch.setattr(store, "save", lambda: (saves.append(1), original_save()))
+
+        with store.bulk_load():
+            for b in range(4):
+                store.add_chunks([make_chunk(f"{b}_{i}", "10q0325.pdf", f"t {b} {i}") for i in range(2)])
+            store.delete_by_ids(["0_0"])
+            assert saves == []
+
+        assert len(saves) == 1
+        assert not store._delta_log_path.exists()
+        _assert_aligned(store)
+
+    def test_delta_log_recovers_interrupted_session(self, store):
+        store.add_chunks([make_chunk("base", "10q0325.pdf", "base table")])
+
+        with pytest.raises(RuntimeError):
+            with store.bulk_load():
+                store.add_chunks([make_chunk(f"a{i}", "10q0625.pdf", f"a table {i}") for i in range(3)])
+                store.delete_by_ids(["a1"])
+                raise RuntimeError("crash mid-ingest")
+
+        assert store._delta_log_path.exists()
+
+        recovered = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=store.persist_dir,
+        )
+
+        assert list(recovered.ids) == ["base", "a0", "a2"]
+        assert not recovered._delta_log_path.exists()
+        _assert_aligned(recovered)
+
+    def test_aborted_session_without_log_rolls_back(self, tmp_path):
+        store = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=str(tmp_path / "faiss"),
+            delta_log=False,
+        )
+        store.add_chunks([make_chunk("base", "10q0325.pdf", "base table")])
+
+        with pytest.raises(RuntimeError):
+            with store.bulk_load():
+                store.add_chunks([make_chunk("a0", "10q0625.pdf", "a table")])
+                store.delete_by_ids(["base"])
+                raise RuntimeError("crash mid-ingest")
+
+        assert list(store.ids) == ["base"]
+        assert not store._dirty
+        _assert_aligned(store)
+
+        store.add_chunks([make_chunk("b0", "10q0925.pdf", "b table")])
+        reloaded = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=store.persist_dir,
+        )
+        assert list(reloaded.ids) == ["base", "b0"]
+
+
+class TestColumnarSidecar:
+    """Test the memory-mapped metadata sidecar."""
+
+    def test_load_maps_rows_without_decoding(self, store):
+        from datetime import datetime
+        from src.infrastructure.vectordb.stores.faiss_columnar import MappedRecords
+
+        store.add_chunks([make_chunk(f"a{i}", "10q0325.pdf", f"a table {i}", year=2020 + i) for i in range(3)])
+
+        reloaded = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=store.persist_dir,
+        )
+
+        assert isinstance(reloaded.metadata, MappedRecords)
+        assert reloaded._row_by_id_cache is None
+        assert reloaded.get_stats()['years'] == [2020, 2021, 2022]
+
+        doc, _ = reloaded.similarity_search_with_score("a table 1", k=1)[0]
+        assert doc.page_content == "a table 1"
+        assert doc.metadata['year'] == 2021
+        assert isinstance(doc.metadata['extraction_date'], datetime)
+
+    def test_write_after_mapped_load(self, store):
+        store.add_chunks([make_chunk(f"a{i}", "10q0325.pdf", f"a table {i}") for i in range(3)])
+        store.add_chunks([make_chunk("b0", "10q0625.pdf", "b table")])
+
+        reloaded = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=store.persist_dir,
+        )
+        assert reloaded.delete_by_source("10q0625.pdf") == 1
+        reloaded.add_chunks([make_chunk("a1", "10q0325.pdf", "restated")])
+
+        assert reloaded.ids == ["a0", "a2", "a1"]
+        _assert_aligned(reloaded)
+
+    def test_old_generation_files_removed(self, store):
+        import os
+
+        store.add_chunks([make_chunk("a0", "10q0325.pdf", "a table")])
+        store.add_chunks([make_chunk("a1", "10q0325.pdf", "b table")])
+
+        files = os.listdir(store.persist_dir)
+        generations = {name.split('.')[1] for name in files if name != 'manifest.json'}
+        assert generations == {str(store._generation)}
+
+
+class TestPreFilteredSearch:
+    """Test metadata pre-filtering before vector search."""
+
+    @pytest.fixture
+    def filled_store(self, store):
+        chunks = []
+        for year in (2020, 2021, 2022):
+            for report_type, source in (("10-Q", f"10q{year}.pdf"), ("10-K", f"10k{year}.pdf")):
+                for i in range(10):
+                    chunk = make_chunk(f"{source}_{i}", source, f"{source} table {i}", year=year)
+                    chunk.metadata.report_type = report_type
+                    chunks.append(chunk)
+        store.add_chunks(chunks)
+        return store
+
+    def test_selective_filter_returns_exactly_k(self, filled_store):
+        results = filled_store.similarity_search(
+            "unrelated query", k=5, filter={"year": 2021, "report_type": "10-Q"}
+        )
+
+        assert len(results) == 5
+        assert all(d.metadata['year'] == 2021 for d in results)
+        assert all(d.metadata['report_type'] == "10-Q" for d in results)
+
+    def test_filtered_results_match_brute_force(self, filled_store):
+        query = filled_store.embedding_function.embed_query("10q2022.pdf table 3")
+        flt = {"year": 2022, "source_doc": "10Q"}
+
+        results = filled_store.similarity_search_by_vector_with_score(query, k=4, filter=flt)
+
+        expected = sorted(
+            (
+                (float(filled_store.vectors[i] @ filled_store._normalize([query])[0]), filled_store.documents[i])
+                for i, meta in enumerate(filled_store.metadata)
+                if filled_store._matches_filters(meta, flt)
+            ),
+            reverse=True,
+        )[:4]
+        assert [doc.page_content for doc, _ in results] == [doc for _, doc in expected]
+
+    def test_selector_path_matches_exact_path(self, filled_store, monkeypatch):
+        flt = {"year": 2020, "report_type": "10-K"}
+        exact = filled_store.similarity_search("10k2020.pdf table 7", k=3, filter=flt)
+
+        monkeypatch.setattr(FAISSVectorStore, "BRUTE_FORCE_MAX_ROWS", 0)
+        selected = filled_store.similarity_search("10k2020.pdf table 7", k=3, filter=flt)
+
+        assert [d.page_content for d in selected] == [d.page_content for d in exact]
+
+    def test_in_operator_and_residual_filters(self, filled_store):
+        results = filled_store.similarity_search(
+            "table", k=50, filter={"year": {"$in": [2020, 2022]}, "table_title": "table 1"}
+        )
+
+        assert {d.metadata['year'] for d in results} == {2020, 2022}
+        assert all("table 1" in d.metadata['table_title'] for d in results)
+        assert len(results) == 4
+
+    def test_filter_index_invalidated_after_write(self, filled_store):
+        assert len(filled_store.similarity_search("x", k=50, filter={"year": 2021})) == 20
+        filled_store.delete_by_source("10k2021.pdf")
+        assert len(filled_store.similarity_search("x", k=50, filter={"year": 2021})) == 10
+
+    def test_no_match_returns_empty(self, filled_store):
+        assert filled_store.similarity_search("x", k=5, filter={"year": 1999}) == []
+
+
+class TestSearchByVectors:
+    """Test searching with precomputed query embeddings."""
+
+    @pytest.mark.parametrize("filters", [None, {"year": 2021}, {"report_type": "10-K", "year": {"$in": [2020, 2022]}}])
+    def test_batch_matches_single_queries(self, store, filters):
+        chunks = []
+        for i in range(30):
+            chunk = make_chunk(f"c{i}", f"doc{i % 3}.pdf", f"table {i}", year=2020 + i % 3)
+            chunk.metadata.report_type = "10-K" if i % 2 else "10-Q"
+            chunks.append(chunk)
+        store.add_chunks(chunks)
+        queries = [store.embedding_function.embed_query(f"query {i}") for i in range(4)]
+
+        batched = store.search_by_vectors(queries, top_k=5, filters=filters)
+        single = [store.search_by_vector(q, top_k=5, filters=filters) for q in queries]
+
+        assert len(batched) == 4
+        for got, want in zip(batched, single):
+            assert [r.chunk_id for r in got] == [r.chunk_id for r in want]
+            assert [r.score for r in got] == pytest.approx([r.score for r in want])
+        assert any(batched)
+
+    def test_search_by_vector_matches_text_search(self, store):
+        store.add_chunks([make_chunk(f"c{i}", "doc.pdf", f"table {i}") for i in range(10)])
+        query_vector = store.embedding_function.embed_query("table 4")
+
+        by_text = store.search("table 4", top_k=3)
+        by_vector = store.search_by_vector(query_vector, top_k=3)
+
+        assert [r.chunk_id for r in by_vector] == [r.chunk_id for r in by_text]
+
+
+class TestIndexGeneration:
+    """Test the write counter used to invalidate result caches."""
+
+    def test_changes_on_every_write(self, store):
+        seen = [store.index_generation]
+        store.add_chunks([make_chunk("a", "doc.pdf", "revenue"), make_chunk("b", "doc.pdf", "assets")])
+        seen.append(store.index_generation)
+        store.upsert_chunks([make_chunk("a", "doc.pdf", "net revenue")])
+        seen.append(store.index_generation)
+        store.delete_by_ids(["b"])
+        seen.append(store.index_generation)
+        store.clear()
+        seen.append(store.index_generation)
+
+        assert len(set(seen)) == len(seen)
+
+    def test_unchanged_by_searches(self, store):
+        store.add_chunks([make_chunk("a", "doc.pdf", "revenue")])
+        generation = store.index_generation
+        store.search("revenue", top_k=1, filters={"year": 2024})
+
+        assert store.index_generation == generation
+
+
+class TestIndexLifecycle:
+    """Test trainable IVF/HNSW index building."""
+
+    def _fill(self, store, n=600):
+        rng = np.random.default_rng(7)
+        chunks = []
+        for i in range(n):
+            chunk = make_chunk(f"c{i}", f"doc{i % 4}.pdf", f"table {i}", year=2020 + i % 3)
+            chunk.embedding = rng.standard_normal(DIM).tolist()
+            chunks.append(chunk)
+        store.add_chunks(chunks)
+        return chunks
+
+    def test_auto_nlist(self):
+        assert FAISSVectorStore.auto_nlist(10) == 1
+        assert FAISSVectorStore.auto_nlist(10000) == 256
+        assert FAISSVectorStore.auto_nlist(1000) == 25
+
+    def test_trainable_type_serves_flat_until_built(self, tmp_path):
+        store = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=str(tmp_path / "ivf"),
+            index_type="ivf",
+        )
+        self._fill(store, 50)
+        assert store._active_index_kind() == "flat"
+        assert len(store.similarity_search("table 3", k=3)) == 3
+
+    @pytest.mark.parametrize("index_type", ["ivf", "ivf_sq8", "ivf_pq", "hnsw"])
+    def test_build_index_from_stored_vectors(self, store, index_type):
+        chunks = self._fill(store)
+        calls_before = store.embedding_function.calls
+
+        params = store.build_index(index_type, nlist=8, pq_m=2)
+
+        assert store.embedding_function.calls == calls_before
+        assert params['index_type'] == index_type
+        assert store.index.ntotal == len(chunks)
+
+        # Probing every list is exhaustive, so the nearest row is found
+        query = chunks[123].embedding
+        doc, _ = store.similarity_search_by_vector_with_score(
+            query, k=1, nprobe=8, ef_search=600
+        )[0]
+        if index_type in ("ivf", "ivf_sq8", "hnsw"):
+            assert doc.page_content == "table 123"
+
+    def test_built_index_survives_writes_and_reload(self, store):
+        self._fill(store)
+        store.build_index("ivf", nlist=8)
+
+        store.delete_by_source("doc1.pdf")
+        extra = make_chunk("new", "doc9.pdf", "new table")
+        extra.embedding = [1.0] * DIM
+        store.add_chunks([extra])
+        _assert_aligned(store)
+        assert store._active_index_kind() == "ivf"
+
+        reloaded = FAISSVectorStore(
+            embedding_function=CountingEmbeddings(),
+            dimension=DIM,
+            persist_dir=store.persist_dir,
+        )
+        assert reloaded.index_type == "ivf"
+        assert reloaded.index_params['nlist'] == 8
+        assert reloaded._active_index_kind() == "ivf"
+
+        results = reloaded.similarity_search_by_vector_with_score(
+            [1.0] * DIM, k=5, filter={"year": 2021}, nprobe=8
+        )
+        assert len(results) == 5
+        assert all(d.metadata['year'] == 2021 for d, _ in results)
+
+    def test_hnsw_rebuilt_once_per_session(self, store, monkeypatch):
+        self._fill(store, 100)
+        store.build_index("hnsw")
+        rebuilds = []
+        rebuild = store._rebuild_index
+        monkeypatch.setattr(store, "_rebuild_index", lambda: rebuilds.append(1) or rebuild())
+
+        with store.bulk_load():
+            for doc in range(3):
+                store.delete_by_source(f"doc{doc}.pdf")
+            docs = store.similarity_search_with_score("table 3", k=100)
+            assert {d.metadata['source_doc'] for d, _ in docs} == {"doc3.pdf"}
+
+        assert len(rebuilds) == 1
+        assert store._active_index_kind() == "hnsw"
+        _assert_aligned(store)
+
+    def test_build_index_requires_enough_vectors(self, store):
+        self._fill(store, 20)
+        with pytest.raises(ValueError):
+            store.build_index("ivf_pq")
@@ -0,0 +1,189 @@
+"""
+Tests for batched multi-level embedding generation.
+
+Tests:
+- Table/row/cell texts are embedded in batched calls, duplicates once
+- Row texts pick up their own cells only
+- Results are yielded in bounded batches
+- store_document_embeddings() upserts every batch in one bulk load
+- Every vector store backend accepts the generated chunks
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.embeddings.multi_level import MultiLevelEmbeddingGenerator
+from src.infrastructure.vectordb.manager import VectorDBManager
+
+
+class FakeEmbedder:
+    """Records embed_documents calls; vector = [len(text)]."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+
+class FakeVectorStore:
+    """Collects upserted chunks and bulk-load sessions."""
+
+    def __init__(self):
+        self.upserts = []
+        self.sessions = 0
+
+    @contextmanager
+    def bulk_load(self):
+        self.sessions += 1
+        yield self
+
+    def upsert_chunks(self, chunks, show_progress=True):
+        self.upserts.append(list(chunks))
+        return len(chunks)
+
+
+class FakeChroma:
+    """Records the documents handed to LangChain Chroma."""
+
+    def __init__(self):
+        self.documents = []
+
+    def add_documents(self, documents, ids):
+        self.documents.extend(zip(ids, documents))
+
+
+def _faiss_backend(tmp_path):
+    pytest.importorskip("faiss")
+    from src.infrastructure.vectordb.stores.faiss_store import FAISSVectorStore
+
+    store = FAISSVectorStore(
+        embedding_function=FakeEmbedder(), dimension=1, persist_dir=str(tmp_path / "faiss")
+    )
+    return store, lambda: dict(zip(store.ids, store.metadata))
+
+
+def _chromadb_backend(tmp_path):
+    pytest.importorskip("langchain_chroma")
+    from src.infrastructure.vectordb.stores.chromadb_store import VectorStore
+
+    store = VectorStore.__new__(VectorStore)
+    store.vector_db = FakeChroma()
+    return store, lambda: {i: doc.metadata for i, doc in store.vector_db.documents}
+
+
+BACKENDS = {"faiss": _faiss_backend, "chromadb": _chromadb_backend}
+
+
+def _document(rows=3, columns=2):
+    period = SimpleNamespace(
+        display_label="Q1 2025", period_type="quarter", year=2025, quarter="Q1"
+    )
+    row_headers = [
+        SimpleNamespace(
+            row_index=r, text=f"Item {r}", indent_level=0, parent_row=None,
+            canonical_label=None, is_subtotal=False, is_total=False
+        )
+        for r in range(rows)
+    ]
+    data_cells = [
+        SimpleNamespace(
+            row_index=r, column_index=c, row_header=f"Item {r}",
+            column_header=f"Q1 2025 col{c}", raw_text=f"{r}{c}", parsed_value=float(r * 10 + c),
+            data_type="currency", units="millions", base_value=None, display_value=f"${r}{c}"
+        )
+        for r in range(rows) for c in range(columns)
+    ]
+    table = SimpleNamespace(
+        table_id="t1", table_type="Income Statement", original_title="Revenue",
+        canonical_title="revenue", periods=[period], row_headers=row_headers,
+        column_headers=[], data_cells=data_cells, metadata={"page_no": 4}
+    )
+    metadata = SimpleNamespace(
+        filename="10q.pdf", file_hash="abcdef1234567890", company_name="ACME",
+        filing_date=None, document_type="10-Q"
+    )
+    return SimpleNamespace(metadata=metadata, tables=[table])
+
+
+class TestGeneration:
+    """Test batched text building and embedding."""
+
+    def test_all_levels_in_one_call(self):
+        embedder = FakeEmbedder()
+        generator = MultiLevelEmbeddingGenerator(embedder, batch_size=100)
+
+        embeddings = generator.generate_document_embeddings(_document(), levels=["table", "row", "cell"])
+
+        assert len(embedder.calls) == 1
+        assert [e["metadata"]["embedding_level"] for e in embeddings] == (
+            ["table"] + ["row"] * 3 + ["cell"] * 6
+        )
+        assert embeddings[-1]["id"] == "abcdef1234567890_t1_cell_2_1"
+        assert all(e["vector"] == [float(len(e["text"]))] for e in embeddings)
+        assert embeddings[4]["metadata"]["page_number"] == 4
+
+    def test_row_text_uses_own_cells(self):
+        generator = MultiLevelEmbeddingGenerator(FakeEmbedder())
+        table = _document().tables[0]
+        rows = generator.generate_row_level_embeddings(table, _document().metadata)
+
+        assert "Values: Q1 2025 col0: $10, Q1 2025 col1: $11" in rows[1]["text"]
+        assert "$00" not in rows[1]["text"]
+
+    def test_duplicate_texts_embedded_once(self):
+        embedder = FakeEmbedder()
+        generator = MultiLevelEmbeddingGenerator(embedder)
+        document = _document()
+        document.tables.append(document.tables[0])
+
+        embeddings = generator.generate_document_embeddings(document, levels=["table"])
+
+        assert len(embeddings) == 2
+        assert embedder.calls == [[embeddings[0]["text"]]]
+
+    def test_bounded_batches(self):
+        embedder = FakeEmbedder()
+        generator = MultiLevelEmbeddingGenerator(embedder, batch_size=4)
+
+        batches = list(generator.iter_document_embeddings(_document(), levels=["row", "cell"]))
+
+        assert [len(b) for b in batches] == [4, 4, 1]
+        assert len(embedder.calls) == 3
+
+
+class TestStore:
+    """Test writing to the vector store."""
+
+    def test_upserts_batches_in_one_bulk_load(self):
+        store = FakeVectorStore()
+        generator = MultiLevelEmbeddingGenerator(FakeEmbedder(), batch_size=5)
+
+        written = generator.store_document_embeddings(
+            _document(), vector_store=store, levels=["table", "row", "cell"]
+        )
+
+        assert written == 10
+        assert store.sessions == 1
+        assert [len(batch) for batch in store.upserts] == [5, 5]
+        chunk = store.upserts[0][0]
+        assert chunk.chunk_id == "abcdef1234567890_t1_table"
+        assert chunk.embedding == [float(len(chunk.content))]
+
+    @pytest.mark.parametrize("provider", sorted(BACKENDS))
+    def test_backends_accept_generated_chunks(self, provider, tmp_path):
+        store, stored_metadata = BACKENDS[provider](tmp_path)
+        manager = VectorDBManager.__new__(VectorDBManager)
+        manager.provider_name, manager._db, manager._writes = provider, store, 0
+        generator = MultiLevelEmbeddingGenerator(FakeEmbedder(), batch_size=5)
+
+        written = generator.store_document_embeddings(
+            _document(), vector_store=manager, levels=["table", "row"]
+        )
+
+        metadata = stored_metadata()
+        assert written == len(metadata) == 4
+        assert metadata["abcdef1234567890_t1_row_2"]["embedding_level"] == "row"
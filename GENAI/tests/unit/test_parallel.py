@@ -0,0 +1,147 @@
+"""
+Tests for process-pool execution with per-task timeouts, and thread fan-out.
+
+Tests:
+- All items processed, results in completion order
+- Per-worker initializer runs once per process
+- Task errors reported without stopping the batch
+- Hung tasks time out and other in-flight tasks are resubmitted
+- Crashed workers are replaced
+- Fan-out runs calls concurrently, reports slow/failed calls, and runs
+  inline when nested in the same pool
+- Parallel extraction returns a result for every spelling of a path
+"""
+
+import os
+import time
+
+from src.utils import parallel
+from src.utils.parallel import TaskOutcome, fan_out, imap_processes
+
+_initialized_pid = None
+
+
+def _init():
+    global _initialized_pid
+    _initialized_pid = os.getpid()
+
+
+def _square(x):
+    assert _initialized_pid == os.getpid(), "initializer did not run in this worker"
+    return x * x
+
+
+def _sleepy(x):
+    if x == "hang":
+        time.sleep(60)
+    time.sleep(0.2)
+    return x
+
+
+def _fail_on_odd(x):
+    if x % 2:
+        raise ValueError(f"odd: {x}")
+    return x
+
+
+def _crash_once(marker_dir):
+    marker = os.path.join(marker_dir, "crashed")
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return "recovered"
+
+
+class TestImapProcesses:
+    """Test process-pool runner."""
+
+    def test_processes_all_items(self):
+        outcomes = list(imap_processes(_square, range(10), max_workers=3, initializer=_init))
+        assert sorted(o.result for o in outcomes) == [x * x for x in range(10)]
+        assert all(o.ok for o in outcomes)
+
+    def test_errors_do_not_stop_batch(self):
+        outcomes = list(imap_processes(_fail_on_odd, range(6), max_workers=2))
+        failed = sorted(o.item for o in outcomes if not o.ok)
+        passed = sorted(o.result for o in outcomes if o.ok)
+        assert failed == [1, 3, 5]
+        assert passed == [0, 2, 4]
+        assert all(isinstance(o.error, ValueError) for o in outcomes if not o.ok)
+
+    def test_timeout_kills_hung_task_only(self):
+        start = time.monotonic()
+        outcomes = list(imap_processes(_sleepy, ["a", "hang", "b", "c"], max_workers=2, timeout=3))
+        assert time.monotonic() - start < 30
+
+        by_item = {o.item: o for o in outcomes}
+        assert by_item["hang"].timed_out and isinstance(by_item["hang"].error, TimeoutError)
+        assert all(by_item[x].ok and by_item[x].result == x for x in "abc")
+
+    def test_crashed_worker_is_replaced(self, tmp_path):
+        outcomes = list(imap_processes(_crash_once, [str(tmp_path)], max_workers=1))
+        assert len(outcomes) == 1
+        assert outcomes[0].ok and outcomes[0].result == "recovered"
+
+
+class TestFanOut:
+    """Test concurrent thread fan-out."""
+
+    def test_latency_is_max_not_sum(self):
+        calls = {name: (lambda n=name: time.sleep(0.3) or n) for name in ("a", "b", "c")}
+        start = time.monotonic()
+        outcomes = fan_out(calls, pool="test-fan-out", max_workers=4)
+        assert time.monotonic() - start < 0.8
+        assert list(outcomes) == ["a", "b", "c"]
+        assert all(o.ok and o.result == name for name, o in outcomes.items())
+
+    def test_partial_results_on_timeout_and_error(self):
+        def boom():
+            raise RuntimeError("down")
+
+        outcomes = fan_out(
+            {"fast": lambda: 1, "slow": lambda: time.sleep(2), "broken": boom},
+            pool="test-fan-out", max_workers=4, timeout=0.5,
+        )
+        assert outcomes["fast"].ok and outcomes["fast"].result == 1
+        assert outcomes["slow"].timed_out and isinstance(outcomes["slow"].error, TimeoutError)
+        assert isinstance(outcomes["broken"].error, RuntimeError) and not outcomes["broken"].timed_out
+
+    def test_nested_call_in_same_pool_runs_inline(self):
+        def outer():
+            inner = fan_out({"x": lambda: 2}, pool="test-nested", max_workers=1, timeout=1)
+            return inner["x"].result
+
+        outcomes = fan_out({"outer": outer}, pool="test-nested", max_workers=1, timeout=5)
+        assert outcomes["outer"].result == 2
+
+
+class TestParallelExtraction:
+    """Test UnifiedExtractor.iter_extract in parallel mode."""
+
+    def test_same_file_under_two_paths(self, tmp_path, monkeypatch):
+        from src.infrastructure.extraction.base import ExtractionResult
+        from src.infrastructure.extraction.extractor import UnifiedExtractor
+
+        (tmp_path / "a.pdf").write_bytes(b"%PDF-1.4")
+        (tmp_path / "b.pdf").write_bytes(b"%PDF-1.4")
+        monkeypatch.chdir(tmp_path)
+
+        extracted = []
+
+        def fake_imap(func, items, **kwargs):
+            for item in items:
+                extracted.append(item)
+                yield TaskOutcome(item=item, result=ExtractionResult(pdf_path=item))
+
+        monkeypatch.setattr(parallel, "imap_processes", fake_imap)
+        extractor = UnifiedExtractor.__new__(UnifiedExtractor)
+        extractor.cache = None
+        extractor.backend_names = []
+        extractor.min_quality = 0.0
+        monkeypatch.setattr(extractor, "_record_result", lambda path, result: None, raising=False)
+
+        paths = ["a.pdf", "./a.pdf", "b.pdf"]
+        results = extractor.extract_batch(paths, workers=2)
+
+        assert sorted(extracted) == [str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")]
+        assert [r.pdf_path for r in results] == [str(tmp_path / n) for n in ("a.pdf", "a.pdf", "b.pdf")]
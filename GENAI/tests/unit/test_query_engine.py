@@ -0,0 +1,155 @@
+"""
+Tests for request-scoped QueryEngine execution.
+
+Tests:
+- filters/top_k reach the retriever
+- Concurrent queries keep their own sources
+- aquery() runs the chain asynchronously
+- batch_query() shares retrieval, answers duplicates once and keeps order
+- stream_query() emits sources first, then tokens, caches on completion
+  and reports time-to-first-token
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from src.rag.pipeline import QueryEngine, reset_query_engine
+
+
+class FakeRetriever:
+    """Returns one chunk named after the query; records calls."""
+
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.batch_calls = []
+        self.delay = delay
+
+    def retrieve(self, query, top_k=5, filters=None):
+        self.calls.append((query, top_k, filters))
+        time.sleep(self.delay)
+        metadata = {"source_doc": f"{query}.pdf", "page_no": 1, "table_title": "Revenue", "year": 2025}
+        return [{"content": f"chunk for {query}", "metadata": metadata}]
+
+    def retrieve_batch(self, queries, top_k=5, filters=None):
+        self.batch_calls.append(list(queries))
+        return [self.retrieve(q, top_k, filters) for q in queries]
+
+
+class FakeLLMManager:
+    """Echoes the prompt context back as the answer."""
+
+    def get_langchain_model(self):
+        return RunnableLambda(lambda prompt: prompt.to_string().split("chunk for ")[-1].split("\n")[0])
+
+
+class StreamingLLMManager:
+    """Chat model that streams a fixed answer word by word."""
+
+    def get_langchain_model(self):
+        return GenericFakeChatModel(messages=iter([AIMessage(content="Revenue rose 5%")]))
+
+
+class FakeCache:
+    """Minimal LLM response cache."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get_llm_response(self, query, context_key):
+        return self.data.get((query, context_key))
+
+    def set_llm_response(self, query, response, context_key):
+        self.data[(query, context_key)] = response
+
+
+@pytest.fixture
+def engine():
+    reset_query_engine()
+    retriever = FakeRetriever()
+    engine = QueryEngine(retriever=retriever, llm_manager=FakeLLMManager(), cache=False)
+    yield engine
+    reset_query_engine()
+
+
+class TestQuery:
+    """Test single-query execution."""
+
+    def test_filters_and_top_k_reach_retriever(self, engine):
+        response = engine.query("q1", filters={"year": 2025}, top_k=3, use_cache=False)
+        assert engine.retriever.calls == [("q1", 3, {"year": 2025})]
+        assert response.retrieved_chunks == 1
+        assert [s.source_doc for s in response.sources] == ["q1.pdf"]
+
+    def test_concurrent_queries_keep_their_sources(self, engine):
+        engine.retriever.delay = 0.02
+        queries = [f"q{i}" for i in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(lambda q: engine.query(q, use_cache=False), queries))
+
+        for query, response in zip(queries, responses):
+            assert [s.source_doc for s in response.sources] == [f"{query}.pdf"]
+
+    def test_aquery(self, engine):
+        async def run():
+            return await asyncio.gather(*(engine.aquery(q, use_cache=False) for q in ("a", "b")))
+
+        responses = asyncio.run(run())
+        assert [r.sources[0].source_doc for r in responses] == ["a.pdf", "b.pdf"]
+
+
+class TestBatchQuery:
+    """Test batched execution."""
+
+    def test_shared_retrieval_and_order(self, engine):
+        responses = engine.batch_query(["a", "b", "a"], top_k=2, use_cache=False)
+
+        assert engine.retriever.batch_calls == [["a", "b"]]
+        assert [r.sources[0].source_doc for r in responses] == ["a.pdf", "b.pdf", "a.pdf"]
+        assert responses[0].answer == "a"
+
+
+class TestStreamQuery:
+    """Test streamed execution."""
+
+    @pytest.fixture
+    def streaming_engine(self):
+        reset_query_engine()
+        engine = QueryEngine(
+            retriever=FakeRetriever(), llm_manager=StreamingLLMManager(), cache=FakeCache()
+        )
+        yield engine
+        reset_query_engine()
+
+    def test_event_order_and_metrics(self, streaming_engine):
+        events = list(streaming_engine.stream_query("q1", top_k=2))
+
+        assert events[0].type == "sources"
+        assert [s.source_doc for s in events[0].sources] == ["q1.pdf"]
+        tokens = [e.text for e in events if e.type == "token"]
+        assert len(tokens) > 1
+        assert "".join(tokens) == "Revenue rose 5%"
+
+        done = events[-1]
+        assert done.type == "done" and done.error is None
+        assert done.response.answer == "Revenue rose 5%"
+        assert done.metrics["time_to_first_token_ms"] >= done.metrics["retrieval_ms"]
+        assert done.metrics["tokens"] == len(tokens)
+
+    def test_caches_full_text_on_completion(self, streaming_engine):
+        stream = streaming_engine.stream_query("q1", top_k=2)
+        next(stream)
+        assert streaming_engine.cache.data == {}
+
+        list(stream)
+        assert list(streaming_engine.cache.data.values()) == ["Revenue rose 5%"]
+
+        replay = list(streaming_engine.stream_query("q1", top_k=2))
+        assert replay[-1].response.from_cache
@@ -0,0 +1,100 @@
+"""
+Tests for the request-scoped query embedding memo.
+
+Tests:
+- Each distinct text is embedded once per memo
+- Lists of texts are embedded in one batched call
+- Concurrent requests for the same text share one computation
+- Failures are raised to every waiter and can be retried
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure.embeddings.query_memo import QueryEmbeddingMemo
+
+
+class RecordingEmbeddings:
+    """Fake embedding manager that records every model call."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.calls = []
+        self.delay = delay
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def _record(self, kind, texts):
+        with self._lock:
+            self.calls.append((kind, list(texts)))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("embedding service down")
+        return [[float(len(t)), float(hash(t) % 97)] for t in texts]
+
+    def embed_query(self, text):
+        return self._record("query", [text])[0]
+
+    def embed_queries(self, texts):
+        return self._record("queries", texts)
+
+    def embed_documents(self, texts):
+        return self._record("documents", texts)
+
+
+class TestQueryEmbeddingMemo:
+    """Test per-request embedding reuse."""
+
+    def test_embeds_each_text_once(self):
+        embeddings = RecordingEmbeddings()
+        memo = QueryEmbeddingMemo(embeddings)
+
+        first = memo.embed_query("revenue in Q1")
+        again = memo.embed_query("revenue in Q1")
+
+        assert first == again
+        assert embeddings.calls == [("query", ["revenue in Q1"])]
+        assert memo.stats() == {'calls': 1, 'texts_embedded': 1, 'hits': 1}
+
+    def test_variations_embedded_in_one_batch(self):
+        embeddings = RecordingEmbeddings()
+        memo = QueryEmbeddingMemo(embeddings)
+        memo.embed_query("revenue")
+
+        vectors = memo.embed_queries(["revenue", "sales", "income", "sales"])
+
+        assert embeddings.calls[1:] == [("queries", ["sales", "income"])]
+        assert vectors[0] == memo.embed_query("revenue")
+        assert vectors[1] == vectors[3]
+
+    def test_documents_kept_apart_from_queries(self):
+        embeddings = RecordingEmbeddings()
+        memo = QueryEmbeddingMemo(embeddings)
+
+        memo.embed_query("net income")
+        memo.embed_document("net income")
+
+        assert [kind for kind, _ in embeddings.calls] == ["query", "documents"]
+
+    def test_concurrent_callers_share_one_call(self):
+        embeddings = RecordingEmbeddings(delay=0.2)
+        memo = QueryEmbeddingMemo(embeddings)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            vectors = list(pool.map(memo.embed_query, ["total assets"] * 4))
+
+        assert len(embeddings.calls) == 1
+        assert all(v == vectors[0] for v in vectors)
+
+    def test_failure_raised_then_retried(self):
+        embeddings = RecordingEmbeddings(fail=True)
+        memo = QueryEmbeddingMemo(embeddings)
+
+        with pytest.raises(RuntimeError):
+            memo.embed_query("goodwill")
+
+        embeddings.fail = False
+        assert memo.embed_query("goodwill")
+        assert len(embeddings.calls) == 2
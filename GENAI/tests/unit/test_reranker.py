@@ -0,0 +1,104 @@
+"""
+Tests for the cross-encoder reranking service.
+
+Tests:
+- Model loads lazily and only once
+- (query, chunk) scores are cached; changed chunk content is rescored
+- Long chunks are truncated to the token budget
+- Concurrent rerank calls are merged into one predict call
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.retrieval.reranking import cross_encoder
+from src.retrieval.reranking.cross_encoder import CrossEncoderReranker, truncate_to_tokens
+from src.retrieval.search.base import SearchResult
+
+
+class FakeModel:
+    """Scores a pair by document length and records predict calls."""
+
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=False):
+        self.calls.append(list(pairs))
+        time.sleep(self.delay)
+        return [float(len(doc)) for _, doc in pairs]
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeModel()
+    loads = []
+
+    def load(*args):
+        loads.append(args)
+        return fake
+
+    monkeypatch.setattr(cross_encoder, "_load_model", load)
+    fake.loads = loads
+    return fake
+
+
+def _result(chunk_id, content):
+    return SearchResult(id=chunk_id, content=content, metadata={}, score=0.0, strategy="vector")
+
+
+class TestReranker:
+    """Test scoring, caching and truncation."""
+
+    def test_lazy_load_and_order(self, model):
+        reranker = CrossEncoderReranker(batch_wait_ms=0)
+        assert model.loads == []
+
+        ranked = reranker.rerank("q", [_result("a", "x"), _result("b", "xxx")], top_k=1)
+        assert [r.id for r in ranked] == ["b"]
+        assert len(model.loads) == 1
+
+    def test_scores_cached_per_query_and_chunk(self, model):
+        reranker = CrossEncoderReranker(batch_wait_ms=0)
+        reranker.rerank("q", [_result("a", "x"), _result("b", "xx")])
+        reranker.rerank("q", [_result("a", "x"), _result("c", "xxx")])
+        assert [len(call) for call in model.calls] == [2, 1]
+
+        # Re-ingested chunk with the same id but new content is rescored
+        reranker.rerank("q", [_result("a", "changed")])
+        assert len(model.calls) == 3
+        assert reranker.get_model_info()["score_cache"]["hits"] == 1
+
+    def test_truncates_long_chunks(self, model):
+        reranker = CrossEncoderReranker(max_tokens=4, batch_wait_ms=0)
+        reranker.rerank("q", [_result("a", "| h1 | h2 |\n| 1 | 2 |\n| 3 | 4 |")])
+        assert model.calls[0][0][1] == "| h1 | h2 |"
+
+        assert truncate_to_tokens("short", 100) == "short"
+        assert truncate_to_tokens("x" * 100, 2) == "x" * 8
+
+
+class TestMicroBatching:
+    """Test merging of concurrent rerank calls."""
+
+    def test_concurrent_calls_share_predict(self, model):
+        model.delay = 0.05
+        reranker = CrossEncoderReranker(batch_wait_ms=100)
+        outputs = {}
+
+        def run(name):
+            outputs[name] = reranker.rerank(name, [_result(name, name * 3), _result("z", "z")])
+
+        threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b", "c")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(model.calls) == 1
+        assert len(model.calls[0]) == 6
+        for name, ranked in outputs.items():
+            assert ranked[0].id == name
+            assert ranked[0].rerank_score == 3.0
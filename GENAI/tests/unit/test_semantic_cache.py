@@ -0,0 +1,161 @@
+"""
+Tests for the semantic (embedding-similarity) query cache.
+
+Tests:
+- Paraphrased queries hit, unrelated queries miss
+- Filters, top_k, namespace and period/number terms must match exactly
+- TTL expiry and LRU eviction
+- Invalidation on vector index generation change, by query text and by source
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from src.infrastructure.cache.semantic_cache import SemanticQueryCache, period_terms
+
+
+VECTORS = {
+    "What was revenue in Q1 2025?": [1.0, 0.0, 0.0, 0.1],
+    "Q1 2025 revenue?": [0.98, 0.02, 0.0, 0.12],
+    "What was revenue in Q2 2025?": [0.99, 0.01, 0.0, 0.1],
+    "What was revenue in the first quarter of 2025?": [0.99, 0.0, 0.01, 0.1],
+    "Total assets at year end": [0.0, 1.0, 0.0, 0.0],
+    "Goodwill impairment": [0.0, 0.0, 1.0, 0.0],
+}
+
+
+class FakeEmbedder:
+    """Looks up fixed vectors and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return VECTORS[text]
+
+
+@pytest.fixture
+def cache():
+    return SemanticQueryCache(embed_fn=FakeEmbedder(), threshold=0.95)
+
+
+class TestLookup:
+    """Test similarity matching within a scope."""
+
+    def test_paraphrase_hits(self, cache):
+        cache.store("What was revenue in Q1 2025?", {"answer": "$10M"}, filters={"year": 2025})
+
+        assert cache.lookup("Q1 2025 revenue?", filters={"year": 2025}) == {"answer": "$10M"}
+        assert cache.lookup("Total assets at year end", filters={"year": 2025}) is None
+        assert cache.get_stats().hits == 1 and cache.get_stats().misses == 1
+
+    def test_scope_must_match_exactly(self, cache):
+        cache.store("What was revenue in Q1 2025?", "answer", filters={"year": 2025}, top_k=5)
+
+        assert cache.lookup("Q1 2025 revenue?", filters={"year": 2024}, top_k=5) is None
+        assert cache.lookup("Q1 2025 revenue?", filters={"year": 2025}, top_k=10) is None
+        assert cache.lookup("Q1 2025 revenue?", filters={"year": 2025}, namespace="hybrid") is None
+        assert cache.lookup("Q1 2025 revenue?", filters={"year": 2025}, top_k=5) == "answer"
+
+    def test_different_period_misses(self, cache):
+        cache.store("What was revenue in Q1 2025?", "Q1 answer")
+
+        assert cache.lookup("What was revenue in Q2 2025?") is None
+        assert cache.lookup("What was revenue in the first quarter of 2025?") == "Q1 answer"
+
+    def test_period_terms(self):
+        assert period_terms("Q1 2025 revenue?") == period_terms("What was revenue in Q1 2025?")
+        assert period_terms("revenue 2Q24") == ("2024", "q2")
+        assert period_terms("Assets at March 31, 2025 of $1,234.5") == ("1234.5", "2025", "31", "mar")
+        assert period_terms("market margin") == ()
+
+    def test_returns_copies(self, cache):
+        cache.store("Goodwill impairment", {"sources": ["a.pdf"]})
+        cache.lookup("Goodwill impairment")["sources"].append("b.pdf")
+
+        assert cache.lookup("Goodwill impairment") == {"sources": ["a.pdf"]}
+
+    def test_store_after_lookup_embeds_once(self, cache):
+        cache.lookup("Goodwill impairment")
+        cache.store("Goodwill impairment", "answer")
+
+        assert cache.embed_fn.calls == 1
+
+    def test_precomputed_vector(self, cache):
+        cache.store("anything", "answer", vector=np.array(VECTORS["Goodwill impairment"]) * 3)
+
+        assert cache.lookup("Goodwill impairment") == "answer"
+
+
+class TestEviction:
+    """Test TTL, LRU and invalidation."""
+
+    def test_ttl_expiry(self):
+        cache = SemanticQueryCache(embed_fn=FakeEmbedder(), ttl_seconds=0.05)
+        cache.store("Goodwill impairment", "answer")
+        time.sleep(0.1)
+
+        assert cache.lookup("Goodwill impairment") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = SemanticQueryCache(embed_fn=FakeEmbedder(), max_entries=2)
+        cache.store("Goodwill impairment", 1)
+        cache.store("Total assets at year end", 2)
+        cache.lookup("Goodwill impairment")  # most recently used
+        cache.store("What was revenue in Q1 2025?", 3)
+
+        assert cache.lookup("Total assets at year end") is None
+        assert cache.lookup("Goodwill impairment") == 1
+        assert cache.get_stats().evictions == 1
+
+    def test_restore_replaces_entry(self, cache):
+        cache.store("Goodwill impairment", "old")
+        cache.store("Goodwill impairment", "new")
+
+        assert len(cache) == 1
+        assert cache.lookup("Goodwill impairment") == "new"
+
+    def test_generation_change_drops_entries(self):
+        generation = {"value": 1}
+        cache = SemanticQueryCache(embed_fn=FakeEmbedder(), generation_fn=lambda: generation["value"])
+        cache.store("Goodwill impairment", "answer")
+        assert cache.lookup("Goodwill impairment") == "answer"
+
+        generation["value"] = 2
+        assert cache.lookup("Goodwill impairment") is None
+        assert len(cache) == 0
+
+    def test_invalidate_query(self, cache):
+        cache.store("Goodwill impairment", "a", top_k=5)
+        cache.store("Goodwill impairment", "b", top_k=10)
+        cache.store("Total assets at year end", "c")
+
+        assert cache.invalidate_query("  goodwill IMPAIRMENT ") == 2
+        assert len(cache) == 1
+
+    def test_invalidate_by_source(self, cache):
+        cache.store("Goodwill impairment", "a", dependencies=["source:10q0625.pdf"])
+        cache.store("Total assets at year end", "b", dependencies=["source:10k1224.pdf"])
+
+        assert cache.invalidate_by_source("10q0625.pdf") == 1
+        assert cache.lookup("Goodwill impairment") is None
+        assert cache.lookup("Total assets at year end") == "b"
+
+    def test_source_invalidation_with_generation_check(self):
+        generation = {"value": 1}
+        cache = SemanticQueryCache(embed_fn=FakeEmbedder(), generation_fn=lambda: generation["value"])
+        cache.store("Goodwill impairment", "a", dependencies=["source:10q0625.pdf"])
+        cache.store("Total assets at year end", "b", dependencies=["source:10k1224.pdf"])
+
+        assert cache.invalidate_by_source("10q0625.pdf") == 1
+        assert cache.lookup("Total assets at year end") == "b"
+
+        generation["value"] = 2
+        assert cache.lookup("Total assets at year end") is None
+        assert len(cache) == 0
@@ -0,0 +1,128 @@
+"""
+Tests for indexed fuzzy table grouping.
+
+Tests:
+- TableGroupIndex returns the same group as the linear
+  TableGrouper.find_fuzzy_matching_group scan (with and without rapidfuzz)
+- Ties resolve to the first matching group, as in the scan
+- Row labels replaced after a group is created are picked up
+"""
+
+import random
+from collections import defaultdict
+
+import pytest
+
+from src.infrastructure.extraction.consolidation import table_grouping
+from src.infrastructure.extraction.consolidation.table_grouping import TableGrouper, TableGroupIndex
+
+TITLES = [
+    "income statement information", "balance sheet", "borrowings by maturity",
+    "net revenues by segment", "wealth management metrics", "capital ratios",
+    "average liquidity resources", "non-interest expenses", "regulatory capital",
+]
+LABELS = [f"line item {i}" for i in range(30)] + ["Total revenues", "Net income", "Row Label", ""]
+STRUCTURES = ["a_b::L2_L3::POINT_IN_TIME::", "a_b::L3_ONLY::POINT_IN_TIME::", "_::L2_L3::PERIOD_BASED::x"]
+
+RAPIDFUZZ_MODES = [False, True] if table_grouping.RAPIDFUZZ_AVAILABLE else [False]
+
+
+def _perturb(rng, title):
+    """Typos, dropped words and suffixes that land on both sides of 80%."""
+    choice = rng.random()
+    if choice < 0.3:
+        return title
+    if choice < 0.5:
+        i = rng.randrange(len(title))
+        return title[:i] + rng.choice("xyz ") + title[i + 1:]
+    if choice < 0.7:
+        return title + rng.choice([" (continued)", "s", " - q1", " at march 31"])
+    if choice < 0.85:
+        return " ".join(title.split()[1:]) or title
+    return rng.choice(TITLES)
+
+
+def _incoming_tables(seed, count=400):
+    rng = random.Random(seed)
+    for _ in range(count):
+        base = rng.sample(LABELS[:12], 6) if rng.random() < 0.6 else rng.sample(LABELS, rng.randint(0, 8))
+        section = rng.choice(["", "results", "institutional securities"])
+        title = _perturb(rng, rng.choice(TITLES))
+        yield {
+            "combo": f"{section}|{title}" if section else title,
+            "structure": rng.choice(STRUCTURES),
+            "row_labels": base if rng.random() < 0.9 else None,
+        }
+
+
+def _group_all(tables, find):
+    """Mimic _process_xlsx_file: match or create a group, then append."""
+    groups = defaultdict(list)
+    index = TableGroupIndex(groups)
+    keys = []
+    for table in tables:
+        key = find(groups, index, table)
+        if key is None:
+            key = f"{table['combo']}::{table['structure']}"
+        groups[key].append({"metadata": {"row_labels": list(table["row_labels"] or [])}})
+        keys.append(key)
+    return keys
+
+
+def _scan(groups, index, table):
+    return TableGrouper.find_fuzzy_matching_group(
+        groups, table["combo"], table["structure"], 0.80, table["row_labels"]
+    )
+
+
+def _indexed(groups, index, table):
+    return index.find_matching_group(table["combo"], table["structure"], 0.80, table["row_labels"])
+
+
+@pytest.fixture(params=RAPIDFUZZ_MODES, ids=lambda on: "rapidfuzz" if on else "difflib")
+def rapidfuzz_mode(request, monkeypatch):
+    monkeypatch.setattr(table_grouping, "RAPIDFUZZ_AVAILABLE", request.param)
+
+
+class TestEquivalence:
+    """Test that the index matches the linear scan."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_groups_as_scan(self, rapidfuzz_mode, seed):
+        tables = list(_incoming_tables(seed))
+
+        expected = _group_all(tables, _scan)
+        actual = _group_all(tables, _indexed)
+
+        assert actual == expected
+        assert 1 < len(set(expected)) < len(tables)
+
+    def test_each_lookup_matches_scan(self, rapidfuzz_mode):
+        groups = defaultdict(list)
+        index = TableGroupIndex(groups)
+        for table in _incoming_tables(seed=42):
+            assert _indexed(groups, index, table) == _scan(groups, index, table)
+            groups[f"{table['combo']}::{table['structure']}"].append(
+                {"metadata": {"row_labels": table["row_labels"] or []}}
+            )
+
+    def test_ties_resolve_to_first_group(self, rapidfuzz_mode):
+        groups = defaultdict(list)
+        for title in ["balance sheet a", "balance sheet b"]:
+            groups[f"{title}::s"].append({"metadata": {"row_labels": ["cash"]}})
+
+        table = {"combo": "balance sheet c", "structure": "s", "row_labels": ["cash"]}
+        assert _indexed(groups, TableGroupIndex(groups), table) == "balance sheet a::s"
+        assert _scan(groups, None, table) == "balance sheet a::s"
+
+    def test_replaced_row_labels(self, rapidfuzz_mode):
+        groups = defaultdict(list)
+        index = TableGroupIndex(groups)
+        metadata = {"row_labels": ["cash", "loans"]}
+        groups["balance sheet::s"].append({"metadata": metadata})
+        table = {"combo": "balance sheet", "structure": "s", "row_labels": ["deposits", "equity"]}
+        assert _indexed(groups, index, table) is None
+
+        # Sub-tables of one sheet share a metadata dict that is updated in place
+        metadata["row_labels"] = ["deposits", "equity"]
+        assert _indexed(groups, index, table) == _scan(groups, index, table) == "balance sheet::s"
@@ -0,0 +1,183 @@
+"""
+Tests for the table store (cached sheets of merged workbooks).
+
+Tests:
+- Stored sheets match pd.ExcelFile.parse (header=None and header=0)
+- The manifest carries Index metadata and selects sheets
+- A workbook changed after publishing, or an unreadable store, falls
+  back to the xlsx
+- Consolidation reads the same tables from the store as from the xlsx
+"""
+
+import os
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from config.settings import settings
+from src.infrastructure.extraction.exporters.table_store import (
+    read_table_store,
+    table_store_dir,
+    write_table_store,
+)
+
+
+def _write_workbook(path):
+    """Index plus two table sheets in the processed layout."""
+    index = pd.DataFrame({
+        "Source": ["10q0325.pdf", "10q0325.pdf"],
+        "PageNo": [7, 9],
+        "Section": ["Results", "Balance Sheet"],
+        "Table Title": ["Net Revenues", "Assets"],
+        "Year": [2025, 2025],
+        "Quarter": ["Q1", None],
+        "Link": ["→ 1", "→ 2"],
+    })
+    sheets = {
+        "1": [
+            ["Source: 10q0325.pdf"],
+            [None, "Three Months Ended"],
+            ["$ in millions", "2025", "2024"],
+            ["Net revenues", 1500, 1400.5],
+            ["ROE", 0.12, None],
+        ],
+        "2": [
+            ["Source: 10q0325.pdf"],
+            ["$ in millions", "At March 31, 2025"],
+            ["Cash", 100],
+        ],
+    }
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        index.to_excel(writer, sheet_name="Index", index=False)
+        for name, rows in sheets.items():
+            pd.DataFrame(rows).to_excel(writer, sheet_name=name, index=False, header=False)
+
+
+def _assert_same_frame(a, b):
+    assert list(a.columns) == list(b.columns)
+    assert list(a.dtypes) == list(b.dtypes)
+    assert a.equals(b)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "10q0325_tables.xlsx"
+    _write_workbook(path)
+    return path
+
+
+class TestRoundTrip:
+    """Test stored sheets against the xlsx."""
+
+    @pytest.mark.parametrize("from_memory", [False, True])
+    def test_sheets_match_excel_parse(self, workbook, from_memory):
+        wb = load_workbook(workbook) if from_memory else None
+        assert write_table_store(workbook, workbook=wb) == table_store_dir(workbook)
+
+        stored = read_table_store(workbook)
+        xl = pd.ExcelFile(workbook)
+        assert stored.sheet_names == xl.sheet_names == ["Index", "1", "2"]
+        for name in xl.sheet_names:
+            _assert_same_frame(stored.parse(name, header=None), xl.parse(name, header=None))
+            _assert_same_frame(stored.parse(name), xl.parse(name))
+
+    def test_manifest_metadata(self, workbook):
+        write_table_store(workbook)
+        stored = read_table_store(workbook)
+
+        entry = stored.sheets[1]
+        assert entry["title"] == "Net Revenues"
+        assert entry["section"] == "Results"
+        assert (entry["page"], entry["year"], entry["quarter"]) == (7, 2025, "Q1")
+        assert stored.sheets[2]["quarter"] is None
+        assert stored.select(section="Balance Sheet") == ["2"]
+        assert stored.select(year=2025, source="10q0325.pdf") == ["1", "2"]
+
+    def test_cell_types_round_trip(self, tmp_path):
+        path = tmp_path / "types.xlsx"
+        df = pd.DataFrame({
+            "label": ["a", None, "c"],
+            "mixed": [1, "x", None],
+            "float": [1.5, None, 2.0],
+            "when": pd.to_datetime(["2025-03-31", None, "2024-12-31"]),
+        })
+        df.to_excel(path, sheet_name="T", index=False, engine="openpyxl")
+        write_table_store(path)
+
+        stored, xl = read_table_store(path), pd.ExcelFile(path)
+        _assert_same_frame(stored.parse("T", header=None), xl.parse("T", header=None))
+        _assert_same_frame(stored.parse("T"), xl.parse("T"))
+        assert not list(table_store_dir(path).glob("*.pkl"))
+
+    def test_missing_sheet(self, workbook):
+        write_table_store(workbook)
+        with pytest.raises(ValueError):
+            read_table_store(workbook).parse("3")
+
+
+class TestStaleness:
+    """Test fallback to the xlsx."""
+
+    def test_no_store(self, workbook):
+        assert read_table_store(workbook) is None
+
+    def test_changed_workbook(self, workbook):
+        write_table_store(workbook)
+        stat = workbook.stat()
+        os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert read_table_store(workbook) is None
+
+        write_table_store(workbook)
+        assert read_table_store(workbook) is not None
+
+
+class TestConsolidationInput:
+    """Test that consolidation reads the store like the xlsx."""
+
+    def test_same_payloads(self, workbook, monkeypatch):
+        from src.infrastructure.extraction.consolidation.consolidated_exporter import (
+            ConsolidatedExcelExporter,
+        )
+
+        exporter = ConsolidatedExcelExporter()
+        from_xlsx = exporter._read_xlsx_tables(str(workbook))
+
+        write_table_store(workbook)
+        monkeypatch.setattr(pd, "ExcelFile", None)  # Store must not fall back
+        from_store = exporter._read_xlsx_tables(str(workbook))
+
+        assert len(from_store) == len(from_xlsx) > 0
+        for a, b in zip(from_store, from_xlsx):
+            assert a["table"]["data"].equals(b["table"]["data"])
+            assert a["table"]["metadata"] == b["table"]["metadata"]
+            assert {k: v for k, v in a.items() if k != "table"} == {k: v for k, v in b.items() if k != "table"}
+
+    def test_unreadable_store_falls_back(self, workbook):
+        from src.infrastructure.extraction.consolidation.consolidated_exporter import (
+            ConsolidatedExcelExporter,
+        )
+
+        exporter = ConsolidatedExcelExporter()
+        expected = exporter._read_xlsx_tables(str(workbook))
+
+        root = write_table_store(workbook)
+        (root / read_table_store(workbook).sheets[1]["file"]).write_text('{"columns": [0')
+        actual = exporter._read_xlsx_tables(str(workbook))
+
+        assert len(actual) == len(expected) > 0
+        for a, b in zip(actual, expected):
+            assert a["table"]["data"].equals(b["table"]["data"])
+
+    def test_disabled(self, workbook, monkeypatch):
+        from src.infrastructure.extraction.consolidation.consolidated_exporter import (
+            ConsolidatedExcelExporter,
+        )
+
+        write_table_store(workbook)
+        monkeypatch.setattr(settings, "TABLE_STORE_ENABLED", False)
+        monkeypatch.setattr(
+            "src.infrastructure.extraction.consolidation.consolidated_exporter.read_table_store",
+            lambda path: pytest.fail("store read while disabled"),
+        )
+        assert ConsolidatedExcelExporter()._read_xlsx_tables(str(workbook))